@@ -23,10 +23,20 @@ import glob
 import subprocess
 import shutil
 import os
+import re
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from functools import partial
+
+import build_cache
+import build_trace
 
 ROOT_PATH = os.path.realpath(".")
 DESIGN_PDI_PATH = os.path.join(ROOT_PATH, "..")
-RESOURCES_PATH = os.path.realpath("../../submodules/v80-vitis-flow/resources/")
+LINKER_SOURCE_DIR = os.path.realpath("../../submodules/v80-vitis-flow/")
+AVED_SOURCE_DIR = os.path.join(LINKER_SOURCE_DIR, "submodules/aved/")
+RESOURCES_PATH = os.path.join(LINKER_SOURCE_DIR, "resources/")
 COMPUTE_EXAMPLE_DIR = os.path.realpath("../../examples/05_perf/")
 DEPLOY_PROJECT_COMPUTE = os.path.join(os.getcwd(), "deploy_project_compute")
 HLS_DIR_COMPUTE = os.path.join(DEPLOY_PROJECT_COMPUTE, "hls/")
@@ -44,6 +54,14 @@ CREATE_DESIGN_DIR = os.path.join(TCL_DIR, "create_design.tcl")
 NOC_SOLUTION_DIR = os.path.join(TCL_DIR, "noc_solution.tcl")
 EXPORT_NOC_DIR = os.path.join(TCL_DIR, "export_noc.tcl")
 SEGMENTED_IMG_BIF = os.path.join(TCL_DIR, "segmented_img.bif")
+HW_PDIS = [
+    os.path.join(AVED_ROOT_DIR_COMPUTE, "build/prj.runs/impl_1/top_wrapper_boot.pdi"),
+    os.path.join(AVED_ROOT_DIR_COMPUTE, "build/prj.runs/impl_1/top_wrapper_pld.pdi"),
+]
+
+HLS_DEFAULT_DEVICE = "xcv80-lsva4737-2MHP-e-S"
+HLS_JOB_MEM_GB = 8  # Memory budget of a single vitis_hls synthesis job
+HLS_DONE = ".hls_done"  # Written into a kernel's build directory once its synthesis succeeded
 
 
 
@@ -58,18 +76,22 @@ def run_linker(CONFIG_PATH, KERNEL_PATHS):
     cmd.append("--kernels")
     cmd.extend(KERNEL_PATHS)
 
-    subprocess.run(cmd, check=True)
+    build_trace.run(cmd, check=True)
     print("Linker run completed.")
 
 def run_hw():
     os.chdir(AVED_ROOT_DIR_COMPUTE)
-    subprocess.run(["./build_all.sh"], check=False)
+    build_trace.run(["./build_all.sh"], check=True)
+    # A failed Vivado run can still exit with 0, the PDIs are only written by a complete build
+    missing = [p for p in HW_PDIS if not os.path.isfile(p)]
+    if missing:
+        raise RuntimeError(f"Hardware build did not produce {', '.join(missing)}")
     print("Hardware build completed.")
 
 def setup_step(platform):
     if platform == "compute":
         os.chdir(COMPUTE_EXAMPLE_DIR)
-        subprocess.run(["make", "setup"])
+        build_trace.run(["make", "setup"])
         shutil.copytree(COMPUTE_EXAMPLE_DIR, DEPLOY_PROJECT_COMPUTE, dirs_exist_ok=True)
     elif platform == "eth":
         print("Eth mode not supported yet.")
@@ -79,23 +101,113 @@ def setup_step(platform):
 def hls_step(platform):
     if platform == "compute":
         os.chdir(DEPLOY_PROJECT_COMPUTE)
-        subprocess.run(["make", "hls"])
+        build_trace.run(["make", "hls"], check=True)
     elif platform == "eth":
         print("Eth mode not supported yet.")
     else:
         raise ValueError("Invalid platform specified.")
     
-def linker_step(platform):
+def find_hls_kernels(hls_dir):
+    """Each top-level <kernel>.cpp in the HLS directory is synthesized as its own IP."""
+    return sorted(os.path.splitext(os.path.basename(f))[0] for f in glob.glob(os.path.join(hls_dir, "*.cpp")))
+
+def hls_device(hls_dir):
+    makefile = os.path.join(hls_dir, "Makefile")
+    if os.path.exists(makefile):
+        with open(makefile) as f:
+            m = re.search(r"^DEVICE\s*=\s*(\S+)", f.read(), re.MULTILINE)
+            if m:
+                return m.group(1)
+    return HLS_DEFAULT_DEVICE
+
+def available_memory_gb():
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024 ** 2
+    except OSError:
+        pass
+    return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_AVPHYS_PAGES") / 1024 ** 3
+
+def hls_pool_size(num_kernels, jobs, job_mem_gb):
+    """Bound the number of concurrent HLS jobs by cores, memory budget and kernel count."""
+    limit = min(os.cpu_count() or 1, max(int(available_memory_gb() // job_mem_gb), 1))
+    if jobs > 0:
+        limit = min(limit, jobs)
+    return max(min(limit, num_kernels), 1)
+
+def run_hls_kernel(hls_dir, device, kernel):
+    build_name = f"build_{kernel}.{device}"
+    build_dir = os.path.join(hls_dir, build_name)
+    log_file = os.path.join(hls_dir, f"build_{kernel}.log")
+    if os.path.isfile(os.path.join(build_dir, HLS_DONE)):
+        print(f"HLS: {kernel} already synthesized, skipping")
+        return 0.0
+    # Each job runs in its own directory, so jobs do not share vitis_hls.log, .Xil or the project
+    # paths, and a synthesis that did not complete never replaces build_dir
+    work_dir = os.path.join(hls_dir, f".work_{kernel}")
+    shutil.rmtree(work_dir, ignore_errors=True)
+    os.makedirs(work_dir)
+    for name in os.listdir(hls_dir):
+        path = os.path.join(hls_dir, name)
+        if os.path.isfile(path) and not name.startswith("build_") and not name.endswith(".log"):
+            os.symlink(path, os.path.join(work_dir, name))
+    print(f"HLS: synthesizing {kernel} (log: {log_file})")
+    start = time.monotonic()
+    build_trace.run(["vitis_hls", "-f", "build.tcl", "-l", log_file, "-tclargs", "ip", device, kernel],
+                    cwd=work_dir, stdout=subprocess.DEVNULL, check=True)
+    open(os.path.join(work_dir, build_name, HLS_DONE), "w").close()
+    shutil.rmtree(build_dir, ignore_errors=True)
+    os.rename(os.path.join(work_dir, build_name), build_dir)
+    shutil.rmtree(work_dir)
+    return time.monotonic() - start
+
+def run_hls_parallel(hls_dir, jobs, job_mem_gb):
+    kernels = find_hls_kernels(hls_dir)
+    if not kernels:
+        raise RuntimeError(f"No HLS kernels found in {hls_dir}")
+    device = hls_device(hls_dir)
+    workers = hls_pool_size(len(kernels), jobs, job_mem_gb)
+    print(f"HLS: {len(kernels)} kernel(s) for {device} on {workers} worker(s)")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_hls_kernel, hls_dir, device, k): k for k in kernels}
+        for future in futures:
+            print(f"HLS: {futures[future]} done ({future.result():.1f}s)")
+
+def hls_parallel_step(platform, jobs=0, job_mem_gb=HLS_JOB_MEM_GB):
+    if platform == "compute":
+        run_hls_parallel(HLS_DIR_COMPUTE, jobs, job_mem_gb)
+    elif platform == "eth":
+        print("Eth mode not supported yet.")
+    else:
+        raise ValueError("Invalid platform specified.")
+
+def linker_build_step(platform):
     if platform == "compute":
         os.chdir(LINKER_SRC_DIR_COMPUTE)
         os.makedirs("build", exist_ok=True)
-        subprocess.run(["cmake", ".."], cwd="build", check=True)
-        subprocess.run(["make", "-j", "4"], cwd="build", check=True)
+        build_trace.run(["cmake", ".."], cwd="build", check=True)
+        build_trace.run(["make", "-j", "4"], cwd="build", check=True)
+    elif platform == "eth":
+        print("Eth mode not supported yet.")
+    else:
+        raise ValueError("Invalid platform specified.")
+
+def aved_copy_step(platform):
+    if platform == "compute":
         shutil.copytree(AVED_DIR_SUBMODULE_COMPUTE, AVED_DIR_COMPUTE_BUILD, dirs_exist_ok=True)
         shutil.copy(CREATE_DESIGN_DIR, os.path.join(AVED_SRC_DIR_COMPUTE, "create_design.tcl"))
         shutil.copy(NOC_SOLUTION_DIR, os.path.join(AVED_SRC_DIR_COMPUTE, "noc_solution.tcl"))
         shutil.copy(EXPORT_NOC_DIR, os.path.join(AVED_SRC_DIR_COMPUTE, "export_noc.tcl"))
         shutil.copy(SEGMENTED_IMG_BIF, os.path.join(AVED_ROOT_DIR_COMPUTE, "segmented_img.bif"))
+    elif platform == "eth":
+        print("Eth mode not supported yet.")
+    else:
+        raise ValueError("Invalid platform specified.")
+
+def linker_run_step(platform):
+    if platform == "compute":
         # Copying HLS to iprepo
         shutil.copytree(HLS_DIR_COMPUTE, AVED_IPREPO_DIR_COMPUTE, dirs_exist_ok=True)
         build_dirs = [d for d in glob.glob(os.path.join(HLS_DIR_COMPUTE, "build_*"))
@@ -109,6 +221,11 @@ def linker_step(platform):
     else:
         raise ValueError("Invalid platform specified.")
 
+def linker_step(platform):
+    linker_build_step(platform)
+    aved_copy_step(platform)
+    linker_run_step(platform)
+
 def hw_step(platform):
     if platform == "compute":
         run_hw()
@@ -121,7 +238,7 @@ def generate_pdi_step(platform):
     if platform == "compute":
         os.chdir(AVED_ROOT_DIR_COMPUTE)
         # No FPT generation for now
-        subprocess.run(["bootgen", "-arch", "versal", "-image", "segmented_img.bif", "-w", "-o", "design.pdi"], check=True)
+        build_trace.run(["bootgen", "-arch", "versal", "-image", "segmented_img.bif", "-w", "-o", "design.pdi"], check=True)
         shutil.copy(os.path.join(AVED_ROOT_DIR_COMPUTE, "design.pdi"), os.path.join(ROOT_PATH, "../design.pdi"))
     elif platform == "eth":
         print("Eth mode not supported yet.")
@@ -148,24 +265,199 @@ STEPS = [
     ("generate_noc_solution_step", generate_noc_solution_step)
 ]
 
+# Dependency graph of the build: (node, function, dependencies, step the node belongs to).
+# Nodes whose dependencies are satisfied run concurrently, e.g. the linker build and the
+# AVED copy do not need the HLS output, only linker_run does.
+GRAPH = [
+    ("setup", setup_step, [], "setup_step"),
+    ("hls", hls_step, ["setup"], "hls_step"),
+    ("linker_build", linker_build_step, ["setup"], "linker_step"),
+    ("aved_copy", aved_copy_step, ["setup"], "linker_step"),
+    ("linker_run", linker_run_step, ["hls", "linker_build", "aved_copy"], "linker_step"),
+    ("hw", hw_step, ["linker_run"], "hw_step"),
+    ("generate_pdi", generate_pdi_step, ["hw"], "generate_pdi_step"),
+    ("generate_noc_solution", generate_noc_solution_step, ["hw"], "generate_noc_solution_step")
+]
+
+# Inputs hashed into the cache key of each node, together with the keys of its dependencies.
+# "git" work trees, i.e. the AVED submodule, are hashed by commit and uncommitted changes.
+# Nodes with outputs are cacheable: on a key hit the outputs are restored instead of running the node.
+CACHE_SPECS = {
+    "setup": {
+        "inputs": [os.path.join(COMPUTE_EXAMPLE_DIR, "Makefile"), os.path.join(COMPUTE_EXAMPLE_DIR, "config.cfg")],
+    },
+    "hls": {
+        "inputs": [os.path.join(COMPUTE_EXAMPLE_DIR, "hls")],
+        "outputs": [os.path.join(HLS_DIR_COMPUTE, "build_*", "")],  # directories only, no logs
+    },
+    "linker_build": {
+        "inputs": [os.path.join(LINKER_SOURCE_DIR, d) for d in ["CMakeLists.txt", "include", "src", "resources", "scripts"]],
+        "git": [AVED_SOURCE_DIR],
+    },
+    "aved_copy": {
+        "inputs": [TCL_DIR],
+        "git": [AVED_SOURCE_DIR],
+    },
+    "linker_run": {
+        "inputs": [],
+        "outputs": [
+            os.path.join(LINKER_BUILD_DIR_COMPUTE, "run_pre.tcl"),
+            os.path.join(LINKER_BUILD_DIR_COMPUTE, "system_map.xml"),
+            os.path.join(AVED_SRC_DIR_COMPUTE, "run_pre.tcl"),
+            os.path.join(AVED_SRC_DIR_COMPUTE, "run_post.tcl"),
+            AVED_IPREPO_DIR_COMPUTE,
+        ],
+    },
+    "hw": {
+        "inputs": [],
+        "outputs": HW_PDIS + [
+            os.path.join(AVED_ROOT_DIR_COMPUTE, "build/amc.elf"),
+            os.path.join(AVED_ROOT_DIR_COMPUTE, "build/report_*.txt"),
+        ],
+    },
+    "generate_pdi": {
+        "inputs": [],
+        "outputs": [os.path.join(AVED_ROOT_DIR_COMPUTE, "design.pdi"), os.path.join(DESIGN_PDI_PATH, "design.pdi")],
+    },
+}
+
+# Tool logs whose Vivado/HLS phases are added to the build trace
+TRACE_LOGS = {
+    "hls": [os.path.join(HLS_DIR_COMPUTE, "vitis_hls.log"), os.path.join(HLS_DIR_COMPUTE, "build_*.log")],
+    "hw": [os.path.join(AVED_ROOT_DIR_COMPUTE, "build/vivado.log")],
+}
+
+# Generated and log files that never take part in an input hash
+CACHE_EXCLUDE = ["build", "build_*", "*.log", "__pycache__", ".*"]
+
+def compute_cache_keys(platform):
+    keys = {}
+    for name, _, deps, _ in GRAPH:
+        spec = CACHE_SPECS.get(name, {})
+        digest = build_cache.hash_inputs(spec.get("inputs", []), CACHE_EXCLUDE)
+        if spec.get("git"):
+            digest += build_cache.hash_git_state(spec["git"])
+        keys[name] = build_cache.node_key(name, platform, digest, [keys[d] for d in deps])
+    return keys
+
+def run_node(name, func, platform, cache=None, key=None):
+    """
+    Run a single node in a worker process.
+    Returns (wall-clock seconds, trace events, error message or None, traceback or None).
+    """
+    start = time.monotonic()
+    error = None
+    details = None
+    try:
+        with build_trace.node(name):
+            outputs = CACHE_SPECS.get(name, {}).get("outputs")
+            if cache is not None and outputs and cache.restore(key):
+                print(f"Cache: restored {name} ({key[:12]})")
+            else:
+                func(platform)
+                build_trace.add_log_phases(TRACE_LOGS.get(name, []))
+                if cache is not None and outputs:
+                    cache.store(key, name, outputs)
+    except Exception as e:
+        error = str(e) or type(e).__name__
+        # Only the return value crosses the process boundary, the traceback would be lost
+        details = traceback.format_exc()
+    return time.monotonic() - start, build_trace.take_events(), error, details
+
+def run_graph(nodes, platform, jobs, cache=None, keys=None, events=None):
+    """
+    Run the given graph nodes on a process pool of `jobs` workers.
+    Dependencies on nodes outside of `nodes` are considered already satisfied.
+    With a `cache`, cacheable nodes are restored from or saved to it under their `keys`.
+    Trace events of finished and failed nodes are appended to `events`.
+    Returns a list of (node, wall-clock seconds) in completion order.
+    """
+    selected = {name for name, _, _, _ in nodes}
+    funcs = {name: func for name, func, _, _ in nodes}
+    pending = {name: {d for d in deps if d in selected} for name, _, deps, _ in nodes}
+    running = {}
+    timings = []
+    failed = None
+
+    executor = ProcessPoolExecutor(max_workers=jobs)
+    try:
+        while pending or running:
+            if failed is None:
+                for name in [n for n, deps in pending.items() if not deps]:
+                    del pending[name]
+                    print(f"\n--- Starting node: {name} ---")
+                    key = keys[name] if keys else None
+                    running[executor.submit(run_node, name, funcs[name], platform, cache, key)] = name
+            if not running:
+                if failed is None:
+                    raise ValueError(f"Dependency cycle between nodes: {sorted(pending)}")
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    elapsed, node_events, error, details = future.result()
+                except Exception as e:
+                    elapsed, node_events, error, details = 0.0, [], str(e), traceback.format_exc()
+                if events is not None:
+                    events.extend(node_events)
+                if error is not None:
+                    print(f"\n{details}", end="")
+                    print(f"\n--- Node {name} failed: {error} ---")
+                    if running:
+                        print("Waiting for running nodes to finish...")
+                    failed = name
+                    continue
+                print(f"\n--- Finished node: {name} ({elapsed:.1f}s) ---")
+                timings.append((name, elapsed))
+                for deps in pending.values():
+                    deps.discard(name)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    if failed is not None:
+        raise RuntimeError(f"Build failed at node {failed}")
+    return timings
+
 def main():
     parser = argparse.ArgumentParser(description="Platform build driver with step range.")
     parser.add_argument("--platform", choices=["compute", "eth"], required=True)
     parser.add_argument("--from_step", type=str, default=STEPS[0][0], help="Step name or index to start from.")
     parser.add_argument("--to_step", type=str, help="(Optional) Step name or index to end at.")
     parser.add_argument("--list_steps", action="store_true", help="List all available steps and exit.")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(),
+                        help="Number of build graph nodes to run concurrently (default: number of cores).")
+    parser.add_argument("--hls-parallel", action="store_true",
+                        help="Synthesize each HLS kernel as a separate job instead of a single 'make hls'.")
+    parser.add_argument("--hls-jobs", type=int, default=0,
+                        help="Maximum number of concurrent HLS jobs (default: bounded by cores and memory).")
+    parser.add_argument("--hls-job-mem", type=float, default=HLS_JOB_MEM_GB,
+                        help="Memory budget of a single HLS job in GB, used to size the HLS pool (default: %(default)s).")
+    parser.add_argument("--no-cache", action="store_true", help="Always run every step, do not use the build cache.")
+    parser.add_argument("--cache-dir", type=str, default=build_cache.default_cache_dir(),
+                        help="Build cache location (default: %(default)s).")
+    parser.add_argument("--cache-size", type=float, default=50,
+                        help="Maximum build cache size in GB, least recently used entries are evicted (default: %(default)s).")
+    parser.add_argument("--trace", type=str, default=os.path.join(DESIGN_PDI_PATH, "build_trace.json"),
+                        help="Chrome trace written after the build, compare two with build_trace.py (default: %(default)s).")
     args = parser.parse_args()
 
     if args.list_steps:
         print("Available steps:")
         for i, (name, _) in enumerate(STEPS, 1):
             print(f"{i}. {name}")
+            for node, _, deps, step in GRAPH:
+                if step == name:
+                    print(f"     {node}" + (f" (after {', '.join(deps)})" if deps else ""))
         return
 
     if args.platform != "compute":
         print("Eth mode not supported yet.")
         return
 
+    if args.jobs < 1:
+        raise ValueError("--jobs must be at least 1")
+
     def step_index(step_id):
         if step_id.isdigit():
             idx = int(step_id) - 1
@@ -181,45 +473,33 @@ def main():
     if from_idx > to_idx:
         raise ValueError("--from_step must come before or equal to --to_step")
 
-    for i in range(from_idx, to_idx + 1):
-        name, func = STEPS[i]
-        print(f"\n--- Running Step {i + 1}: {name} ---")
-        func(args.platform)
-
-    # if args.platform == "compute":
-    #     print("Running in compute mode.")
-    #     os.chdir(COMPUTE_EXAMPLE_DIR)
-    #     subprocess.run(["make", "setup"])
-    #     shutil.copytree(COMPUTE_EXAMPLE_DIR, DEPLOY_PROJECT_COMPUTE, dirs_exist_ok=True)
-    #     os.chdir(DEPLOY_PROJECT_COMPUTE)
-    #     # Setup the deployment project
-    #     subprocess.run(["make", "hls"])
-    #     os.chdir(LINKER_SRC_DIR_COMPUTE)
-    #     os.makedirs("build", exist_ok=True)
-    #     subprocess.run(["cmake", ".."], cwd="build", check=True)
-    #     subprocess.run(["make", "-j", "4"], cwd="build", check=True)
-    #     shutil.copytree(AVED_DIR_SUBMODULE_COMPUTE, AVED_DIR_COMPUTE_BUILD, dirs_exist_ok=True)
-    #     shutil.copy(CREATE_DESIGN_DIR, os.path.join(AVED_SRC_DIR_COMPUTE, "create_design.tcl"))
-    #     shutil.copy(NOC_SOLUTION_DIR, os.path.join(AVED_SRC_DIR_COMPUTE, "noc_solution.tcl"))
-    #     shutil.copy(EXPORT_NOC_DIR, os.path.join(AVED_SRC_DIR_COMPUTE, "export_noc.tcl"))
-    #     shutil.copy(SEGMENTED_IMG_BIF, os.path.join(AVED_ROOT_DIR_COMPUTE, "segmented_img.bif"))
-    #     # Copying HLS to iprepo
-    #     shutil.copytree(HLS_DIR_COMPUTE, AVED_IPREPO_DIR_COMPUTE, dirs_exist_ok=True)
-    #     build_dirs = [d for d in glob.glob(os.path.join(HLS_DIR_COMPUTE, "build_*"))
-    #           if os.path.isdir(d)]
-    #     sol1_paths = [os.path.join(d, "sol1") for d in build_dirs]
-    #     run_linker(CONFIG_FILE_PATH_COMPUTE, sol1_paths)
-    #     shutil.copy(os.path.join(LINKER_BUILD_DIR_COMPUTE, "run_pre.tcl"), AVED_SRC_DIR_COMPUTE)
-    #     run_hw()
-    #     os.chdir(AVED_ROOT_DIR_COMPUTE)
-    #     # No FPT generation for now
-    #     subprocess.run(["bootgen", "-arch", "versal", "-image", "segmented_img.bif", "-w", "-o", "design.pdi"], check=True)
-    #     shutil.copy(os.path.join(AVED_ROOT_DIR_COMPUTE, "design.pdi"), os.path.join(ROOT_PATH, "design.pdi"))
-    #     # Generate NoC solution from the vivado project
-    #     subprocess.run(["vivado", "-mode", "batch", "-source", "export_noc.tcl"], check=True)
-    #     shutil.copy(os.path.join(AVED_ROOT_DIR_COMPUTE, "noc_sol.ncr"), os.path.join(RESOURCES_PATH, "noc_sol_compute.ncr"))
-    # elif args.platform == "eth":
-    #     print("Eth mode not supported yet.")
+    steps = [name for name, _ in STEPS[from_idx:to_idx + 1]]
+    nodes = [node for node in GRAPH if node[3] in steps]
+    if args.hls_parallel:
+        hls_func = partial(hls_parallel_step, jobs=args.hls_jobs, job_mem_gb=args.hls_job_mem)
+        nodes = [(name, hls_func, deps, step) if name == "hls" else (name, func, deps, step)
+                 for name, func, deps, step in nodes]
+    print(f"Running steps {', '.join(steps)} with {args.jobs} job(s)")
+
+    cache = None
+    keys = None
+    if not args.no_cache:
+        cache = build_cache.BuildCache(args.cache_dir, int(args.cache_size * 1024 ** 3))
+        keys = compute_cache_keys(args.platform)
+
+    start = time.monotonic()
+    events = []
+    try:
+        run_graph(nodes, args.platform, args.jobs, cache, keys, events)
+    finally:
+        build_trace.print_report(events, time.monotonic() - start)
+        build_trace.write_chrome_trace(args.trace, events, {
+            "platform": args.platform,
+            "steps": steps,
+            "jobs": args.jobs,
+            "hls_parallel": args.hls_parallel,
+        })
+        print(f"Build trace written to {os.path.realpath(args.trace)}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,194 @@
+# ##################################################################################################
+#  The MIT License (MIT)
+#  Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+# 
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+#  and associated documentation files (the "Software"), to deal in the Software without restriction,
+#  including without limitation the rights to use, copy, modify, merge, publish, distribute,
+#  sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+# 
+#  The above copyright notice and this permission notice shall be included in all copies or
+#  substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+# NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ##################################################################################################
+
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import time
+
+MANIFEST = "manifest.json"
+
+def default_cache_dir():
+    """
+    Same lookup order as the runtime's FilesystemCache, with a 'build' subdirectory:
+    $SLASH_CACHE_PATH, $XDG_CACHE_HOME/SLASH, $HOME/.cache/SLASH, /tmp/SLASH-cache-<uid>.
+    """
+    if os.environ.get("SLASH_CACHE_PATH"):
+        return os.path.join(os.environ["SLASH_CACHE_PATH"], "build")
+    if os.environ.get("XDG_CACHE_HOME"):
+        return os.path.join(os.environ["XDG_CACHE_HOME"], "SLASH", "build")
+    if os.environ.get("HOME"):
+        return os.path.join(os.environ["HOME"], ".cache", "SLASH", "build")
+    return f"/tmp/SLASH-cache-{os.getuid()}/build"
+
+def hash_file(path, digest):
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+
+def hash_inputs(paths, exclude=()):
+    """
+    Hash the content and relative names of all files under `paths`.
+    Files and directories whose name matches one of the `exclude` patterns are skipped.
+    Missing paths are hashed by name only, so adding them later changes the digest.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.basename(os.path.normpath(path)).encode())
+        if os.path.isfile(path):
+            hash_file(path, digest)
+            continue
+        if not os.path.isdir(path):
+            digest.update(b"<missing>")
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if not any(fnmatch.fnmatch(d, p) for p in exclude))
+            for name in sorted(files):
+                if any(fnmatch.fnmatch(name, p) for p in exclude):
+                    continue
+                full = os.path.join(root, name)
+                digest.update(os.path.relpath(full, path).encode())
+                hash_file(full, digest)
+    return digest.hexdigest()
+
+def git_output(path, *args):
+    return subprocess.run(["git", "-C", path, *args], capture_output=True, check=True).stdout
+
+def hash_git_state(paths):
+    """
+    Hash the checked out commit and the uncommitted changes of the git work trees at `paths`,
+    e.g. submodules too large to hash file by file. Untracked files are hashed by content.
+    Paths that are not a work tree are hashed by name only.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.basename(os.path.normpath(path)).encode())
+        try:
+            digest.update(git_output(path, "rev-parse", "HEAD"))
+            digest.update(git_output(path, "diff", "HEAD", "--binary"))
+            untracked = git_output(path, "ls-files", "--others", "--exclude-standard", "-z")
+            untracked = untracked.split(b"\0")
+        except (OSError, subprocess.CalledProcessError):
+            digest.update(b"<no git>")
+            continue
+        for name in sorted(n for n in untracked if n):
+            digest.update(name)
+            full = os.path.join(path, os.fsdecode(name))
+            if os.path.isfile(full):
+                hash_file(full, digest)
+    return digest.hexdigest()
+
+def node_key(name, platform, inputs_digest, dep_keys):
+    digest = hashlib.sha256()
+    for part in [name, platform, inputs_digest] + sorted(dep_keys):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+def path_size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            full = os.path.join(root, name)
+            if not os.path.islink(full):
+                total += os.path.getsize(full)
+    return total
+
+def copy_path(src, dst):
+    if os.path.isdir(dst) and not os.path.islink(dst):
+        shutil.rmtree(dst)
+    elif os.path.lexists(dst):
+        os.remove(dst)
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    if os.path.isdir(src):
+        shutil.copytree(src, dst, symlinks=True)
+    else:
+        shutil.copy2(src, dst)
+
+class BuildCache:
+    """
+    Content-addressed store of build node outputs.
+
+    Each entry lives in <root>/<key>/ and holds a copy of every output plus a manifest with the
+    original locations. The manifest mtime is the last use time, entries are evicted least
+    recently used first once the cache grows beyond `max_size` bytes.
+    """
+
+    def __init__(self, root, max_size):
+        self.root = root
+        self.max_size = max_size
+
+    def entry_dir(self, key):
+        return os.path.join(self.root, key)
+
+    def restore(self, key):
+        """Copy the outputs of entry `key` back in place. Returns False on a cache miss."""
+        manifest_path = os.path.join(self.entry_dir(key), MANIFEST)
+        if not os.path.isfile(manifest_path):
+            return False
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        for output in manifest["outputs"]:
+            copy_path(os.path.join(self.entry_dir(key), output["entry"]), output["path"])
+        os.utime(manifest_path)
+        return True
+
+    def store(self, key, node, patterns):
+        """Save the outputs matching `patterns` under `key` and enforce the size limit."""
+        outputs = sorted({p for pattern in patterns for p in glob.glob(pattern)})
+        if not outputs:
+            print(f"Cache: node {node} produced no outputs, not caching")
+            return
+        os.makedirs(self.root, exist_ok=True)
+        tmp_dir = os.path.join(self.root, f".{key}.tmp-{os.getpid()}")
+        if os.path.exists(tmp_dir):
+            shutil.rmtree(tmp_dir)
+        os.makedirs(tmp_dir)
+        manifest = {"node": node, "created": time.time(), "outputs": []}
+        for i, path in enumerate(outputs):
+            copy_path(path, os.path.join(tmp_dir, str(i)))
+            manifest["outputs"].append({"path": os.path.abspath(path), "entry": str(i)})
+        with open(os.path.join(tmp_dir, MANIFEST), "w") as f:
+            json.dump(manifest, f, indent=4)
+        if os.path.exists(self.entry_dir(key)):
+            shutil.rmtree(self.entry_dir(key))
+        os.rename(tmp_dir, self.entry_dir(key))
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for key in os.listdir(self.root):
+            manifest_path = os.path.join(self.root, key, MANIFEST)
+            if key.startswith(".") or not os.path.isfile(manifest_path):
+                continue
+            entries.append((os.path.getmtime(manifest_path), key, path_size(self.entry_dir(key))))
+        total = sum(size for _, _, size in entries)
+        for _, key, size in sorted(entries):
+            if total <= self.max_size:
+                break
+            print(f"Cache: evicting {key}")
+            shutil.rmtree(self.entry_dir(key), ignore_errors=True)
+            total -= size
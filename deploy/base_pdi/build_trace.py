@@ -0,0 +1,240 @@
+# ##################################################################################################
+#  The MIT License (MIT)
+#  Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+# 
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+#  and associated documentation files (the "Software"), to deal in the Software without restriction,
+#  including without limitation the rights to use, copy, modify, merge, publish, distribute,
+#  sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+# 
+#  The above copyright notice and this permission notice shall be included in all copies or
+#  substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+# NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ##################################################################################################
+
+"""
+Build telemetry: wall time, CPU time, peak RSS and exit code of every build node and every
+subprocess it runs, plus the tool phases found in Vivado/HLS logs. Events are kept in memory
+per process and written as a Chrome trace (chrome://tracing, https://ui.perfetto.dev).
+
+Run as a script to compare two traces:
+    python3 build_trace.py --compare old_trace.json new_trace.json
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import resource
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+_events = []
+_lock = threading.Lock()
+_current_node = None
+_node_start = None
+
+# "place_design: Time (s): cpu = 00:05:03 ; elapsed = 00:02:10 . Memory (MB): peak = 9000.5 ; ..."
+VIVADO_COMMAND_RE = re.compile(
+    r"^(\w+): Time \(s\): cpu = (\d+):(\d+):(\d+) ; elapsed = (\d+):(\d+):(\d+) \. "
+    r"Memory \(MB\): peak = ([\d.]+)")
+# "INFO: [HLS 200-111] Finished Command csynth_design CPU user time: 41.2 seconds. CPU system time:
+#  2.1 seconds. Elapsed time: 45.5 seconds; current allocated memory: 521.3 MB."
+HLS_COMMAND_RE = re.compile(
+    r"Finished Command (\w+) CPU user time: ([\d.]+) seconds\. CPU system time: ([\d.]+) seconds\. "
+    r"Elapsed time: ([\d.]+) seconds")
+
+def record(name, cat, start, end, lane, args):
+    """Record a complete event. `start`/`end` are time.time() values."""
+    with _lock:
+        _events.append({
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": int(start * 1e6),
+            "dur": int((end - start) * 1e6),
+            "lane": lane,
+            "args": args,
+        })
+
+def take_events():
+    """Return and clear the events recorded by this process."""
+    with _lock:
+        events = list(_events)
+        _events.clear()
+    return events
+
+def current_lane():
+    lane = _current_node or "build"
+    if threading.current_thread() is not threading.main_thread():
+        lane += f" ({threading.current_thread().name})"
+    return lane
+
+def run(cmd, check=False, **kwargs):
+    """
+    subprocess.run replacement that records the command's wall time, CPU time, peak RSS and
+    exit code. Output is not captured, so PIPE must not be passed for stdout/stderr.
+    """
+    start = time.time()
+    proc = subprocess.Popen(cmd, **kwargs)
+    try:
+        _, status, usage = os.wait4(proc.pid, 0)
+    except BaseException:
+        proc.kill()
+        proc.wait()
+        raise
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    record(os.path.basename(cmd[0]) if isinstance(cmd, list) else cmd.split()[0], "subprocess",
+           start, time.time(), current_lane(), {
+               "cmd": " ".join(cmd) if isinstance(cmd, list) else cmd,
+               "cwd": kwargs.get("cwd") or os.getcwd(),
+               "cpu_s": round(usage.ru_utime + usage.ru_stime, 3),
+               "peak_rss_mb": round(usage.ru_maxrss / 1024, 1),
+               "exit_code": proc.returncode,
+           })
+    if check and proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+    return subprocess.CompletedProcess(cmd, proc.returncode)
+
+def cpu_seconds():
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+@contextmanager
+def node(name):
+    """Record a build node. Subprocesses run inside it are attributed to the node."""
+    global _current_node, _node_start
+    _current_node = name
+    _node_start = time.time()
+    cpu_start = cpu_seconds()
+    exit_code = 0
+    try:
+        yield
+    except BaseException:
+        exit_code = 1
+        raise
+    finally:
+        # Peak RSS of the node is the largest of the worker itself and any of its subprocesses
+        with _lock:
+            rss = [e["args"]["peak_rss_mb"] for e in _events if e["cat"] == "subprocess"]
+        rss.append(round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1))
+        record(name, "node", _node_start, time.time(), name, {
+            "cpu_s": round(cpu_seconds() - cpu_start, 3),
+            "peak_rss_mb": max(rss),
+            "exit_code": exit_code,
+        })
+        _current_node = None
+
+def parse_hms(h, m, s):
+    return int(h) * 3600 + int(m) * 60 + int(s)
+
+def parse_log_phases(path):
+    """Return (phase, elapsed seconds, args) for each Vivado/HLS command found in a tool log."""
+    phases = []
+    with open(path, errors="replace") as f:
+        for line in f:
+            m = VIVADO_COMMAND_RE.match(line)
+            if m:
+                phases.append((m.group(1), parse_hms(*m.group(5, 6, 7)), {
+                    "cpu_s": parse_hms(*m.group(2, 3, 4)),
+                    "peak_mem_mb": float(m.group(8)),
+                }))
+                continue
+            m = HLS_COMMAND_RE.search(line)
+            if m:
+                phases.append((m.group(1), float(m.group(4)), {
+                    "cpu_s": round(float(m.group(2)) + float(m.group(3)), 3),
+                }))
+    return phases
+
+def add_log_phases(patterns):
+    """
+    Add the phases of the tool logs matching `patterns` to the current node. Logs older than the
+    node are ignored. Logs only carry durations, so phases are laid out back to back from the
+    start of the node on their own lane.
+    """
+    node_start = _node_start or time.time()
+    for path in sorted({p for pattern in patterns for p in glob.glob(pattern)}):
+        if os.path.getmtime(path) < node_start:
+            continue
+        start = node_start
+        for phase, elapsed, args in parse_log_phases(path):
+            args["log"] = path
+            record(phase, "phase", start, start + elapsed, f"{_current_node} ({os.path.basename(path)})", args)
+            start += elapsed
+
+def write_chrome_trace(path, events, metadata):
+    lanes = {}
+    trace = []
+    for event in sorted(events, key=lambda e: e["ts"]):
+        tid = lanes.setdefault(event["lane"], len(lanes) + 1)
+        trace.append({k: v for k, v in event.items() if k != "lane"} | {"pid": 1, "tid": tid})
+    for lane, tid in lanes.items():
+        trace.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": lane}})
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"traceEvents": trace, "displayTimeUnit": "ms", "otherData": metadata}, f, indent=1)
+
+def print_report(events, total):
+    print("\n--- Build summary ---")
+    print(f"{'node':<28} {'wall (s)':>10} {'cpu (s)':>10} {'peak RSS (MB)':>14} {'exit':>5}")
+    for event in sorted((e for e in events if e["cat"] == "node"), key=lambda e: e["ts"]):
+        args = event["args"]
+        print(f"{event['name']:<28} {event['dur'] / 1e6:>10.1f} {args['cpu_s']:>10.1f} "
+              f"{args['peak_rss_mb']:>14.1f} {args['exit_code']:>5}")
+    print(f"{'total (wall-clock)':<28} {total:>10.1f}")
+
+def load_durations(path):
+    """Total duration in seconds per (category, name) of a trace."""
+    with open(path) as f:
+        trace = json.load(f)
+    durations = {}
+    for event in trace["traceEvents"]:
+        if event.get("ph") == "X":
+            key = (event["cat"], event["name"])
+            durations[key] = durations.get(key, 0.0) + event["dur"] / 1e6
+    return durations
+
+def compare(old_path, new_path, threshold, min_seconds):
+    """Print the per node/subprocess/phase time difference. Returns the number of regressions."""
+    old = load_durations(old_path)
+    new = load_durations(new_path)
+    regressions = 0
+    print(f"{'category':<11} {'name':<32} {'old (s)':>10} {'new (s)':>10} {'delta (s)':>10} {'delta':>8}")
+    for key in sorted(set(old) | set(new), key=lambda k: (k[0], -abs(new.get(k, 0) - old.get(k, 0)))):
+        before, after = old.get(key, 0.0), new.get(key, 0.0)
+        delta = after - before
+        pct = f"{100 * delta / before:+.1f}%" if before else ("new" if after else "")
+        regressed = delta > min_seconds and (not before or 100 * delta / before > threshold)
+        regressions += regressed
+        print(f"{key[0]:<11} {key[1]:<32} {before:>10.1f} {after:>10.1f} {delta:>+10.1f} {pct:>8}"
+              + ("  REGRESSION" if regressed else ""))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two build traces.")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), required=True,
+                        help="Traces to compare.")
+    parser.add_argument("--threshold", type=float, default=10,
+                        help="Slowdown in percent reported as a regression (default: %(default)s).")
+    parser.add_argument("--min-seconds", type=float, default=1,
+                        help="Ignore differences shorter than this (default: %(default)s).")
+    args = parser.parse_args()
+    regressions = compare(args.compare[0], args.compare[1], args.threshold, args.min_seconds)
+    if regressions:
+        print(f"\n{regressions} regression(s) above {args.threshold}%")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
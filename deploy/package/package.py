@@ -22,10 +22,15 @@
 
 import os
 import sys
+import errno
+import fcntl
 import subprocess
 import shutil
 import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 
 PACKAGE_NAME = "amd-vrt"
 MAINTAINER = "AMD <support@amd.com>"
@@ -43,6 +48,16 @@ RPM_REQUIRES = [
     "jsoncpp",
 ]
 
+# Payload compression per format: (dpkg-deb -Z type, default level, rpm payload io suffix).
+# With rpm, T0 compresses with one thread per core.
+COMPRESSION = {
+    "zstd": ("zstd", 3, "zstdio"),
+    "xz": ("xz", 6, "xzdio"),
+}
+
+# ioctl that clones a file's extents on copy-on-write filesystems (btrfs, xfs)
+FICLONE = 0x40049409
+
 def run_command(cmd, cwd=None, env=None):
     try:
         result = subprocess.run(
@@ -85,9 +100,15 @@ def get_version_from_header(repo_root):
 
 def detect_packaging_format(forced=None):
     """
-    Return 'deb' or 'rpm'.
+    Return 'deb', 'rpm' or 'all'.
     If --format is provided, honor it. Otherwise detect via /etc/os-release.
     """
+    if forced == "all":
+        missing = [tool for tool in ("dpkg-deb", "rpmbuild") if not shutil.which(tool)]
+        if missing:
+            print(f"--format all needs {' and '.join(missing)}.")
+            sys.exit(2)
+        return forced
     if forced:
         return forced
     os_release = "/etc/os-release"
@@ -105,11 +126,20 @@ def detect_packaging_format(forced=None):
     print("Could not detect packaging system. Install dpkg-deb or rpmbuild, or pass --format deb|rpm.")
     sys.exit(2)
 
-def create_stage_tree(repo_root):
+def prune_stage_dirs(out_dir, keep):
+    """Remove all but the `keep` most recent stage directories"""
+    stages = sorted(d for d in os.listdir(out_dir)
+                    if d.startswith(f"{PACKAGE_NAME}-stage-") and os.path.isdir(os.path.join(out_dir, d)))
+    for d in stages[:max(len(stages) - keep, 0)]:
+        print(f"Removing stale stage directory {d}")
+        shutil.rmtree(os.path.join(out_dir, d))
+
+def create_stage_tree(repo_root, keep_stages=0):
     """Create the staging directory with the final filesystem layout"""
     timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
     out_dir = os.path.join(repo_root, "deploy", "output")
     os.makedirs(out_dir, exist_ok=True)
+    prune_stage_dirs(out_dir, keep_stages)
     stage_dir = os.path.join(out_dir, f"{PACKAGE_NAME}-stage-{timestamp}")
     os.makedirs(stage_dir, exist_ok=True)
 
@@ -125,29 +155,105 @@ def create_stage_tree(repo_root):
 
     return stage_dir
 
-def copy_design_pdi(repo_root, stage_dir):
+def reflink(src, dst):
+    """Clone src into dst sharing its data blocks. Returns False if the filesystem can't."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        except OSError as e:
+            if e.errno in (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.EBADF):
+                fdst.close()
+                os.remove(dst)
+                return False
+            raise
+    shutil.copystat(src, dst)
+    return True
+
+def stage_file(src, dst, stage_mode="link", mode=None):
+    """
+    Put src at dst in the stage tree.
+    With stage_mode 'link' the file is reflinked (copy-on-write) when the filesystem supports
+    it, otherwise hardlinked, and only copied across filesystems. A hardlink shares its
+    permissions with the source, so files that need a different `mode` are never hardlinked.
+    """
+    if os.path.lexists(dst):
+        os.remove(dst)
+    if stage_mode == "link" and not os.path.islink(src):
+        if reflink(src, dst):
+            if mode is not None:
+                os.chmod(dst, mode)
+            return dst
+        if mode is None or (os.stat(src).st_mode & 0o7777) == mode:
+            try:
+                os.link(src, dst)
+                return dst
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+                    raise
+    shutil.copy2(src, dst, follow_symlinks=False)
+    if mode is not None:
+        os.chmod(dst, mode)
+    return dst
+
+def copy_design_pdi(repo_root, stage_dir, stage_mode="link"):
     pdi_src = os.path.join(repo_root, "deploy", "design.pdi")
     pdi_dst = os.path.join(stage_dir, "opt/amd/vrt/design.pdi")
     if os.path.exists(pdi_src):
-        shutil.copy2(pdi_src, pdi_dst)
+        stage_file(pdi_src, pdi_dst, stage_mode)
         print("design.pdi copied to package")
     else:
         print(f"Warning: design.pdi not found at {pdi_src}")
 
-def build_and_copy_vrt(repo_root, stage_dir):
-    vrt_dir = os.path.join(repo_root, "vrt")
-    build_dir = os.path.join(vrt_dir, "build")
-    if os.path.exists(build_dir):
+def cmake_generator():
+    """Ninja when it is installed, make otherwise"""
+    return "Ninja" if shutil.which("ninja") else "Unix Makefiles"
+
+def cached_generator(build_dir):
+    cache_file = os.path.join(build_dir, "CMakeCache.txt")
+    if not os.path.exists(cache_file):
+        return None
+    with open(cache_file) as f:
+        for line in f:
+            if line.startswith("CMAKE_GENERATOR:INTERNAL="):
+                return line.strip().split("=", 1)[1]
+    return None
+
+def cmake_build(src_dir, incremental=False, ccache=False, jobs=None):
+    """
+    Configure and build the CMake project in src_dir/build with `jobs` compile jobs, one per
+    CPU by default.
+    Without `incremental` the build directory is rebuilt from scratch. With it the existing
+    tree is reused unless it was configured with a different generator. cmake is always
+    re-run, so new sources picked up by the file globs are built too.
+    """
+    build_dir = os.path.join(src_dir, "build")
+    generator = cmake_generator()
+    if os.path.exists(build_dir) and not (incremental and cached_generator(build_dir) == generator):
         shutil.rmtree(build_dir)
     os.makedirs(build_dir, exist_ok=True)
-    run_command("cmake ..", cwd=build_dir)
-    run_command("make -j$(nproc)", cwd=build_dir)
+    launcher = "ccache" if ccache else ""
+    run_command(f'cmake -G "{generator}" -DCMAKE_C_COMPILER_LAUNCHER={launcher} '
+                f'-DCMAKE_CXX_COMPILER_LAUNCHER={launcher} ..', cwd=build_dir)
+    run_command(f"cmake --build . --parallel {jobs or os.cpu_count() or 1}", cwd=build_dir)
+    return build_dir
+
+def build_and_copy_vrt(repo_root, stage_dir, stage_mode="link", incremental=False, ccache=False,
+                       jobs=None):
+    vrt_dir = os.path.join(repo_root, "vrt")
+    build_dir = cmake_build(vrt_dir, incremental, ccache, jobs)
 
     lib_dir = os.path.join(build_dir, "lib")
     if os.path.isdir(lib_dir):
         for lib_file in os.listdir(lib_dir):
             if lib_file.startswith("libvrt") and (lib_file.endswith(".so") or lib_file.endswith(".a")):
-                shutil.copy2(os.path.join(lib_dir, lib_file), os.path.join(stage_dir, "usr/local/lib", lib_file))
+                stage_file(os.path.join(lib_dir, lib_file), os.path.join(stage_dir, "usr/local/lib", lib_file), stage_mode)
+
+    # The device manager daemon, next to the SMI binaries
+    vrtd = os.path.join(build_dir, "bin", "vrtd")
+    if os.path.exists(vrtd):
+        stage_file(vrtd, os.path.join(stage_dir, "usr/local/bin", "vrtd"), stage_mode, 0o755)
+    else:
+        print(f"Warning: vrtd not found at {vrtd}")
 
     include_src = os.path.join(vrt_dir, "include")
     include_dst = os.path.join(stage_dir, "usr/local/vrt/include")
@@ -158,7 +264,7 @@ def build_and_copy_vrt(repo_root, stage_dir):
                     rel = os.path.relpath(root, include_src)
                     dst_dir = os.path.join(include_dst, rel)
                     os.makedirs(dst_dir, exist_ok=True)
-                    shutil.copy2(os.path.join(root, file), os.path.join(dst_dir, file))
+                    stage_file(os.path.join(root, file), os.path.join(dst_dir, file), stage_mode)
 
     scripts_src = os.path.join(vrt_dir, "scripts")
     if os.path.exists(scripts_src):
@@ -168,21 +274,16 @@ def build_and_copy_vrt(repo_root, stage_dir):
             s = os.path.join(scripts_src, item)
             d = os.path.join(scripts_dst, item)
             if os.path.isfile(s):
-                shutil.copy2(s, d)
                 # make script executable if it looks like one
-                if s.endswith((".sh", ".py")) or os.access(s, os.X_OK):
-                    os.chmod(d, 0o755)
+                executable = s.endswith((".sh", ".py")) or os.access(s, os.X_OK)
+                stage_file(s, d, stage_mode, 0o755 if executable else None)
 
     print("VRT API built and files copied to stage")
 
-def build_and_copy_smi(repo_root, stage_dir):
+def build_and_copy_smi(repo_root, stage_dir, stage_mode="link", incremental=False, ccache=False,
+                       jobs=None):
     smi_dir = os.path.join(repo_root, "smi")
-    build_dir = os.path.join(smi_dir, "build")
-    if os.path.exists(build_dir):
-        shutil.rmtree(build_dir)
-    os.makedirs(build_dir, exist_ok=True)
-    run_command("cmake ..", cwd=build_dir)
-    run_command("make -j$(nproc)", cwd=build_dir)
+    build_dir = cmake_build(smi_dir, incremental, ccache, jobs)
 
     # find <something>-smi binaries (incl. v80-smi)
     for root, _, files in os.walk(build_dir):
@@ -190,13 +291,11 @@ def build_and_copy_smi(repo_root, stage_dir):
             full = os.path.join(root, f)
             if (f == "v80-smi" or f.endswith("-smi")) and os.access(full, os.X_OK):
                 print(f"Found SMI binary: {f}")
-                dst = os.path.join(stage_dir, "usr/local/bin", f)
-                shutil.copy2(full, dst)
-                os.chmod(dst, 0o755)
+                stage_file(full, os.path.join(stage_dir, "usr/local/bin", f), stage_mode, 0o755)
 
     print("SMI CLI built and files copied to stage")
 
-def copy_pcie_driver(repo_root, stage_dir):
+def copy_pcie_driver(repo_root, stage_dir, stage_mode="link"):
     src = os.path.join(repo_root, "submodules/pcie-hotplug-drv")
     dst = os.path.join(stage_dir, "usr/src/pcie-hotplug-drv")
     if not os.path.exists(src):
@@ -205,9 +304,9 @@ def copy_pcie_driver(repo_root, stage_dir):
     for item in os.listdir(src):
         s = os.path.join(src, item); d = os.path.join(dst, item)
         if os.path.isdir(s):
-            shutil.copytree(s, d, symlinks=True)
+            shutil.copytree(s, d, symlinks=True, copy_function=partial(stage_file, stage_mode=stage_mode))
         else:
-            shutil.copy2(s, d)
+            stage_file(s, d, stage_mode)
     print("PCIe hotplug driver source copied to stage")
 
 # ----------------------- DEB PACKAGING -----------------------
@@ -312,7 +411,7 @@ exit 0
     os.chmod(os.path.join(debian_dir, "prerm"), 0o755)
     os.chmod(os.path.join(debian_dir, "postrm"), 0o755)
 
-def build_deb(stage_dir, version, repo_root):
+def build_deb(stage_dir, version, repo_root, compression=None, level=None):
     timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
     deb_root = stage_dir  # stage already mirrors FS
     debian_dir = os.path.join(deb_root, "DEBIAN")
@@ -342,7 +441,11 @@ Description: {DESCRIPTION}
     deb_name = f"{PACKAGE_NAME}_{version}_{timestamp}_{DEB_ARCH}.deb"
     deb_path = os.path.join(out_dir, deb_name)
 
-    run_command(f"dpkg-deb --build --root-owner-group {deb_root} {deb_path}")
+    options = ""
+    if compression:
+        deb_type, default_level, _ = COMPRESSION[compression]
+        options = f"-Z{deb_type} -z{level if level is not None else default_level} "
+    run_command(f"dpkg-deb --build --root-owner-group {options}{deb_root} {deb_path}")
     print(f"DEB created: {deb_path}")
     return deb_path
 
@@ -480,8 +583,10 @@ BuildArch:      {RPM_ARCH}
 %install
 rm -rf %{{buildroot}}
 mkdir -p %{{buildroot}}
-# Copy from staging dir into buildroot
-cp -a "{stage_dir}/." %{{buildroot}}/
+# Copy from staging dir into buildroot. rpmbuild strips and rewrites files in the
+# buildroot, so it must not share inodes with the (possibly hardlinked) stage. Only the
+# installed trees are copied, the stage may also hold the DEBIAN dir of a deb build.
+cp -a --reflink=auto "{stage_dir}/usr" "{stage_dir}/opt" %{{buildroot}}/
 
 %post
 {post}
@@ -507,7 +612,7 @@ cp -a "{stage_dir}/." %{{buildroot}}/
     with open(spec_path, "w") as f:
         f.write(spec)
 
-def build_rpm(stage_dir, version, repo_root):
+def build_rpm(stage_dir, version, repo_root, compression=None, level=None):
     out_dir = os.path.join(repo_root, "deploy", "output")
     os.makedirs(out_dir, exist_ok=True)
     topdirs = rpm_topdirs(out_dir)
@@ -517,6 +622,9 @@ def build_rpm(stage_dir, version, repo_root):
     make_rpm_spec(spec_path, version, release, stage_dir)
     # rpmbuild uses %_topdir to find BUILD, RPMS, etc.
     cmd = f'rpmbuild -bb --define "_topdir {topdirs["TOP"]}" "{spec_path}"'
+    if compression:
+        _, default_level, rpm_io = COMPRESSION[compression]
+        cmd += f' --define "_binary_payload w{level if level is not None else default_level}T0.{rpm_io}"'
     run_command(cmd)
 
     # Find the built RPM in RPMS/<arch>/
@@ -537,33 +645,69 @@ def build_rpm(stage_dir, version, repo_root):
 
 def main():
     parser = argparse.ArgumentParser(description="Build amd-vrt package as DEB or RPM")
-    parser.add_argument("--format", choices=["deb", "rpm", "auto"], default="auto",
-                        help="Packaging format (default: auto)")
+    parser.add_argument("--format", choices=["deb", "rpm", "all", "auto"], default="auto",
+                        help="Packaging format, 'all' builds deb and rpm concurrently from one stage (default: auto)")
+    parser.add_argument("--compression", choices=sorted(COMPRESSION),
+                        help="Payload compression (default: the packaging tool's own default)")
+    parser.add_argument("--compression-level", type=int,
+                        help="Payload compression level (default: 3 for zstd, 6 for xz)")
+    parser.add_argument("--stage-mode", choices=["link", "copy"], default="link",
+                        help="Stage files as reflinks/hardlinks, falling back to copies across "
+                             "filesystems, or always copy them (default: link)")
+    parser.add_argument("--keep-stages", type=int, default=0,
+                        help="Number of previous stage directories to keep, older ones are removed (default: 0)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Keep the VRT and SMI build directories and only rebuild what changed")
+    parser.add_argument("--ccache", action="store_true",
+                        help="Compile through ccache (must be installed)")
     args = parser.parse_args()
 
+    if args.ccache and not shutil.which("ccache"):
+        print("ccache not found, install it or drop --ccache.")
+        sys.exit(2)
+
     repo_root = os.path.abspath(os.getcwd())
     print(f"Repository root directory: {repo_root}")
 
     version = get_version_from_header(repo_root)
     pkg_format = detect_packaging_format(None if args.format == "auto" else args.format)
 
-    stage_dir = create_stage_tree(repo_root)
+    stage_dir = create_stage_tree(repo_root, args.keep_stages)
 
-    # Build & stage files
-    build_and_copy_vrt(repo_root, stage_dir)
-    build_and_copy_smi(repo_root, stage_dir)
-    copy_pcie_driver(repo_root, stage_dir)
-    copy_design_pdi(repo_root, stage_dir)
+    # Build & stage files. VRT and SMI don't depend on each other and are built concurrently,
+    # sharing the CPUs between them.
+    jobs = max((os.cpu_count() or 1) // 2, 1)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        builds = [executor.submit(build, repo_root, stage_dir, args.stage_mode, args.incremental, args.ccache,
+                                  jobs)
+                  for build in (build_and_copy_vrt, build_and_copy_smi)]
+        for future in builds:
+            future.result()
+    copy_pcie_driver(repo_root, stage_dir, args.stage_mode)
+    copy_design_pdi(repo_root, stage_dir, args.stage_mode)
 
     # Build packages
-    if pkg_format == "deb":
-        deb = build_deb(stage_dir, version, repo_root)
-        print(f"\nPackage successfully created: {deb}")
-        print(f"Install with: sudo apt install ./{os.path.basename(deb)}")
-    else:
-        rpm = build_rpm(stage_dir, version, repo_root)
-        print(f"\nPackage successfully created: {rpm}")
-        print(f"Install with: sudo dnf install {rpm}  # or yum")
+    builders = {"deb": build_deb, "rpm": build_rpm}
+    formats = list(builders) if pkg_format == "all" else [pkg_format]
+
+    def build_package(fmt):
+        start = time.monotonic()
+        package = builders[fmt](stage_dir, version, repo_root, args.compression, args.compression_level)
+        return package, time.monotonic() - start
+
+    with ThreadPoolExecutor(max_workers=len(formats)) as executor:
+        results = dict(zip(formats, executor.map(build_package, formats)))
+
+    for fmt, (package, _) in results.items():
+        print(f"\nPackage successfully created: {package}")
+        if fmt == "deb":
+            print(f"Install with: sudo apt install ./{os.path.basename(package)}")
+        else:
+            print(f"Install with: sudo dnf install {package}  # or yum")
+
+    print("\nPackaging time:")
+    for fmt, (package, elapsed) in results.items():
+        print(f"  {fmt}: {elapsed:.1f}s ({os.path.getsize(package) / 1024 ** 2:.1f} MB)")
 
 if __name__ == "__main__":
     main()
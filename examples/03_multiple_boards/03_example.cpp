@@ -23,77 +23,64 @@
 #include <random>
 
 #include <utils/logger.hpp>
-#include <api/device.hpp>
-#include <api/buffer.hpp>
-#include <api/kernel.hpp>
+#include <api/device_group.hpp>
 
 int main() {
     try {
         uint32_t size = 2048;
         vrt::utils::Logger::setLogLevel(vrt::utils::LogLevel::INFO);
-        vrt::Device fpga0("e2:00.0", "03_example_hw.vrtbin", false, vrt::ProgramType::FLASH);
-        vrt::Device fpga1("21:00.0", "03_example_hw.vrtbin", false, vrt::ProgramType::FLASH);
-        fpga0.setFrequency(200000000);
-        fpga1.setFrequency(200000000);
-        vrt::Kernel accumulate0(fpga0, "accumulate_0");
-        vrt::Kernel increment0(fpga0, "increment_0");
-        vrt::Kernel accumulate1(fpga1, "accumulate_0");
-        vrt::Kernel increment1(fpga1, "increment_0");
-        vrt::Buffer<float> buffer0(fpga0, size, vrt::MemoryRangeType::HBM);
-        vrt::Buffer<float> buffer1(fpga1, size, vrt::MemoryRangeType::HBM);
+        // Both boards are brought up at the same time
+        vrt::DeviceGroup fpgas({"e2:00.0", "21:00.0"}, "03_example_hw.vrtbin", false, vrt::ProgramType::FLASH);
+        if (!fpgas.ok()) {
+            for (const auto& status : fpgas.getStatus()) {
+                if (!status.ok) {
+                    vrt::utils::Logger::log(vrt::utils::LogLevel::ERROR, __PRETTY_FUNCTION__,"Device {} failed: {}", status.bdf, status.error);
+                }
+            }
+            fpgas.cleanup();
+            return 1;
+        }
+        fpgas.setFrequency(200000000);
+        vrt::KernelGroup accumulate(fpgas, "accumulate_0");
+        vrt::KernelGroup increment(fpgas, "increment_0");
+        vrt::BufferGroup<float> buffer(fpgas, size, vrt::MemoryRangeType::HBM);
         std::random_device rd;
         std::mt19937 gen(rd());
         std::uniform_real_distribution<> dis(0.0, 1.0);
 
-        float goldenModel0 = 0, goldenModel1 = 0;
-        for(uint32_t i = 0; i < size; i++) {
-            buffer0[i] = static_cast<float>(dis(gen));
-            buffer1[i] = static_cast<float>(dis(gen));
-            goldenModel0+=buffer0[i] + 1;
-            goldenModel1+=buffer1[i] + 1;
+        std::vector<float> goldenModel(fpgas.getSize(), 0);
+        for (size_t fpga = 0; fpga < fpgas.getSize(); fpga++) {
+            for(uint32_t i = 0; i < size; i++) {
+                buffer[fpga][i] = static_cast<float>(dis(gen));
+                goldenModel[fpga] += buffer[fpga][i] + 1;
+            }
         }
 
-        buffer0.sync(vrt::SyncType::HOST_TO_DEVICE);
-        buffer1.sync(vrt::SyncType::HOST_TO_DEVICE);
-        increment0.start(size, buffer0.getPhysAddr());
-        accumulate0.start(size);
-        increment0.wait();
-        accumulate0.wait();
-        increment1.start(size, buffer1.getPhysAddr());
-        accumulate1.start(size);
-        increment1.wait();
-        accumulate1.wait();
-        uint32_t val0 = accumulate0.read(0x18);
-        uint32_t val1 = accumulate1.read(0x18);
-        float floatVal0, floatVal1;
-        std::memcpy(&floatVal0, &val0, sizeof(float));
-        std::memcpy(&floatVal1, &val1, sizeof(float));
-        if(std::fabs(goldenModel0 - floatVal0) > 0.0001) {
-            vrt::utils::Logger::log(vrt::utils::LogLevel::ERROR, __PRETTY_FUNCTION__,"Test failed for FPGA 0!");
-            vrt::utils::Logger::log(vrt::utils::LogLevel::ERROR, __PRETTY_FUNCTION__,"Expected: {}", goldenModel0);
-            vrt::utils::Logger::log(vrt::utils::LogLevel::ERROR, __PRETTY_FUNCTION__,"Got: {}", floatVal0);
-            fpga0.cleanup();
-            return 1;
-        } else {
-            vrt::utils::Logger::log(vrt::utils::LogLevel::INFO, __PRETTY_FUNCTION__,"Expected: {}", goldenModel0);
-            vrt::utils::Logger::log(vrt::utils::LogLevel::INFO, __PRETTY_FUNCTION__,"Got: {}", floatVal0);
-            vrt::utils::Logger::log(vrt::utils::LogLevel::INFO, __PRETTY_FUNCTION__,"Test passed for FPGA 0!");
+        buffer.sync(vrt::SyncType::HOST_TO_DEVICE);
+        // Each board gets its own buffer as the second argument
+        increment.start(size, buffer);
+        accumulate.start(size);
+        increment.wait();
+        accumulate.wait();
+        int result = 0;
+        for (size_t fpga = 0; fpga < fpgas.getSize(); fpga++) {
+            uint32_t val = accumulate[fpga].read(0x18);
+            float floatVal;
+            std::memcpy(&floatVal, &val, sizeof(float));
+            if(std::fabs(goldenModel[fpga] - floatVal) > 0.0001) {
+                vrt::utils::Logger::log(vrt::utils::LogLevel::ERROR, __PRETTY_FUNCTION__,"Test failed for FPGA {}!", fpga);
+                vrt::utils::Logger::log(vrt::utils::LogLevel::ERROR, __PRETTY_FUNCTION__,"Expected: {}", goldenModel[fpga]);
+                vrt::utils::Logger::log(vrt::utils::LogLevel::ERROR, __PRETTY_FUNCTION__,"Got: {}", floatVal);
+                result = 1;
+            } else {
+                vrt::utils::Logger::log(vrt::utils::LogLevel::INFO, __PRETTY_FUNCTION__,"Expected: {}", goldenModel[fpga]);
+                vrt::utils::Logger::log(vrt::utils::LogLevel::INFO, __PRETTY_FUNCTION__,"Got: {}", floatVal);
+                vrt::utils::Logger::log(vrt::utils::LogLevel::INFO, __PRETTY_FUNCTION__,"Test passed for FPGA {}!", fpga);
+            }
         }
 
-        if(std::fabs(goldenModel1 - floatVal1) > 0.0001) {
-            vrt::utils::Logger::log(vrt::utils::LogLevel::ERROR, __PRETTY_FUNCTION__,"Test failed for FPGA 1!");
-            vrt::utils::Logger::log(vrt::utils::LogLevel::ERROR, __PRETTY_FUNCTION__,"Expected: {}", goldenModel1);
-            vrt::utils::Logger::log(vrt::utils::LogLevel::ERROR, __PRETTY_FUNCTION__,"Got: {}", floatVal1);
-            fpga1.cleanup();
-            return 1;
-        } else {
-            vrt::utils::Logger::log(vrt::utils::LogLevel::INFO, __PRETTY_FUNCTION__,"Expected: {}", goldenModel1);
-            vrt::utils::Logger::log(vrt::utils::LogLevel::INFO, __PRETTY_FUNCTION__,"Got: {}", floatVal1);
-            vrt::utils::Logger::log(vrt::utils::LogLevel::INFO, __PRETTY_FUNCTION__,"Test passed for FPGA 1!");
-        }
-        
-        fpga0.cleanup();
-        fpga1.cleanup();
+        fpgas.cleanup();
+        return result;
 
     } catch (const std::exception& e) {
         vrt::utils::Logger::log(vrt::utils::LogLevel::ERROR, __PRETTY_FUNCTION__,"Exception: {}", e.what());
@@ -25,6 +25,7 @@
 
 #include <api/device.hpp>
 #include <api/buffer.hpp>
+#include <api/completion.hpp>
 #include <api/kernel.hpp>
 
 int main(int argc, char* argv[]) {
@@ -60,15 +61,15 @@ int main(int argc, char* argv[]) {
 
         auto start_time = std::chrono::high_resolution_clock::now();
         
-        // The line you want to measure
-        kernels[14].wait();
+        // Wait for the 15 kernels from this thread, polling them with backoff
+        vrt::waitAll(kernels);
         
         // Add timing code after wait call
         auto end_time = std::chrono::high_resolution_clock::now();
         auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
         
         // Print the time taken
-        std::cout << "Time taken for kernels[14].wait(): " << duration.count() << " milliseconds" << std::endl;
+        std::cout << "Time taken for vrt::waitAll(kernels): " << duration.count() << " milliseconds" << std::endl;
 
         device.cleanup();
     } catch (const std::exception& e) {
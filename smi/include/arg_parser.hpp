@@ -25,6 +25,7 @@
 #include <functional>
 #include <string>
 #include <unordered_map>
+#include <vector>
 
 /**
  * @brief Class for parsing command-line arguments.
@@ -55,6 +56,13 @@ class ArgParser {
      */
     std::string getDevice() const;
 
+    /**
+     * @brief Gets all devices given with a comma separated list, e.g. -d 21:00.0,e2:00.0.
+     *
+     * @return The device BDF identifiers.
+     */
+    std::vector<std::string> getDevices() const;
+
     /**
      * @brief Gets the path to the image file.
      *
@@ -69,6 +77,13 @@ class ArgParser {
      */
     uint8_t getPartition() const;
 
+    /**
+     * @brief Checks whether programming was forced.
+     *
+     * @return True if the device is programmed even if it already runs the image.
+     */
+    bool isForce() const;
+
     /**
      * @brief Checks if a specific command was specified.
      *
@@ -95,11 +110,13 @@ class ArgParser {
 
    private:
     std::unordered_map<std::string, std::function<void()>>
-        commands;                ///< Map of command names to handler functions.
-    std::string device;          ///< The device BDF identifier.
-    std::string image;           ///< The path to the image file.
-    uint8_t partition = -1;      ///< The partition number.
-    std::string currentCommand;  ///< The currently active command.
+        commands;                      ///< Map of command names to handler functions.
+    std::string device;                ///< The device BDF identifier.
+    std::vector<std::string> devices;  ///< All device BDF identifiers.
+    std::string image;                 ///< The path to the image file.
+    uint8_t partition = -1;            ///< The partition number.
+    bool force = false;                ///< Whether to program a device already running the image.
+    std::string currentCommand;        ///< The currently active command.
 
     /**
      * @brief Registers a command with its handler function.
@@ -59,19 +59,24 @@ class PartialProgramCommand {
      *
      * @param device The BDF of the device to program.
      * @param image_path Path to the segmented PDI image file.
+     * @param force Program the device even if it already runs the image's logic UUID.
      */
-    PartialProgramCommand(const std::string& device, const std::string& image_path);
+    PartialProgramCommand(const std::string& device, const std::string& image_path,
+                          bool force = false);
 
     /**
      * @brief Executes the partial program command.
      *
-     * This method programs the specified device with the segmented PDI image.
+     * This method programs the specified device with the segmented PDI image. A vrtbin whose
+     * logic UUID is already running is skipped, including the boot into the base PDI, unless
+     * programming is forced.
      */
     void execute();
 
    private:
     std::string device;     ///< The BDF of the device to program.
     std::string imagePath;  ///< Path to the segmented PDI image file.
+    bool force;             ///< Whether to program a device already running the image.
     ami_device* dev;        ///< Pointer to the AMI device object.
 };
 
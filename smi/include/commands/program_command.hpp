@@ -62,13 +62,16 @@ class ProgramCommand {
      * @param device The BDF of the device to program.
      * @param image_path Path to the image file.
      * @param partition The partition number to program.
+     * @param force Program the device even if it already runs the image's logic UUID.
      */
-    ProgramCommand(const std::string& device, const std::string& image_path, uint8_t partition);
+    ProgramCommand(const std::string& device, const std::string& image_path, uint8_t partition,
+                   bool force = false);
 
     /**
      * @brief Executes the program command.
      *
-     * This method programs the specified device with the image file.
+     * This method programs the specified device with the image file, unless the device
+     * already runs a design with the same logic UUID and programming is not forced.
      */
     void execute();
 
@@ -83,6 +86,7 @@ class ProgramCommand {
     std::string device;     ///< The BDF of the device to program.
     std::string imagePath;  ///< Path to the image file.
     uint8_t partition;      ///< The partition number to program.
+    bool force;             ///< Whether to program a device already running the image.
     ami_device* dev;        ///< Pointer to the AMI device object.
 };
 
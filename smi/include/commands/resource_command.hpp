@@ -21,10 +21,17 @@
 #ifndef RESOURCE_COMMAND_HPP
 #define RESOURCE_COMMAND_HPP
 
+#include <fcntl.h>
 #include <libxml/parser.h>
 #include <libxml/tree.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
 
+#include <algorithm>
+#include <cstdint>
 #include <cstdlib>
+#include <cstring>
 #include <iomanip>
 #include <iostream>
 #include <regex>
@@ -39,6 +46,31 @@
  */
 #define RESOURCE_UTILIZATION_FILE "%s/%s:00.0/report_utilization.xml"
 
+/**
+ * @brief Format string for the binary resource utilization file path.
+ *
+ * This macro defines the format string for the path to the columnar sidecar of the resource
+ * utilization XML file, generated by report_utilization.py.
+ */
+#define RESOURCE_UTILIZATION_BINARY_FILE "%s/%s:00.0/report_utilization.bin"
+
+/**
+ * @brief Header of the binary resource utilization file.
+ *
+ * The header is followed by the columns: int32 parent index (-1 for top level instances),
+ * uint32 name and module offsets into the string table, then int32 counts and float
+ * percentages of the nine resources, one column per resource. The NUL terminated string table
+ * comes last. Parents always come before their children.
+ */
+struct UtilizationBinaryHeader {
+    char magic[8];         ///< "VRTUTIL" followed by a NUL byte.
+    uint32_t version;      ///< Format version.
+    uint32_t count;        ///< Number of instances.
+    uint32_t stringsSize;  ///< Size of the string table in bytes.
+    uint32_t reserved;     ///< Reserved, always 0.
+    uint64_t xmlSize;      ///< Size of the XML file generated together with this file.
+};
+
 /**
  * @brief Structure representing an instance in the resource hierarchy.
  *
@@ -96,6 +128,19 @@ class ResourceCommand {
      */
     void parseXML(const std::string& filename);
 
+    /**
+     * @brief Loads the binary resource utilization file.
+     *
+     * @param filename Path to the binary file containing resource utilization data.
+     * @param xmlFilename Path to the XML file the binary file was generated with.
+     * @return True if the resource hierarchy was loaded, false if the file is missing, invalid
+     * or does not belong to the XML file.
+     *
+     * This method maps the binary file into memory and builds the resource hierarchy from its
+     * columns, without parsing the XML file.
+     */
+    bool loadBinary(const std::string& filename, const std::string& xmlFilename);
+
     /**
      * @brief Parses a single instance node from the XML.
      *
@@ -157,6 +157,16 @@ class ValidateCommand {
 
    private:
     std::string device;  ///< The BDF of the device to validate.
+    int numaNode;        ///< The NUMA node of the device, -1 if unknown.
+
+    /**
+     * @brief Allocates a pinned host buffer on the NUMA node of the device.
+     * @param size The size of the buffer in bytes.
+     * @return Pointer to the page aligned buffer, or NULL if it cannot be allocated.
+     *
+     * Buffers are returned to HostMemoryPool, so later tests reuse them.
+     */
+    char* allocate_host_buffer(uint64_t size);
 
     /**
      * @brief Performs a DMA test.
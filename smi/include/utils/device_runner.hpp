@@ -0,0 +1,58 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#ifndef DEVICE_RUNNER_HPP
+#define DEVICE_RUNNER_HPP
+
+#include <chrono>
+#include <functional>
+#include <string>
+#include <vector>
+
+/**
+ * @brief Class for running a command on several devices at once.
+ *
+ * Programming a card takes tens of seconds, most of it waiting for the card to boot, so the
+ * devices of a multi-BDF command are handled concurrently, one thread per device.
+ */
+class DeviceRunner {
+   public:
+    /**
+     * @brief Struct reporting the command on one device.
+     */
+    struct Result {
+        std::string device;                 ///< The BDF of the device.
+        bool ok = false;                    ///< Whether the command succeeded.
+        std::string error;                  ///< Error message if the command failed.
+        std::chrono::milliseconds time{0};  ///< Duration of the command.
+    };
+
+    /**
+     * @brief Runs a command on every device concurrently and prints a summary.
+     *
+     * @param devices The BDFs of the devices.
+     * @param command The command, called with the BDF of a device. It fails by throwing.
+     * @return The result of the command on each device, in the order of the devices.
+     */
+    static std::vector<Result> run(const std::vector<std::string>& devices,
+                                   const std::function<void(const std::string&)>& command);
+};
+
+#endif  // DEVICE_RUNNER_HPP
@@ -0,0 +1,138 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#ifndef HOST_MEMORY_HPP
+#define HOST_MEMORY_HPP
+
+#include <cstddef>
+#include <cstdint>
+#include <map>
+#include <mutex>
+#include <string>
+#include <unordered_map>
+
+/**
+ * @brief Class for the pool of pinned host memory used as the local side of buffers.
+ *
+ * Blocks are mapped with 1 GiB or 2 MiB huge pages when they are large enough and the system has
+ * huge pages reserved, and with transparent huge pages otherwise. They are placed on the NUMA
+ * node of the card, locked in memory and faulted in when they are mapped, so DMA transfers
+ * neither cross the socket interconnect nor take page faults.
+ *
+ * Freed blocks are kept for reuse instead of being unmapped, up to a maximum number of cached
+ * bytes, so buffers created and destroyed in a loop do not pay for mapping and pinning again.
+ * The pool is shared by all threads of the process and is thread safe.
+ */
+class HostMemoryPool {
+    /**
+     * @brief Struct for a mapped block.
+     */
+    struct Block {
+        void* address = nullptr;  ///< Start of the mapping
+        size_t capacity = 0;      ///< Size of the mapping in bytes
+        int numaNode = -1;        ///< NUMA node the block was allocated for, -1 for any
+        bool locked = false;      ///< Whether the block is locked in memory
+    };
+
+    std::mutex mutex;                              ///< Protects the maps below
+    std::unordered_map<void*, Block> used;         ///< Allocated blocks by address
+    std::multimap<size_t, Block> available;        ///< Freed blocks by capacity
+    size_t cachedBytes = 0;                        ///< Bytes held by freed blocks
+    size_t maxCachedBytes;                         ///< Bytes above which freed blocks are unmapped
+
+    /**
+     * @brief Constructor for HostMemoryPool.
+     * @param maxCachedBytes The number of freed bytes kept for reuse.
+     */
+    HostMemoryPool(size_t maxCachedBytes);
+
+    /**
+     * @brief Maps, places and pins a new block.
+     * @param size The minimum size of the block in bytes.
+     * @param numaNode The NUMA node to place the block on, -1 for any.
+     * @return The mapped block.
+     * @throws std::bad_alloc If the block cannot be mapped.
+     */
+    static Block map(size_t size, int numaNode);
+
+    /**
+     * @brief Unmaps a block.
+     * @param block The block to unmap.
+     */
+    static void unmap(const Block& block);
+
+   public:
+    /// Default number of freed bytes kept for reuse
+    static constexpr size_t DEFAULT_MAX_CACHED_BYTES = 1ULL << 30;
+
+    /// Size of a transparent or 2 MiB huge page
+    static constexpr size_t HUGE_PAGE_SIZE = 2ULL << 20;
+
+    /// Size of a 1 GiB huge page
+    static constexpr size_t GIGANTIC_PAGE_SIZE = 1ULL << 30;
+
+    /**
+     * @brief Gets the pool of the process.
+     *
+     * The number of freed bytes kept for reuse is read from SMI_HOST_POOL_SIZE, 0 disables reuse.
+     *
+     * @return The pool.
+     */
+    static HostMemoryPool& getInstance();
+
+    /**
+     * @brief Gets the NUMA node of a PCIe device.
+     * @param bdf The Bus:Device.Function identifier, e.g. 21:00.0, or the bus alone.
+     * @return The NUMA node, or -1 if the device has no node or does not exist.
+     */
+    static int getNumaNode(const std::string& bdf);
+
+    /**
+     * @brief Allocates host memory, reusing a freed block if one fits.
+     * @param size The size in bytes.
+     * @param numaNode The NUMA node to allocate on, -1 for any.
+     * @return Page aligned memory, or nullptr if size is 0.
+     * @throws std::bad_alloc If the memory cannot be mapped.
+     */
+    void* allocate(size_t size, int numaNode = -1);
+
+    /**
+     * @brief Returns memory to the pool.
+     * @param address Memory returned by allocate, or nullptr.
+     * @throws std::invalid_argument If the memory was not allocated by the pool.
+     */
+    void deallocate(void* address);
+
+    /**
+     * @brief Unmaps all freed blocks.
+     */
+    void trim();
+
+    /**
+     * @brief Gets the number of bytes held by freed blocks.
+     * @return The number of cached bytes.
+     */
+    size_t getCachedBytes();
+
+    HostMemoryPool(const HostMemoryPool&) = delete;
+    HostMemoryPool& operator=(const HostMemoryPool&) = delete;
+};
+
+#endif  // HOST_MEMORY_HPP
@@ -47,9 +47,22 @@ class Vrtbin {
      *
      * @param source Path to the source VRTBIN file.
      * @param destination Path where the contents will be extracted.
+     *
+     * Extracting the same VRTBIN to the same destination again is skipped, so the devices of a
+     * multi-device command share one extraction.
      */
     static void extract(std::string source, std::string destination);
 
+    /**
+     * @brief Enables or disables the progress bar printed while programming.
+     *
+     * @param enabled Whether progressHandler prints a progress bar.
+     *
+     * Disabled when several devices are programmed at once, whose progress bars would overwrite
+     * each other.
+     */
+    static void setProgress(bool enabled);
+
     /**
      * @brief Copies a VRTBIN file.
      *
@@ -58,6 +71,16 @@ class Vrtbin {
      */
     static void copy(const std::string& source, const std::string& destination);
 
+    /**
+     * @brief Copies an optional file of a VRTBIN.
+     *
+     * @param source Path to the source file.
+     * @param destination Path where the file will be copied.
+     *
+     * If the source does not exist, a destination left over from a previous VRTBIN is removed.
+     */
+    static void copyOptional(const std::string& source, const std::string& destination);
+
     /**
      * @brief Handler for progress events during VRTBIN operations.
      *
@@ -24,6 +24,7 @@
 
 #include <iostream>
 #include <regex>
+#include <sstream>
 
 ArgParser::ArgParser() {
     addCommand("query", [this]() { currentCommand = "query"; });
@@ -41,6 +42,7 @@ void ArgParser::parse(int argc, char* argv[]) {
     static struct option long_options[] = {{"device", required_argument, 0, 'd'},
                                            {"image", required_argument, 0, 'i'},
                                            {"partition", required_argument, 0, 'p'},
+                                           {"force", no_argument, 0, 'f'},
                                            {"help", no_argument, 0, 'h'},
                                            {0, 0, 0, 0}};
 
@@ -68,17 +70,29 @@ void ArgParser::parse(int argc, char* argv[]) {
             break;
         }
     }
-    while ((opt = getopt_long(argc, argv, "d:i:p:h", long_options, &option_index)) != -1) {
+    while ((opt = getopt_long(argc, argv, "d:i:p:fh", long_options, &option_index)) != -1) {
         switch (opt) {
-            case 'd':
-                device = convertBdf(optarg);
+            case 'd': {
+                devices.clear();
+                std::stringstream list(optarg);
+                std::string bdf;
+                while (std::getline(list, bdf, ',')) {
+                    if (!bdf.empty()) {
+                        devices.push_back(convertBdf(bdf));
+                    }
+                }
+                device = devices.empty() ? "" : devices.front();
                 break;
+            }
             case 'i':
                 image = optarg;
                 break;
             case 'p':
                 partition = std::stoi(optarg);
                 break;
+            case 'f':
+                force = true;
+                break;
             case 'h':
                 printHelp();
                 exit(EXIT_SUCCESS);
@@ -164,6 +178,8 @@ void ArgParser::parse(int argc, char* argv[]) {
 
 std::string ArgParser::getDevice() const { return device; }
 
+std::vector<std::string> ArgParser::getDevices() const { return devices; }
+
 bool ArgParser::isCommand(const std::string& command) const { return currentCommand == command; }
 
 void ArgParser::printHelp() const {
@@ -180,11 +196,15 @@ void ArgParser::printHelp() const {
         << "  reload               Reloads the PCIe handler for device\n"
         << "  reset                Resets the device to a clean state\n"
         << "Options:\n"
-        << "  -d, --device <device>  Specify the device (e.g., 21:00.0)\n"
+        << "  -d, --device <device>  Specify the device (e.g., 21:00.0). program, partial_program, "
+           "reload and reset accept a comma separated list (e.g., 21:00.0,e2:00.0) and run on "
+           "all devices at once\n"
         << "  -i, --image <image>    Specify the image file to program. Only relevant for "
            "program/partial_program commands\n"
         << "  -p, --partition <num>  Specify the partition to program. Only relevant for program "
            "command\n"
+        << "  -f, --force            Program even if the device already runs the image's logic "
+           "UUID. Only relevant for program/partial_program commands\n"
         << "  -h, --help             Show this help message\n";
 }
 
@@ -213,6 +233,8 @@ std::string ArgParser::getImagePath() const { return image; }
 
 uint8_t ArgParser::getPartition() const { return partition; }
 
+bool ArgParser::isForce() const { return force; }
+
 bool ArgParser::endsWith(const std::string& str, const std::string& suffix) {
     return str.size() >= suffix.size() &&
            str.compare(str.size() - suffix.size(), suffix.size(), suffix) == 0;
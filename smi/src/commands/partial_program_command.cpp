@@ -23,9 +23,10 @@
 #include "utils/filesystem_cache.hpp"
 
 PartialProgramCommand::PartialProgramCommand(const std::string& device,
-                                             const std::string& image_path) {
+                                             const std::string& image_path, bool force) {
     this->device = device;
     this->imagePath = image_path;
+    this->force = force;
     this->dev = nullptr;
     if (ami_dev_find(device.c_str(), &dev) != AMI_STATUS_OK) {
         std::cerr << "Error finding ami device: " << device << std::endl;
@@ -46,7 +47,8 @@ void PartialProgramCommand::execute() {
     uint16_t dev_bdf;
     ami_dev_get_pci_bdf(dev, &dev_bdf);
 
-    if (ArgParser::endsWith(this->imagePath, ".vrtbin")) {
+    bool isVrtbin = ArgParser::endsWith(this->imagePath, ".vrtbin");
+    if (isVrtbin) {
         Vrtbin::extract(this->imagePath, FilesystemCache::getCachePath());
         std::string ami_path = std::string(std::getenv("AMI_HOME"));
         std::string create_path = "mkdir -p " + ami_path + "/" + device + ":00.0/";
@@ -55,29 +57,10 @@ void PartialProgramCommand::execute() {
         Vrtbin::copy(FilesystemCache::getCachePath() / "system_map.xml", basePath + "system_map.xml");
         Vrtbin::copy(FilesystemCache::getCachePath() / "version.json", basePath + "version.json");
         Vrtbin::copy(FilesystemCache::getCachePath() / "report_utilization.xml", basePath + "report_utilization.xml");
+        Vrtbin::copyOptional(FilesystemCache::getCachePath() / "report_utilization.bin", basePath + "report_utilization.bin");
         imagePath = FilesystemCache::getCachePath() / "design.pdi";
     }
 
-    int ret = ami_prog_device_boot(&dev, 1);  // segmented PDI is on partition 1
-
-    if (ret != AMI_STATUS_OK && geteuid() == 0) {
-        throw std::runtime_error("Error booting device to partition 1");
-    }
-
-    ami_mem_bar_write(dev, 0, 0x1040000,
-                      1);  // PMC GPIO. this is needed for reset PDI into partition 1
-    ami_dev_delete(&dev);
-    pcieDriverHandler.execute(PcieDriverHandler::Command::REMOVE);
-    pcieDriverHandler.execute(PcieDriverHandler::Command::TOGGLE_SBR);
-    usleep(5000000);
-    pcieDriverHandler.execute(PcieDriverHandler::Command::RESCAN);
-    pcieDriverHandler.execute(PcieDriverHandler::Command::HOTPLUG);
-
-    if (ami_dev_find(device.c_str(), &dev) != AMI_STATUS_OK) {
-        std::cerr << "Error finding ami device: " << device << std::endl;
-        throw std::runtime_error("Error finding device");
-    }
-
     found_current_uuid = ami_dev_read_uuid(dev, current_uuid);
     found_new_uuid = Vrtbin::extractUUID().empty() ? AMI_STATUS_ERROR : AMI_STATUS_OK;
     new_uuid = Vrtbin::extractUUID().substr(0, 32);
@@ -98,12 +81,36 @@ void PartialProgramCommand::execute() {
         ((found_current_uuid != AMI_STATUS_OK) ? ("N/A") : (current_uuid)),
         ((found_new_uuid != AMI_STATUS_OK) ? ("N/A") : (new_uuid.c_str())), imagePath.c_str());
 
-    if (new_uuid == current_uuid) {
-        std::cout << "Device configured with the same image.\n";
+    // Checked before booting into the base PDI, which replaces the running design. A .pdi has
+    // no version.json, so only vrtbins are compared.
+    if (!force && isVrtbin && found_current_uuid == AMI_STATUS_OK &&
+        found_new_uuid == AMI_STATUS_OK && std::string(current_uuid).substr(0, 32) == new_uuid) {
+        std::cout << "Device already configured with the same image, skipping programming. "
+                     "Use --force to program it anyway.\n";
         ami_dev_delete(&dev);
         return;
     }
 
+    int ret = ami_prog_device_boot(&dev, 1);  // segmented PDI is on partition 1
+
+    if (ret != AMI_STATUS_OK && geteuid() == 0) {
+        throw std::runtime_error("Error booting device to partition 1");
+    }
+
+    ami_mem_bar_write(dev, 0, 0x1040000,
+                      1);  // PMC GPIO. this is needed for reset PDI into partition 1
+    ami_dev_delete(&dev);
+    pcieDriverHandler.execute(PcieDriverHandler::Command::REMOVE);
+    pcieDriverHandler.execute(PcieDriverHandler::Command::TOGGLE_SBR);
+    usleep(5000000);
+    pcieDriverHandler.execute(PcieDriverHandler::Command::RESCAN);
+    pcieDriverHandler.execute(PcieDriverHandler::Command::HOTPLUG);
+
+    if (ami_dev_find(device.c_str(), &dev) != AMI_STATUS_OK) {
+        std::cerr << "Error finding ami device: " << device << std::endl;
+        throw std::runtime_error("Error finding device");
+    }
+
     if (ami_dev_request_access(dev) != AMI_STATUS_OK) {
         std::cerr << "Error requesting access to ami device: " << device << std::endl;
         throw std::runtime_error("Error requesting access to device");
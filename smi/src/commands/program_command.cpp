@@ -22,10 +22,11 @@
 #include "utils/filesystem_cache.hpp"
 
 ProgramCommand::ProgramCommand(const std::string& device, const std::string& image_path,
-                               uint8_t partition) {
+                               uint8_t partition, bool force) {
     this->device = device;
     this->imagePath = image_path;
     this->partition = partition;
+    this->force = force;
     this->dev = nullptr;
     if (ami_dev_find(device.c_str(), &dev) != AMI_STATUS_OK) {
         std::cerr << "Error finding ami device: " << device << std::endl;
@@ -51,6 +52,7 @@ void ProgramCommand::execute() {
         Vrtbin::copy(FilesystemCache::getCachePath() / "system_map.xml", basePath + "system_map.xml");
         Vrtbin::copy(FilesystemCache::getCachePath() / "version.json", basePath + "version.json");
         Vrtbin::copy(FilesystemCache::getCachePath() / "report_utilization.xml", basePath + "report_utilization.xml");
+        Vrtbin::copyOptional(FilesystemCache::getCachePath() / "report_utilization.bin", basePath + "report_utilization.bin");
         imagePath = FilesystemCache::getCachePath() / "design.pdi";
     }
 
@@ -79,6 +81,13 @@ void ProgramCommand::execute() {
         ((found_new_uuid != AMI_STATUS_OK) ? ("N/A") : (new_uuid.c_str())), imagePath.c_str(),
         partition);
 
+    if (!force && extension == ImageType::VRTBIN && found_current_uuid == AMI_STATUS_OK &&
+        found_new_uuid == AMI_STATUS_OK && std::string(current_uuid).substr(0, 32) == new_uuid) {
+        std::cout << "Device already configured with the same image, skipping programming. "
+                     "Use --force to program it anyway.\n";
+        return;
+    }
+
     if (ami_dev_request_access(dev) != AMI_STATUS_OK) {
         std::cerr << "Error requesting access to ami device: " << device << std::endl;
         throw std::runtime_error("Error requesting access to device");
@@ -28,10 +28,97 @@ ResourceCommand::ResourceCommand(const std::string& device) : device(device) {
     }
     char filePath[1024];
     sprintf(filePath, RESOURCE_UTILIZATION_FILE, amiHome.c_str(), device.c_str());
-    parseXML(std::string(filePath));
+    char binaryPath[1024];
+    sprintf(binaryPath, RESOURCE_UTILIZATION_BINARY_FILE, amiHome.c_str(), device.c_str());
+    if (!loadBinary(std::string(binaryPath), std::string(filePath))) {
+        parseXML(std::string(filePath));
+    }
     printResources();
 }
 
+bool ResourceCommand::loadBinary(const std::string& filename, const std::string& xmlFilename) {
+    static constexpr char magic[8] = {'V', 'R', 'T', 'U', 'T', 'I', 'L', '\0'};
+    static constexpr size_t numResources = 9;
+
+    struct stat xmlStat;
+    if (stat(xmlFilename.c_str(), &xmlStat) != 0) {
+        return false;
+    }
+    int fd = open(filename.c_str(), O_RDONLY);
+    if (fd < 0) {
+        return false;
+    }
+    struct stat binaryStat;
+    if (fstat(fd, &binaryStat) != 0 ||
+        static_cast<size_t>(binaryStat.st_size) < sizeof(UtilizationBinaryHeader)) {
+        close(fd);
+        return false;
+    }
+    size_t size = binaryStat.st_size;
+    void* data = mmap(nullptr, size, PROT_READ, MAP_PRIVATE, fd, 0);
+    close(fd);
+    if (data == MAP_FAILED) {
+        return false;
+    }
+
+    const auto* header = static_cast<const UtilizationBinaryHeader*>(data);
+    size_t count = header->count;
+    size_t columnsSize = count * sizeof(uint32_t) * (3 + 2 * numResources);
+    // The XML size ties the binary file to the XML file it was generated with
+    bool valid = std::memcmp(header->magic, magic, sizeof(magic)) == 0 && header->version == 1 &&
+                 header->xmlSize == static_cast<uint64_t>(xmlStat.st_size) &&
+                 size == sizeof(UtilizationBinaryHeader) + columnsSize + header->stringsSize;
+    const char* base = static_cast<const char*>(data) + sizeof(UtilizationBinaryHeader);
+    const char* strings = base + columnsSize;
+    if (valid && header->stringsSize > 0 && strings[header->stringsSize - 1] != '\0') {
+        valid = false;
+    }
+    if (!valid) {
+        munmap(data, size);
+        return false;
+    }
+
+    const int32_t* parents = reinterpret_cast<const int32_t*>(base);
+    const uint32_t* names = reinterpret_cast<const uint32_t*>(parents + count);
+    const uint32_t* modules = names + count;
+    const int32_t* counts = reinterpret_cast<const int32_t*>(modules + count);
+    const float* percentages = reinterpret_cast<const float*>(counts + numResources * count);
+    std::pair<int, float> Instance::*resources[numResources] = {
+        &Instance::totalLUTs, &Instance::logicLUTs, &Instance::lutRAMs,
+        &Instance::srls,      &Instance::ffs,       &Instance::ramb36,
+        &Instance::ramb18,    &Instance::uram,      &Instance::dspBlocks};
+
+    std::vector<Instance> instances(count);
+    std::vector<int32_t> parentIndices(parents, parents + count);
+    for (size_t i = 0; i < count; i++) {
+        if (names[i] >= header->stringsSize || modules[i] >= header->stringsSize ||
+            parents[i] < -1 || parents[i] >= static_cast<int32_t>(i)) {
+            valid = false;
+            break;
+        }
+        instances[i].name = strings + names[i];
+        instances[i].module = strings + modules[i];
+        for (size_t r = 0; r < numResources; r++) {
+            instances[i].*resources[r] = {counts[r * count + i], percentages[r * count + i]};
+        }
+    }
+    munmap(data, size);
+    if (!valid) {
+        return false;
+    }
+
+    // Children come after their parent, so walking backwards completes every instance before
+    // it is moved into its parent.
+    rootInstance = Instance();
+    for (size_t i = count; i-- > 0;) {
+        std::reverse(instances[i].children.begin(), instances[i].children.end());
+        Instance& parent = parentIndices[i] < 0 ? rootInstance : instances[parentIndices[i]];
+        parent.children.push_back(std::move(instances[i]));
+    }
+    std::reverse(rootInstance.children.begin(), rootInstance.children.end());
+    return true;
+}
+
 void ResourceCommand::parseXML(const std::string& filename) {
     xmlDoc* doc = xmlReadFile(filename.c_str(), NULL, 0);
     if (doc == NULL) {
@@ -30,9 +30,20 @@
 #include <iostream>
 #include <sstream>
 
+#include "utils/host_memory.hpp"
+
 static std::atomic<double> pci_bw_result(0);
 
-ValidateCommand::ValidateCommand(const std::string& device) : device(device) {}
+ValidateCommand::ValidateCommand(const std::string& device)
+    : device(device), numaNode(HostMemoryPool::getNumaNode(device)) {}
+
+char* ValidateCommand::allocate_host_buffer(uint64_t size) {
+    try {
+        return static_cast<char*>(HostMemoryPool::getInstance().allocate(size, numaNode));
+    } catch (const std::bad_alloc&) {
+        return NULL;
+    }
+}
 
 void ValidateCommand::execute() {
     if (device.empty()) {
@@ -127,11 +138,11 @@ std::size_t ValidateCommand::test_dma_write(const std::string& devname, uint64_t
         fprintf(stderr, "unable to open device %s, %d.\n", devname.c_str(), fpga_fd);
         return EXIT_FAILURE;
     }
-    posix_memalign((void**)&allocated, 4096 /*alignment */, size + 4096);
+    allocated = allocate_host_buffer(size + 4096);
     if (!allocated) {
         fprintf(stderr, "OOM %lu.\n", size + 4096);
         close(fpga_fd);
-        free(allocated);
+        HostMemoryPool::getInstance().deallocate(allocated);
         return EXIT_FAILURE;
     }
     buffer = allocated + offset;
@@ -144,7 +155,7 @@ std::size_t ValidateCommand::test_dma_write(const std::string& devname, uint64_t
         if (ret < 0) {
             fprintf(stderr, "Could not write to device buffer.\n");
             close(fpga_fd);
-            free(allocated);
+            HostMemoryPool::getInstance().deallocate(allocated);
             return EXIT_FAILURE;
         }
         clock_gettime(CLOCK_MONOTONIC, &ts_end);
@@ -161,7 +172,7 @@ std::size_t ValidateCommand::test_dma_write(const std::string& devname, uint64_t
     print_results(devname, addr, total_time, avg_time, size, result, TEST_TYPE_WRITE, verbose);
     // pthread_mutex_unlock(&print_mutex);
     close(fpga_fd);
-    free(allocated);
+    HostMemoryPool::getInstance().deallocate(allocated);
     return 0;
 }
 
@@ -180,11 +191,11 @@ std::size_t ValidateCommand::test_dma_read(const std::string& devname, uint64_t
         fprintf(stderr, "unable to open device %s, %d.\n", devname.c_str(), fpga_fd);
         return 1;
     }
-    posix_memalign((void**)&allocated, 4096 /*alignment */, size + 4096);
+    allocated = allocate_host_buffer(size + 4096);
     if (!allocated) {
         fprintf(stderr, "OOM %lu.\n", size + 4096);
         close(fpga_fd);
-        free(allocated);
+        HostMemoryPool::getInstance().deallocate(allocated);
         return EXIT_FAILURE;
     }
     buffer = allocated + offset;
@@ -197,7 +208,7 @@ std::size_t ValidateCommand::test_dma_read(const std::string& devname, uint64_t
         if (ret < 0) {
             fprintf(stderr, "Could not read to device buffer.\n");
             close(fpga_fd);
-            free(allocated);
+            HostMemoryPool::getInstance().deallocate(allocated);
             return 1;
         }
         clock_gettime(CLOCK_MONOTONIC, &ts_end);
@@ -217,7 +228,7 @@ std::size_t ValidateCommand::test_dma_read(const std::string& devname, uint64_t
     this->print_results(devname, addr, total_time, avg_time, size, result, TEST_TYPE_READ, verbose);
     // pthread_mutex_unlock(&print_mutex);
     close(fpga_fd);
-    free(allocated);
+    HostMemoryPool::getInstance().deallocate(allocated);
     return 0;
 }
 
@@ -488,11 +499,11 @@ double ValidateCommand::test_dma_write_pcie(const std::string& devname, uint64_t
         fprintf(stderr, "unable to open device %s, %d.\n", devname.c_str(), fpga_fd);
         return EXIT_FAILURE;
     }
-    posix_memalign((void**)&allocated, 4096 /*alignment */, size + 4096);
+    allocated = allocate_host_buffer(size + 4096);
     if (!allocated) {
         fprintf(stderr, "OOM %lu.\n", size + 4096);
         close(fpga_fd);
-        free(allocated);
+        HostMemoryPool::getInstance().deallocate(allocated);
         return EXIT_FAILURE;
     }
     buffer = allocated + offset;
@@ -505,7 +516,7 @@ double ValidateCommand::test_dma_write_pcie(const std::string& devname, uint64_t
         if (ret < 0) {
             fprintf(stderr, "Could not write to device buffer.\n");
             close(fpga_fd);
-            free(allocated);
+            HostMemoryPool::getInstance().deallocate(allocated);
             return EXIT_FAILURE;
         }
         clock_gettime(CLOCK_MONOTONIC, &ts_end);
@@ -519,7 +530,7 @@ double ValidateCommand::test_dma_write_pcie(const std::string& devname, uint64_t
     avg_time = (double)total_time / (double)count;
     result = ((double)size) / avg_time;
     close(fpga_fd);
-    free(allocated);
+    HostMemoryPool::getInstance().deallocate(allocated);
     return result;
 }
 
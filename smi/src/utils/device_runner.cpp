@@ -0,0 +1,63 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#include "utils/device_runner.hpp"
+
+#include <cstdio>
+#include <exception>
+#include <thread>
+
+std::vector<DeviceRunner::Result> DeviceRunner::run(
+    const std::vector<std::string>& devices,
+    const std::function<void(const std::string&)>& command) {
+    std::vector<Result> results(devices.size());
+    std::vector<std::thread> threads;
+    for (size_t i = 0; i < devices.size(); i++) {
+        threads.emplace_back([&, i]() {
+            Result& result = results[i];
+            result.device = devices[i];
+            auto start = std::chrono::steady_clock::now();
+            try {
+                command(devices[i]);
+                result.ok = true;
+            } catch (const std::exception& e) {
+                result.error = e.what();
+            } catch (...) {
+                result.error = "unknown error";
+            }
+            result.time = std::chrono::duration_cast<std::chrono::milliseconds>(
+                std::chrono::steady_clock::now() - start);
+        });
+    }
+    for (auto& thread : threads) {
+        thread.join();
+    }
+
+    printf(
+        "\r\n----------------------------------------------\r\n"
+        "Device | Result | Time (s)\r\n"
+        "----------------------------------------------\r\n");
+    for (const auto& result : results) {
+        printf("%-6s | %-6s | %.1f %s\r\n", result.device.c_str(), result.ok ? "OK" : "FAILED",
+               result.time.count() / 1000.0, result.error.c_str());
+    }
+    printf("----------------------------------------------\r\n");
+    return results;
+}
@@ -21,7 +21,23 @@
 #include "utils/vrtbin.hpp"
 #include "utils/filesystem_cache.hpp"
 
+#include <atomic>
+#include <mutex>
+
+namespace {
+std::mutex extractMutex;               // Serializes extractions into the shared cache directory
+std::string lastExtracted;             // Source and destination of the last extraction
+std::atomic<bool> showProgress{true};  // Whether progressHandler prints a progress bar
+}  // namespace
+
 void Vrtbin::extract(std::string source, std::string destination) {
+    // The devices of a multi-device command extract the same vrtbin from several threads
+    std::lock_guard<std::mutex> lock(extractMutex);
+    if (lastExtracted == source + "\n" + destination) {
+        return;
+    }
+    // Older vrtbins have no binary utilization report, don't pick up the one of another vrtbin
+    std::filesystem::remove(std::filesystem::path(destination) / "report_utilization.bin");
     std::string command = "tar -xvf " + source + " -C " + destination + " 2>&1";
     std::array<char, 128> buffer;
     std::string result;
@@ -34,8 +50,11 @@ void Vrtbin::extract(std::string source, std::string destination) {
     while (fgets(buffer.data(), buffer.size(), pipe.get()) != nullptr) {
         result += buffer.data();
     }
+    lastExtracted = source + "\n" + destination;
 }
 
+void Vrtbin::setProgress(bool enabled) { showProgress = enabled; }
+
 void Vrtbin::copy(const std::string& source, const std::string& destination) {
     std::ifstream src(source, std::ios::binary);
     if (!src) {
@@ -62,6 +81,14 @@ void Vrtbin::copy(const std::string& source, const std::string& destination) {
     }
 }
 
+void Vrtbin::copyOptional(const std::string& source, const std::string& destination) {
+    if (std::filesystem::exists(source)) {
+        copy(source, destination);
+    } else {
+        std::filesystem::remove(destination);
+    }
+}
+
 std::string Vrtbin::extractUUID() {
     std::string uuid;
     std::ifstream jsonFile(FilesystemCache::getCachePath() / "version.json");
@@ -85,7 +112,7 @@ std::string Vrtbin::extractUUID() {
 void Vrtbin::progressHandler(enum ami_event_status status, uint64_t ctr, void* data) {
     struct ami_pdi_progress* prog = NULL;
 
-    if (!data) return;
+    if (!data || !showProgress) return;
 
     prog = (struct ami_pdi_progress*)data;
 
@@ -30,6 +30,25 @@
 #include "commands/reset_command.hpp"
 #include "commands/resource_command.hpp"
 #include "commands/validate_command.hpp"
+#include "utils/device_runner.hpp"
+#include "utils/vrtbin.hpp"
+
+/**
+ * Runs a command on the device, or on all devices at once if several were given.
+ */
+int runOnDevices(const ArgParser& parser, const std::function<void(const std::string&)>& command) {
+    std::vector<std::string> devices = parser.getDevices();
+    if (devices.size() <= 1) {
+        command(parser.getDevice());
+        return EXIT_SUCCESS;
+    }
+    Vrtbin::setProgress(false);
+    bool ok = true;
+    for (const auto& result : DeviceRunner::run(devices, command)) {
+        ok = ok && result.ok;
+    }
+    return ok ? EXIT_SUCCESS : EXIT_FAILURE;
+}
 
 int main(int argc, char* argv[]) {
     ArgParser parser;
@@ -55,21 +74,30 @@ int main(int argc, char* argv[]) {
         ListCommand listCommand(0x10ee, 0x50b4);
         listCommand.execute();
     } else if (parser.isCommand("program")) {
-        ProgramCommand programCommand(parser.getDevice(), parser.getImagePath(),
-                                      parser.getPartition());
-        programCommand.execute();
+        return runOnDevices(parser, [&parser](const std::string& device) {
+            ProgramCommand programCommand(device, parser.getImagePath(), parser.getPartition(),
+                                          parser.isForce());
+            programCommand.execute();
+        });
     } else if (parser.isCommand("partial_program")) {
-        PartialProgramCommand partialProgramCommand(parser.getDevice(), parser.getImagePath());
-        partialProgramCommand.execute();
+        return runOnDevices(parser, [&parser](const std::string& device) {
+            PartialProgramCommand partialProgramCommand(device, parser.getImagePath(),
+                                                        parser.isForce());
+            partialProgramCommand.execute();
+        });
     } else if (parser.isCommand("inspect")) {
         InspectCommand inspectCommand(parser.getImagePath());
         inspectCommand.execute();
     } else if (parser.isCommand("reload")) {
-        ReloadCommand reloadCommand(parser.getDevice());
-        reloadCommand.execute();
+        return runOnDevices(parser, [](const std::string& device) {
+            ReloadCommand reloadCommand(device);
+            reloadCommand.execute();
+        });
     } else if (parser.isCommand("reset")) {
-        ResetCommand resetCommand(parser.getDevice());
-        resetCommand.execute();
+        return runOnDevices(parser, [](const std::string& device) {
+            ResetCommand resetCommand(device);
+            resetCommand.execute();
+        });
     } else {
         parser.printHelp();
     }
@@ -18,97 +18,160 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 # ##################################################################################################
 
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
 import argparse
-
-def read_input_file(file_path):
-    with open(file_path, 'r') as file:
-        return file.read()
-
-def add_instance(parent, instance, module, total_luts, logic_luts, lutrams, srls, ffs, ramb36, ramb18, uram, dsp_blocks):
-    instance_element = ET.SubElement(parent, "Instance")
-    ET.SubElement(instance_element, "Name").text = instance.strip()
-    ET.SubElement(instance_element, "Module").text = module.strip()
-    ET.SubElement(instance_element, "TotalLUTs").text = total_luts.strip()
-    ET.SubElement(instance_element, "LogicLUTs").text = logic_luts.strip()
-    ET.SubElement(instance_element, "LUTRAMs").text = lutrams.strip()
-    ET.SubElement(instance_element, "SRLs").text = srls.strip()
-    ET.SubElement(instance_element, "FFs").text = ffs.strip()
-    ET.SubElement(instance_element, "RAMB36").text = ramb36.strip()
-    ET.SubElement(instance_element, "RAMB18").text = ramb18.strip()
-    ET.SubElement(instance_element, "URAM").text = uram.strip()
-    ET.SubElement(instance_element, "DSPBlocks").text = dsp_blocks.strip()
-    return instance_element
-
-def main(resource_file):
-    root = ET.Element("UtilizationReport")
-
-    input_text = read_input_file(resource_file)
-
-    table_start = input_text.find("+---------------------------+")
-    table_end = input_text.rfind("+---------------------------+")
-    table_text = input_text[table_start:table_end + len("+---------------------------+")]
-
-    lines = table_text.splitlines()
-
-    current_parents = {0: root}
-
-    for line in lines[1:]:
-        parts = line.split('|')
-        print(parts)
-        
-        if len(parts) < 13:
-            continue
-        
-        leading_whitespace = parts[1][:len(parts[1]) - len(parts[1].lstrip())]
-        fields = [part.strip() for part in parts[1:]]
-
-        if len(fields) < 12:
-            continue
-
-        instance = fields[0]
-        module = fields[1]
-        total_luts = fields[2]
-        logic_luts = fields[3]
-        lutrams = fields[4]
-        srls = fields[5]
-        ffs = fields[6]
-        ramb36 = fields[7]
-        ramb18 = fields[8]
-        uram = fields[9]
-        dsp_blocks = fields[10]
-
-        level = len(leading_whitespace)
-        print(f"Instance: {instance}, Level: {level}, Leading whitespace: '{leading_whitespace}'")
-
-        if level not in current_parents:
-            valid_levels = sorted(current_parents.keys())
-            for valid_level in reversed(valid_levels):
-                if valid_level < level:
-                    level = valid_level + 1
+import os
+import re
+import struct
+import sys
+from array import array
+from xml.sax.saxutils import XMLGenerator
+
+FIELDS = ["Name", "Module", "TotalLUTs", "LogicLUTs", "LUTRAMs", "SRLs", "FFs", "RAMB36", "RAMB18", "URAM", "DSPBlocks"]
+INDENT = "  "
+
+# Columnar sidecar of the XML report, read by v80-smi with a single mmap. Little endian:
+#   header   magic "VRTUTIL\0", u32 version, u32 instance count, u32 string table size,
+#            u32 reserved, u64 size of the XML report it was generated with
+#   columns  i32 parent index (-1 for top level instances, parents come before children)
+#            u32 name offset, u32 module offset (into the string table)
+#            i32 count[9][instances], f32 percentage[9][instances] in FIELDS[2:] order
+#   strings  NUL terminated names and modules
+BINARY_MAGIC = b"VRTUTIL\0"
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct("<8sIIIIQ")
+VALUE_RE = re.compile(r"(\d+)\((\d+\.\d+)%\)")
+
+class UtilizationColumns:
+    """Instances of the report as numeric columns plus a string table"""
+
+    def __init__(self):
+        self.parents = array('i')
+        self.names = array('I')
+        self.modules = array('I')
+        self.counts = [array('i') for _ in FIELDS[2:]]
+        self.percentages = [array('f') for _ in FIELDS[2:]]
+        self.strings = bytearray()
+
+    def add_string(self, value):
+        offset = len(self.strings)
+        self.strings += value.encode("utf-8") + b"\0"
+        return offset
+
+    def add(self, parent, fields):
+        """Add an instance and return its index"""
+        self.parents.append(parent)
+        self.names.append(self.add_string(fields[0]))
+        self.modules.append(self.add_string(fields[1]))
+        for i, value in enumerate(fields[2:]):
+            # Same rule as the XML reader of v80-smi: anything but "N(P.P%)" is 0
+            match = VALUE_RE.search(value)
+            self.counts[i].append(int(match.group(1)) if match else 0)
+            self.percentages[i].append(float(match.group(2)) if match else 0.0)
+        return len(self.parents) - 1
+
+    def write(self, output_file, xml_size):
+        with open(output_file, "wb") as f:
+            f.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, len(self.parents), len(self.strings), 0, xml_size))
+            for column in [self.parents, self.names, self.modules] + self.counts + self.percentages:
+                if sys.byteorder != "little":
+                    column = array(column.typecode, column)
+                    column.byteswap()
+                column.tofile(f)
+            f.write(self.strings)
+
+def parse_rows(resource_file):
+    """
+    Read the hierarchical utilization table one line at a time and yield (level, fields) for
+    every instance row. The level is the indentation of the instance name in the table.
+    """
+    borders = 0
+    with open(resource_file, 'r') as file:
+        for line in file:
+            if line.startswith("+-"):
+                borders += 1
+                # The table is closed by its third border
+                if borders == 3:
                     break
+                continue
+            # Skip the report preamble and the table header
+            if borders < 2:
+                continue
+
+            parts = line.rstrip("\n").split('|')
+            if len(parts) < 13:
+                continue
+
+            level = len(parts[1]) - len(parts[1].lstrip())
+            yield level, [part.strip() for part in parts[1:len(FIELDS) + 1]]
+
+def write_report(rows, output_file, verbose=False, columns=None):
+    """
+    Write the instances as nested XML elements while they are read. An instance is closed as
+    soon as a row at the same or a lower indentation level shows up. Instances are also added
+    to `columns` when given.
+    """
+    count = 0
+    with open(output_file, "w", encoding="utf-8") as f:
+        xml = XMLGenerator(f, encoding="utf-8")
+        xml.startDocument()
+        xml.startElement("UtilizationReport", {})
+        open_levels = []
+        open_indices = []
+        for level, fields in rows:
+            if verbose:
+                print(f"Instance: {fields[0]}, Level: {level}")
+            while open_levels and open_levels[-1] >= level:
+                open_levels.pop()
+                open_indices.pop()
+                xml.ignorableWhitespace("\n" + INDENT * (len(open_levels) + 1))
+                xml.endElement("Instance")
+
+            if columns is not None:
+                open_indices.append(columns.add(open_indices[-1] if open_indices else -1, fields))
             else:
-                level = 0
-
-        parent_level = max(level - 1, 0)
-        current_parents[level] = add_instance(current_parents[parent_level], instance, module, total_luts, logic_luts, lutrams, srls, ffs, ramb36, ramb18, uram, dsp_blocks)
-        current_parents[level + 1] = current_parents[level]
-
-    tree = ET.ElementTree(root)
-
-    xml_str = ET.tostring(root, encoding='utf-8')
-
-    parsed_xml = minidom.parseString(xml_str)
-    pretty_xml_str = parsed_xml.toprettyxml(indent="  ")
-
-    with open("build/utilization_report.xml", "w", encoding="utf-8") as f:
-        f.write(pretty_xml_str)
-
-    print("XML file created successfully.")
+                open_indices.append(-1)
+            open_levels.append(level)
+            depth = len(open_levels)
+            xml.ignorableWhitespace("\n" + INDENT * depth)
+            xml.startElement("Instance", {})
+            for tag, value in zip(FIELDS, fields):
+                xml.ignorableWhitespace("\n" + INDENT * (depth + 1))
+                xml.startElement(tag, {})
+                xml.characters(value)
+                xml.endElement(tag)
+            count += 1
+
+        while open_levels:
+            open_levels.pop()
+            xml.ignorableWhitespace("\n" + INDENT * (len(open_levels) + 1))
+            xml.endElement("Instance")
+        xml.ignorableWhitespace("\n")
+        xml.endElement("UtilizationReport")
+        xml.ignorableWhitespace("\n")
+        xml.endDocument()
+    return count
+
+def main(resource_file, output_file="build/utilization_report.xml", verbose=False, binary_file=None):
+    if os.path.dirname(output_file):
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    columns = UtilizationColumns()
+    count = write_report(parse_rows(resource_file), output_file, verbose, columns)
+    print(f"XML file created successfully ({count} instances): {output_file}")
+
+    binary_file = binary_file or os.path.splitext(output_file)[0] + ".bin"
+    columns.write(binary_file, os.path.getsize(output_file))
+    print(f"Binary file created successfully: {binary_file}")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Generate XML utilization report.')
     parser.add_argument('--resource_file', type=str, required=True, help='Path to the resource file')
+    parser.add_argument('--output_file', type=str, default='build/utilization_report.xml',
+                        help='Path to the generated XML file (default: %(default)s)')
+    parser.add_argument('--binary_file', type=str,
+                        help='Path to the generated binary file (default: the XML file with a .bin extension)')
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument('--quiet', dest='verbose', action='store_false', help='Only report the result (default)')
+    output.add_argument('--verbose', dest='verbose', action='store_true', help='Print every parsed instance')
+    parser.set_defaults(verbose=False)
     args = parser.parse_args()
-    main(args.resource_file)
\ No newline at end of file
+    main(args.resource_file, args.output_file, args.verbose, args.binary_file)
@@ -20,13 +20,19 @@
 
 #include "sim.hpp"
 
+#include <fcntl.h>
 #include <json/json.h>
 #include <signal.h>
 #include <stdlib.h>
 #include <string.h>
+#include <sys/mman.h>
 #include <unistd.h>
 
+#include <algorithm>
 #include <condition_variable>
+#include <cstring>
+#include <iostream>
+#include <map>
 #include <mutex>
 #include <queue>
 #include <string>
@@ -517,6 +523,118 @@ void fetchScalar(ap_uint<64> addr, uint32_t& data) {
     }
 }
 
+void writeScalar(ap_uint<64> addr, uint32_t val) {
+    {
+        std::unique_lock<std::mutex> lock(mtx);
+        cv_control_write.wait(lock, [] { return !control_write_busy; });
+        control_write_busy = true;
+        axiWriteAddr.push(addr);
+        axiWriteData.push(val);
+    }
+    {
+        std::unique_lock<std::mutex> lock(mtx);
+        cv_control_write.wait(lock, [] { return !control_write_busy; });
+    }
+}
+
+// Binary register access protocol of vrt::ZmqServer, see vrt::BinaryHeader. A request is a header
+// followed by count BinaryScalar entries, the reply a header followed by the values read.
+struct BinaryHeader {
+    uint32_t magic;
+    uint16_t version;
+    uint16_t opcode;
+    uint32_t count;
+    uint32_t reserved;
+};
+
+struct BinaryScalar {
+    uint64_t addr;
+    uint32_t value;
+    uint32_t read;
+};
+
+constexpr uint32_t BINARY_MAGIC = 0x42545256;
+constexpr uint16_t BINARY_SCALARS = 1;
+
+bool isBinaryRequest(const zmq::message_t& request) {
+    uint32_t magic = 0;
+    if (request.size() < sizeof(BinaryHeader)) {
+        return false;
+    }
+    std::memcpy(&magic, request.data(), sizeof(magic));
+    return magic == BINARY_MAGIC;
+}
+
+std::string handleBinaryRequest(const zmq::message_t& request) {
+    BinaryHeader header;
+    std::memcpy(&header, request.data(), sizeof(header));
+    std::string reply(sizeof(header), '\0');
+    if (header.opcode != BINARY_SCALARS ||
+        request.size() != sizeof(header) + header.count * sizeof(BinaryScalar)) {
+        std::cerr << "Invalid binary request" << std::endl;
+        header.count = 0;
+        std::memcpy(&reply[0], &header, sizeof(header));
+        return reply;
+    }
+    const char* entries = static_cast<const char*>(request.data()) + sizeof(header);
+    uint32_t reads = 0;
+    for (uint32_t i = 0; i < header.count; i++) {
+        BinaryScalar scalar;
+        std::memcpy(&scalar, entries + i * sizeof(scalar), sizeof(scalar));
+        if (scalar.read) {
+            uint32_t val = 0;
+            fetchScalar(scalar.addr, val);
+            reply.append(reinterpret_cast<const char*>(&val), sizeof(val));
+            reads++;
+        } else {
+            writeScalar(scalar.addr, scalar.value);
+        }
+    }
+    header.count = reads;
+    std::memcpy(&reply[0], &header, sizeof(header));
+    return reply;
+}
+
+// Shared memory regions of the host buffers, by buffer address. A region is mapped when it is
+// first sent and its name unlinked right away, the host keeps its own mapping. The host sends a new
+// region when a buffer is resized and a release command when it is freed, the old one is unmapped.
+struct SharedRegion {
+    std::string name;  // Name of the region
+    uint8_t* data;     // Mapping of the region
+    uint64_t length;   // Length of the mapping
+};
+std::map<std::string, SharedRegion> sharedRegions;
+
+void unmapSharedMemory(const std::string& buffer) {
+    auto it = sharedRegions.find(buffer);
+    if (it != sharedRegions.end()) {
+        munmap(it->second.data, it->second.length);
+        sharedRegions.erase(it);
+    }
+}
+
+uint8_t* mapSharedMemory(uint64_t addr, const std::string& name, uint64_t size) {
+    std::string buffer = std::to_string(addr);
+    auto it = sharedRegions.find(buffer);
+    if (it != sharedRegions.end() && it->second.name == name) {
+        return it->second.data;
+    }
+    int fd = shm_open(name.c_str(), O_RDWR, 0600);
+    if (fd < 0) {
+        throw std::runtime_error("Failed to open shared memory " + name);
+    }
+    uint64_t length = size > 0 ? size : 1;
+    void* data = mmap(nullptr, length, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+    close(fd);
+    shm_unlink(name.c_str());
+    if (data == MAP_FAILED) {
+        throw std::runtime_error("Failed to map shared memory " + name);
+    }
+    unmapSharedMemory(buffer);
+    sharedRegions[buffer] = {name, static_cast<uint8_t*>(data), length};
+    return static_cast<uint8_t*>(data);
+}
+
 void zmq_ctx_setup_and_run() {
     zmq::context_t context(1);
     zmq::socket_t socket(context, ZMQ_REP);
@@ -525,6 +643,11 @@ void zmq_ctx_setup_and_run() {
     while (!stop) {
         zmq::message_t request;
         socket.recv(&request);
+        if (isBinaryRequest(request)) {
+            std::string reply = handleBinaryRequest(request);
+            socket.send(zmq::message_t(reply.data(), reply.size()), zmq::send_flags::none);
+            continue;
+        }
         std::string req_str(static_cast<char*>(request.data()), request.size());
         Json::Value root;
         Json::Reader reader;
@@ -534,12 +657,16 @@ void zmq_ctx_setup_and_run() {
         if (command == "populate") {
             uint64_t addr = root["addr"].asUInt64();
             uint64_t bufferSize = root["size"].asUInt64();
-            zmq::message_t data;
-            socket.recv(&data);
-            void* buffer = new uint8_t[bufferSize];
-            std::memcpy(buffer, data.data(), bufferSize);
-            std::vector<uint8_t> vec(static_cast<uint8_t*>(buffer),
-                                     static_cast<uint8_t*>(buffer) + bufferSize);
+            std::vector<uint8_t> vec;
+            if (root.isMember("shm")) {
+                uint8_t* region = mapSharedMemory(addr, root["shm"].asString(), bufferSize);
+                vec.assign(region, region + bufferSize);
+            } else {
+                zmq::message_t data;
+                socket.recv(&data);
+                vec.assign(static_cast<uint8_t*>(data.data()),
+                           static_cast<uint8_t*>(data.data()) + bufferSize);
+            }
             socket.send(zmq::message_t("OK", 2), zmq::send_flags::none);
             std::cout << "Received data of size: " << std::hex << bufferSize
                       << " at address: " << addr << std::endl;
@@ -555,7 +682,13 @@ void zmq_ctx_setup_and_run() {
                           << " from address: " << std::hex << addr << std::endl;
                 std::vector<uint8_t> vec;
                 { fetchBuffer(addr, bufferSize, vec); }
-                response = createJsonBuffer(vec.data(), vec.size());
+                if (root.isMember("shm")) {
+                    uint8_t* region = mapSharedMemory(addr, root["shm"].asString(), bufferSize);
+                    std::memcpy(region, vec.data(), std::min<uint64_t>(vec.size(), bufferSize));
+                    response = "OK";
+                } else {
+                    response = createJsonBuffer(vec.data(), vec.size());
+                }
 
             } else if (type == "scalar") {
                 uint64_t addr = root["addr"].asUInt64();
@@ -569,6 +702,9 @@ void zmq_ctx_setup_and_run() {
             std::string responseStr = Json::writeString(Json::StreamWriterBuilder(), response);
             socket.send(zmq::message_t(responseStr.c_str(), responseStr.size()),
                         zmq::send_flags::none);
+        } else if (command == "release") {
+            unmapSharedMemory(root["name"].asString());
+            socket.send(zmq::message_t("OK", 2), zmq::send_flags::none);
         } else if (command == "exit") {
             stop = true;
             start = false;
@@ -578,17 +714,7 @@ void zmq_ctx_setup_and_run() {
             uint32_t val = root["val"].asUInt();
             std::cout << "Writing value: " << std::hex << val << " to address: " << addr
                       << std::endl;
-            {
-                std::unique_lock<std::mutex> lock(mtx);
-                cv_control_write.wait(lock, [] { return !control_write_busy; });
-                control_write_busy = true;
-                axiWriteAddr.push(addr);
-                axiWriteData.push(val);
-            }
-            {
-                std::unique_lock<std::mutex> lock(mtx);
-                cv_control_write.wait(lock, [] { return !control_write_busy; });
-            }
+            writeScalar(addr, val);
 
             socket.send(zmq::message_t("OK", 2), zmq::send_flags::none);
 
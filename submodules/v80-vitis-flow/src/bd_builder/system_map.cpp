@@ -45,6 +45,15 @@ void SystemMap::printToFile() {
     xmlNewChild(rootNode, NULL, BAD_CAST "Type", BAD_CAST(segmented ? "Segmented" : "Full"));
     xmlNewChild(rootNode, NULL, BAD_CAST "ClockFrequency",
                 BAD_CAST std::to_string(targetClockFreq).c_str());
+    if (platform != Platform::HARDWARE) {
+        // The emulation/simulation executables built by this version take buffer data through
+        // shared memory
+        xmlNewChild(rootNode, NULL, BAD_CAST "SharedMemory", BAD_CAST "true");
+    }
+    if (platform == Platform::SIMULATOR) {
+        // The simulation executable takes register accesses as binary batches
+        xmlNewChild(rootNode, NULL, BAD_CAST "BinaryProtocol", BAD_CAST "true");
+    }
     for (auto& entry : entries) {
         xmlNodePtr newNode = xmlNewChild(rootNode, NULL, BAD_CAST "Kernel", NULL);
         xmlNewChild(newNode, NULL, BAD_CAST "Name", BAD_CAST entry.getName().c_str());
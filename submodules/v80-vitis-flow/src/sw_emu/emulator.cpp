@@ -58,6 +58,9 @@ void Emulator::print() {
     out << "#include <map>\n";
     out << "#include <vector>\n";
     out << "#include <cstring>\n";
+    out << "#include <fcntl.h>\n";
+    out << "#include <sys/mman.h>\n";
+    out << "#include <unistd.h>\n";
     out << "\n\n";
 
     for (auto fn : functions) {
@@ -97,6 +100,31 @@ void Emulator::print() {
     out << "\treturn value;\n";
     out << "}\n\n";
 
+    // Buffers sent through shared memory are mapped once and used in place as device memory.
+    // The name is unlinked as soon as it is mapped, the host keeps its own mapping.
+    out << "void* mapSharedMemory(const std::string& name, size_t size) {\n";
+    out << "\tint fd = shm_open(name.c_str(), O_RDWR, 0600);\n";
+    out << "\tif (fd < 0) {\n";
+    out << "\t\tthrow std::runtime_error(\"Failed to open shared memory \" + name);\n";
+    out << "\t}\n";
+    out << "\tvoid* addr = mmap(nullptr, size > 0 ? size : 1, PROT_READ | PROT_WRITE, "
+           "MAP_SHARED, fd, 0);\n";
+    out << "\tclose(fd);\n";
+    out << "\tshm_unlink(name.c_str());\n";
+    out << "\tif (addr == MAP_FAILED) {\n";
+    out << "\t\tthrow std::runtime_error(\"Failed to map shared memory \" + name);\n";
+    out << "\t}\n";
+    out << "\treturn addr;\n";
+    out << "}\n\n";
+
+    out << "void freeBuffer(void* buffer, size_t size, bool shared) {\n";
+    out << "\tif (shared) {\n";
+    out << "\t\tmunmap(buffer, size > 0 ? size : 1);\n";
+    out << "\t} else {\n";
+    out << "\t\tdelete[] static_cast<uint8_t*>(buffer);\n";
+    out << "\t}\n";
+    out << "}\n\n";
+
     out << "int main() {\n";
     out << "\t// Initialize zmq context and socket\n";
     out << "\tzmq::context_t context(1);\n";
@@ -105,6 +133,7 @@ void Emulator::print() {
 
     out << "\tstd::map<std::string, void*> buffers;\n";
     out << "\tstd::map<std::string, size_t> bufferSizes;\n";
+    out << "\tstd::map<std::string, std::string> sharedBuffers;\n";
     out << "\tstd::map<std::string, void*> streamingBuffers;\n";
 
     std::map<std::string, void*> streamingBuffers;
@@ -236,12 +265,25 @@ void Emulator::print() {
     out << "\t\t\tstd::string name = root[\"name\"].asString();\n";
     out << "\t\t\tsize_t bufferSize = root[\"size\"].asUInt64();\n";
 
-    out << "\t\t\tzmq::message_t data;\n";
-    out << "\t\t\tsocket.recv(data);\n";
-    out << "\t\t\tvoid* buffer = new uint8_t[bufferSize];\n";
-    out << "\t\t\tmemcpy(buffer, data.data(), bufferSize);\n";
+    out << "\t\t\tif (root.isMember(\"shm\")) {\n";
+    out << "\t\t\t\tstd::string shmName = root[\"shm\"].asString();\n";
+    out << "\t\t\t\tif (sharedBuffers[name] != shmName) {\n";
+    out << "\t\t\t\t\tif (buffers.find(name) != buffers.end()) {\n";
+    out << "\t\t\t\t\t\tfreeBuffer(buffers[name], bufferSizes[name], "
+           "!sharedBuffers[name].empty());\n";
+    out << "\t\t\t\t\t}\n";
+    out << "\t\t\t\t\tbuffers[name] = mapSharedMemory(shmName, bufferSize);\n";
+    out << "\t\t\t\t\tsharedBuffers[name] = shmName;\n";
+    out << "\t\t\t\t}\n";
+    out << "\t\t\t} else {\n";
+    out << "\t\t\t\tzmq::message_t data;\n";
+    out << "\t\t\t\tsocket.recv(data);\n";
+    out << "\t\t\t\tvoid* buffer = new uint8_t[bufferSize];\n";
+    out << "\t\t\t\tmemcpy(buffer, data.data(), bufferSize);\n";
+    out << "\t\t\t\tbuffers[name] = buffer;\n";
+    out << "\t\t\t\tsharedBuffers.erase(name);\n";
+    out << "\t\t\t}\n";
 
-    out << "\t\t\tbuffers[name] = buffer;\n";
     out << "\t\t\tbufferSizes[name] = bufferSize;\n";
     out << "\t\t\tsocket.send(zmq::message_t(\"OK\", 2), zmq::send_flags::none);\n";  // Send OK
                                                                                       // after
@@ -365,7 +407,20 @@ void Emulator::print() {
 
     out << "\t\t\t} else if (type == \"buffer\") {\n";
     out << "\t\t\t\tstd::string name = root[\"name\"].asString();\n";
-    out << "\t\t\t\tif (buffers.find(name) != buffers.end()) {\n";
+    out << "\t\t\t\tif (root.isMember(\"shm\")) {\n";
+    // A buffer populated through shared memory already lives in the region
+    out << "\t\t\t\t\tstd::string shmName = root[\"shm\"].asString();\n";
+    out << "\t\t\t\t\tif (buffers.find(name) != buffers.end() && "
+           "sharedBuffers[name] != shmName) {\n";
+    out << "\t\t\t\t\t\tvoid* region = mapSharedMemory(shmName, bufferSizes[name]);\n";
+    out << "\t\t\t\t\t\tmemcpy(region, buffers[name], bufferSizes[name]);\n";
+    out << "\t\t\t\t\t\tfreeBuffer(buffers[name], bufferSizes[name], "
+           "!sharedBuffers[name].empty());\n";
+    out << "\t\t\t\t\t\tbuffers[name] = region;\n";
+    out << "\t\t\t\t\t\tsharedBuffers[name] = shmName;\n";
+    out << "\t\t\t\t\t}\n";
+    out << "\t\t\t\t\tresponse = \"OK\";\n";
+    out << "\t\t\t\t} else if (buffers.find(name) != buffers.end()) {\n";
     out << "\t\t\t\t\tresponse = createJsonBuffer(static_cast<uint8_t*>(buffers[name]), "
            "bufferSizes[name]);\n";
     out << "\t\t\t\t}\n";
@@ -375,6 +430,17 @@ void Emulator::print() {
            "response);\n";
     out << "\t\t\tsocket.send(zmq::message_t(responseStr.c_str(), responseStr.size()), "
            "zmq::send_flags::none);\n";
+    // The host releases the region of a buffer it frees
+    out << "\t\t} else if (command == \"release\") {\n";
+    out << "\t\t\tstd::string name = root[\"name\"].asString();\n";
+    out << "\t\t\tif (buffers.find(name) != buffers.end()) {\n";
+    out << "\t\t\t\tfreeBuffer(buffers[name], bufferSizes[name], "
+           "!sharedBuffers[name].empty());\n";
+    out << "\t\t\t\tbuffers.erase(name);\n";
+    out << "\t\t\t\tbufferSizes.erase(name);\n";
+    out << "\t\t\t}\n";
+    out << "\t\t\tsharedBuffers.erase(name);\n";
+    out << "\t\t\tsocket.send(zmq::message_t(\"OK\", 2), zmq::send_flags::none);\n";
     out << "\t\t} else if (command == \"exit\") {\n";
     out << "\t\t\tsocket.send(zmq::message_t(\"OK\", 2), zmq::send_flags::none);\n";
     out << "\t\t\tbreak;\n";
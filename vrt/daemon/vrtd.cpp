@@ -0,0 +1,143 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#include <getopt.h>
+
+#include <csignal>
+#include <cstdlib>
+#include <iostream>
+#include <sstream>
+#include <string>
+#include <vector>
+
+#include "api/device_group.hpp"
+#include "daemon/device_manager.hpp"
+#include "utils/logger.hpp"
+
+namespace {
+
+vrt::DeviceManager* manager = nullptr;  ///< Manager stopped by the signal handler
+
+void handleSignal(int) {
+    if (manager != nullptr) {
+        manager->stop();
+    }
+}
+
+void printHelp() {
+    std::cout << "Usage: vrtd -d <bdf>[,<bdf>...] -i <vrtbin> [options]\n"
+              << "Keeps the devices programmed and serves them to client processes.\n\n"
+              << "Options:\n"
+              << "  -d, --device <bdfs>   Devices to serve, separated by commas\n"
+              << "  -i, --image <vrtbin>  VRTBIN of the design\n"
+              << "  -s, --socket <path>   Socket of the daemon (default: "
+              << vrt::DaemonSocket::getDefaultPath() << ")\n"
+              << "  -n, --no-program      Use the devices as they are\n"
+              << "  -f, --force           Program the devices even if they run the design\n"
+              << "  -h, --help            Print this help\n";
+}
+
+}  // namespace
+
+int main(int argc, char* argv[]) {
+    static struct option long_options[] = {{"device", required_argument, 0, 'd'},
+                                           {"image", required_argument, 0, 'i'},
+                                           {"socket", required_argument, 0, 's'},
+                                           {"no-program", no_argument, 0, 'n'},
+                                           {"force", no_argument, 0, 'f'},
+                                           {"help", no_argument, 0, 'h'},
+                                           {0, 0, 0, 0}};
+    std::vector<std::string> bdfs;
+    std::string image;
+    std::string socketPath = vrt::DaemonSocket::getDefaultPath();
+    bool program = true;
+    vrt::ProgramMode programMode = vrt::ProgramMode::IF_CHANGED;
+
+    int opt;
+    while ((opt = getopt_long(argc, argv, "d:i:s:nfh", long_options, nullptr)) != -1) {
+        switch (opt) {
+            case 'd': {
+                std::stringstream list(optarg);
+                std::string bdf;
+                while (std::getline(list, bdf, ',')) {
+                    if (!bdf.empty()) {
+                        bdfs.push_back(bdf);
+                    }
+                }
+                break;
+            }
+            case 'i':
+                image = optarg;
+                break;
+            case 's':
+                socketPath = optarg;
+                break;
+            case 'n':
+                program = false;
+                break;
+            case 'f':
+                programMode = vrt::ProgramMode::FORCE;
+                break;
+            case 'h':
+                printHelp();
+                return EXIT_SUCCESS;
+            default:
+                printHelp();
+                return EXIT_FAILURE;
+        }
+    }
+    if (bdfs.empty() || image.empty()) {
+        printHelp();
+        return EXIT_FAILURE;
+    }
+
+    vrt::utils::Logger::setLogLevel(vrt::utils::LogLevel::INFO);
+    try {
+        vrt::DeviceGroup devices(bdfs, image, program, vrt::ProgramType::FLASH, programMode);
+        for (const auto& status : devices.getStatus()) {
+            if (!status.ok) {
+                vrt::utils::Logger::log(vrt::utils::LogLevel::ERROR, __PRETTY_FUNCTION__,
+                                        "Device {} failed: {}", status.bdf, status.error);
+            }
+        }
+        if (devices.getSize() == 0) {
+            return EXIT_FAILURE;
+        }
+        std::vector<vrt::Device*> served;
+        for (size_t i = 0; i < devices.getSize(); i++) {
+            served.push_back(&devices[i]);
+        }
+        {
+            vrt::DeviceManager deviceManager(served, socketPath);
+            manager = &deviceManager;
+            std::signal(SIGINT, handleSignal);
+            std::signal(SIGTERM, handleSignal);
+            deviceManager.run();
+            std::signal(SIGINT, SIG_DFL);
+            std::signal(SIGTERM, SIG_DFL);
+            manager = nullptr;
+        }
+        devices.cleanup();
+    } catch (const std::exception& e) {
+        vrt::utils::Logger::log(vrt::utils::LogLevel::ERROR, __PRETTY_FUNCTION__, "{}", e.what());
+        return EXIT_FAILURE;
+    }
+    return EXIT_SUCCESS;
+}
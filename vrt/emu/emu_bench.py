@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# ##################################################################################################
+#  The MIT License (MIT)
+#  Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+# 
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+#  and associated documentation files (the "Software"), to deal in the Software without restriction,
+#  including without limitation the rights to use, copy, modify, merge, publish, distribute,
+#  sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+# 
+#  The above copyright notice and this permission notice shall be included in all copies or
+#  substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+# NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ##################################################################################################
+
+"""
+Host-side emulation benchmark: buffer sync throughput and kernel call latency against the
+Python emulation peer (emu_peer.py).
+
+--mode protocol  talks the vrt::ZmqServer wire protocol from Python, no VRT build needed.
+--mode vrt       runs the real Buffer::sync/Kernel::call through the VRT Python bindings, with a
+                 generated emulation vrtbin whose vpp_emu is the Python peer.
+
+Results can be written with --output and compared against a previous run with --baseline, which
+exits with an error when a metric got worse by more than --threshold percent.
+"""
+
+import argparse
+import json
+import mmap
+import os
+import shlex
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+
+import zmq
+
+PEER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "emu_peer.py")
+# vrt::ZmqServer always connects to this address
+VRT_ADDRESS = "tcp://localhost:5555"
+KERNEL = "bench_0"
+KERNEL_BASE = 0x20100000000
+BUFFER_BASE = 0x4000000000
+
+SYSTEM_MAP = f"""<?xml version="1.0" encoding="UTF-8"?>
+<SystemMap>
+  <Platform>Emulation</Platform>
+  <Type>Full</Type>
+  <ClockFrequency>200000000</ClockFrequency>
+  <Kernel>
+    <Name>{KERNEL}</Name>
+    <BaseAddress>{KERNEL_BASE:#x}</BaseAddress>
+    <Range>0x10000</Range>
+    <register offset="0x0" name="CTRL" access="RW" description="Control signals" range="32"/>
+    <register offset="0x4" name="GIER" access="RW" description="Global interrupt" range="32"/>
+    <register offset="0x8" name="IP_IER" access="RW" description="IP interrupt enable" range="32"/>
+    <register offset="0xc" name="IP_ISR" access="RW" description="IP interrupt status" range="32"/>
+    <register offset="0x10" name="size" access="W" description="Data signal of size" range="32"/>
+    <register offset="0x18" name="data_1" access="W" description="Data signal of data" range="32"/>
+    <register offset="0x1c" name="data_2" access="W" description="Data signal of data" range="32"/>
+  </Kernel>
+</SystemMap>
+"""
+
+class ProtocolClient:
+    """The requests vrt::ZmqServer makes for Buffer::sync and Kernel::call in emulation."""
+
+    def __init__(self, address, shared_memory):
+        self.context = zmq.Context()
+        self.socket = self.context.socket(zmq.REQ)
+        self.socket.connect(address)
+        self.shared_memory = shared_memory
+        self.regions = {}
+
+    def region(self, name, size):
+        """Shared memory region of a buffer, like vrt::SharedMemory."""
+        if name not in self.regions:
+            shm_name = f"/vrt-{os.getpid()}-{len(self.regions)}"
+            fd = os.open("/dev/shm" + shm_name, os.O_CREAT | os.O_EXCL | os.O_RDWR, 0o600)
+            try:
+                os.ftruncate(fd, max(size, 1))
+                self.regions[name] = (shm_name, mmap.mmap(fd, max(size, 1)))
+            finally:
+                os.close(fd)
+        return self.regions[name]
+
+    def request(self, command, data=None):
+        message = json.dumps(command).encode()
+        if data is None:
+            self.socket.send(message)
+        else:
+            self.socket.send_multipart([message, data], copy=False)
+        return self.socket.recv()
+
+    def send_buffer(self, name, data):
+        command = {"command": "populate", "name": name, "size": len(data)}
+        if self.shared_memory:
+            shm_name, region = self.region(name, len(data))
+            region[:len(data)] = data
+            self.request(command | {"shm": shm_name})
+        else:
+            self.request(command, data)
+
+    def fetch_buffer(self, name, data):
+        command = {"command": "fetch", "type": "buffer", "name": name}
+        if self.shared_memory:
+            shm_name, region = self.region(name, len(data))
+            self.request(command | {"shm": shm_name})
+            data[:] = memoryview(region)[:len(data)]
+        else:
+            data[:] = json.loads(self.request(command))
+
+    def call(self, function, size, addr):
+        self.request({"command": "call", "function": function, "args": {
+            "arg0": {"type": "scalar", "value": size},
+            "arg1": {"type": "buffer", "name": str(addr)},
+        }})
+
+    def close(self):
+        self.request({"command": "exit"})
+        self.socket.close()
+        self.context.term()
+        for shm_name, region in self.regions.values():
+            region.close()
+            if os.path.exists("/dev/shm" + shm_name):
+                os.unlink("/dev/shm" + shm_name)
+
+class ProtocolTarget:
+    def __init__(self, address, shared_memory):
+        self.client = ProtocolClient(address, shared_memory)
+        self.buffers = {}
+
+    def alloc(self, size):
+        addr = BUFFER_BASE + sum(len(b) for b in self.buffers.values())
+        self.buffers[addr] = bytearray(os.urandom(size))
+        self.client.send_buffer(str(addr), self.buffers[addr])
+        return addr
+
+    def h2d(self, addr):
+        self.client.send_buffer(str(addr), self.buffers[addr])
+
+    def d2h(self, addr):
+        self.client.fetch_buffer(str(addr), self.buffers[addr])
+
+    def data(self, addr):
+        return self.buffers[addr]
+
+    def call(self, addr):
+        self.client.call(KERNEL, len(self.buffers[addr]) // 64, addr)
+
+    def close(self):
+        self.client.close()
+
+class VrtTarget:
+    def __init__(self, bdf, vrtbin):
+        import vrt
+
+        self.vrt = vrt
+        self.device = vrt.Device(bdf, vrtbin)
+        self.kernel = vrt.Kernel(self.device, KERNEL)
+        self.buffers = []
+
+    def alloc(self, size):
+        buffer = self.vrt.Buffer(self.device, size // 4, "uint32")
+        buffer.array[:] = memoryview(os.urandom(size)).cast("I")
+        buffer.sync(self.vrt.SyncType.HOST_TO_DEVICE)
+        self.buffers.append(buffer)
+        return len(self.buffers) - 1
+
+    def h2d(self, idx):
+        self.buffers[idx].sync(self.vrt.SyncType.HOST_TO_DEVICE)
+
+    def d2h(self, idx):
+        self.buffers[idx].sync(self.vrt.SyncType.DEVICE_TO_HOST)
+
+    def data(self, idx):
+        return self.buffers[idx].array.tobytes()
+
+    def call(self, idx):
+        self.kernel.call(len(self.buffers[idx]) * 4 // 64, self.buffers[idx])
+
+    def close(self):
+        self.device.cleanup()
+
+def make_vrtbin(path, peer_args):
+    """Create an emulation vrtbin whose vpp_emu runs the Python peer."""
+    build_dir = os.path.dirname(path)
+    with open(os.path.join(build_dir, "system_map.xml"), "w") as f:
+        f.write(SYSTEM_MAP)
+    with open(os.path.join(build_dir, "vpp_emu"), "w") as f:
+        f.write("#!/bin/sh\nexec " + shlex.join([sys.executable, PEER] + peer_args) + "\n")
+    os.chmod(os.path.join(build_dir, "vpp_emu"), 0o755)
+    with tarfile.open(path, "w") as tar:
+        for name in ["system_map.xml", "vpp_emu"]:
+            tar.add(os.path.join(build_dir, name), arcname=name)
+
+def measure(func, iterations):
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+def run_benchmark(target, sizes, iterations, calls):
+    results = {}
+    for size in sizes:
+        handle = target.alloc(size)
+        expected = bytes(target.data(handle))
+        h2d = measure(lambda: target.h2d(handle), iterations)
+        d2h = measure(lambda: target.d2h(handle), iterations)
+        if bytes(target.data(handle)) != expected:
+            raise RuntimeError(f"Data read back does not match for {size} bytes")
+        results[f"sync_h2d_MBps/{size}"] = size / statistics.median(h2d) / 1e6
+        results[f"sync_d2h_MBps/{size}"] = size / statistics.median(d2h) / 1e6
+        print(f"sync {size:>10} B: h2d {results[f'sync_h2d_MBps/{size}']:>10.1f} MB/s, "
+              f"d2h {results[f'sync_d2h_MBps/{size}']:>10.1f} MB/s")
+    handle = target.alloc(min(sizes))
+    latencies = sorted(d * 1e6 for d in measure(lambda: target.call(handle), calls))
+    results["call_latency_us/p50"] = statistics.median(latencies)
+    results["call_latency_us/p99"] = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    results["call_latency_us/mean"] = statistics.fmean(latencies)
+    print(f"call latency: p50 {results['call_latency_us/p50']:.1f} us, "
+          f"p99 {results['call_latency_us/p99']:.1f} us, "
+          f"mean {results['call_latency_us/mean']:.1f} us")
+    return results
+
+def compare(baseline, results, threshold):
+    """Print the change of every metric. Returns the number of regressions."""
+    regressions = 0
+    print(f"\n{'metric':<30} {'baseline':>12} {'current':>12} {'delta':>8}")
+    for metric in sorted(set(baseline) & set(results)):
+        before, after = baseline[metric], results[metric]
+        delta = 100 * (after - before) / before if before else 0.0
+        # Throughput regresses when it drops, latency when it grows
+        worse = -delta if metric.startswith("sync_") else delta
+        # Tail latency is reported but too noisy to fail a run on
+        regressed = worse > threshold and not metric.endswith("/p99")
+        regressions += regressed
+        print(f"{metric:<30} {before:>12.1f} {after:>12.1f} {delta:>+7.1f}%"
+              + ("  REGRESSION" if regressed else ""))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Emulation buffer sync and kernel call benchmark.")
+    parser.add_argument("--mode", choices=["protocol", "vrt"], default="protocol",
+                        help="Drive the wire protocol from Python or the VRT Python bindings.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4096, 65536, 1048576],
+                        help="Buffer sizes in bytes (default: %(default)s).")
+    parser.add_argument("--iterations", type=int, default=20,
+                        help="Syncs per size and direction (default: %(default)s).")
+    parser.add_argument("--calls", type=int, default=1000,
+                        help="Kernel calls for the latency measurement (default: %(default)s).")
+    parser.add_argument("--transport", choices=["shm", "socket"], default="shm",
+                        help="Send buffer data through shared memory or over ZeroMQ.")
+    parser.add_argument("--kernels", type=str, nargs="*", default=[],
+                        help="Kernel callback files passed to the peer.")
+    parser.add_argument("--no-peer", action="store_true",
+                        help="Do not start the Python peer in protocol mode, e.g. to measure "
+                             "a vpp_emu.")
+    parser.add_argument("--bdf", type=str, default="00:00.0", help="BDF used in vrt mode.")
+    parser.add_argument("--output", type=str, help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", type=str,
+                        help="Compare against the results of a previous run.")
+    parser.add_argument("--threshold", type=float, default=10,
+                        help="Change in percent reported as a regression (default: %(default)s).")
+    args = parser.parse_args()
+
+    peer_args = ["--address", "tcp://*:5555"]
+    if args.kernels:
+        peer_args += ["--kernels"] + [os.path.abspath(path) for path in args.kernels]
+    peer = None
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if args.mode == "vrt":
+            vrtbin = os.path.join(tmp_dir, "bench_emu.vrtbin")
+            make_vrtbin(vrtbin, peer_args)
+            os.environ.setdefault("AMI_HOME", os.path.join(tmp_dir, "ami"))
+            os.environ["VRT_SHARED_MEMORY"] = "1" if args.transport == "shm" else "0"
+            target = VrtTarget(args.bdf, vrtbin)
+        else:
+            if not args.no_peer:
+                peer = subprocess.Popen([sys.executable, PEER] + peer_args)
+            target = ProtocolTarget(VRT_ADDRESS, args.transport == "shm")
+        try:
+            results = run_benchmark(target, args.sizes, args.iterations, args.calls)
+        finally:
+            target.close()
+            if peer is not None:
+                peer.wait(timeout=10)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"mode": args.mode, "transport": args.transport, "results": results}, f,
+                      indent=1)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(json.load(f)["results"], results, args.threshold)
+        if regressions:
+            print(f"\n{regressions} regression(s) above {args.threshold}%")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# ##################################################################################################
+#  The MIT License (MIT)
+#  Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+# 
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+#  and associated documentation files (the "Software"), to deal in the Software without restriction,
+#  including without limitation the rights to use, copy, modify, merge, publish, distribute,
+#  sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+# 
+#  The above copyright notice and this permission notice shall be included in all copies or
+#  substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+# NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ##################################################################################################
+
+"""
+Stand-in for the vpp_emu/vpp_sim executables of a vrtbin: answers the JSON commands of
+vrt::ZmqServer, keeps buffers in memory and runs kernels as Python callbacks. Buffer data comes
+either over ZeroMQ or, with the "shm" key of populate/fetch, through a POSIX shared memory region
+of the host.
+
+Callbacks are loaded from the files given with --kernels. Each file defines
+
+    KERNELS = {"accumulate_0": accumulate}        # emulation, by kernel name
+    SIM_KERNELS = {0x20100000000: accumulate}     # simulation, by kernel base address
+
+Emulation callbacks are called with the kernel arguments in order: buffers as writable uint8
+NumPy arrays (memoryviews without NumPy), scalars as int. They may return a dict
+{argument index: value} to update scalar arguments read back with Kernel::read.
+Simulation callbacks are called with the peer and the kernel base address, and read their
+arguments with peer.registers / peer.read_memory.
+Kernels without a callback complete immediately, which is what the benchmark uses.
+
+Register accesses also come as binary SCALARS requests, see vrt::BinaryHeader: a header
+followed by (addr, value, read) entries, answered with a header followed by the values read.
+"""
+
+import argparse
+import json
+import mmap
+import os
+import runpy
+import struct
+import sys
+
+import zmq
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_ADDRESS = "tcp://*:5555"
+OK = b"OK"
+ERROR = b"ERROR: "
+AP_START = 0x01
+AP_DONE = 0x02
+AP_AUTO_RESTART = 0x80
+BINARY_HEADER = struct.Struct("<IHHII")  # magic, version, opcode, count, reserved
+BINARY_SCALAR = struct.Struct("<QII")    # addr, value, read
+BINARY_MAGIC = 0x42545256
+BINARY_VERSION = 1
+BINARY_SCALARS = 1
+
+class EmulationPeer:
+    def __init__(self, kernels=None, sim_kernels=None):
+        self.kernels = kernels or {}
+        self.sim_kernels = sim_kernels or {}
+        self.buffers = {}      # emulation: buffer name (physical address) -> bytearray
+        self.memory = {}       # simulation: start address -> bytearray
+        self.registers = {}    # simulation: register address -> value
+        self.scalars = {}      # emulation: (function, "argN") -> last scalar value
+        self.streams = {}      # stream name -> bytearray FIFO
+        self.regions = {}      # buffer name or address -> (region name, mmap, view)
+        self.running = True
+
+    def array(self, data):
+        return np.frombuffer(data, dtype=np.uint8) if np is not None else memoryview(data)
+
+    def handle(self, frames):
+        """Handle one request (a JSON command and an optional data frame), return the reply."""
+        request = bytes(frames[0])
+        if request[:4] == BINARY_HEADER.pack(BINARY_MAGIC, 0, 0, 0, 0)[:4]:
+            return self.handle_binary(request)
+        command = json.loads(request)
+        name = command["command"]
+        if name == "populate":
+            return self.populate(command, frames[1] if len(frames) > 1 else None)
+        if name == "fetch":
+            return self.fetch(command)
+        if name == "call":
+            return self.call(command)
+        if name == "reg":
+            return self.write_register(command["addr"], command["val"])
+        if name == "release":
+            self.buffers.pop(command["name"], None)
+            self.unmap_region(self.regions.pop(command["name"], None))
+            return OK
+        if name == "stream_in":
+            self.streams.setdefault(command["name"], bytearray()).extend(frames[1])
+            return OK
+        if name == "stream_out":
+            return self.stream_out(command["name"], command["size"])
+        if name == "exit":
+            self.running = False
+            return OK
+        if name == "start":
+            return OK
+        raise ValueError(f"Unknown command: {name}")
+
+    def handle_binary(self, request):
+        """Handle a binary SCALARS request, return the values read."""
+        _, _, opcode, count, _ = BINARY_HEADER.unpack_from(request)
+        size = BINARY_HEADER.size + count * BINARY_SCALAR.size
+        if opcode != BINARY_SCALARS or len(request) != size:
+            raise ValueError("Invalid binary request")
+        values = []
+        for addr, value, read in BINARY_SCALAR.iter_unpack(request[BINARY_HEADER.size:]):
+            if read:
+                values.append(self.registers.get(addr, 0) & 0xFFFFFFFF)
+            else:
+                self.write_register(addr, value)
+        header = BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, BINARY_SCALARS, len(values), 0)
+        return header + struct.pack(f"<{len(values)}I", *values)
+
+    def map_region(self, command, size):
+        """Map the shared memory region of the buffer of a command, return it and the mapping
+        it replaces. The host sends a new region when a buffer is resized, the caller unmaps
+        the old one once it is done with its data. A region's name is unlinked once mapped."""
+        key = command["name"] if "name" in command else str(command["addr"])
+        name = command["shm"]
+        current = self.regions.get(key)
+        if current is not None and current[0] == name:
+            return current[2], None
+        path = "/dev/shm/" + name.lstrip("/")
+        fd = os.open(path, os.O_RDWR)
+        try:
+            region = mmap.mmap(fd, max(size, 1))
+        finally:
+            os.close(fd)
+            os.unlink(path)
+        self.regions[key] = (name, region, memoryview(region)[:size])
+        return self.regions[key][2], current
+
+    @staticmethod
+    def unmap_region(mapping):
+        if mapping is None:
+            return
+        _, region, view = mapping
+        view.release()
+        try:
+            region.close()
+        except BufferError:
+            pass  # Still exported, e.g. to an array a kernel kept, unmapped once collected
+
+    def populate(self, command, data):
+        if "shm" in command:
+            region, replaced = self.map_region(command, command["size"])
+            if "addr" in command:
+                self.write_memory(command["addr"], region)
+            else:
+                # The region is used in place as the device buffer
+                self.buffers[command["name"]] = region
+            self.unmap_region(replaced)
+        elif "addr" in command:
+            self.write_memory(command["addr"], data)
+        else:
+            self.buffers[command["name"]] = bytearray(data)
+        return OK
+
+    def fetch(self, command):
+        if command["type"] == "scalar":
+            if "addr" in command:
+                value = self.registers.get(command["addr"], 0)
+            else:
+                value = self.scalars.get((command["function"], command["arg"]), 0)
+            return str(value & 0xFFFFFFFF).encode()
+        if "addr" in command:
+            data = self.read_memory(command["addr"], command["size"])
+        else:
+            data = self.buffers.get(command["name"], b"")
+        if "shm" in command:
+            region, replaced = self.map_region(command, len(data))
+            if region is not data:
+                region[:] = data
+                if "addr" not in command:
+                    self.buffers[command["name"]] = region
+            self.unmap_region(replaced)
+            return OK
+        # The protocol sends buffers as a JSON array of bytes
+        return ("[" + ",".join(map(str, data)) + "]").encode()
+
+    def call(self, command):
+        function = command["function"]
+        args = command.get("args", {})
+        values = []
+        for key in sorted(args, key=lambda k: int(k[3:])):
+            arg = args[key]
+            if arg["type"] == "buffer":
+                values.append(self.array(self.buffers.setdefault(arg["name"], bytearray())))
+            else:
+                self.scalars[(function, key)] = arg["value"]
+                values.append(arg["value"])
+        callback = self.kernels.get(function)
+        if callback is not None:
+            for idx, value in (callback(*values) or {}).items():
+                self.scalars[(function, f"arg{idx}")] = value
+        return OK
+
+    def write_register(self, addr, value):
+        self.registers[addr] = value
+        # ap_start written to the control register (offset 0) of a kernel
+        if addr & 0xFFF == 0 and value & AP_START:
+            callback = self.sim_kernels.get(addr)
+            if callback is not None:
+                callback(self, addr)
+            self.registers[addr] = (value & AP_AUTO_RESTART) | AP_DONE
+        return OK
+
+    def write_memory(self, addr, data):
+        region = self.find_region(addr, len(data))
+        if region is None:
+            self.memory[addr] = bytearray(data)
+        else:
+            start, buffer = region
+            buffer[addr - start:addr - start + len(data)] = data
+
+    def read_memory(self, addr, size):
+        region = self.find_region(addr, size)
+        if region is None:
+            return bytes(size)
+        start, buffer = region
+        return bytes(buffer[addr - start:addr - start + size])
+
+    def find_region(self, addr, size):
+        for start, buffer in self.memory.items():
+            if start <= addr and addr + size <= start + len(buffer):
+                return start, buffer
+        return None
+
+    def stream_out(self, name, size):
+        stream = self.streams.setdefault(name, bytearray())
+        data = bytes(stream[:size]).ljust(size, b"\0")
+        del stream[:size]
+        return data
+
+def load_kernels(paths):
+    kernels = {}
+    sim_kernels = {}
+    for path in paths:
+        module = runpy.run_path(path)
+        kernels.update(module.get("KERNELS", {}))
+        sim_kernels.update(module.get("SIM_KERNELS", {}))
+    return kernels, sim_kernels
+
+def serve(peer, address=DEFAULT_ADDRESS):
+    context = zmq.Context()
+    socket = context.socket(zmq.REP)
+    socket.bind(address)
+    try:
+        while peer.running:
+            frames = socket.recv_multipart(copy=False)
+            try:
+                reply = peer.handle([frame.buffer for frame in frames])
+            except Exception as e:
+                # Answer anyway, the runtime waits for a reply to every request
+                print(f"emu_peer: invalid request: {e!r}", file=sys.stderr)
+                reply = ERROR + f"{type(e).__name__}: {e}".encode()
+            socket.send(reply)
+    finally:
+        socket.close(linger=1000)
+        context.term()
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Python stand-in for the VRT emulation/simulation executables.")
+    parser.add_argument("--address", type=str, default=DEFAULT_ADDRESS,
+                        help="ZeroMQ address to bind (default: %(default)s).")
+    parser.add_argument("--kernels", type=str, nargs="*", default=[],
+                        help="Python files defining KERNELS and/or SIM_KERNELS callbacks.")
+    args = parser.parse_args()
+    kernels, sim_kernels = load_kernels(args.kernels)
+    serve(EmulationPeer(kernels, sim_kernels), args.address)
+
+if __name__ == "__main__":
+    main()
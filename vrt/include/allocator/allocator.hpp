@@ -23,6 +23,9 @@
 
 #include <algorithm>
 #include <cstdint>
+#include <map>
+#include <mutex>
+#include <set>
 #include <stdexcept>
 #include <unordered_map>
 #include <vector>
@@ -50,6 +53,9 @@ constexpr uint64_t DDR_SIZE = 32L * 1024 * 1024 * 1024;  // 32G
 
 /**
  * @brief Class representing a superblock of memory.
+ *
+ * A superblock is split into blocks of a single size class, used for allocations smaller than
+ * half a superblock. Free blocks are kept in a free list and reused.
  */
 class Superblock {
    public:
@@ -57,15 +63,16 @@ class Superblock {
      * @brief Constructor for Superblock.
      * @param startAddress The starting address of the superblock.
      * @param size The size of the superblock.
+     * @param blockSize The size of the blocks of the superblock.
      */
-    Superblock(uint64_t startAddress, uint64_t size);
+    Superblock(uint64_t startAddress, uint64_t size, uint64_t blockSize);
 
     /**
      * @brief Allocates a block of memory from the superblock.
-     * @param size The size of the memory block to allocate.
      * @return The starting address of the allocated memory block.
+     * @throws std::bad_alloc if the superblock is full.
      */
-    uint64_t allocate(uint64_t size);
+    uint64_t allocate();
 
     /**
      * @brief Deallocates a block of memory.
@@ -73,33 +80,93 @@ class Superblock {
      */
     void deallocate(uint64_t addr);
 
+    /**
+     * @brief Checks whether all blocks are allocated.
+     * @return True if no block is free.
+     */
+    bool full() const;
+
+    /**
+     * @brief Checks whether no block is allocated.
+     * @return True if all blocks are free.
+     */
+    bool empty() const;
+
     uint64_t startAddress;  ///< The starting address of the superblock.
+    uint64_t blockSize;     ///< The size of the blocks of the superblock.
    private:
     uint64_t size;                   ///< The size of the superblock.
-    uint64_t offset;                 ///< The current offset for allocation.
+    uint64_t offset;                 ///< Offset of the first block never allocated.
+    uint64_t used;                   ///< Number of allocated blocks.
     std::vector<uint64_t> freeList;  ///< List of free memory blocks.
 };
 
+/**
+ * @brief Struct representing a pool of memory: DDR, or one port of HBM.
+ *
+ * Free memory is kept coalesced in an address ordered map, and indexed by size for best fit
+ * allocation in O(log n).
+ */
+struct MemoryPool {
+    uint64_t startAddress;                           ///< The starting address of the pool.
+    uint64_t size;                                   ///< The size of the pool.
+    std::map<uint64_t, uint64_t> freeBlocks;         ///< Free blocks, address to size.
+    std::set<std::pair<uint64_t, uint64_t>> bySize;  ///< Free blocks, ordered by size.
+    std::map<uint64_t, Superblock> superblocks;      ///< Superblocks, by starting address.
+    std::map<uint64_t, std::set<uint64_t>> partial;  ///< Superblocks with free blocks, by class.
+    uint64_t freeBytes;                              ///< Total size of the free blocks.
+    uint64_t allocations = 0;                        ///< Number of successful allocations.
+    uint64_t deallocations = 0;                      ///< Number of deallocations.
+    uint64_t failedAllocations = 0;                  ///< Number of failed allocations.
+    /**
+     * @brief Constructor for MemoryPool.
+     * @param startAddress The starting address of the pool.
+     * @param size The size of the pool.
+     */
+    MemoryPool(uint64_t startAddress, uint64_t size);
+};
+
 /**
  * @brief Struct representing a range of memory.
  */
 struct MemoryRange {
-    uint64_t startAddress;                ///< The starting address of the memory range.
-    uint64_t size;                        ///< The size of the memory range.
-    uint64_t offset;                      ///< The current offset for allocation.
-    std::vector<Superblock> superblocks;  ///< List of superblocks in the memory range.
-    std::vector<uint64_t> freeList;       ///< List of free memory blocks.
-    std::vector<std::pair<uint64_t, uint64_t>> usedMemoryBlocks;  ///< List of used memory blocks.
+    uint64_t startAddress;          ///< The starting address of the memory range.
+    uint64_t size;                  ///< The size of the memory range.
+    uint64_t poolSize;              ///< The size of each pool of the memory range.
+    std::vector<MemoryPool> pools;  ///< Pools of the memory range, in address order.
     /**
      * @brief Constructor for MemoryRange.
      * @param startAddress The starting address of the memory range.
      * @param size The size of the memory range.
+     * @param poolSize The size of each pool, e.g. the size of an HBM port.
      */
-    MemoryRange(uint64_t startAddress, uint64_t size);
+    MemoryRange(uint64_t startAddress, uint64_t size, uint64_t poolSize);
+};
+
+/**
+ * @brief Struct reporting the usage of a memory range or pool.
+ */
+struct AllocatorStats {
+    uint64_t totalBytes = 0;         ///< Size of the memory.
+    uint64_t usedBytes = 0;          ///< Bytes not free, including partly used superblocks.
+    uint64_t freeBytes = 0;          ///< Bytes free.
+    uint64_t largestFreeBlock = 0;   ///< Size of the largest free block.
+    uint64_t freeBlocks = 0;         ///< Number of free blocks.
+    double fragmentation = 0.0;      ///< 1 - largestFreeBlock / freeBytes.
+    uint64_t allocations = 0;        ///< Number of successful allocations.
+    uint64_t deallocations = 0;      ///< Number of deallocations.
+    uint64_t liveAllocations = 0;    ///< Number of allocations not deallocated yet.
+    uint64_t failedAllocations = 0;  ///< Number of failed allocations.
 };
 
 /**
  * @brief Class representing a memory allocator.
+ *
+ * Each memory range is split into pools, one per HBM port and a single one for DDR. Allocations
+ * smaller than half a superblock are served from superblocks of their size class, larger ones
+ * are rounded up to a multiple of the superblock size and taken best fit from the free blocks of
+ * the pool. If the pool is full, HBM allocations move on to the following ports. Freed memory is
+ * coalesced with its free neighbours.
  */
 class Allocator {
    public:
@@ -116,8 +183,10 @@ class Allocator {
      * @param type The type of memory range (HBM or DDR).
      * @param startAddress The starting address of the memory range.
      * @param size The size of the memory range.
+     * @param poolSize The size of each pool of the range. Defaults to a single pool.
      */
-    void addMemoryRange(MemoryRangeType type, uint64_t startAddress, uint64_t size);
+    void addMemoryRange(MemoryRangeType type, uint64_t startAddress, uint64_t size,
+                        uint64_t poolSize = 0);
 
     /**
      * @brief Allocates a block of memory.
@@ -149,14 +218,80 @@ class Allocator {
      */
     uint64_t getSize(MemoryRangeType type) const;
 
+    /**
+     * @brief Gets the usage of a memory range.
+     * @param type The type of memory range (HBM or DDR).
+     * @return The usage of the memory range. Free blocks adjacent across pools count as one.
+     */
+    AllocatorStats getStats(MemoryRangeType type) const;
+
+    /**
+     * @brief Gets the usage of a pool of a memory range.
+     * @param type The type of memory range (HBM or DDR).
+     * @param port The port, i.e. the index of the pool.
+     * @return The usage of the pool.
+     */
+    AllocatorStats getStats(MemoryRangeType type, uint8_t port) const;
+
    private:
+    /**
+     * @brief Struct recording a live allocation.
+     */
+    struct Allocation {
+        MemoryRangeType type;  ///< The type of memory range.
+        uint64_t size;         ///< The allocated size, after rounding.
+        bool small;            ///< Whether the allocation is a superblock block.
+    };
+
+    /**
+     * @brief Allocates from the pools of a range, starting with the given pool.
+     * @param range The memory range.
+     * @param pool The index of the first pool to try.
+     * @param size The size to allocate, a multiple of the superblock size.
+     * @return The starting address of the allocated memory block.
+     */
+    uint64_t allocateBlock(MemoryRange& range, size_t pool, uint64_t size);
+
+    /**
+     * @brief Allocates a block smaller than half a superblock.
+     * @param range The memory range.
+     * @param pool The index of the first pool to try.
+     * @param size The size class to allocate.
+     * @return The starting address of the allocated memory block.
+     */
+    uint64_t allocateSmall(MemoryRange& range, size_t pool, uint64_t size);
+
+    /**
+     * @brief Sets up a superblock of a size class and allocates its first block.
+     * @param range The memory range.
+     * @param superblockAddr The starting address of the superblock, already allocated.
+     * @param size The size class of the superblock.
+     * @return The starting address of the allocated block.
+     */
+    uint64_t allocateSuperblock(MemoryRange& range, uint64_t superblockAddr, uint64_t size);
+
+    /**
+     * @brief Returns a block to the free blocks of its pools, coalescing it with its neighbours.
+     * @param range The memory range.
+     * @param addr The starting address of the block.
+     * @param size The size of the block.
+     */
+    void freeBlock(MemoryRange& range, uint64_t addr, uint64_t size);
+
+    /**
+     * @brief Gets the memory range of a type.
+     * @param type The type of memory range (HBM or DDR).
+     * @return The memory range.
+     */
+    MemoryRange& getRange(MemoryRangeType type);
+
     uint64_t superblockSize;  ///< The size of the superblocks.
     std::unordered_map<MemoryRangeType, MemoryRange>
         memoryRanges;  ///< Map of memory ranges by type.
-    std::unordered_map<uint64_t, Superblock*>
-        addrToSuperblock;  ///< Map of addresses to superblocks.
+    std::unordered_map<uint64_t, Allocation> allocations;  ///< Live allocations by address.
+    mutable std::mutex mutex;  ///< Serializes the allocator between threads.
 };
 
 }  // namespace vrt
 
-#endif  // ALLOCATOR_HPP
\ No newline at end of file
+#endif  // ALLOCATOR_HPP
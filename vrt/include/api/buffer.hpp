@@ -21,10 +21,16 @@
 #ifndef BUFFER_HPP
 #define BUFFER_HPP
 
+#include <future>
+#include <memory>
+
 #include "allocator/allocator.hpp"
 #include "api/device.hpp"
+#include "qdma/dma_engine.hpp"
 #include "qdma/qdma_intf.hpp"
+#include "utils/host_memory.hpp"
 #include "utils/platform.hpp"
+#include "utils/tracer.hpp"
 #include "utils/zmq_server.hpp"
 
 namespace vrt {
@@ -41,7 +47,8 @@ enum class SyncType {
  * @brief Class representing a buffer.
  *
  * This class provides an interface for managing a buffer in a device.
- * It supports memory mapped QDMA connections.
+ * It supports memory mapped QDMA connections. The host memory of the buffer is pinned, placed on
+ * the NUMA node of the card and reused across buffers, see HostMemoryPool.
  *
  * @tparam T The type of the elements in the buffer.
  */
@@ -90,6 +97,12 @@ class Buffer {
      */
     const T& operator[](size_t index) const;
 
+    /**
+     * @brief Gets the number of elements in the buffer.
+     * @return The number of elements in the buffer.
+     */
+    size_t getSize() const;
+
     /**
      * @brief Gets the physical address of the buffer.
      * @return The physical address of the buffer.
@@ -114,6 +127,19 @@ class Buffer {
      */
     void sync(SyncType syncType);
 
+    /**
+     * @brief Starts synchronizing the buffer without waiting for it to complete.
+     *
+     * On hardware the transfer is queued on the DMA engine of the device, so it overlaps with
+     * other transfers and kernel execution. On emulation and simulation the buffer is
+     * synchronized before returning. The buffer must not be accessed or destroyed until the
+     * future completes.
+     *
+     * @param syncType The type of synchronization.
+     * @return A future that completes once the buffer is synchronized.
+     */
+    std::future<void> syncAsync(SyncType syncType);
+
     std::string getName();
 
     Buffer(const Buffer&) = delete;
@@ -129,6 +155,20 @@ class Buffer {
     Device device;                   ///< The device associated with the buffer
     std::size_t index;               // Member variable to store the index of the buffer
     static std::size_t bufferIndex;  // Static variable to track the buffer index
+
+    /**
+     * @brief Allocates host memory for elements from the pool.
+     * @param count The number of elements.
+     * @return Pointer to the default constructed elements.
+     */
+    T* allocateLocal(size_t count);
+
+    /**
+     * @brief Destroys elements and returns their host memory to the pool.
+     * @param buffer Pointer returned by allocateLocal, or nullptr.
+     * @param count The number of elements.
+     */
+    static void releaseLocal(T* buffer, size_t count);
 };
 
 template <typename T>
@@ -142,16 +182,13 @@ Buffer<T>::Buffer(Device device, size_t size, MemoryRangeType type)
         throw std::bad_alloc();
     }
 
-    localBuffer = new T[size];
+    localBuffer = allocateLocal(size);
     Platform platform = device.getPlatform();
     if (platform == Platform::EMULATION) {
         // send initial buffer so it is populated in the emulation environment
         std::shared_ptr<ZmqServer> server = device.getZmqServer();
-        std::vector<uint8_t> sendData;
-        std::size_t dataSize = size * sizeof(T);
-        sendData.resize(dataSize);
-        std::memcpy(sendData.data(), localBuffer, dataSize);
-        server->sendBuffer(std::to_string(getPhysAddr()), sendData);
+        server->sendBuffer(std::to_string(getPhysAddr()),
+                           reinterpret_cast<const uint8_t*>(localBuffer), size * sizeof(T));
     }
 }
 
@@ -165,16 +202,33 @@ Buffer<T>::Buffer(Device device, size_t size, MemoryRangeType type, uint8_t port
         throw std::bad_alloc();
     }
 
-    localBuffer = new T[size];
+    localBuffer = allocateLocal(size);
 }
 
 template <typename T>
 Buffer<T>::~Buffer() {
     if (startAddress != 0) {
+        if (device.getPlatform() != Platform::HARDWARE) {
+            device.getZmqServer()->releaseBuffer(std::to_string(startAddress));
+        }
         device.getAllocator()->deallocate(startAddress);
     }
-    if (localBuffer != nullptr) {
-        delete[] localBuffer;
+    releaseLocal(localBuffer, size);
+}
+
+template <typename T>
+T* Buffer<T>::allocateLocal(size_t count) {
+    T* buffer = static_cast<T*>(
+        HostMemoryPool::getInstance().allocate(count * sizeof(T), device.getNumaNode()));
+    std::uninitialized_default_construct_n(buffer, count);
+    return buffer;
+}
+
+template <typename T>
+void Buffer<T>::releaseLocal(T* buffer, size_t count) {
+    if (buffer != nullptr) {
+        std::destroy_n(buffer, count);
+        HostMemoryPool::getInstance().deallocate(buffer);
     }
 }
 
@@ -199,6 +253,11 @@ const T& Buffer<T>::operator[](size_t index) const {
     return localBuffer[index];
 }
 
+template <typename T>
+size_t Buffer<T>::getSize() const {
+    return size;
+}
+
 template <typename T>
 uint64_t Buffer<T>::getPhysAddr() const {
     return startAddress;
@@ -221,40 +280,29 @@ std::string Buffer<T>::getName() {
 
 template <typename T>
 void Buffer<T>::sync(SyncType syncType) {
+    TraceScope trace(syncType == SyncType::HOST_TO_DEVICE ? TraceType::BUFFER_SYNC_TO_DEVICE
+                                                          : TraceType::BUFFER_SYNC_TO_HOST,
+                     size * sizeof(T), startAddress);
     Platform platform = device.getPlatform();
     if (platform == Platform::HARDWARE) {
-        size_t maxChunkSize = 1 << 24;  // 22
-        size_t totalSize = size * sizeof(T);
-        size_t chunkSize = maxChunkSize * sizeof(T);
-        size_t offset = 0;
-
-        while (totalSize > 0) {
-            size_t currentChunkSize = std::min(chunkSize, totalSize);
-            if (syncType == SyncType::HOST_TO_DEVICE) {
-                this->device.qdmaIntf.write_buff(reinterpret_cast<char*>(localBuffer) + offset,
-                                                 startAddress + offset, currentChunkSize);
-            } else if (syncType == SyncType::DEVICE_TO_HOST) {
-                this->device.qdmaIntf.read_buff(reinterpret_cast<char*>(localBuffer) + offset,
-                                                startAddress + offset, currentChunkSize);
-            } else {
-                throw std::invalid_argument("Invalid sync type");
-            }
-            offset += currentChunkSize;
-            totalSize -= currentChunkSize;
-        }
+        syncAsync(syncType).get();
     } else if (platform == Platform::EMULATION) {
         std::shared_ptr<ZmqServer> server = device.getZmqServer();
         if (syncType == SyncType::HOST_TO_DEVICE) {
-            std::vector<uint8_t> sendData;
-            std::size_t dataSize = size * sizeof(T);
-            sendData.resize(dataSize);
-            std::memcpy(sendData.data(), localBuffer, dataSize);
-            server->sendBuffer(std::to_string(getPhysAddr()), sendData);
+            server->sendBuffer(std::to_string(getPhysAddr()),
+                               reinterpret_cast<const uint8_t*>(localBuffer), size * sizeof(T));
+        } else if (syncType == SyncType::DEVICE_TO_HOST && server->useSharedMemory()) {
+            server->fetchBuffer(std::to_string(getPhysAddr()),
+                                reinterpret_cast<uint8_t*>(localBuffer), size * sizeof(T));
         } else if (syncType == SyncType::DEVICE_TO_HOST) {
             std::vector<uint8_t> recvData = server->fetchBuffer(std::to_string(getPhysAddr()));
-            size = recvData.size() / sizeof(T);
-            localBuffer = reinterpret_cast<T*>(realloc(localBuffer, recvData.size()));
-            std::memcpy(localBuffer, recvData.data(), recvData.size());
+            // Copy in place when the size did not change, so views of the buffer stay valid
+            if (recvData.size() != size * sizeof(T)) {
+                releaseLocal(localBuffer, size);
+                size = recvData.size() / sizeof(T);
+                localBuffer = allocateLocal(size);
+            }
+            std::memcpy(localBuffer, recvData.data(), size * sizeof(T));
 
         } else {
             throw std::invalid_argument("Invalid sync type");
@@ -263,23 +311,57 @@ void Buffer<T>::sync(SyncType syncType) {
     } else if (platform == Platform::SIMULATION) {
         std::shared_ptr<ZmqServer> server = device.getZmqServer();
         if (syncType == SyncType::HOST_TO_DEVICE) {
-            std::vector<uint8_t> sendData;
-            std::size_t dataSize = size * sizeof(T);
-            sendData.resize(dataSize);
-            std::memcpy(sendData.data(), localBuffer, dataSize);
-            server->sendBufferSim(getPhysAddr(), sendData);
+            server->sendBufferSim(getPhysAddr(), reinterpret_cast<const uint8_t*>(localBuffer),
+                                  size * sizeof(T));
+        } else if (syncType == SyncType::DEVICE_TO_HOST && server->useSharedMemory()) {
+            server->fetchBufferSim(getPhysAddr(), size * sizeof(T),
+                                   reinterpret_cast<uint8_t*>(localBuffer));
         } else if (syncType == SyncType::DEVICE_TO_HOST) {
             std::vector<uint8_t> recvData;
             server->fetchBufferSim(getPhysAddr(), size * sizeof(T), recvData);
 
-            size = recvData.size() * sizeof(T);
-            localBuffer = reinterpret_cast<T*>(realloc(localBuffer, recvData.size()));
-            std::memcpy(localBuffer, recvData.data(), recvData.size());
+            // Copy in place when the size did not change, so views of the buffer stay valid
+            if (recvData.size() != size * sizeof(T)) {
+                releaseLocal(localBuffer, size);
+                size = recvData.size() / sizeof(T);
+                localBuffer = allocateLocal(size);
+            }
+            std::memcpy(localBuffer, recvData.data(), size * sizeof(T));
         } else {
             throw std::invalid_argument("Invalid sync type");
         }
     }
 }
+
+template <typename T>
+std::future<void> Buffer<T>::syncAsync(SyncType syncType) {
+    if (device.getPlatform() == Platform::HARDWARE) {
+        std::shared_ptr<DmaEngine> engine = device.getDmaEngine();
+        if (!engine) {
+            throw std::runtime_error("No DMA engine for device " + device.getBdf());
+        }
+        DmaDirection direction;
+        if (syncType == SyncType::HOST_TO_DEVICE) {
+            direction = DmaDirection::HOST_TO_DEVICE;
+        } else if (syncType == SyncType::DEVICE_TO_HOST) {
+            direction = DmaDirection::DEVICE_TO_HOST;
+        } else {
+            throw std::invalid_argument("Invalid sync type");
+        }
+        return engine->submit(direction, reinterpret_cast<char*>(localBuffer), startAddress,
+                              size * sizeof(T));
+    }
+    // The ZeroMQ connection to the emulator/simulator is not shared between threads
+    std::promise<void> done;
+    try {
+        sync(syncType);
+        done.set_value();
+    } catch (...) {
+        done.set_exception(std::current_exception());
+    }
+    return done.get_future();
+}
+
 template <typename T>
 Buffer<T>::Buffer(Buffer&& other) noexcept
     : device(other.device),
@@ -296,11 +378,12 @@ Buffer<T>::Buffer(Buffer&& other) noexcept
 template <typename T>
 Buffer<T>& Buffer<T>::operator=(Buffer&& other) noexcept {
     if (this != &other) {
-        if (localBuffer) {
-            delete[] localBuffer;
-        }
+        releaseLocal(localBuffer, size);
 
         if (startAddress != 0) {
+            if (device.getPlatform() != Platform::HARDWARE) {
+                device.getZmqServer()->releaseBuffer(std::to_string(startAddress));
+            }
             device.getAllocator()->deallocate(startAddress);
         }
 
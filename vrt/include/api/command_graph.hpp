@@ -0,0 +1,209 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#ifndef COMMAND_GRAPH_HPP
+#define COMMAND_GRAPH_HPP
+
+#include <functional>
+#include <future>
+#include <optional>
+#include <vector>
+
+#include "api/buffer.hpp"
+#include "api/kernel.hpp"
+#include "api/launch_descriptor.hpp"
+#include "utils/backoff.hpp"
+
+namespace vrt {
+
+/**
+ * @brief Class recording buffer transfers and kernel launches once and replaying them.
+ *
+ * Nodes are added with the nodes they depend on. launch() runs the whole graph from the calling
+ * thread: a node starts as soon as its dependencies completed, so independent branches overlap,
+ * e.g. the DMA transfers of two buffers, or two kernels. Transfers are submitted to the DMA
+ * engine of the device and kernels are started with the register burst of their launch
+ * descriptor, then both are polled with adaptive backoff until they complete.
+ *
+ * The order of the nodes, their dependents and the launch descriptors are prepared when the graph
+ * is first launched, so a replay only patches the scalar arguments changed with setArg. The
+ * buffers and kernels of the graph must outlive it. The graph is not thread safe.
+ */
+class CommandGraph {
+   public:
+    using Node = size_t;                     ///< Index of a node in the graph
+    using Dependencies = std::vector<Node>;  ///< Nodes that must complete before a node starts
+
+    /**
+     * @brief Constructor for CommandGraph.
+     * @param policy The backoff between two polls of the running nodes.
+     */
+    CommandGraph(const BackoffPolicy& policy = BackoffPolicy());
+
+    /**
+     * @brief Adds a buffer synchronization.
+     * @param buffer The buffer.
+     * @param syncType The direction of the synchronization.
+     * @param dependencies The nodes to complete first.
+     * @return The node.
+     */
+    template <typename T>
+    Node addSync(Buffer<T>& buffer, SyncType syncType, const Dependencies& dependencies = {}) {
+        Buffer<T>* target = &buffer;
+        return addSync([target, syncType]() { return target->syncAsync(syncType); },
+                       dependencies);
+    }
+
+    /**
+     * @brief Adds a kernel launch, which completes when the kernel is done.
+     * @param kernel The kernel.
+     * @param descriptor The arguments of the launch, copied into the graph.
+     * @param dependencies The nodes to complete first.
+     * @return The node.
+     * @throws std::invalid_argument If the descriptor was not created for the kernel.
+     */
+    Node addLaunch(Kernel& kernel, const LaunchDescriptor& descriptor,
+                   const Dependencies& dependencies = {});
+
+    /**
+     * @brief Adds a kernel launch with its arguments.
+     * @param kernel The kernel.
+     * @param args The arguments of the launch, buffers as their physical address.
+     * @param dependencies The nodes to complete first.
+     * @return The node.
+     */
+    Node addLaunch(Kernel& kernel, const std::vector<int64_t>& args,
+                   const Dependencies& dependencies = {});
+
+    /**
+     * @brief Adds a function run on the host, e.g. to prepare the data of the next transfer.
+     * @param function The function, run on the thread that launches the graph.
+     * @param dependencies The nodes to complete first.
+     * @return The node.
+     */
+    Node addHost(std::function<void()> function, const Dependencies& dependencies = {});
+
+    /**
+     * @brief Changes an argument of a kernel launch for the following replays.
+     * @param node The launch node.
+     * @param index The index of the argument.
+     * @param value The value of the argument, buffers as their physical address.
+     * @throws std::invalid_argument If the node is not a kernel launch.
+     * @throws std::out_of_range If the kernel has no such argument.
+     */
+    void setArg(Node node, size_t index, int64_t value);
+
+    /**
+     * @brief Runs the graph and waits for all nodes to complete.
+     *
+     * If a node fails, no further nodes are started, the running ones are waited for and the
+     * first error is rethrown.
+     */
+    void launch();
+
+    /**
+     * @brief Gets the number of nodes.
+     * @return The number of nodes.
+     */
+    size_t size() const;
+
+   private:
+    /**
+     * @brief Enum class representing what a node does.
+     */
+    enum class NodeType { SYNC, LAUNCH, HOST };
+
+    /**
+     * @brief Struct for a node of the graph.
+     */
+    struct NodeData {
+        NodeType type;                               ///< What the node does
+        std::function<std::future<void>()> sync;     ///< Starts the transfer of a SYNC node
+        Kernel* kernel = nullptr;                    ///< Kernel of a LAUNCH node
+        std::optional<LaunchDescriptor> descriptor;  ///< Arguments of a LAUNCH node
+        std::function<void()> host;                  ///< Function of a HOST node
+        Dependencies dependencies;                   ///< Nodes to complete first
+        std::vector<Node> dependents;                ///< Nodes waiting for this one
+    };
+
+    /**
+     * @brief A node that was started and has not completed yet.
+     */
+    struct Running {
+        Node node;                   ///< The node
+        std::future<void> transfer;  ///< Completion of a SYNC node
+    };
+
+    BackoffPolicy policy;             ///< Backoff between two polls
+    std::vector<NodeData> nodes;      ///< Nodes, in the order they were added
+    std::vector<Node> roots;          ///< Nodes without dependencies
+    std::vector<uint32_t> indegrees;  ///< Number of dependencies of every node
+    bool prepared = false;            ///< Whether the lists above are up to date
+    std::vector<uint32_t> remaining;  ///< Dependencies left during a replay
+    std::vector<Node> ready;          ///< Nodes to start during a replay
+    std::vector<Running> running;     ///< Started nodes during a replay
+
+    /**
+     * @brief Adds a buffer synchronization.
+     * @param sync Starts the transfer.
+     * @param dependencies The nodes to complete first.
+     * @return The node.
+     */
+    Node addSync(std::function<std::future<void>()> sync, const Dependencies& dependencies);
+
+    /**
+     * @brief Adds a node.
+     * @param data The node.
+     * @return The index of the node.
+     * @throws std::out_of_range If a dependency is not a node of the graph.
+     */
+    Node addNode(NodeData data);
+
+    /**
+     * @brief Computes the dependents and roots, and checks that a kernel is never launched by
+     * two nodes that could run at the same time.
+     * @throws std::invalid_argument If a kernel could be launched twice concurrently.
+     */
+    void prepare();
+
+    /**
+     * @brief Starts a node, or runs it if it is a HOST node.
+     * @param node The node.
+     * @return True if the node already completed.
+     */
+    bool start(Node node);
+
+    /**
+     * @brief Checks whether a started node completed.
+     * @param entry The started node.
+     * @return True if the node completed.
+     */
+    bool isDone(Running& entry);
+
+    /**
+     * @brief Marks the dependents of a completed node whose dependencies all completed as ready.
+     * @param node The completed node.
+     */
+    void complete(Node node);
+};
+
+}  // namespace vrt
+
+#endif  // COMMAND_GRAPH_HPP
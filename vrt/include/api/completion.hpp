@@ -0,0 +1,142 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#ifndef COMPLETION_HPP
+#define COMPLETION_HPP
+
+#include <chrono>
+#include <deque>
+#include <functional>
+#include <vector>
+
+#include "api/kernel.hpp"
+#include "utils/backoff.hpp"
+
+namespace vrt {
+
+/**
+ * @brief Class tracking the completion of many started kernels from a single thread.
+ *
+ * Kernels are added once started, optionally with a callback. Polling reads the control register
+ * of each running kernel once, runs the callbacks of the completed ones on the polling thread
+ * and queues them for waitAny. The wait methods poll with adaptive backoff, so one thread can
+ * drive many concurrent kernels without keeping a core busy.
+ *
+ * Kernels must stay alive while they are in the queue. The queue is not thread safe.
+ */
+class CompletionQueue {
+   public:
+    using Callback = std::function<void(Kernel&)>;  ///< Called when a kernel completes
+
+    /**
+     * @brief Constructor for CompletionQueue.
+     * @param policy The backoff between two polls of the kernels.
+     */
+    CompletionQueue(const BackoffPolicy& policy = BackoffPolicy());
+
+    /**
+     * @brief Adds a started kernel to the queue.
+     * @param kernel The kernel.
+     * @param callback Called on the polling thread when the kernel completes.
+     */
+    void add(Kernel& kernel, Callback callback = nullptr);
+
+    /**
+     * @brief Checks every running kernel once, without waiting.
+     * @return The number of kernels that completed.
+     */
+    size_t poll();
+
+    /**
+     * @brief Waits for one kernel to complete.
+     * @param timeout The longest time to wait.
+     * @return The completed kernel, which is removed from the queue, or nullptr on timeout or if
+     * the queue is empty.
+     */
+    Kernel* waitAny(std::chrono::microseconds timeout = NO_TIMEOUT);
+
+    /**
+     * @brief Waits for all kernels to complete and empties the queue.
+     * @param timeout The longest time to wait.
+     * @return True if all kernels completed, false on timeout.
+     */
+    bool waitAll(std::chrono::microseconds timeout = NO_TIMEOUT);
+
+    /**
+     * @brief Gets the number of kernels still running.
+     * @return The number of running kernels.
+     */
+    size_t running() const;
+
+    /**
+     * @brief Gets the number of kernels in the queue, running or completed.
+     * @return The number of kernels.
+     */
+    size_t size() const;
+
+   private:
+    /**
+     * @brief A running kernel and its callback.
+     */
+    struct Entry {
+        Kernel* kernel;     ///< The kernel
+        Callback callback;  ///< Called when the kernel completes
+    };
+
+    BackoffPolicy policy;          ///< Backoff between two polls
+    std::vector<Entry> pending;    ///< Running kernels
+    std::deque<Kernel*> complete;  ///< Completed kernels, not returned by waitAny yet
+};
+
+/**
+ * @brief Waits for all kernels to complete.
+ * @param kernels The started kernels.
+ * @param timeout The longest time to wait.
+ * @return True if all kernels completed, false on timeout.
+ */
+bool waitAll(const std::vector<Kernel*>& kernels, std::chrono::microseconds timeout = NO_TIMEOUT);
+
+/**
+ * @brief Waits for all kernels to complete.
+ * @param kernels The started kernels.
+ * @param timeout The longest time to wait.
+ * @return True if all kernels completed, false on timeout.
+ */
+bool waitAll(std::vector<Kernel>& kernels, std::chrono::microseconds timeout = NO_TIMEOUT);
+
+/**
+ * @brief Waits for any kernel to complete.
+ * @param kernels The started kernels.
+ * @param timeout The longest time to wait.
+ * @return The index of a completed kernel, or -1 on timeout.
+ */
+int waitAny(const std::vector<Kernel*>& kernels, std::chrono::microseconds timeout = NO_TIMEOUT);
+
+/**
+ * @brief Waits for any kernel to complete.
+ * @param kernels The started kernels.
+ * @param timeout The longest time to wait.
+ * @return The index of a completed kernel, or -1 on timeout.
+ */
+int waitAny(std::vector<Kernel>& kernels, std::chrono::microseconds timeout = NO_TIMEOUT);
+
+}  // namespace vrt
+
+#endif  // COMPLETION_HPP
@@ -42,7 +42,9 @@
 #include "api/vrtbin.hpp"
 #include "driver/clk_wiz.hpp"
 #include "driver/qdma_logic.hpp"
+#include "parser/compiled_system_map.hpp"
 #include "parser/xml_parser.hpp"
+#include "qdma/dma_engine.hpp"
 #include "qdma/pcie_driver_handler.hpp"
 #include "qdma/qdma_connection.hpp"
 #include "qdma/qdma_intf.hpp"
@@ -52,6 +54,8 @@
 
 namespace vrt {
 
+class CommandGraph;
+
 /**
  * @brief Enumeration for device programming types.
  *
@@ -62,6 +66,17 @@ enum class ProgramType {
     JTAG    ///< Program the device using JTAG interface
 };
 
+/**
+ * @brief Enumeration for when a device is programmed.
+ *
+ * The logic UUID of the design running on the device is compared with the one in version.json of
+ * the VRTBIN.
+ */
+enum class ProgramMode {
+    IF_CHANGED,  ///< Skip programming and booting if the device already runs the VRTBIN's design
+    FORCE        ///< Always program and boot the device
+};
+
 /**
  * @brief Path to the JTAG programming script.
  *
@@ -102,7 +117,8 @@ class Device {
     ClkWiz clkWiz;            ///< Clock Wizard object for handling clock wizard operations
     uint64_t clockFreq;       ///< Clock frequency
     ProgramType programType;  ///< Type of programming
-    std::map<std::string, Kernel> kernels;        ///< Map of kernel names to Kernel objects
+    ProgramMode programMode;  ///< When to program
+    std::shared_ptr<const CompiledSystemMap> compiledMap;  ///< Parsed system map of the vrtbin
     PcieDriverHandler pcieHandler;                ///< PCIe driver handler object
     Allocator* allocator;                         ///< Allocator object
     VrtbinType vrtbinType;                        ///< Type of VRTBIN
@@ -110,6 +126,29 @@ class Device {
     std::shared_ptr<ZmqServer> zmqServer;         ///< ZeroMQ server object
     std::vector<QdmaConnection> qdmaConnections;  ///< Vector of QDMA connections
     std::vector<QdmaIntf*> qdmaIntfs;             ///< Vector of QDMA interfaces for streaming
+    std::shared_ptr<DmaEngine> dmaEngine;         ///< Engine for memory mapped buffer transfers
+    uint32_t dmaQueueCount = DmaEngine::DEFAULT_QUEUES;  ///< Number of memory mapped queues
+    int numaNode = -1;                                   ///< NUMA node of the card, -1 if unknown
+
+    /**
+     * @brief Gets the indexes of the memory mapped queues used for buffer transfers.
+     * @param connections The streaming connections, whose queue indexes are skipped.
+     * @return The queue indexes.
+     */
+    std::vector<uint32_t> getDmaQueueIds(const std::vector<QdmaConnection>& connections);
+
+    /**
+     * @brief Sets up the memory mapped and stream QDMA queues with the setup script.
+     * @param missingOnly Only set up queues whose device node does not exist yet.
+     */
+    void setupQdmaQueues(bool missingOnly = false);
+
+    /**
+     * @brief Reads the logic UUID of the design running on the device.
+     * @return The logic UUID, or an empty string if it cannot be read.
+     */
+    std::string readLogicUUID();
+
    public:
     QdmaIntf qdmaIntf;  ///< QDMA interface object
 
@@ -118,9 +157,12 @@ class Device {
      * @param bdf The Bus:Device.Function identifier.
      * @param vrtbinPath The path to the VRTBIN file.
      * @param program Flag indicating whether to program the device.
+     * @param programType The method used to program the device.
+     * @param programMode Whether a device already running the VRTBIN's design is programmed.
      */
     Device(const std::string& bdf, const std::string& vrtbinPath, bool program = true,
-           ProgramType programType = ProgramType::FLASH);
+           ProgramType programType = ProgramType::FLASH,
+           ProgramMode programMode = ProgramMode::IF_CHANGED);
 
     Device() = default;
     /**
@@ -136,8 +178,24 @@ class Device {
      */
     std::string getBdf();
 
+    /**
+     * @brief Creates an empty command graph to record transfers and launches on the device.
+     * @param policy The backoff between two polls of the running nodes.
+     * @return The command graph.
+     */
+    CommandGraph createGraph(const BackoffPolicy& policy = BackoffPolicy());
+
+    /**
+     * @brief Gets the NUMA node the card is attached to.
+     * @return The NUMA node, or -1 if it is unknown or the device is not hardware.
+     */
+    int getNumaNode();
+
     /**
      * @brief Programs the device.
+     *
+     * With ProgramMode::IF_CHANGED, a device whose running design has the logic UUID of the
+     * VRTBIN is neither programmed nor booted, only missing QDMA queues are set up.
      */
     void programDevice();
 
@@ -173,7 +231,7 @@ class Device {
     ~Device();
 
     /**
-     * @brief Parses the system map file.
+     * @brief Reads the clock frequency, platform and QDMA connections from the system map.
      */
     void parseSystemMap();
 
@@ -241,6 +299,11 @@ class Device {
      */
     std::vector<QdmaIntf*> getQdmaInterfaces();
 
+    /**
+     * @brief Gets the DMA engine used for buffer transfers on hardware.
+     */
+    std::shared_ptr<DmaEngine> getDmaEngine();
+
     /**
      * @brief Locks pcie device, for exclusive access.
      */
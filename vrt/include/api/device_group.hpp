@@ -0,0 +1,302 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#ifndef DEVICE_GROUP_HPP
+#define DEVICE_GROUP_HPP
+
+#include <chrono>
+#include <functional>
+#include <future>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include "api/buffer.hpp"
+#include "api/completion.hpp"
+#include "api/device.hpp"
+#include "api/kernel.hpp"
+
+namespace vrt {
+
+/**
+ * @brief Struct reporting the bring-up of one device of a DeviceGroup.
+ */
+struct DeviceStatus {
+    std::string bdf;                    ///< Bus:Device.Function identifier of the device
+    bool ok = false;                    ///< Whether the device was brought up
+    std::string error;                  ///< Error message if the bring-up failed
+    std::chrono::milliseconds time{0};  ///< Duration of the bring-up, including programming
+};
+
+/**
+ * @brief Class bringing up several devices concurrently.
+ *
+ * Each device is constructed, i.e. its VRTBIN extracted, programmed and its system map parsed, on
+ * a worker thread, so bringing up a node with several cards takes about as long as the slowest
+ * card. A card that fails to come up does not stop the others: its error is reported in
+ * getStatus() and it is left out of the group.
+ */
+class DeviceGroup {
+    std::vector<std::unique_ptr<Device>> devices;  ///< Devices brought up, in the order of the BDFs
+    std::vector<DeviceStatus> status;               ///< Bring-up report of every BDF
+    size_t threads;                                 ///< Maximum number of worker threads
+
+   public:
+    /**
+     * @brief Constructor for DeviceGroup.
+     * @param bdfs The Bus:Device.Function identifiers of the devices.
+     * @param vrtbinPath The path to the VRTBIN file, used for every device.
+     * @param program Flag indicating whether to program the devices.
+     * @param programType The method used to program the devices.
+     * @param programMode Whether devices already running the VRTBIN's design are programmed.
+     * @param threads Maximum number of devices brought up at the same time, 0 for all at once.
+     */
+    DeviceGroup(const std::vector<std::string>& bdfs, const std::string& vrtbinPath,
+                bool program = true, ProgramType programType = ProgramType::FLASH,
+                ProgramMode programMode = ProgramMode::IF_CHANGED, size_t threads = 0);
+
+    /**
+     * @brief Gets the number of devices brought up.
+     * @return The number of devices in the group.
+     */
+    size_t getSize() const;
+
+    /**
+     * @brief Gets a device of the group.
+     * @param index The index of the device, among the devices brought up.
+     * @return The device.
+     * @throws std::out_of_range If the index is out of range.
+     */
+    Device& operator[](size_t index);
+
+    /**
+     * @brief Gets the bring-up report of every BDF, in the order they were given.
+     * @return The status of each device.
+     */
+    const std::vector<DeviceStatus>& getStatus() const;
+
+    /**
+     * @brief Checks whether every device was brought up.
+     * @return True if no bring-up failed.
+     */
+    bool ok() const;
+
+    /**
+     * @brief Runs a function on every device concurrently, on up to one thread per device.
+     * @param function The function, called with the device and its index.
+     * @throws The first exception thrown by the function, once all calls returned.
+     */
+    void forEach(const std::function<void(Device&, size_t)>& function);
+
+    /**
+     * @brief Sets the clock frequency of every device.
+     * @param freq The frequency in Hz.
+     */
+    void setFrequency(uint64_t freq);
+
+    /**
+     * @brief Cleans up every device.
+     */
+    void cleanup();
+};
+
+/**
+ * @brief Class holding one buffer of the same size on every device of a group.
+ *
+ * A BufferGroup passed to KernelGroup::start is replaced by the buffer of each device.
+ *
+ * @tparam T The type of the elements in the buffers.
+ */
+template <typename T>
+class BufferGroup {
+    std::vector<Buffer<T>> buffers;  ///< Buffer of each device, in the order of the group
+
+   public:
+    /**
+     * @brief Constructor for BufferGroup.
+     * @param group The devices to allocate the buffers on.
+     * @param size The number of elements of each buffer.
+     * @param type The type of memory range.
+     */
+    BufferGroup(DeviceGroup& group, size_t size, MemoryRangeType type) {
+        buffers.reserve(group.getSize());
+        for (size_t i = 0; i < group.getSize(); i++) {
+            buffers.emplace_back(group[i], size, type);
+        }
+    }
+
+    /**
+     * @brief Constructor for BufferGroup.
+     * @param group The devices to allocate the buffers on.
+     * @param size The number of elements of each buffer.
+     * @param type The type of memory range.
+     * @param port The HBM port number. This would not have any effect if the type is DDR.
+     */
+    BufferGroup(DeviceGroup& group, size_t size, MemoryRangeType type, uint8_t port) {
+        buffers.reserve(group.getSize());
+        for (size_t i = 0; i < group.getSize(); i++) {
+            buffers.emplace_back(group[i], size, type, port);
+        }
+    }
+
+    /**
+     * @brief Gets the number of buffers.
+     * @return The number of buffers, one per device.
+     */
+    size_t getSize() const { return buffers.size(); }
+
+    /**
+     * @brief Gets the buffer of a device.
+     * @param index The index of the device in the group.
+     * @return The buffer.
+     */
+    Buffer<T>& operator[](size_t index) { return buffers.at(index); }
+
+    /**
+     * @brief Gets the buffer of a device (const version).
+     * @param index The index of the device in the group.
+     * @return The buffer.
+     */
+    const Buffer<T>& operator[](size_t index) const { return buffers.at(index); }
+
+    /**
+     * @brief Starts synchronizing every buffer, see Buffer::syncAsync.
+     * @param syncType The type of synchronization.
+     * @return A future per buffer, in the order of the group.
+     */
+    std::vector<std::future<void>> syncAsync(SyncType syncType) {
+        std::vector<std::future<void>> pending;
+        pending.reserve(buffers.size());
+        for (auto& buffer : buffers) {
+            pending.push_back(buffer.syncAsync(syncType));
+        }
+        return pending;
+    }
+
+    /**
+     * @brief Synchronizes every buffer, the transfers to different devices overlap.
+     * @param syncType The type of synchronization.
+     * @throws The first error of a transfer, once all transfers completed.
+     */
+    void sync(SyncType syncType) {
+        std::vector<std::future<void>> pending = syncAsync(syncType);
+        std::exception_ptr error;
+        for (auto& future : pending) {
+            try {
+                future.get();
+            } catch (...) {
+                if (!error) {
+                    error = std::current_exception();
+                }
+            }
+        }
+        if (error) {
+            std::rethrow_exception(error);
+        }
+    }
+};
+
+/**
+ * @brief Gets the argument passed to the kernel of one device by KernelGroup.
+ * @param value A scalar argument, passed unchanged to every device.
+ * @return The value.
+ */
+template <typename T>
+T fanOutArg(const T& value, size_t) {
+    return value;
+}
+
+/**
+ * @brief Gets the argument passed to the kernel of one device by KernelGroup.
+ * @param buffers A buffer per device.
+ * @param index The index of the device.
+ * @return The physical address of the buffer of the device.
+ */
+template <typename T>
+uint64_t fanOutArg(const BufferGroup<T>& buffers, size_t index) {
+    return buffers[index].getPhysAddr();
+}
+
+/**
+ * @brief Class holding the same kernel of every device of a group.
+ */
+class KernelGroup {
+    std::vector<Kernel> kernels;  ///< Kernel of each device, in the order of the group
+
+   public:
+    /**
+     * @brief Constructor for KernelGroup.
+     * @param group The devices of the kernels.
+     * @param kernelName The name of the kernel.
+     */
+    KernelGroup(DeviceGroup& group, const std::string& kernelName);
+
+    /**
+     * @brief Gets the number of kernels.
+     * @return The number of kernels, one per device.
+     */
+    size_t getSize() const;
+
+    /**
+     * @brief Gets the kernel of a device.
+     * @param index The index of the device in the group.
+     * @return The kernel.
+     */
+    Kernel& operator[](size_t index);
+
+    /**
+     * @brief Gets the kernels, e.g. to wait on them together with other kernels.
+     * @return The kernel of each device.
+     */
+    std::vector<Kernel>& getKernels();
+
+    /**
+     * @brief Starts the kernel on every device.
+     * @param args The arguments. Scalars are passed to every device, a BufferGroup as the
+     * buffer of each device.
+     */
+    template <typename... Args>
+    void start(const Args&... args) {
+        for (size_t i = 0; i < kernels.size(); i++) {
+            kernels[i].start(fanOutArg(args, i)...);
+        }
+    }
+
+    /**
+     * @brief Starts the kernel on every device and waits for all of them to complete.
+     * @param args The arguments, see start.
+     */
+    template <typename... Args>
+    void call(const Args&... args) {
+        start(args...);
+        wait();
+    }
+
+    /**
+     * @brief Waits for the kernel to complete on every device.
+     * @param timeout The maximum time to wait, NO_TIMEOUT to wait forever.
+     * @return True if all kernels completed, false on timeout.
+     */
+    bool wait(std::chrono::microseconds timeout = NO_TIMEOUT);
+};
+
+}  // namespace vrt
+
+#endif  // DEVICE_GROUP_HPP
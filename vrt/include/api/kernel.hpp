@@ -27,22 +27,81 @@
 
 #include <iostream>
 #include <memory>
-#include <regex>
 #include <stdexcept>
 #include <string>
 #include <type_traits>
 #include <vector>
 
 #include "register/register.hpp"
+#include "utils/backoff.hpp"
 #include "utils/logger.hpp"
 #include "utils/platform.hpp"
+#include "utils/tracer.hpp"
 #include "utils/zmq_server.hpp"
 
 namespace vrt {
 class Device;
+class LaunchDescriptor;
 template <typename T>
 class Buffer;
 
+/**
+ * @brief Struct describing where an argument of a kernel is written.
+ */
+struct LaunchArg {
+    uint32_t offset;      ///< Offset of the register, of the low word for 64 bit arguments
+    uint32_t highOffset;  ///< Offset of the high word of 64 bit arguments
+    bool wide;            ///< Whether the argument is a 64 bit buffer address
+};
+
+/**
+ * @brief Struct with the register layout of the arguments of a kernel.
+ *
+ * Built once from the registers of the system map, so launching a kernel only copies the
+ * arguments into a register image that is written to the device in one burst.
+ */
+struct LaunchPlan {
+    static constexpr uint32_t FIRST_ARG_OFFSET = 0x10;  ///< After CTRL, GIER, IP_IER and IP_ISR
+    std::vector<LaunchArg> args;                        ///< Arguments in call order
+    uint32_t imageSize = 0;  ///< Number of registers from FIRST_ARG_OFFSET to the last one
+
+    /**
+     * @brief Builds the plan of a kernel.
+     * @param registers The registers of the kernel. Registers whose name ends with _<number>
+     * hold the two words of a buffer address.
+     */
+    LaunchPlan(std::vector<Register> registers);
+
+    /**
+     * @brief Constructor for a plan that was built before, e.g. loaded from a compiled system map.
+     * @param args The arguments in call order.
+     * @param imageSize The number of registers of the register image.
+     */
+    LaunchPlan(std::vector<LaunchArg> args, uint32_t imageSize);
+
+    /**
+     * @brief Packs an argument into a register image.
+     * @param image The register image, of imageSize registers.
+     * @param index The index of the argument.
+     * @param value The value of the argument.
+     */
+    void pack(uint32_t* image, size_t index, uint64_t value) const {
+        const LaunchArg& arg = args[index];
+        image[(arg.offset - FIRST_ARG_OFFSET) / sizeof(uint32_t)] = value & 0xFFFFFFFF;
+        if (arg.wide) {
+            image[(arg.highOffset - FIRST_ARG_OFFSET) / sizeof(uint32_t)] =
+                static_cast<uint32_t>((value >> 32) & 0xFFFFFFFF);
+        }
+    }
+
+    /**
+     * @brief Finds the argument a register offset belongs to.
+     * @param offset The offset of the register.
+     * @return The index of the argument, or -1 if no scalar argument is at the offset.
+     */
+    int scalarIndex(uint32_t offset) const;
+};
+
 /**
  * @brief Class representing a kernel.
  */
@@ -53,12 +112,37 @@ class Kernel {
     std::string name;                                         ///< Name of the kernel
     uint64_t baseAddr;                                        ///< Base address of the kernel
     uint64_t range;                                           ///< Address range of the kernel
-    std::vector<Register> registers;                          ///< List of registers in the kernel
-    size_t currentRegisterIndex = 4;           ///< Index of the current register being processed
-    std::string deviceBdf;                     ///< BDF of the device
-    Platform platform;                         ///< Platform of the device
-    std::shared_ptr<ZmqServer> server;         ///< Pointer to ZeroMQ server for communication
-    std::map<uint32_t, uint32_t> registerMap;  ///< Map of register offsets to values
+    size_t currentArgIndex = 0;              ///< Index of the current argument being processed
+    std::string deviceBdf;                   ///< BDF of the device
+    Platform platform;                       ///< Platform of the device
+    std::shared_ptr<ZmqServer> server;       ///< Pointer to ZeroMQ server for communication
+    std::shared_ptr<const LaunchPlan> plan;  ///< Register layout of the arguments
+    std::vector<uint32_t> registerImage;     ///< Argument registers written by writeBatch
+    uint16_t traceName = 0;                  ///< Name of the kernel interned by the tracer
+
+    /**
+     * @brief Checks that another argument can be processed.
+     */
+    void checkArgIndex() const {
+        if (!plan || currentArgIndex >= plan->args.size()) {
+            throw std::runtime_error("Not enough registers to process all arguments.");
+        }
+    }
+
+    /**
+     * @brief Sends the registers of the first arguments to the simulation in one batch.
+     * @param image The register image, from LaunchPlan::FIRST_ARG_OFFSET.
+     * @param argCount The number of arguments to write.
+     */
+    void writeSimBatch(const std::vector<uint32_t>& image, size_t argCount);
+
+    uint16_t getTraceName() {
+        if (traceName == 0 && Tracer::isEnabled()) {
+            traceName = Tracer::intern(name);
+        }
+        return traceName;
+    }
+
    public:
     /**
      * @brief Constructor for Kernel.
@@ -71,6 +155,17 @@ class Kernel {
     Kernel(ami_device* device, const std::string& name, uint64_t baseAddr, uint64_t range,
            const std::vector<Register>& registers);
 
+    /**
+     * @brief Constructor for Kernel with a launch plan shared with other kernels.
+     * @param device Pointer to the AMI device.
+     * @param name The name of the kernel.
+     * @param baseAddr The base address of the kernel.
+     * @param range The address range of the kernel.
+     * @param plan The register layout of the arguments of the kernel.
+     */
+    Kernel(ami_device* device, const std::string& name, uint64_t baseAddr, uint64_t range,
+           std::shared_ptr<const LaunchPlan> plan);
+
     /**
      * @brief Default constructor for Kernel.
      */
@@ -108,6 +203,20 @@ class Kernel {
      */
     void wait();
 
+    /**
+     * @brief Waits for the kernel to complete, up to a timeout.
+     * @param timeout The longest time to wait.
+     * @param policy The backoff between two polls of the kernel.
+     * @return True if the kernel completed, false on timeout.
+     */
+    bool wait(std::chrono::microseconds timeout, const BackoffPolicy& policy = BackoffPolicy());
+
+    /**
+     * @brief Checks whether the kernel completed, with a single read of its control register.
+     * @return True if the kernel is not running.
+     */
+    bool isDone();
+
     /**
      * @brief Starts the kernel.
      * @param autorestart Flag indicating whether to enable autorestart.
@@ -121,34 +230,44 @@ class Kernel {
     void setPlatform(Platform platform);
 
     /**
-     * @brief Writes batch register to PCIe BAR.
+     * @brief Writes batch register to PCIe BAR, or to the simulation in one request.
      */
     void writeBatch();
 
+    /**
+     * @brief Writes the register image of a launch descriptor to the PCIe BAR in one burst, or to
+     * the simulation in one request.
+     * @param descriptor The launch descriptor.
+     */
+    void writeBatch(const LaunchDescriptor& descriptor);
+
+    /**
+     * @brief Gets the register layout of the arguments of the kernel.
+     * @return The launch plan, shared by the copies of the kernel.
+     */
+    std::shared_ptr<const LaunchPlan> getLaunchPlan() const;
+
+    /**
+     * @brief Starts the kernel with the arguments of a launch descriptor.
+     * @param descriptor The launch descriptor, created for this kernel.
+     */
+    void start(const LaunchDescriptor& descriptor);
+
+    /**
+     * @brief Calls the kernel with the arguments of a launch descriptor and waits for it to
+     * complete.
+     * @param descriptor The launch descriptor, created for this kernel.
+     */
+    void call(const LaunchDescriptor& descriptor);
+
     /**
      * @brief Calls the kernel and waits for it to complete.
      * @param args The arguments to pass to the kernel.
      */
     template <typename... Args>
     void call(Args... args) {
-        currentRegisterIndex = 4;
-        if (platform == Platform::HARDWARE) {
-            (processArg(args), ...);
-            this->writeBatch();
-            this->startKernel();
-            this->wait();
-        } else if (platform == Platform::EMULATION) {
-            Json::Value command;
-            command["command"] = "call";
-            command["function"] = name;
-            int argIdx = 0;
-            (processEmuArg(args, command, argIdx), ...);
-            server->sendCommand(command);
-        } else if (platform == Platform::SIMULATION) {
-            (processSimArg(args), ...);
-            this->startKernel();
-            this->wait();
-        }
+        this->start(args...);
+        this->wait();
     }
 
     /**
@@ -157,12 +276,12 @@ class Kernel {
      */
     template <typename... Args>
     void start(Args... args) {
-        currentRegisterIndex = 4;
+        TraceScope trace(TraceType::KERNEL_START, 0, baseAddr, getTraceName());
+        currentArgIndex = 0;
         if (platform == Platform::HARDWARE) {
             (processArg(args), ...);
             this->writeBatch();
             this->startKernel();
-
         } else if (platform == Platform::EMULATION) {
             Json::Value command;
             command["command"] = "call";
@@ -172,9 +291,23 @@ class Kernel {
             server->sendCommand(command);
         } else if (platform == Platform::SIMULATION) {
             (processSimArg(args), ...);
+            this->writeBatch();
             this->startKernel();
         }
     }
+    /**
+     * @brief Starts the kernel with arguments only known at run time, e.g. from the Python
+     * bindings.
+     * @param args The arguments to pass to the kernel, buffers as their physical address.
+     */
+    void start(const std::vector<int64_t>& args);
+
+    /**
+     * @brief Calls the kernel with arguments only known at run time and waits for it to complete.
+     * @param args The arguments to pass to the kernel, buffers as their physical address.
+     */
+    void call(const std::vector<int64_t>& args);
+
     /**
      * @brief Helper method which processes an argument.
      * @tparam T The type of the argument.
@@ -182,22 +315,8 @@ class Kernel {
      */
     template <typename T>
     void processArg(T arg) {
-        if (currentRegisterIndex < registers.size()) {
-            std::regex re(".*_\\d+$");  // Regular expression to match strings ending with _nr
-            if (std::regex_match(registers.at(currentRegisterIndex).getRegisterName(), re)) {
-                this->registerMap[registers.at(currentRegisterIndex).getOffset()] =
-                    arg & 0xFFFFFFFF;
-                this->registerMap[registers.at(currentRegisterIndex + 1).getOffset()] =
-                    static_cast<uint32_t>((static_cast<uint64_t>(arg) >> 32) & 0xFFFFFFFF);
-                currentRegisterIndex += 2;
-            } else {
-                this->registerMap[registers.at(currentRegisterIndex).getOffset()] = arg;
-                currentRegisterIndex++;
-            }
-
-        } else {
-            throw std::runtime_error("Not enough registers to process all arguments.");
-        }
+        checkArgIndex();
+        plan->pack(registerImage.data(), currentArgIndex++, static_cast<uint64_t>(arg));
     }
 
     /**
@@ -207,17 +326,8 @@ class Kernel {
      */
     template <typename T>
     void processSimArg(T arg) {
-        if (currentRegisterIndex < registers.size()) {
-            std::regex re(".*_\\d+$");  // Regular expression to match strings ending with _nr
-            if (std::regex_match(registers.at(currentRegisterIndex).getRegisterName(), re)) {
-                this->write(registers.at(currentRegisterIndex).getOffset(), arg & 0xFFFFFFFF);
-                this->write(registers.at(currentRegisterIndex + 1).getOffset(),
-                            static_cast<uint32_t>((static_cast<uint64_t>(arg) >> 32) & 0xFFFFFFFF));
-                currentRegisterIndex += 2;
-            } else {
-                this->write(registers.at(currentRegisterIndex).getOffset(), arg);
-                currentRegisterIndex++;
-            }
+        if (plan && currentArgIndex < plan->args.size()) {
+            plan->pack(registerImage.data(), currentArgIndex++, static_cast<uint64_t>(arg));
         }
     }
 
@@ -230,21 +340,16 @@ class Kernel {
      */
     template <typename T>
     void processEmuArg(T arg, Json::Value& command, int& argIndex) {
-        if (currentRegisterIndex < registers.size()) {
-            std::regex re(".*_\\d+$");  // Regular expression to match strings ending with _nr
-            if (std::regex_match(registers.at(currentRegisterIndex).getRegisterName(), re)) {
-                command["args"]["arg" + std::to_string(argIndex)]["type"] = "buffer";
-                command["args"]["arg" + std::to_string(argIndex)]["name"] = std::to_string(arg);
-                currentRegisterIndex += 2;
-            } else {
-                command["args"]["arg" + std::to_string(argIndex)]["type"] = "scalar";
-                command["args"]["arg" + std::to_string(argIndex)]["value"] = arg;
-                currentRegisterIndex++;
-            }
-            argIndex++;
+        checkArgIndex();
+        Json::Value& value = command["args"]["arg" + std::to_string(argIndex)];
+        if (plan->args[currentArgIndex++].wide) {
+            value["type"] = "buffer";
+            value["name"] = std::to_string(arg);
         } else {
-            throw std::runtime_error("Not enough registers to process all arguments.");
+            value["type"] = "scalar";
+            value["value"] = arg;
         }
+        argIndex++;
     }
 
     /**
@@ -276,12 +381,12 @@ class Kernel {
           name(std::move(other.name)),
           baseAddr(other.baseAddr),
           range(other.range),
-          registers(std::move(other.registers)),
-          currentRegisterIndex(other.currentRegisterIndex),
+          currentArgIndex(other.currentArgIndex),
           deviceBdf(std::move(other.deviceBdf)),
           platform(other.platform),
           server(std::move(other.server)),
-          registerMap(std::move(other.registerMap)) {}
+          plan(std::move(other.plan)),
+          registerImage(std::move(other.registerImage)) {}
 
     /**
      * @brief Copy assignment operator.
@@ -304,12 +409,12 @@ class Kernel {
             name = std::move(other.name);
             baseAddr = other.baseAddr;
             range = other.range;
-            registers = std::move(other.registers);
-            currentRegisterIndex = other.currentRegisterIndex;
+            currentArgIndex = other.currentArgIndex;
             deviceBdf = std::move(other.deviceBdf);
             platform = other.platform;
             server = std::move(other.server);
-            registerMap = std::move(other.registerMap);
+            plan = std::move(other.plan);
+            registerImage = std::move(other.registerImage);
         }
         return *this;
     }
@@ -0,0 +1,101 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#ifndef LAUNCH_DESCRIPTOR_HPP
+#define LAUNCH_DESCRIPTOR_HPP
+
+#include <cstdint>
+#include <memory>
+#include <stdexcept>
+#include <vector>
+
+#include "api/kernel.hpp"
+
+namespace vrt {
+
+/**
+ * @brief Class holding the arguments of a kernel launch, packed in the register layout of the
+ * kernel.
+ *
+ * A descriptor is created once per kernel and reused: setting an argument only writes its
+ * registers in the image, and Kernel::start writes the whole image in a single burst. Arguments
+ * that are not set keep their previous value.
+ */
+class LaunchDescriptor {
+    std::shared_ptr<const LaunchPlan> plan;  ///< Register layout of the kernel
+    std::vector<uint32_t> image;             ///< Argument registers, from FIRST_ARG_OFFSET
+    std::vector<int64_t> values;             ///< Argument values, for emulation and simulation
+
+   public:
+    /**
+     * @brief Constructor for LaunchDescriptor.
+     * @param kernel The kernel the descriptor launches.
+     */
+    LaunchDescriptor(const Kernel& kernel);
+
+    /**
+     * @brief Sets an argument.
+     * @param index The index of the argument.
+     * @param value The value of the argument, buffers as their physical address.
+     * @return Reference to this descriptor.
+     * @throws std::out_of_range if the kernel has no such argument.
+     */
+    LaunchDescriptor& setArg(size_t index, int64_t value);
+
+    /**
+     * @brief Sets the arguments, in order.
+     * @param args The arguments to pass to the kernel.
+     * @return Reference to this descriptor.
+     */
+    template <typename... Args>
+    LaunchDescriptor& setArgs(Args... args) {
+        size_t index = 0;
+        (setArg(index++, static_cast<int64_t>(args)), ...);
+        return *this;
+    }
+
+    /**
+     * @brief Gets the number of arguments of the kernel.
+     * @return The number of arguments.
+     */
+    size_t getArgCount() const;
+
+    /**
+     * @brief Gets the register image.
+     * @return The argument registers, starting at LaunchPlan::FIRST_ARG_OFFSET.
+     */
+    const std::vector<uint32_t>& getImage() const;
+
+    /**
+     * @brief Gets the argument values.
+     * @return The argument values.
+     */
+    const std::vector<int64_t>& getValues() const;
+
+    /**
+     * @brief Gets the register layout the descriptor was built for.
+     * @return The launch plan.
+     */
+    std::shared_ptr<const LaunchPlan> getLaunchPlan() const;
+};
+
+}  // namespace vrt
+
+#endif  // LAUNCH_DESCRIPTOR_HPP
@@ -29,10 +29,11 @@
 #include <memory>
 #include <string>
 
+#include "parser/compiled_system_map.hpp"
 #include "parser/xml_parser.hpp"
 #include "utils/logger.hpp"
 #include "utils/platform.hpp"
-#include "utils/filesystem_cache.hpp"
+#include "utils/vrtbin_cache.hpp"
 
 namespace vrt {
 
@@ -45,12 +46,14 @@ class Vrtbin {
     std::string versionPath;                                        ///< Path to the version file
     std::string pdiPath;                                            ///< Path to the PDI file
     std::string uuid;                                               ///< UUID of the VRTBIN
-    std::string tempExtractPath = FilesystemCache::getCachePath();  ///< Temporary extraction path
+    std::string tempExtractPath;                                    ///< Cache entry of the VRTBIN
     std::string emulationExecPath;                                  ///< Path to the emulation executable
     std::string simulationExecPath;                                 ///< Path to the simulation executable
     Platform platform;                                              ///< Platform type
+    std::shared_ptr<VrtbinCache> cache;                             ///< Extraction cache entry
+    std::shared_ptr<const CompiledSystemMap> systemMap;             ///< Parsed system map
     /**
-     * @brief Copies a file from source to destination.
+     * @brief Copies a file from source to destination, unless both are identical.
      * @param source The source file path.
      * @param destination The destination file path.
      */
@@ -65,7 +68,11 @@ class Vrtbin {
     Vrtbin(std::string vrtbinPath, const std::string& bdf);
 
     /**
-     * @brief Extracts the VRTBIN file.
+     * @brief Extracts the members of the VRTBIN used on its platform into the extraction cache.
+     *
+     * Members are read from the archive in-process and only once per VRTBIN content, later
+     * calls for the same VRTBIN reuse the cached files. See VrtbinCache. The system map is
+     * loaded from its compiled form, keyed by the UUID of the VRTBIN. See CompiledSystemMap.
      */
     void extract();
 
@@ -75,6 +82,12 @@ class Vrtbin {
      */
     std::string getSystemMapPath();
 
+    /**
+     * @brief Gets the parsed system map, shared by all users of the VRTBIN in the process.
+     * @return The system map.
+     */
+    std::shared_ptr<const CompiledSystemMap> getSystemMap();
+
     /**
      * @brief Gets the path to the PDI file.
      * @return The path to the PDI file.
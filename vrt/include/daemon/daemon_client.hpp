@@ -0,0 +1,213 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#ifndef DAEMON_CLIENT_HPP
+#define DAEMON_CLIENT_HPP
+
+#include <cstdint>
+#include <mutex>
+#include <string>
+#include <vector>
+
+#include "allocator/allocator.hpp"
+#include "api/buffer.hpp"
+#include "daemon/daemon_protocol.hpp"
+#include "utils/platform.hpp"
+
+namespace vrt {
+
+class DaemonClient;
+
+/**
+ * @brief Class for a buffer allocated through the device manager daemon.
+ *
+ * The host memory is shared with the daemon, which transfers it with the DMA engine of the device,
+ * so data written to it is synchronized without a copy. The buffer is freed when it is
+ * destroyed; its client must outlive it.
+ */
+class RemoteBuffer {
+    DaemonClient* client = nullptr;  ///< Client that allocated the buffer
+    uint64_t address = 0;            ///< Physical address on the device
+    size_t size = 0;                 ///< Size in bytes
+    uint8_t* data = nullptr;         ///< Mapping of the host memory
+
+   public:
+    /**
+     * @brief Constructor for RemoteBuffer, used by DaemonClient::allocate.
+     * @param client The client.
+     * @param address The physical address of the buffer.
+     * @param size The size of the buffer in bytes.
+     * @param fd The memfd of the host memory, closed once it is mapped.
+     * @throws std::system_error If the memory cannot be mapped.
+     */
+    RemoteBuffer(DaemonClient* client, uint64_t address, size_t size, int fd);
+
+    /**
+     * @brief Destructor for RemoteBuffer. Frees the buffer.
+     */
+    ~RemoteBuffer();
+
+    /**
+     * @brief Gets the host memory of the buffer.
+     * @return Pointer to the host memory, as elements of type T.
+     */
+    template <typename T = uint8_t>
+    T* get() const {
+        return reinterpret_cast<T*>(data);
+    }
+
+    /**
+     * @brief Gets the size of the buffer.
+     * @return The size in bytes.
+     */
+    size_t getSize() const;
+
+    /**
+     * @brief Gets the physical address of the buffer, to pass it to a kernel.
+     * @return The physical address.
+     */
+    uint64_t getPhysAddr() const;
+
+    /**
+     * @brief Synchronizes the buffer.
+     * @param syncType The type of synchronization.
+     * @param offset The offset of the range to synchronize, in bytes.
+     * @param size The size of the range in bytes, 0 for the rest of the buffer.
+     */
+    void sync(SyncType syncType, size_t offset = 0, size_t size = 0);
+
+    RemoteBuffer(const RemoteBuffer&) = delete;
+    RemoteBuffer& operator=(const RemoteBuffer&) = delete;
+    RemoteBuffer(RemoteBuffer&& other) noexcept;
+    RemoteBuffer& operator=(RemoteBuffer&& other) noexcept;
+};
+
+/**
+ * @brief Class for a connection to the device manager daemon.
+ *
+ * A client uses a device the daemon keeps programmed, without bringing it up itself. Requests
+ * are sent in order and wait for their reply; they are safe to call from several threads, but
+ * only requests of different clients run concurrently on the device. The clients of a process
+ * share its buffers, so a buffer allocated through one client can be used through another.
+ */
+class DaemonClient {
+   public:
+    /**
+     * @brief Constructor for DaemonClient. Connects to the daemon and attaches to a device.
+     * @param bdf The BDF of the device, empty for the first device of the daemon.
+     * @param socketPath The path of the socket of the daemon.
+     * @throws std::system_error If the daemon cannot be reached.
+     * @throws std::runtime_error If the daemon has no such device.
+     */
+    DaemonClient(const std::string& bdf = "",
+                 const std::string& socketPath = DaemonSocket::getDefaultPath());
+
+    /**
+     * @brief Destructor for DaemonClient. The daemon frees the buffers left.
+     */
+    ~DaemonClient();
+
+    /**
+     * @brief Allocates a buffer.
+     * @param size The size of the buffer in bytes.
+     * @param type The type of memory range.
+     * @return The buffer.
+     * @throws std::runtime_error If the daemon failed to allocate the buffer.
+     */
+    RemoteBuffer allocate(size_t size, MemoryRangeType type = MemoryRangeType::HBM);
+
+    /**
+     * @brief Allocates a buffer on an HBM port.
+     * @param size The size of the buffer in bytes.
+     * @param type The type of memory range.
+     * @param port The HBM port number. This would not have any effect if the type is DDR.
+     * @return The buffer.
+     * @throws std::runtime_error If the daemon failed to allocate the buffer.
+     */
+    RemoteBuffer allocate(size_t size, MemoryRangeType type, uint8_t port);
+
+    /**
+     * @brief Synchronizes a range of a buffer.
+     * @param buffer The buffer.
+     * @param syncType The type of synchronization.
+     * @param offset The offset of the range to synchronize, in bytes.
+     * @param size The size of the range in bytes, 0 for the rest of the buffer.
+     * @throws std::runtime_error If the transfer failed.
+     */
+    void sync(const RemoteBuffer& buffer, SyncType syncType, size_t offset = 0, size_t size = 0);
+
+    /**
+     * @brief Runs a kernel and waits for it to complete.
+     * @param kernel The name of the kernel.
+     * @param args The arguments of the kernel, buffers as their physical address.
+     * @throws std::runtime_error If the kernel does not exist or failed.
+     */
+    void call(const std::string& kernel, const std::vector<int64_t>& args);
+
+    /**
+     * @brief Frees a buffer. Called by the destructor of RemoteBuffer.
+     * @param address The physical address of the buffer.
+     */
+    void release(uint64_t address);
+
+    /**
+     * @brief Gets the platform of the device.
+     * @return The platform.
+     */
+    Platform getPlatform() const;
+
+    /**
+     * @brief Gets the clock frequency of the kernels.
+     * @return The frequency in Hz.
+     */
+    uint64_t getFrequency() const;
+
+    DaemonClient(const DaemonClient&) = delete;
+    DaemonClient& operator=(const DaemonClient&) = delete;
+
+   private:
+    int socket = -1;                ///< Socket connected to the daemon
+    uint32_t sequence = 0;          ///< Sequence number of the last request
+    std::mutex mutex;               ///< Serializes the requests
+    Platform platform;              ///< Platform of the device
+    uint64_t clockFrequency = 0;    ///< Clock frequency of the kernels in Hz
+    std::vector<uint8_t> response;  ///< Payload of the last reply
+
+    /**
+     * @brief Sends a request and waits for its reply. The mutex must be held.
+     * @param opcode The opcode of the request.
+     * @param payload The payload.
+     * @param size The size of the payload.
+     * @param fd Receives the file descriptor passed with the reply, may be nullptr.
+     * @throws std::runtime_error If the request failed, with the error of the daemon.
+     */
+    void request(DaemonOpcode opcode, const void* payload, size_t size, int* fd = nullptr);
+
+    /**
+     * @brief Allocates a buffer.
+     * @param allocation The allocation request.
+     * @return The buffer.
+     */
+    RemoteBuffer allocate(const AllocateRequest& allocation);
+};
+
+}  // namespace vrt
+
+#endif  // DAEMON_CLIENT_HPP
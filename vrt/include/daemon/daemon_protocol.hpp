@@ -0,0 +1,161 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#ifndef DAEMON_PROTOCOL_HPP
+#define DAEMON_PROTOCOL_HPP
+
+#include <cstdint>
+#include <string>
+#include <vector>
+
+namespace vrt {
+
+/**
+ * @brief Enum class representing the requests a client sends to the device manager daemon.
+ */
+enum class DaemonOpcode : uint16_t {
+    ATTACH = 1,  ///< Selects the device of the connection, payload: BDF, empty for the first
+    ALLOCATE,    ///< Allocates a buffer, payload: AllocateRequest, reply: AllocateReply + fd
+    RELEASE,     ///< Frees a buffer, payload: ReleaseRequest
+    SYNC,        ///< Synchronizes part of a buffer, payload: SyncRequest
+    LAUNCH,      ///< Runs a kernel to completion, payload: LaunchRequest, arguments, name
+};
+
+/**
+ * @brief Struct for the header of every message, requests and replies.
+ *
+ * A reply has the opcode and sequence number of its request. On failure its status is not 0 and
+ * its payload is the error message.
+ */
+struct DaemonHeader {
+    static constexpr uint32_t MAGIC = 0x44545256;  ///< "VRTD"
+    static constexpr uint16_t VERSION = 1;         ///< Version of the protocol
+    uint32_t magic = MAGIC;                        ///< Always MAGIC
+    uint16_t version = VERSION;                    ///< Always VERSION
+    uint16_t opcode = 0;                           ///< DaemonOpcode of the request
+    uint32_t sequence = 0;                         ///< Number of the request on the connection
+    int32_t status = 0;                            ///< 0 on success
+};
+
+/**
+ * @brief Struct for the reply of ATTACH.
+ */
+struct AttachReply {
+    uint32_t platform;        ///< Platform of the device
+    uint32_t reserved;        ///< Always 0
+    uint64_t clockFrequency;  ///< Clock frequency of the kernels in Hz
+};
+
+/**
+ * @brief Struct for the payload of ALLOCATE.
+ */
+struct AllocateRequest {
+    uint64_t size;    ///< Size of the buffer in bytes
+    uint8_t type;     ///< MemoryRangeType of the buffer
+    uint8_t port;     ///< HBM port, if hasPort is set
+    uint8_t hasPort;  ///< Whether port is set
+    uint8_t reserved[5];
+};
+
+/**
+ * @brief Struct for the reply of ALLOCATE. The memfd of the host memory is passed along.
+ */
+struct AllocateReply {
+    uint64_t address;  ///< Physical address of the buffer on the device
+    uint64_t size;     ///< Size of the buffer in bytes
+};
+
+/**
+ * @brief Struct for the payload of RELEASE.
+ */
+struct ReleaseRequest {
+    uint64_t address;  ///< Physical address of the buffer
+};
+
+/**
+ * @brief Struct for the payload of SYNC.
+ */
+struct SyncRequest {
+    uint64_t address;    ///< Physical address of the buffer
+    uint64_t offset;     ///< Offset of the range to synchronize, in bytes
+    uint64_t size;       ///< Size of the range to synchronize, in bytes
+    uint32_t direction;  ///< SyncType of the synchronization
+    uint32_t reserved;   ///< Always 0
+};
+
+/**
+ * @brief Struct for the start of the payload of LAUNCH, followed by the int64_t arguments and
+ * the name of the kernel.
+ */
+struct LaunchRequest {
+    uint32_t argCount;    ///< Number of arguments
+    uint32_t nameLength;  ///< Length of the name of the kernel
+};
+
+/**
+ * @brief Static class for messages on the Unix socket of the daemon.
+ *
+ * The socket is a SOCK_SEQPACKET socket, so every message is a header and its payload, and file
+ * descriptors are passed as SCM_RIGHTS ancillary data.
+ */
+class DaemonSocket {
+   public:
+    /// Largest message, header included
+    static constexpr size_t MAX_MESSAGE_SIZE = 64 * 1024;
+
+    /**
+     * @brief Disable construction of static class.
+     */
+    DaemonSocket() = delete;
+
+    /**
+     * @brief Gets the path of the socket.
+     * @return $VRT_DAEMON_SOCKET if it is set, otherwise vrtd.sock in the runtime directory.
+     */
+    static std::string getDefaultPath();
+
+    /**
+     * @brief Sends a message.
+     * @param socket The socket.
+     * @param header The header.
+     * @param payload The payload.
+     * @param size The size of the payload.
+     * @param fd A file descriptor to pass, -1 for none.
+     * @return True on success, false if the peer is gone.
+     */
+    static bool send(int socket, const DaemonHeader& header, const void* payload, size_t size,
+                     int fd = -1);
+
+    /**
+     * @brief Receives a message.
+     * @param socket The socket.
+     * @param header The received header.
+     * @param payload The received payload.
+     * @param fd The received file descriptor, or -1. May be nullptr if none is expected.
+     * @return True on success, false if the peer closed the connection.
+     * @throws std::runtime_error If the message is not a valid message.
+     */
+    static bool receive(int socket, DaemonHeader& header, std::vector<uint8_t>& payload,
+                        int* fd = nullptr);
+};
+
+}  // namespace vrt
+
+#endif  // DAEMON_PROTOCOL_HPP
@@ -0,0 +1,147 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#ifndef DEVICE_MANAGER_HPP
+#define DEVICE_MANAGER_HPP
+
+#include <atomic>
+#include <cstdint>
+#include <map>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include "api/device.hpp"
+#include "daemon/daemon_protocol.hpp"
+#include "utils/backoff.hpp"
+
+namespace vrt {
+
+/**
+ * @brief Class serving devices to client processes over a Unix socket.
+ *
+ * The manager owns the devices for as long as it runs, so their design stays loaded and the
+ * clients skip the bring-up. A client connects, attaches to a device by BDF and sends ALLOCATE,
+ * RELEASE, SYNC and LAUNCH requests, see DaemonOpcode. The host memory of a buffer is a memfd
+ * mapped by both the manager and the client, so transfers are DMA'd from and to the memory the
+ * client writes and reads, without copies.
+ *
+ * Each device has a scheduler thread. It keeps a queue per connection and takes the next request
+ * of each connection in turn, so a client flooding the device delays the others by at most one
+ * request each. The requests of a connection run in order, one at a time, while requests of
+ * different connections overlap: transfers run on the DMA engine and kernels run concurrently,
+ * a kernel busy for one client is only started for another once it is done. Replies are sent
+ * without blocking, a client that stops reading them is disconnected.
+ *
+ * Buffers belong to the client process, identified by the credentials of its socket, so the
+ * connections of a process share them and a process gets several requests in flight by opening
+ * several connections. They are freed once the last connection of the process closed and its
+ * running requests completed. The buffer arguments of a LAUNCH must point into buffers of the
+ * process, which cannot be released while the kernel runs. A kernel is not confined to them
+ * though, so the clients allowed on the socket have full access to the devices.
+ */
+class DeviceManager {
+   public:
+    /**
+     * @brief Constructor for DeviceManager.
+     * @param devices The devices to serve, which must outlive the manager.
+     * @param socketPath The path of the Unix socket. A stale socket at this path is replaced.
+     * @param policy The backoff between two polls of the running requests.
+     * @throws std::invalid_argument If no device is given.
+     * @throws std::system_error If the socket cannot be created.
+     */
+    DeviceManager(const std::vector<Device*>& devices,
+                  const std::string& socketPath = DaemonSocket::getDefaultPath(),
+                  const BackoffPolicy& policy = BackoffPolicy());
+
+    /**
+     * @brief Destructor for DeviceManager. Stops the schedulers and removes the socket.
+     */
+    ~DeviceManager();
+
+    /**
+     * @brief Serves the clients until stop() is called.
+     */
+    void run();
+
+    /**
+     * @brief Makes run() return. Safe to call from a signal handler.
+     */
+    void stop();
+
+    /**
+     * @brief Gets the path of the socket.
+     * @return The path of the Unix socket.
+     */
+    const std::string& getSocketPath() const;
+
+    /**
+     * @brief Gets the number of connected clients.
+     * @return The number of connections.
+     */
+    size_t getClientCount() const;
+
+    DeviceManager(const DeviceManager&) = delete;
+    DeviceManager& operator=(const DeviceManager&) = delete;
+
+   private:
+    struct Connection;
+    class Scheduler;
+
+    std::string socketPath;                                  ///< Path of the Unix socket
+    int listener = -1;                                       ///< Listening socket
+    int wakeup[2] = {-1, -1};                                ///< Pipe written by stop()
+    std::vector<std::unique_ptr<Scheduler>> schedulers;      ///< Scheduler of each device
+    std::map<int, std::shared_ptr<Connection>> connections;  ///< Connections by socket
+    std::atomic<size_t> clientCount{0};                      ///< Number of connections
+    uint64_t nextConnection = 0;                             ///< Identifier of the next connection
+    std::vector<uint8_t> message;                            ///< Receive buffer of run()
+
+    /**
+     * @brief Accepts a pending connection.
+     */
+    void accept();
+
+    /**
+     * @brief Handles the next message of a connection.
+     * @param connection The connection.
+     * @return False if the connection is closed.
+     */
+    bool handle(const std::shared_ptr<Connection>& connection);
+
+    /**
+     * @brief Attaches a connection to a device.
+     * @param connection The connection.
+     * @param header The header of the ATTACH request.
+     * @param bdf The BDF of the device, empty for the first device.
+     */
+    void attach(const std::shared_ptr<Connection>& connection, const DaemonHeader& header,
+                const std::string& bdf);
+
+    /**
+     * @brief Closes a connection, its requests and buffers are dropped by its scheduler.
+     * @param connection The connection.
+     */
+    void disconnect(const std::shared_ptr<Connection>& connection);
+};
+
+}  // namespace vrt
+
+#endif  // DEVICE_MANAGER_HPP
@@ -28,6 +28,7 @@
 
 #include "api/kernel.hpp"
 #include "utils/logger.hpp"
+#include "utils/tracer.hpp"
 
 namespace vrt {
 #define XCLK_WIZ_HANDLER_CLK_OUTOF_RANGE 1
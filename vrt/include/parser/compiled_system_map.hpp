@@ -0,0 +1,216 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#ifndef COMPILED_SYSTEM_MAP_HPP
+#define COMPILED_SYSTEM_MAP_HPP
+
+#include <cstdint>
+#include <memory>
+#include <string>
+#include <string_view>
+#include <vector>
+
+#include "api/kernel.hpp"
+#include "parser/xml_parser.hpp"
+#include "qdma/qdma_connection.hpp"
+#include "register/register.hpp"
+#include "utils/platform.hpp"
+
+namespace vrt {
+
+/**
+ * @brief Class holding a system map compiled to a flat binary file.
+ *
+ * The first load of a system map parses its XML with XMLParser and writes the result, with the
+ * launch plans of the kernels, to <cache>/system_map/<key>.bin. Later loads, from this or any
+ * other process, mmap that file instead of parsing the XML. The key is the logic UUID of the
+ * vrtbin, or its content hash when it has no UUID. The file records its format version and a hash
+ * of the XML it was compiled from, a file of another version or XML is compiled again.
+ *
+ * Loads of the same key in a process share one instance, and the kernels created from it share
+ * their launch plans, so opening more devices with the same vrtbin neither parses XML nor copies
+ * registers.
+ */
+class CompiledSystemMap {
+    struct Header;
+    struct KernelRecord;
+    struct RegisterRecord;
+    struct ArgRecord;
+    struct QdmaRecord;
+    struct StringRef;
+
+    std::string key;                                       ///< Key of the system map
+    void* mapping = nullptr;                               ///< Mapping of the binary file
+    size_t mappingSize = 0;                                ///< Size of the mapping
+    std::string data;                                      ///< Binary image, if not mapped
+    const Header* header = nullptr;                        ///< Header of the image
+    const KernelRecord* kernelRecords = nullptr;           ///< Kernels, sorted by name
+    const RegisterRecord* registerRecords = nullptr;       ///< Registers of all kernels
+    const ArgRecord* argRecords = nullptr;                 ///< Arguments of all kernels
+    const QdmaRecord* qdmaRecords = nullptr;               ///< QDMA connections
+    const char* strings = nullptr;                         ///< String table
+    std::vector<std::shared_ptr<const LaunchPlan>> plans;  ///< Launch plans by kernel index
+
+    /**
+     * @brief Compiles an XML system map to its binary image.
+     * @param xmlPath The path to the XML system map.
+     * @param key The key of the system map.
+     * @param xmlHash The hash of the XML system map.
+     * @return The binary image.
+     */
+    static std::string compile(const std::string& xmlPath, const std::string& key,
+                               uint64_t xmlHash);
+
+    /**
+     * @brief Maps a binary file if it is a valid image for the key and XML hash.
+     * @param path The path to the binary file.
+     * @param xmlHash The hash of the XML system map.
+     * @return True if the file was mapped.
+     */
+    bool map(const std::string& path, uint64_t xmlHash);
+
+    /**
+     * @brief Checks the image at base and sets the record pointers to it.
+     * @param base The start of the image.
+     * @param size The size of the image in bytes.
+     * @param xmlHash The hash of the XML system map.
+     * @return True if the image is valid.
+     */
+    bool attach(const char* base, size_t size, uint64_t xmlHash);
+
+    /**
+     * @brief Gets a string of the string table.
+     * @param ref The reference to the string.
+     * @return A view of the string, valid for the lifetime of the system map.
+     */
+    std::string_view getString(const StringRef& ref) const;
+
+    /**
+     * @brief Finds a kernel by name.
+     * @param name The name of the kernel.
+     * @return The index of the kernel, or -1 if there is no such kernel.
+     */
+    int findKernel(std::string_view name) const;
+
+    /**
+     * @brief Constructor for CompiledSystemMap. Use load().
+     * @param xmlPath The path to the XML system map.
+     * @param key The key of the system map.
+     */
+    CompiledSystemMap(const std::string& xmlPath, const std::string& key);
+
+   public:
+    /// Version of the binary format, files of other versions are compiled again
+    static constexpr uint32_t VERSION = 2;
+
+    /**
+     * @brief Loads a system map, compiling it if there is no valid binary file for it yet.
+     * @param xmlPath The path to the XML system map.
+     * @param key The key of the system map, the logic UUID or content hash of the vrtbin.
+     * @return The system map.
+     * @throws std::runtime_error If the XML system map cannot be parsed.
+     */
+    static std::shared_ptr<const CompiledSystemMap> load(const std::string& xmlPath,
+                                                         const std::string& key);
+
+    /**
+     * @brief Destructor for CompiledSystemMap. Unmaps the binary file.
+     */
+    ~CompiledSystemMap();
+
+    /**
+     * @brief Gets the key of the system map.
+     * @return The key of the system map.
+     */
+    const std::string& getKey() const;
+
+    /**
+     * @brief Gets the clock frequency of the device.
+     * @return The clock frequency of the device.
+     */
+    uint64_t getClockFrequency() const;
+
+    /**
+     * @brief Gets the VRT bin type of the device.
+     * @return The VRT bin type of the device.
+     */
+    VrtbinType getVrtbinType() const;
+
+    /**
+     * @brief Gets the platform of the device.
+     * @return The platform of the device.
+     */
+    Platform getPlatform() const;
+
+    /**
+     * @brief Checks whether the emulation/simulation executable supports shared memory buffers.
+     * @return True if buffer data can be transferred through shared memory.
+     */
+    bool getSharedMemory() const;
+
+    /**
+     * @brief Checks whether the simulation executable supports the binary scalar protocol.
+     * @return True if scalar accesses can be sent as binary requests.
+     */
+    bool getBinaryProtocol() const;
+
+    /**
+     * @brief Gets the QDMA connections.
+     * @return The QDMA connections, in system map order.
+     */
+    std::vector<QdmaConnection> getQdmaConnections() const;
+
+    /**
+     * @brief Gets the names of the kernels.
+     * @return The names of the kernels, sorted.
+     */
+    std::vector<std::string> getKernelNames() const;
+
+    /**
+     * @brief Checks whether the system map has a kernel.
+     * @param name The name of the kernel.
+     * @return True if the kernel exists.
+     */
+    bool hasKernel(const std::string& name) const;
+
+    /**
+     * @brief Creates a kernel. Kernels created for the same name share their launch plan.
+     * @param name The name of the kernel.
+     * @param device Pointer to the AMI device.
+     * @return The kernel.
+     * @throws std::out_of_range If there is no such kernel.
+     */
+    Kernel getKernel(const std::string& name, ami_device* device) const;
+
+    /**
+     * @brief Gets the registers of a kernel.
+     * @param name The name of the kernel.
+     * @return The registers of the kernel, in system map order.
+     * @throws std::out_of_range If there is no such kernel.
+     */
+    std::vector<Register> getRegisters(const std::string& name) const;
+
+    CompiledSystemMap(const CompiledSystemMap&) = delete;
+    CompiledSystemMap& operator=(const CompiledSystemMap&) = delete;
+};
+
+}  // namespace vrt
+
+#endif  // COMPILED_SYSTEM_MAP_HPP
@@ -45,6 +45,16 @@ enum class VrtbinType {
     // PARTIAL when implemented
 };
 
+/**
+ * @brief Struct with the description of a kernel in the system map.
+ */
+struct KernelDescription {
+    std::string name;                 ///< Name of the kernel
+    uint64_t baseAddr = 0;            ///< Base address of the kernel
+    uint64_t range = 0;               ///< Address range of the kernel
+    std::vector<Register> registers;  ///< Registers of the kernel, in system map order
+};
+
 /**
  * @brief Class for parsing XML files to extract kernel information.
  */
@@ -53,11 +63,14 @@ class XMLParser {
     xmlDocPtr document;    ///< Pointer to the parsed XML document.
     xmlNode* rootNode;     ///< Pointer to the root node of the XML document.
     xmlNode* workingNode;  ///< Pointer to the current working node in the XML document.
-    std::map<std::string, Kernel> kernels;        ///< Map of kernel names to Kernel objects.
-    uint64_t clockFrequency;                      ///< The clock frequency of the device.
-    VrtbinType vrtbinType;                        ///< The VRT bin type of the device.
-    Platform platform;                            ///< The platform of the device.
-    std::vector<QdmaConnection> qdmaConnections;  ///< Vector of QDMA connections.
+    std::map<std::string, Kernel> kernels;              ///< Map of kernel names to Kernel objects.
+    std::vector<KernelDescription> kernelDescriptions;  ///< Kernels as described in the file.
+    uint64_t clockFrequency = 0;                        ///< The clock frequency of the device.
+    VrtbinType vrtbinType = VrtbinType::FLAT;           ///< The VRT bin type of the device.
+    Platform platform = Platform::UNKNOWN;              ///< The platform of the device.
+    std::vector<QdmaConnection> qdmaConnections;        ///< Vector of QDMA connections.
+    bool sharedMemory = false;  ///< Whether the emulator/simulator supports shared memory buffers.
+    bool binaryProtocol = false;  ///< Whether the simulator supports the binary protocol.
 
    public:
     /**
@@ -84,6 +97,12 @@ class XMLParser {
      */
     std::map<std::string, Kernel> getKernels();
 
+    /**
+     * @brief Gets the descriptions of the kernels parsed from the XML file.
+     * @return The kernels with their registers, in file order.
+     */
+    std::vector<KernelDescription> getKernelDescriptions();
+
     /**
      * @brief Gets the clock frequency of the device.
      * @return The clock frequency of the device.
@@ -108,6 +127,18 @@ class XMLParser {
      */
     std::vector<QdmaConnection> getQdmaConnections();
 
+    /**
+     * @brief Checks whether the emulation/simulation executable supports shared memory buffers.
+     * @return True if buffer data can be transferred through shared memory.
+     */
+    bool getSharedMemory();
+
+    /**
+     * @brief Checks whether the simulation executable supports the binary scalar protocol.
+     * @return True if scalar accesses can be sent as binary requests.
+     */
+    bool getBinaryProtocol();
+
     /**
      * @brief Destructor for XMLParser.
      */
@@ -0,0 +1,188 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#ifndef DMA_ENGINE_HPP
+#define DMA_ENGINE_HPP
+
+#include <atomic>
+#include <condition_variable>
+#include <deque>
+#include <exception>
+#include <future>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <thread>
+#include <vector>
+
+#include "qdma/qdma_intf.hpp"
+
+namespace vrt {
+
+/**
+ * @brief Enum class representing the direction of a DMA transfer.
+ */
+enum class DmaDirection {
+    HOST_TO_DEVICE,  ///< Host memory to device memory
+    DEVICE_TO_HOST,  ///< Device memory to host memory
+};
+
+/**
+ * @brief Class for pipelined transfers over several memory mapped QDMA queues.
+ *
+ * A transfer is split into chunks that are queued and executed by a pool of worker threads,
+ * worker i issuing its chunks on queue i modulo the number of queues. The number of workers is
+ * the number of transfers in flight. Transfers return a future that completes once all their
+ * chunks are done, so they can overlap with each other and with kernel execution.
+ *
+ * Device creates the engine of a board, with the number of queues, transfers in flight and chunk
+ * size taken from VRT_DMA_QUEUES, VRT_DMA_IN_FLIGHT and VRT_DMA_CHUNK_SIZE if they are set.
+ */
+class DmaEngine {
+   public:
+    static constexpr uint32_t DEFAULT_QUEUES = 4;           ///< Default number of queues
+    static constexpr uint32_t DEFAULT_IN_FLIGHT = 8;        ///< Default transfers in flight
+    static constexpr size_t DEFAULT_CHUNK_SIZE = 16 << 20;  ///< Default chunk size in bytes
+    static constexpr size_t MIN_CHUNK_SIZE = 1 << 20;       ///< Smallest chunk when splitting
+    static constexpr size_t CHUNK_ALIGNMENT = 4096;         ///< Alignment of chunk sizes
+
+    /**
+     * @brief Constructor for DmaEngine.
+     * @param bdf The BDF (Bus:Device.Function) of the device.
+     * @param queueIds Indexes of the memory mapped queues to use. Queues without a device node are
+     * skipped, the first queue is always used.
+     * @param inFlight The number of transfers in flight.
+     * @param chunkSize The largest chunk a transfer is split into, in bytes.
+     */
+    DmaEngine(const std::string& bdf, const std::vector<uint32_t>& queueIds,
+              uint32_t inFlight = DEFAULT_IN_FLIGHT, size_t chunkSize = DEFAULT_CHUNK_SIZE);
+
+    /**
+     * @brief Destructor for DmaEngine. Completes the queued transfers and stops the workers.
+     */
+    ~DmaEngine();
+
+    /**
+     * @brief Queues a transfer.
+     * @param direction The direction of the transfer.
+     * @param buffer The host memory, which must stay valid until the transfer completes.
+     * @param address The device address.
+     * @param size The size of the transfer in bytes.
+     * @return A future that completes with the transfer, or holds the error if it failed.
+     */
+    std::future<void> submit(DmaDirection direction, char* buffer, uint64_t address, size_t size);
+
+    /**
+     * @brief Transfers data and waits for completion.
+     * @param direction The direction of the transfer.
+     * @param buffer The host memory.
+     * @param address The device address.
+     * @param size The size of the transfer in bytes.
+     * @throws std::runtime_error if the transfer failed.
+     */
+    void transfer(DmaDirection direction, char* buffer, uint64_t address, size_t size);
+
+    /**
+     * @brief Changes the number of transfers in flight and the chunk size. Waits for the queued
+     * transfers to complete first.
+     * @param inFlight The number of transfers in flight.
+     * @param chunkSize The largest chunk a transfer is split into, in bytes.
+     */
+    void configure(uint32_t inFlight, size_t chunkSize);
+
+    /**
+     * @brief Gets the number of queues in use.
+     * @return The number of queues.
+     */
+    uint32_t getQueueCount() const;
+
+    /**
+     * @brief Gets the number of transfers in flight.
+     * @return The number of transfers in flight.
+     */
+    uint32_t getInFlight() const;
+
+    /**
+     * @brief Gets the largest chunk a transfer is split into.
+     * @return The chunk size in bytes.
+     */
+    size_t getChunkSize() const;
+
+    DmaEngine(const DmaEngine&) = delete;
+    DmaEngine& operator=(const DmaEngine&) = delete;
+
+   private:
+    /**
+     * @brief Completion state shared by the chunks of a transfer.
+     */
+    struct Batch {
+        std::promise<void> promise;        ///< Completed by the last chunk
+        std::atomic<size_t> remaining{0};  ///< Number of chunks not completed yet
+        std::atomic<bool> failed{false};   ///< Set by the first failing chunk
+        std::exception_ptr error;          ///< Error of the first failing chunk
+    };
+
+    /**
+     * @brief A chunk of a transfer.
+     */
+    struct Chunk {
+        DmaDirection direction;        ///< Direction of the transfer
+        char* buffer;                  ///< Host memory of the chunk
+        uint64_t address;              ///< Device address of the chunk
+        size_t size;                   ///< Size of the chunk in bytes
+        std::shared_ptr<Batch> batch;  ///< Transfer the chunk belongs to
+    };
+
+    /**
+     * @brief Starts the worker threads.
+     */
+    void startWorkers();
+
+    /**
+     * @brief Stops the worker threads once the queued chunks are done.
+     */
+    void stopWorkers();
+
+    /**
+     * @brief Worker thread loop.
+     * @param queue The queue the worker issues its chunks on.
+     */
+    void worker(QdmaIntf* queue);
+
+    /**
+     * @brief Executes a chunk and completes its transfer if it is the last one.
+     * @param queue The queue to issue the chunk on.
+     * @param chunk The chunk to execute.
+     */
+    static void execute(QdmaIntf* queue, const Chunk& chunk);
+
+    std::vector<std::unique_ptr<QdmaIntf>> queues;  ///< Memory mapped queues
+    std::vector<std::thread> workers;               ///< Worker threads
+    std::deque<Chunk> pending;                      ///< Chunks waiting for a worker
+    std::mutex mutex;                               ///< Protects pending and stopping
+    std::condition_variable available;              ///< Signals pending chunks or stopping
+    bool stopping = false;                          ///< Set to stop the workers
+    uint32_t inFlight;                              ///< Number of worker threads
+    size_t chunkSize;                               ///< Largest chunk size in bytes
+};
+
+}  // namespace vrt
+
+#endif  // DMA_ENGINE_HPP
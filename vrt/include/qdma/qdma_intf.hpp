@@ -30,6 +30,7 @@
 #include <string>
 
 #include "utils/logger.hpp"
+#include "utils/tracer.hpp"
 
 #define RW_MAX_SIZE 0x7ffff000  ///< Maximum size for read/write operations
 #define GB_DIV 1000000000       ///< Divider for gigabytes
@@ -40,8 +41,18 @@
 #define QDMA_QUEUE_NAME "qdma%s001"                              ///< Format for QDMA queue name
 #define QDMA_DEFAULT_QUEUE "/dev/qdma%s001-MM-0"                 ///< Default QDMA queue
 #define QDMA_DEFAULT_ST_QUEUE "/dev/qdma%s001-ST-%u"             ///< Default stream queue
+#define QDMA_DEFAULT_MM_QUEUE "/dev/qdma%s001-MM-%u"             ///< Memory mapped queue
 
 namespace vrt {
+
+/**
+ * @brief Enum class representing the mode of a QDMA queue.
+ */
+enum class QdmaQueueType {
+    MEMORY_MAPPED,  ///< Memory mapped queue, used for buffers
+    STREAM,         ///< Stream queue, used for streaming connections
+};
+
 /**
  * @brief Class for interfacing with QDMA.
  */
@@ -109,6 +120,14 @@ class QdmaIntf {
      */
     QdmaIntf(const std::string& bdf, const uint32_t queueIdx);
 
+    /**
+     * @brief Constructor of the QdmaIntf class with queue index and queue type
+     * @param bdf The BDF (Bus:Device.Function) of the device.
+     * @param queueIdx The index of the queue.
+     * @param type The mode of the queue.
+     */
+    QdmaIntf(const std::string& bdf, const uint32_t queueIdx, QdmaQueueType type);
+
     /**
      * @brief Default constructor for QdmaIntf.
      */
@@ -119,22 +138,31 @@ class QdmaIntf {
      * @param buffer The buffer to write.
      * @param start_addr The starting address to write to.
      * @param size The size of the buffer.
+     * @return The number of bytes written, or a negative value on failure.
      */
-    void write_buff(char* buffer, uint64_t start_addr, uint64_t size);
+    ssize_t write_buff(char* buffer, uint64_t start_addr, uint64_t size);
 
     /**
      * @brief Reads a buffer from the device.
      * @param buffer The buffer to read into.
      * @param start_addr The starting address to read from.
      * @param size The size of the buffer.
+     * @return The number of bytes read, or a negative value on failure.
      */
-    void read_buff(char* buffer, uint64_t start_addr, uint64_t size);
+    ssize_t read_buff(char* buffer, uint64_t start_addr, uint64_t size);
 
     /**
      * @brief Gets the queue index.
      * @return The queue index.
      */
     uint32_t getQueueIdx();
+
+    /**
+     * @brief Gets the path of the queue device.
+     * @return The path of the queue device.
+     */
+    std::string getQueueName();
+
     /**
      * @brief Destructor for QdmaIntf.
      */
@@ -0,0 +1,73 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#ifndef BACKOFF_HPP
+#define BACKOFF_HPP
+
+#include <chrono>
+#include <cstdint>
+
+namespace vrt {
+
+/**
+ * @brief Struct configuring how long to wait between two polls of a kernel.
+ */
+struct BackoffPolicy {
+    uint32_t spinPolls = 32;                  ///< Polls before starting to sleep
+    std::chrono::microseconds minSleep{5};    ///< First sleep after the spin polls
+    std::chrono::microseconds maxSleep{200};  ///< Longest sleep between two polls
+};
+
+/**
+ * @brief Class implementing adaptive backoff for polling loops.
+ *
+ * The first polls only yield the CPU, so short kernels complete with the lowest latency. Longer
+ * waits sleep between polls, doubling the sleep up to the maximum, so waiting threads do not
+ * keep a core busy.
+ */
+class Backoff {
+    BackoffPolicy policy;                ///< Policy of the backoff
+    uint32_t polls = 0;                  ///< Polls since the last reset
+    std::chrono::microseconds sleep{0};  ///< Next sleep duration
+
+   public:
+    /**
+     * @brief Constructor for Backoff.
+     * @param policy The policy of the backoff.
+     */
+    Backoff(const BackoffPolicy& policy = BackoffPolicy());
+
+    /**
+     * @brief Waits before the next poll.
+     */
+    void pause();
+
+    /**
+     * @brief Restarts from the spin polls, e.g. once progress was made.
+     */
+    void reset();
+};
+
+/// Timeout value meaning wait forever
+constexpr std::chrono::microseconds NO_TIMEOUT = std::chrono::microseconds::max();
+
+}  // namespace vrt
+
+#endif  // BACKOFF_HPP
@@ -27,6 +27,7 @@
 #include <iomanip>
 #include <iostream>
 #include <memory>
+#include <mutex>
 #include <sstream>
 #include <string>
 
@@ -101,6 +102,8 @@ class Logger {
         std::string levelStr = getLevelString(level);
         std::string currentTime = getCurrentTime();
         std::string message = formatString(format, std::forward<Args>(args)...);
+        // Devices of a DeviceGroup and DMA workers log from several threads
+        std::lock_guard<std::mutex> lock(mutex_);
         (*output_) << color << "[" << currentTime << "] [" << std::setw(5) << std::left << levelStr
                    << "] " << std::setw(80) << std::left << function << resetColor << ": "
                    << message << std::endl;
@@ -110,6 +113,7 @@ class Logger {
     static std::unique_ptr<std::ofstream> fileStream_;  ///< File stream for log output.
     static std::ostream* output_;                       ///< Current output stream for logging.
     static LogLevel currentLogLevel_;                   ///< Current minimum log level threshold.
+    static std::mutex mutex_;                           ///< Serializes writes to the output.
 
     /**
      * @brief Gets the color code for a log level.
@@ -0,0 +1,80 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#ifndef SHARED_MEMORY_HPP
+#define SHARED_MEMORY_HPP
+
+#include <atomic>
+#include <cstdint>
+#include <string>
+
+namespace vrt {
+
+/**
+ * @brief Class for a POSIX shared memory region.
+ *
+ * Used as the data plane between the host and the emulation/simulation executables: buffer
+ * contents are copied into the region and only the region name is sent over ZeroMQ. The peer
+ * unlinks the name once it has mapped the region, so no name is left behind if either side
+ * crashes.
+ */
+class SharedMemory {
+    std::string name;                     ///< Name of the region, e.g. /vrt-<pid>-<n>.
+    uint8_t* address = nullptr;           ///< Address the region is mapped at.
+    size_t size = 0;                      ///< Size of the region in bytes.
+    static std::atomic<uint64_t> counter;  ///< Counter used to create unique region names.
+
+   public:
+    /**
+     * @brief Creates and maps a new shared memory region.
+     * @param size The size of the region in bytes.
+     */
+    SharedMemory(size_t size);
+
+    /**
+     * @brief Unmaps the region and unlinks its name if the peer did not.
+     */
+    ~SharedMemory();
+
+    /**
+     * @brief Gets the mapped region.
+     * @return Pointer to the start of the region.
+     */
+    uint8_t* data() const;
+
+    /**
+     * @brief Gets the size of the region.
+     * @return The size of the region in bytes.
+     */
+    size_t getSize() const;
+
+    /**
+     * @brief Gets the name of the region, as passed to shm_open.
+     * @return The name of the region.
+     */
+    const std::string& getName() const;
+
+    SharedMemory(const SharedMemory&) = delete;
+    SharedMemory& operator=(const SharedMemory&) = delete;
+};
+
+}  // namespace vrt
+
+#endif  // SHARED_MEMORY_HPP
@@ -0,0 +1,98 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#ifndef TAR_READER_HPP
+#define TAR_READER_HPP
+
+#include <cstdint>
+#include <filesystem>
+#include <map>
+#include <string>
+
+namespace vrt {
+
+/**
+ * @brief Struct describing a regular file stored in a tar archive.
+ */
+struct TarMember {
+    std::string name;     ///< Path of the member in the archive, without a leading "./"
+    uint64_t offset = 0;  ///< Offset of the member data in the archive
+    uint64_t size = 0;    ///< Size of the member data in bytes
+    uint32_t mode = 0;    ///< Permission bits of the member
+};
+
+/**
+ * @brief Class for reading members of a tar archive without extracting the whole archive.
+ *
+ * Only the headers are read when the archive is opened, the data of a member is read when it is
+ * extracted. ustar archives are supported, including the GNU long name and pax path extensions
+ * written by GNU tar and Python's tarfile. Entries other than regular files are ignored.
+ */
+class TarReader {
+    std::string path;                           ///< Path to the archive
+    std::map<std::string, TarMember> members;  ///< Regular files of the archive by name
+
+    /**
+     * @brief Reads the headers of the archive.
+     */
+    void scan();
+
+   public:
+    /**
+     * @brief Constructor for TarReader.
+     * @param path The path to the archive.
+     * @throws std::runtime_error If the archive cannot be read or is not a tar archive.
+     */
+    TarReader(const std::string& path);
+
+    /**
+     * @brief Checks whether the archive contains a regular file.
+     * @param name The name of the member.
+     * @return True if the member exists.
+     */
+    bool contains(const std::string& name) const;
+
+    /**
+     * @brief Gets a member of the archive.
+     * @param name The name of the member.
+     * @return The member.
+     * @throws std::out_of_range If the member does not exist.
+     */
+    const TarMember& getMember(const std::string& name) const;
+
+    /**
+     * @brief Gets all regular files of the archive.
+     * @return The members by name.
+     */
+    const std::map<std::string, TarMember>& getMembers() const;
+
+    /**
+     * @brief Writes a member to a file, keeping its permission bits.
+     * @param name The name of the member.
+     * @param destination The path of the file to write.
+     * @throws std::out_of_range If the member does not exist.
+     * @throws std::runtime_error If the member cannot be read or written.
+     */
+    void extract(const std::string& name, const std::filesystem::path& destination) const;
+};
+
+}  // namespace vrt
+
+#endif  // TAR_READER_HPP
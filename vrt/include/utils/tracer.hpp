@@ -0,0 +1,189 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#ifndef TRACER_HPP
+#define TRACER_HPP
+
+#include <atomic>
+#include <cstdint>
+#include <string>
+
+namespace vrt {
+
+/**
+ * @brief Enum class representing the operation of a trace event.
+ */
+enum class TraceType : uint16_t {
+    KERNEL_WRITE,           ///< Kernel register write
+    KERNEL_READ,            ///< Kernel register read
+    KERNEL_START,           ///< Kernel argument write and start
+    KERNEL_WAIT,            ///< Wait for a kernel to complete
+    BUFFER_SYNC_TO_DEVICE,  ///< Buffer synchronization from host to device
+    BUFFER_SYNC_TO_HOST,    ///< Buffer synchronization from device to host
+    ALLOCATE,               ///< Device memory allocation
+    DEALLOCATE,             ///< Device memory deallocation
+    CLOCK_SET,              ///< Clock wizard programming
+    QDMA_WRITE,             ///< QDMA transfer from host to device
+    QDMA_READ,              ///< QDMA transfer from device to host
+    COUNT                   ///< Number of event types
+};
+
+/**
+ * @brief Struct for a trace event, as stored in the trace file.
+ */
+struct TraceEvent {
+    uint64_t start;     ///< Start time in nanoseconds of the steady clock
+    uint64_t duration;  ///< Duration in nanoseconds
+    uint64_t bytes;     ///< Bytes transferred, 0 if the operation has no size
+    uint64_t address;   ///< Device address of the operation, 0 if none
+    uint32_t thread;    ///< Index of the recording thread, starting at 1
+    uint16_t type;      ///< TraceType of the operation
+    uint16_t name;      ///< Interned name, e.g. of the kernel, 0 if none
+};
+
+/**
+ * @brief Static class for the runtime tracing layer.
+ *
+ * When tracing is enabled, every thread records its events into its own lock-free ring buffer,
+ * and a background thread periodically drains the rings into a binary trace file. Events are
+ * dropped, and counted, when a ring is full. When tracing is disabled, recording an event costs
+ * a single relaxed atomic load.
+ *
+ * Tracing is enabled at startup when VRT_TRACE is set to the path of the trace file, or with
+ * enable(). The file is read with vrt/trace/vrt_trace.py.
+ *
+ * The file starts with the magic "VRTTRACE", a 32 bit version and the 32 bit size of a
+ * TraceEvent, followed by chunks of a 32 bit tag and a 32 bit payload size:
+ *
+ * - TYPE: the names of the event types, as 16 bit id and NUL terminated string pairs.
+ * - NAME: interned names, as 16 bit id and NUL terminated string pairs.
+ * - EVTS: an array of TraceEvent.
+ * - DROP: a 64 bit count of events dropped since the previous DROP chunk.
+ */
+class Tracer {
+    static std::atomic<bool> enabled;  ///< Whether events are recorded
+
+   public:
+    /// Version of the trace file format
+    static constexpr uint32_t VERSION = 1;
+
+    /// Number of events a ring buffer of a thread holds
+    static constexpr size_t RING_CAPACITY = 1 << 14;
+
+    /**
+     * @brief Disable construction of static class.
+     */
+    Tracer() = delete;
+
+    /**
+     * @brief Checks whether tracing is enabled.
+     * @return True if events are recorded.
+     */
+    static bool isEnabled() { return enabled.load(std::memory_order_relaxed); }
+
+    /**
+     * @brief Starts recording events into a trace file, replacing any trace being recorded.
+     * @param path The path of the trace file.
+     * @throws std::runtime_error If the file cannot be created.
+     */
+    static void enable(const std::string& path);
+
+    /**
+     * @brief Stops recording, writes the remaining events and closes the trace file.
+     */
+    static void disable();
+
+    /**
+     * @brief Writes the events recorded so far to the trace file.
+     */
+    static void flush();
+
+    /**
+     * @brief Interns a name so events can refer to it by id.
+     * @param name The name, e.g. of a kernel.
+     * @return The id of the name.
+     */
+    static uint16_t intern(const std::string& name);
+
+    /**
+     * @brief Gets the current time of the trace clock.
+     * @return Nanoseconds of the steady clock.
+     */
+    static uint64_t now();
+
+    /**
+     * @brief Records an event of the calling thread.
+     * @param type The operation.
+     * @param start The start time, from now().
+     * @param bytes The bytes transferred.
+     * @param address The device address.
+     * @param name The interned name.
+     */
+    static void record(TraceType type, uint64_t start, uint64_t bytes, uint64_t address,
+                       uint16_t name);
+};
+
+/**
+ * @brief Class recording a trace event for the lifetime of a scope.
+ */
+class TraceScope {
+    TraceType type;      ///< The operation
+    uint64_t bytes;      ///< Bytes transferred
+    uint64_t address;    ///< Device address
+    uint16_t name;       ///< Interned name
+    uint64_t start = 0;  ///< Start time, 0 when tracing was disabled
+
+   public:
+    /**
+     * @brief Starts the event, if tracing is enabled.
+     * @param type The operation.
+     * @param bytes The bytes transferred.
+     * @param address The device address.
+     * @param name The interned name.
+     */
+    TraceScope(TraceType type, uint64_t bytes = 0, uint64_t address = 0, uint16_t name = 0)
+        : type(type), bytes(bytes), address(address), name(name) {
+        if (Tracer::isEnabled()) {
+            start = Tracer::now();
+        }
+    }
+
+    /**
+     * @brief Sets the device address, for operations that only know it once they completed.
+     * @param address The device address.
+     */
+    void setAddress(uint64_t address) { this->address = address; }
+
+    /**
+     * @brief Records the event.
+     */
+    ~TraceScope() {
+        if (start != 0) {
+            Tracer::record(type, start, bytes, address, name);
+        }
+    }
+
+    TraceScope(const TraceScope&) = delete;
+    TraceScope& operator=(const TraceScope&) = delete;
+};
+
+}  // namespace vrt
+
+#endif  // TRACER_HPP
@@ -0,0 +1,130 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#ifndef VRTBIN_CACHE_HPP
+#define VRTBIN_CACHE_HPP
+
+#include <cstdint>
+#include <filesystem>
+#include <memory>
+#include <set>
+#include <string>
+
+#include "utils/tar_reader.hpp"
+
+namespace vrt {
+
+/**
+ * @brief Class for the cache of extracted vrtbin members, shared by all processes of a user.
+ *
+ * Members are extracted on demand to <cache path>/vrtbin/<content hash>/, so a vrtbin is only
+ * unpacked once however many processes load it, and different vrtbins never overwrite each
+ * other's files. The content hash of a file is remembered together with its device, inode, size
+ * and modification time, so unchanged vrtbins are not hashed again.
+ *
+ * Every open cache holds a shared lock on its entry, which prevents the entry from being evicted
+ * while its files are in use, e.g. by a running emulation executable. When the cache grows past
+ * its maximum size, the least recently used entries that are not locked are removed.
+ */
+class VrtbinCache {
+    std::string vrtbinPath;              ///< Path to the vrtbin
+    std::filesystem::path root;          ///< Directory of all cache entries
+    std::filesystem::path entryPath;     ///< Directory of the entry of the vrtbin
+    std::string hash;                    ///< Content hash of the vrtbin
+    uint64_t maxSize;                    ///< Size above which entries are evicted
+    int useLock = -1;                    ///< File descriptor of the shared lock on the entry
+    std::set<std::string> members;       ///< Regular files of the vrtbin
+    std::unique_ptr<TarReader> reader;  ///< Reader of the vrtbin, opened on the first miss
+
+    /**
+     * @brief Computes the content hash of the vrtbin, or looks it up if the file is unchanged.
+     * @return The content hash as a hexadecimal string.
+     */
+    std::string computeHash();
+
+    /**
+     * @brief Loads the member list of the entry, creating it from the archive if needed.
+     */
+    void loadMembers();
+
+    /**
+     * @brief Gets the reader of the vrtbin, opening it if needed.
+     * @return The reader.
+     */
+    const TarReader& getReader();
+
+   public:
+    /// Default maximum size of the cache in bytes
+    static constexpr uint64_t DEFAULT_MAX_SIZE = 4ULL << 30;
+
+    /**
+     * @brief Constructor for VrtbinCache.
+     * @param vrtbinPath The path to the vrtbin.
+     * @param maxSize The size of all entries in bytes above which old entries are evicted.
+     * @throws std::runtime_error If the vrtbin cannot be read or the cache cannot be locked.
+     */
+    VrtbinCache(const std::string& vrtbinPath, uint64_t maxSize = DEFAULT_MAX_SIZE);
+
+    /**
+     * @brief Destructor for VrtbinCache. Releases the lock on the entry.
+     */
+    ~VrtbinCache();
+
+    /**
+     * @brief Gets the directory of the entry of the vrtbin.
+     * @return The directory members are extracted to.
+     */
+    const std::filesystem::path& getPath() const;
+
+    /**
+     * @brief Gets the content hash of the vrtbin.
+     * @return The content hash as a hexadecimal string.
+     */
+    const std::string& getHash() const;
+
+    /**
+     * @brief Checks whether the vrtbin contains a regular file.
+     * @param name The name of the member.
+     * @return True if the member exists.
+     */
+    bool contains(const std::string& name) const;
+
+    /**
+     * @brief Extracts a member of the vrtbin into the entry, unless it was already extracted.
+     * @param name The name of the member.
+     * @return The path of the extracted file.
+     * @throws std::runtime_error If the vrtbin does not contain the member.
+     */
+    std::filesystem::path extract(const std::string& name);
+
+    /**
+     * @brief Removes least recently used entries until the cache fits its maximum size.
+     *
+     * Entries in use by any process and the entry of this vrtbin are kept.
+     */
+    void evict();
+
+    VrtbinCache(const VrtbinCache&) = delete;
+    VrtbinCache& operator=(const VrtbinCache&) = delete;
+};
+
+}  // namespace vrt
+
+#endif  // VRTBIN_CACHE_HPP
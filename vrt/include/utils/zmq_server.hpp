@@ -23,26 +23,127 @@
 
 #include <json/json.h>
 
+#include <cstdint>
+#include <map>
 #include <memory>
+#include <string>
 #include <vector>
 #include <zmq.hpp>
 
 #include "utils/logger.hpp"
+#include "utils/shared_memory.hpp"
 
 namespace vrt {
 
+/**
+ * @brief Struct describing a register write of a batch sent with ZmqServer::sendScalars.
+ */
+struct ScalarWrite {
+    uint64_t addr;   ///< Address of the register
+    uint32_t value;  ///< Value to write
+};
+
+/**
+ * @brief Header of the messages of the binary simulation control protocol.
+ *
+ * A binary request is a single frame with the header followed by count entries, told apart from
+ * JSON commands by its magic number. A SCALARS request carries BinaryScalar entries, executed in
+ * order, and is answered with a header followed by one uint32_t per read entry.
+ */
+struct BinaryHeader {
+    static constexpr uint32_t MAGIC = 0x42545256;  ///< "VRTB" in little endian
+    static constexpr uint16_t VERSION = 1;         ///< Version of the protocol
+    static constexpr uint16_t SCALARS = 1;         ///< Opcode of a batch of register accesses
+    uint32_t magic = MAGIC;                        ///< Magic number
+    uint16_t version = VERSION;                    ///< Version of the protocol
+    uint16_t opcode = SCALARS;                     ///< Opcode of the request
+    uint32_t count = 0;                            ///< Number of entries
+    uint32_t reserved = 0;                         ///< Reserved, zero
+};
+
+/**
+ * @brief Struct with a register access of a binary SCALARS request.
+ */
+struct BinaryScalar {
+    uint64_t addr;   ///< Address of the register
+    uint32_t value;  ///< Value to write, ignored for reads
+    uint32_t read;   ///< 1 to read the register, 0 to write it
+};
+
 /**
  * @brief Class for managing ZeroMQ server communication.
  *
  * The ZmqServer class provides functionality for communication between the host application
  * and a simulation/emulation executable using the ZeroMQ messaging library. It supports sending and
  * receiving commands, buffers, and streams, as well as reading and writing scalar values.
+ *
+ * Requests are sent from a DEALER socket, so requests whose reply is not needed, such as register
+ * writes, are sent without waiting for the executable. Their replies are received, in order,
+ * before the reply of the next request that needs one. The executable keeps its REP socket.
+ * Scalar accesses use the binary protocol when the executable supports it, see BinaryHeader.
  */
 class ZmqServer {
    private:
     zmq::context_t context;  ///< ZeroMQ context for managing socket connections.
     zmq::socket_t socket;    ///< ZeroMQ socket for communication.
     std::string address = "tcp://localhost:5555";  ///< Default server address.
+    bool sharedMemory = false;  ///< Whether buffer data is transferred through shared memory.
+    bool binaryProtocol = false;  ///< Whether scalar accesses use the binary protocol.
+    size_t inFlight = 0;          ///< Requests sent whose reply was not received yet.
+    Json::StreamWriterBuilder writer;  ///< Writer of compact JSON commands.
+    std::map<std::string, std::unique_ptr<SharedMemory>> regions;  ///< Shared memory per buffer.
+
+    /// Maximum number of requests without reply, the oldest reply is received above it
+    static constexpr size_t MAX_IN_FLIGHT = 64;
+
+    /**
+     * @brief Serializes a JSON command without whitespace.
+     *
+     * @param command The JSON command.
+     * @return The serialized command.
+     */
+    std::string serialize(const Json::Value& command) const;
+
+    /**
+     * @brief Sends a request without waiting for its reply.
+     *
+     * @param request The request frame.
+     * @param data An optional data frame sent after the request.
+     */
+    void post(zmq::message_t& request, zmq::message_t* data = nullptr);
+
+    /**
+     * @brief Receives the reply of the oldest request in flight.
+     *
+     * @return The reply.
+     */
+    zmq::message_t receive();
+
+    /**
+     * @brief Sends a request and waits for its reply, after the replies of earlier requests.
+     *
+     * @param request The request frame.
+     * @param data An optional data frame sent after the request.
+     * @return The reply.
+     */
+    zmq::message_t roundTrip(zmq::message_t& request, zmq::message_t* data = nullptr);
+
+    /**
+     * @brief Builds a binary SCALARS request.
+     *
+     * @param scalars The register accesses.
+     * @return The request frame.
+     */
+    static zmq::message_t makeScalarRequest(const std::vector<BinaryScalar>& scalars);
+
+    /**
+     * @brief Gets the shared memory region of a buffer, creating it if needed.
+     *
+     * @param name The name identifier of the buffer.
+     * @param size The size of the buffer in bytes.
+     * @return The shared memory region of the buffer.
+     */
+    SharedMemory& getRegion(const std::string& name, size_t size);
 
    public:
     /**
@@ -60,6 +161,56 @@ class ZmqServer {
      */
     void sendBuffer(const std::string& name, const std::vector<uint8_t>& buffer);
 
+    /**
+     * @brief Sends a named buffer to the server, through shared memory when it is enabled.
+     *
+     * @param name The name identifier for the buffer.
+     * @param data The data to send.
+     * @param size The size of the data in bytes.
+     */
+    void sendBuffer(const std::string& name, const uint8_t* data, size_t size);
+
+    /**
+     * @brief Enables or disables the shared memory data plane.
+     *
+     * When enabled, buffer data is copied into a shared memory region per buffer and only
+     * control messages are sent over ZeroMQ. The emulation/simulation executable must support it.
+     *
+     * @param enabled Whether to transfer buffer data through shared memory.
+     */
+    void setSharedMemory(bool enabled);
+
+    /**
+     * @brief Enables or disables the binary protocol for scalar accesses.
+     *
+     * The simulation executable must support it.
+     *
+     * @param enabled Whether to send scalar accesses as binary SCALARS requests.
+     */
+    void setBinaryProtocol(bool enabled);
+
+    /**
+     * @brief Checks whether scalar accesses use the binary protocol.
+     *
+     * @return True if the binary protocol is enabled.
+     */
+    bool useBinaryProtocol() const;
+
+    /**
+     * @brief Checks whether buffer data is transferred through shared memory.
+     *
+     * @return True if the shared memory data plane is enabled.
+     */
+    bool useSharedMemory() const;
+
+    /**
+     * @brief Releases the shared memory region of a buffer, if it has one, and tells the
+     * executable to unmap it.
+     *
+     * @param name The name identifier of the buffer.
+     */
+    void releaseBuffer(const std::string& name);
+
     /**
      * @brief Sends a JSON command to the server.
      *
@@ -84,6 +235,15 @@ class ZmqServer {
      */
     std::vector<uint8_t> fetchBuffer(const std::string& name);
 
+    /**
+     * @brief Fetches a named buffer from the server, through shared memory when it is enabled.
+     *
+     * @param name The name identifier of the buffer to fetch.
+     * @param data Destination of the buffer data.
+     * @param size The size of the buffer in bytes.
+     */
+    void fetchBuffer(const std::string& name, uint8_t* data, size_t size);
+
     /**
      * @brief Sends a stream to the server.
      *
@@ -109,6 +269,14 @@ class ZmqServer {
      */
     uint32_t fetchScalarSim(uint64_t addr);
 
+    /**
+     * @brief Fetches scalar values from a simulation, in one request with the binary protocol.
+     *
+     * @param addrs The memory addresses to read from.
+     * @return The values read, in the order of the addresses.
+     */
+    std::vector<uint32_t> fetchScalarsSim(const std::vector<uint64_t>& addrs);
+
     /**
      * @brief Fetches buffer data from a simulation at a specific address.
      *
@@ -118,6 +286,15 @@ class ZmqServer {
      */
     void fetchBufferSim(uint64_t addr, uint64_t size, std::vector<uint8_t>& buffer);
 
+    /**
+     * @brief Fetches buffer data from a simulation, through shared memory when it is enabled.
+     *
+     * @param addr The starting memory address to read from.
+     * @param size The size of the buffer to read.
+     * @param data Destination of the buffer data.
+     */
+    void fetchBufferSim(uint64_t addr, uint64_t size, uint8_t* data);
+
     /**
      * @brief Sends buffer data to a simulation at a specific address.
      *
@@ -126,14 +303,40 @@ class ZmqServer {
      */
     void sendBufferSim(uint64_t addr, const std::vector<uint8_t>& buffer);
 
+    /**
+     * @brief Sends buffer data to a simulation, through shared memory when it is enabled.
+     *
+     * @param addr The starting memory address to write to.
+     * @param data The data to write.
+     * @param size The size of the data in bytes.
+     */
+    void sendBufferSim(uint64_t addr, const uint8_t* data, size_t size);
+
     /**
      * @brief Sends a scalar value to a specific memory address.
      *
+     * The write is sent without waiting for the simulation to acknowledge it.
+     *
      * @param addr The memory address to write to.
      * @param value The value to write.
      */
     void sendScalar(uint64_t addr, uint32_t value);
 
+    /**
+     * @brief Sends scalar values to memory addresses, in one request with the binary protocol.
+     *
+     * The writes are executed in order and sent without waiting for the simulation to
+     * acknowledge them.
+     *
+     * @param writes The register writes.
+     */
+    void sendScalars(const std::vector<ScalarWrite>& writes);
+
+    /**
+     * @brief Waits until the simulation answered all requests sent so far.
+     */
+    void flush();
+
     /**
      * @brief Deleted copy constructor.
      *
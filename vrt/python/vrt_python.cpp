@@ -0,0 +1,364 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#include <pybind11/chrono.h>
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+#include <chrono>
+#include <future>
+#include <optional>
+
+#include "api/buffer.hpp"
+#include "api/command_graph.hpp"
+#include "api/completion.hpp"
+#include "api/device.hpp"
+#include "api/kernel.hpp"
+#include "api/launch_descriptor.hpp"
+
+namespace py = pybind11;
+
+namespace {
+
+/**
+ * @brief Converts Python kernel arguments: buffers are passed as their physical address,
+ * everything else must be an integer.
+ */
+std::vector<int64_t> kernelArgs(const py::args& args) {
+    std::vector<int64_t> values;
+    values.reserve(args.size());
+    for (const auto& arg : args) {
+        if (py::hasattr(arg, "getPhysAddr")) {
+            values.push_back(arg.attr("getPhysAddr")().cast<int64_t>());
+        } else {
+            values.push_back(arg.cast<int64_t>());
+        }
+    }
+    return values;
+}
+
+/**
+ * @brief Binds vrt::Buffer<T> as a Python class exposing its host memory through the buffer
+ * protocol, so NumPy arrays of it share memory with the buffer.
+ */
+template <typename T>
+void bindBuffer(py::module_& m, const char* name) {
+    py::class_<vrt::Buffer<T>>(m, name, py::buffer_protocol())
+        .def(py::init<vrt::Device, size_t, vrt::MemoryRangeType>(), py::arg("device"),
+             py::arg("size"), py::arg("type") = vrt::MemoryRangeType::HBM, py::keep_alive<1, 2>())
+        .def(py::init<vrt::Device, size_t, vrt::MemoryRangeType, uint8_t>(), py::arg("device"),
+             py::arg("size"), py::arg("type"), py::arg("port"), py::keep_alive<1, 2>())
+        .def_buffer([](vrt::Buffer<T>& buffer) {
+            return py::buffer_info(buffer.get(), sizeof(T), py::format_descriptor<T>::format(), 1,
+                                   {buffer.getSize()}, {sizeof(T)});
+        })
+        .def_property_readonly(
+            "array",
+            [](py::object self) {
+                auto& buffer = self.cast<vrt::Buffer<T>&>();
+                // The array keeps the buffer alive through its base object
+                return py::array_t<T>({buffer.getSize()}, {sizeof(T)}, buffer.get(), self);
+            },
+            "NumPy array sharing the host memory of the buffer")
+        .def("sync", &vrt::Buffer<T>::sync, py::arg("sync_type"),
+             py::call_guard<py::gil_scoped_release>())
+        .def("syncAsync", &vrt::Buffer<T>::syncAsync, py::arg("sync_type"),
+             py::call_guard<py::gil_scoped_release>(), py::keep_alive<0, 1>(),
+             "Start a sync and return a SyncFuture; the buffer must not be used until it is done.")
+        .def("getSize", &vrt::Buffer<T>::getSize)
+        .def("getPhysAddr", &vrt::Buffer<T>::getPhysAddr)
+        .def("getPhysAddrLow", &vrt::Buffer<T>::getPhysAddrLow)
+        .def("getPhysAddrHigh", &vrt::Buffer<T>::getPhysAddrHigh)
+        .def("getName", &vrt::Buffer<T>::getName)
+        .def("__len__", &vrt::Buffer<T>::getSize);
+}
+
+/**
+ * @brief Allocates a vrt::Buffer<T> if T matches the NumPy dtype.
+ */
+template <typename T>
+bool makeBuffer(py::object& buffer, const py::dtype& dtype, vrt::Device& device, size_t size,
+                vrt::MemoryRangeType type, std::optional<uint8_t> port) {
+    py::dtype expected = py::dtype::of<T>();
+    if (dtype.kind() != expected.kind() || dtype.itemsize() != expected.itemsize()) {
+        return false;
+    }
+    if (port) {
+        buffer = py::cast(vrt::Buffer<T>(device, size, type, *port));
+    } else {
+        buffer = py::cast(vrt::Buffer<T>(device, size, type));
+    }
+    return true;
+}
+
+/**
+ * @brief Allocates a buffer of the first element type matching the NumPy dtype.
+ */
+template <typename... Ts>
+py::object makeBufferOfDtype(const py::dtype& dtype, vrt::Device& device, size_t size,
+                             vrt::MemoryRangeType type, std::optional<uint8_t> port) {
+    py::object buffer;
+    if (!(makeBuffer<Ts>(buffer, dtype, device, size, type, port) || ...)) {
+        throw py::type_error("Unsupported buffer dtype: " + py::str(dtype).cast<std::string>());
+    }
+    return buffer;
+}
+
+/**
+ * @brief Adds a sync of a vrt::Buffer<T> to a command graph if the object is one.
+ */
+template <typename T>
+bool addSync(vrt::CommandGraph& graph, vrt::CommandGraph::Node& node, const py::object& buffer,
+             vrt::SyncType syncType, const vrt::CommandGraph::Dependencies& after) {
+    if (!py::isinstance<vrt::Buffer<T>>(buffer)) {
+        return false;
+    }
+    node = graph.addSync(buffer.cast<vrt::Buffer<T>&>(), syncType, after);
+    return true;
+}
+
+/**
+ * @brief Adds a sync of a buffer of any of the element types to a command graph.
+ */
+template <typename... Ts>
+vrt::CommandGraph::Node addSyncOfBuffer(vrt::CommandGraph& graph, const py::object& buffer,
+                                        vrt::SyncType syncType,
+                                        const vrt::CommandGraph::Dependencies& after) {
+    vrt::CommandGraph::Node node = 0;
+    if (!(addSync<Ts>(graph, node, buffer, syncType, after) || ...)) {
+        throw py::type_error("Expected a vrt buffer");
+    }
+    return node;
+}
+
+}  // namespace
+
+PYBIND11_MODULE(vrt, m) {
+    m.doc() = "Python bindings for the SLASH V80 Run-Time (VRT)";
+
+    py::enum_<vrt::ProgramType>(m, "ProgramType")
+        .value("FLASH", vrt::ProgramType::FLASH)
+        .value("JTAG", vrt::ProgramType::JTAG);
+
+    py::enum_<vrt::ProgramMode>(m, "ProgramMode")
+        .value("IF_CHANGED", vrt::ProgramMode::IF_CHANGED)
+        .value("FORCE", vrt::ProgramMode::FORCE);
+
+    py::enum_<vrt::MemoryRangeType>(m, "MemoryRangeType")
+        .value("HBM", vrt::MemoryRangeType::HBM)
+        .value("DDR", vrt::MemoryRangeType::DDR);
+
+    py::enum_<vrt::SyncType>(m, "SyncType")
+        .value("HOST_TO_DEVICE", vrt::SyncType::HOST_TO_DEVICE)
+        .value("DEVICE_TO_HOST", vrt::SyncType::DEVICE_TO_HOST);
+
+    py::enum_<vrt::Platform>(m, "Platform")
+        .value("HARDWARE", vrt::Platform::HARDWARE)
+        .value("EMULATION", vrt::Platform::EMULATION)
+        .value("SIMULATION", vrt::Platform::SIMULATION)
+        .value("UNKNOWN", vrt::Platform::UNKNOWN);
+
+    py::class_<std::future<void>>(m, "SyncFuture")
+        .def(
+            "wait",
+            [](std::future<void>& future) {
+                if (!future.valid()) {
+                    return;
+                }
+                py::gil_scoped_release release;
+                // get() rethrows the error of a failed transfer
+                future.get();
+            },
+            "Wait for the sync to complete.")
+        .def("done", [](std::future<void>& future) {
+            return !future.valid() ||
+                   future.wait_for(std::chrono::seconds(0)) == std::future_status::ready;
+        });
+
+    py::class_<vrt::Device>(m, "Device")
+        .def(py::init<const std::string&, const std::string&, bool, vrt::ProgramType,
+                      vrt::ProgramMode>(),
+             py::arg("bdf"), py::arg("vrtbin_path"), py::arg("program") = true,
+             py::arg("program_type") = vrt::ProgramType::FLASH,
+             py::arg("program_mode") = vrt::ProgramMode::IF_CHANGED,
+             py::call_guard<py::gil_scoped_release>())
+        .def("getBdf", &vrt::Device::getBdf)
+        .def("getPlatform", &vrt::Device::getPlatform)
+        .def("setFrequency", &vrt::Device::setFrequency, py::arg("freq"))
+        .def("getFrequency", &vrt::Device::getFrequency)
+        .def("getMaxFrequency", &vrt::Device::getMaxFrequency)
+        .def("cleanup", &vrt::Device::cleanup, py::call_guard<py::gil_scoped_release>());
+
+    py::class_<vrt::LaunchDescriptor>(m, "LaunchDescriptor")
+        .def(py::init<const vrt::Kernel&>(), py::arg("kernel"))
+        .def(
+            "setArgs",
+            [](vrt::LaunchDescriptor& descriptor, const py::args& args) -> vrt::LaunchDescriptor& {
+                std::vector<int64_t> values = kernelArgs(args);
+                for (size_t i = 0; i < values.size(); i++) {
+                    descriptor.setArg(i, values[i]);
+                }
+                return descriptor;
+            },
+            py::return_value_policy::reference_internal,
+            "Set the arguments in order. Buffers are passed as their physical address.")
+        .def("setArg", &vrt::LaunchDescriptor::setArg, py::arg("index"), py::arg("value"),
+             py::return_value_policy::reference_internal)
+        .def("getArgCount", &vrt::LaunchDescriptor::getArgCount);
+
+    py::class_<vrt::Kernel>(m, "Kernel")
+        .def(py::init<vrt::Device&, const std::string&>(), py::arg("device"), py::arg("name"),
+             py::keep_alive<1, 2>())
+        .def("start",
+             static_cast<void (vrt::Kernel::*)(const vrt::LaunchDescriptor&)>(&vrt::Kernel::start),
+             py::arg("descriptor"), py::call_guard<py::gil_scoped_release>())
+        .def("call",
+             static_cast<void (vrt::Kernel::*)(const vrt::LaunchDescriptor&)>(&vrt::Kernel::call),
+             py::arg("descriptor"), py::call_guard<py::gil_scoped_release>())
+        .def(
+            "start",
+            [](vrt::Kernel& kernel, const py::args& args) {
+                std::vector<int64_t> values = kernelArgs(args);
+                py::gil_scoped_release release;
+                kernel.start(values);
+            },
+            "Start the kernel. Buffers are passed as their physical address.")
+        .def(
+            "call",
+            [](vrt::Kernel& kernel, const py::args& args) {
+                std::vector<int64_t> values = kernelArgs(args);
+                py::gil_scoped_release release;
+                kernel.call(values);
+            },
+            "Start the kernel and wait for it to complete.")
+        .def("startKernel", &vrt::Kernel::startKernel, py::arg("autorestart") = false,
+             py::call_guard<py::gil_scoped_release>())
+        .def("wait", py::overload_cast<>(&vrt::Kernel::wait),
+             py::call_guard<py::gil_scoped_release>())
+        .def(
+            "wait",
+            [](vrt::Kernel& kernel, std::chrono::microseconds timeout) {
+                return kernel.wait(timeout);
+            },
+            py::arg("timeout"), py::call_guard<py::gil_scoped_release>(),
+            "Wait for the kernel to complete, return False on timeout (a timedelta or seconds).")
+        .def("isDone", &vrt::Kernel::isDone)
+        .def("write", &vrt::Kernel::write, py::arg("offset"), py::arg("value"))
+        .def("read", &vrt::Kernel::read, py::arg("offset"))
+        .def("getName", &vrt::Kernel::getName);
+
+    py::class_<vrt::CommandGraph>(m, "CommandGraph")
+        .def(py::init<>())
+        .def(
+            "addSync",
+            [](vrt::CommandGraph& graph, const py::object& buffer, vrt::SyncType syncType,
+               const vrt::CommandGraph::Dependencies& after) {
+                return addSyncOfBuffer<int8_t, uint8_t, int16_t, uint16_t, int32_t, uint32_t,
+                                       int64_t, uint64_t, float, double>(graph, buffer, syncType,
+                                                                         after);
+            },
+            py::arg("buffer"), py::arg("sync_type"),
+            py::arg("after") = vrt::CommandGraph::Dependencies(), py::keep_alive<1, 2>(),
+            "Add a buffer sync that starts once the nodes in `after` completed.")
+        .def(
+            "addLaunch",
+            [](vrt::CommandGraph& graph, vrt::Kernel& kernel,
+               const vrt::LaunchDescriptor& descriptor,
+               const vrt::CommandGraph::Dependencies& after) {
+                return graph.addLaunch(kernel, descriptor, after);
+            },
+            py::arg("kernel"), py::arg("descriptor"),
+            py::arg("after") = vrt::CommandGraph::Dependencies(), py::keep_alive<1, 2>())
+        .def(
+            "addLaunch",
+            [](vrt::CommandGraph& graph, vrt::Kernel& kernel, const py::args& args,
+               const vrt::CommandGraph::Dependencies& after) {
+                return graph.addLaunch(kernel, kernelArgs(args), after);
+            },
+            py::arg("kernel"), py::arg("after") = vrt::CommandGraph::Dependencies(),
+            py::keep_alive<1, 2>(),
+            "Add a kernel launch. Buffers are passed as their physical address.")
+        .def(
+            "addHost",
+            [](vrt::CommandGraph& graph, py::function function,
+               const vrt::CommandGraph::Dependencies& after) {
+                // The graph is launched without the GIL
+                return graph.addHost(
+                    [function]() {
+                        py::gil_scoped_acquire acquire;
+                        function();
+                    },
+                    after);
+            },
+            py::arg("function"), py::arg("after") = vrt::CommandGraph::Dependencies())
+        .def(
+            "setArg",
+            [](vrt::CommandGraph& graph, vrt::CommandGraph::Node node, size_t index,
+               const py::object& value) {
+                graph.setArg(node, index, kernelArgs(py::make_tuple(value))[0]);
+            },
+            py::arg("node"), py::arg("index"), py::arg("value"))
+        .def("launch", &vrt::CommandGraph::launch, py::call_guard<py::gil_scoped_release>())
+        .def("__len__", &vrt::CommandGraph::size);
+
+    m.def(
+        "waitAll",
+        [](const std::vector<vrt::Kernel*>& kernels,
+           std::optional<std::chrono::microseconds> timeout) {
+            return vrt::waitAll(kernels, timeout.value_or(vrt::NO_TIMEOUT));
+        },
+        py::arg("kernels"), py::arg("timeout") = py::none(),
+        py::call_guard<py::gil_scoped_release>(),
+        "Wait for all kernels to complete, return False on timeout.");
+    m.def(
+        "waitAny",
+        [](const std::vector<vrt::Kernel*>& kernels,
+           std::optional<std::chrono::microseconds> timeout) {
+            return vrt::waitAny(kernels, timeout.value_or(vrt::NO_TIMEOUT));
+        },
+        py::arg("kernels"), py::arg("timeout") = py::none(),
+        py::call_guard<py::gil_scoped_release>(),
+        "Wait for any kernel to complete, return its index or -1 on timeout.");
+
+    bindBuffer<int8_t>(m, "BufferInt8");
+    bindBuffer<uint8_t>(m, "BufferUInt8");
+    bindBuffer<int16_t>(m, "BufferInt16");
+    bindBuffer<uint16_t>(m, "BufferUInt16");
+    bindBuffer<int32_t>(m, "BufferInt32");
+    bindBuffer<uint32_t>(m, "BufferUInt32");
+    bindBuffer<int64_t>(m, "BufferInt64");
+    bindBuffer<uint64_t>(m, "BufferUInt64");
+    bindBuffer<float>(m, "BufferFloat32");
+    bindBuffer<double>(m, "BufferFloat64");
+
+    m.def(
+        "Buffer",
+        [](vrt::Device& device, size_t size, const py::object& dtype, vrt::MemoryRangeType type,
+           std::optional<uint8_t> port) {
+            return makeBufferOfDtype<int8_t, uint8_t, int16_t, uint16_t, int32_t, uint32_t, int64_t,
+                                     uint64_t, float, double>(py::dtype::from_args(dtype), device,
+                                                              size, type, port);
+        },
+        py::arg("device"), py::arg("size"), py::arg("dtype") = "uint32",
+        py::arg("type") = vrt::MemoryRangeType::HBM, py::arg("port") = py::none(),
+        py::keep_alive<0, 1>(),
+        "Allocate a device buffer of `size` elements of `dtype` (a NumPy dtype or its name).");
+}
@@ -17,248 +17,359 @@
  * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
  * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
  */
-
 #include "allocator/allocator.hpp"
 
+#include "utils/tracer.hpp"
+
 namespace vrt {
-Superblock::Superblock(uint64_t startAddress, uint64_t size)
-    : startAddress(startAddress), size(size), offset(0) {}
 
-uint64_t Superblock::allocate(uint64_t size) {
+namespace {
+
+/// Smallest size class of the superblocks
+constexpr uint64_t MIN_BLOCK_SIZE = 64;
+
+void insertFree(MemoryPool& pool, uint64_t addr, uint64_t size) {
+    pool.freeBlocks.emplace(addr, size);
+    pool.bySize.emplace(size, addr);
+}
+
+std::map<uint64_t, uint64_t>::iterator eraseFree(MemoryPool& pool,
+                                                 std::map<uint64_t, uint64_t>::iterator it) {
+    pool.bySize.erase({it->second, it->first});
+    return pool.freeBlocks.erase(it);
+}
+
+/**
+ * @brief Takes `size` bytes from the start of a free block of a pool.
+ */
+void takeFree(MemoryPool& pool, std::map<uint64_t, uint64_t>::iterator it, uint64_t size) {
+    uint64_t addr = it->first;
+    uint64_t blockSize = it->second;
+    eraseFree(pool, it);
+    if (blockSize > size) {
+        insertFree(pool, addr + size, blockSize - size);
+    }
+    pool.freeBytes -= size;
+}
+
+/**
+ * @brief Adds the usage of a pool to the stats.
+ */
+void addPoolStats(AllocatorStats& stats, const MemoryPool& pool) {
+    stats.totalBytes += pool.size;
+    stats.freeBytes += pool.freeBytes;
+    stats.usedBytes = stats.totalBytes - stats.freeBytes;
+    stats.freeBlocks += pool.freeBlocks.size();
+    if (!pool.bySize.empty()) {
+        stats.largestFreeBlock = std::max(stats.largestFreeBlock, pool.bySize.rbegin()->first);
+    }
+    stats.allocations += pool.allocations;
+    stats.deallocations += pool.deallocations;
+    stats.liveAllocations = stats.allocations - stats.deallocations;
+    stats.failedAllocations += pool.failedAllocations;
+    stats.fragmentation = stats.freeBytes == 0 ? 0.0
+                                               : 1.0 - static_cast<double>(stats.largestFreeBlock) /
+                                                           static_cast<double>(stats.freeBytes);
+}
+
+}  // namespace
+
+Superblock::Superblock(uint64_t startAddress, uint64_t size, uint64_t blockSize)
+    : startAddress(startAddress), blockSize(blockSize), size(size), offset(0), used(0) {}
+
+uint64_t Superblock::allocate() {
     if (!freeList.empty()) {
         uint64_t addr = freeList.back();
         freeList.pop_back();
+        used++;
         return addr;
     }
-    if (offset + size > this->size) {
+    if (offset + blockSize > size) {
         throw std::bad_alloc();
     }
     uint64_t addr = startAddress + offset;
-    offset += size;
+    offset += blockSize;
+    used++;
     return addr;
 }
 
-void Superblock::deallocate(uint64_t addr) {}
+void Superblock::deallocate(uint64_t addr) {
+    freeList.push_back(addr);
+    used--;
+}
 
-MemoryRange::MemoryRange(uint64_t startAddress, uint64_t size)
-    : startAddress(startAddress), size(size), offset(0) {}
+bool Superblock::full() const { return freeList.empty() && offset + blockSize > size; }
+
+bool Superblock::empty() const { return used == 0; }
+
+MemoryPool::MemoryPool(uint64_t startAddress, uint64_t size)
+    : startAddress(startAddress), size(size), freeBytes(size) {
+    insertFree(*this, startAddress, size);
+}
+
+MemoryRange::MemoryRange(uint64_t startAddress, uint64_t size, uint64_t poolSize)
+    : startAddress(startAddress), size(size), poolSize(poolSize) {
+    for (uint64_t offset = 0; offset < size; offset += poolSize) {
+        pools.emplace_back(startAddress + offset, std::min(poolSize, size - offset));
+    }
+}
 
 Allocator::Allocator(uint64_t superblockSize) : superblockSize(superblockSize) {
-    addMemoryRange(MemoryRangeType::HBM, HBM_START, HBM_SIZE);
+    addMemoryRange(MemoryRangeType::HBM, HBM_START, HBM_SIZE, HBM_PORT_SIZE);
     addMemoryRange(MemoryRangeType::DDR, DDR_START, DDR_SIZE);
 }
 
-void Allocator::addMemoryRange(MemoryRangeType type, uint64_t startAddress, uint64_t size) {
-    memoryRanges.emplace(type, MemoryRange(startAddress, size));
+void Allocator::addMemoryRange(MemoryRangeType type, uint64_t startAddress, uint64_t size,
+                               uint64_t poolSize) {
+    std::lock_guard<std::mutex> lock(mutex);
+    memoryRanges.erase(type);
+    memoryRanges.emplace(type, MemoryRange(startAddress, size, poolSize ? poolSize : size));
 }
 
-uint64_t Allocator::allocate(uint64_t size, MemoryRangeType type) {
-    if (type == MemoryRangeType::HBM) {
-        return allocate(size, type, 0);
-    }
+MemoryRange& Allocator::getRange(MemoryRangeType type) {
     auto it = memoryRanges.find(type);
     if (it == memoryRanges.end()) {
         throw std::out_of_range("Invalid memory range type");
     }
+    return it->second;
+}
+
+uint64_t Allocator::allocate(uint64_t size, MemoryRangeType type) {
+    // HBM allocations without a port start at port 0
+    return allocate(size, type, 0);
+}
+
+uint64_t Allocator::allocate(uint64_t size, MemoryRangeType type, uint8_t port) {
+    TraceScope trace(TraceType::ALLOCATE, size);
+    std::lock_guard<std::mutex> lock(mutex);
+    MemoryRange& range = getRange(type);
+
+    if (port > 31) {
+        throw std::out_of_range("Invalid port number");
+    }
 
-    MemoryRange& range = it->second;
+    // The port only selects the pool of HBM
+    size_t pool = type == MemoryRangeType::HBM ? port : 0;
+    if (pool >= range.pools.size()) {
+        throw std::out_of_range("Invalid port number");
+    }
 
-    if (size < superblockSize / 2) {
-        for (auto& superblock : range.superblocks) {
-            try {
-                uint64_t addr = superblock.allocate(size);
-                addrToSuperblock[addr] = &superblock;
-                return addr;
-            } catch (const std::bad_alloc&) {
-                continue;
+    bool small = size < superblockSize / 2;
+    uint64_t addr;
+    try {
+        if (small) {
+            uint64_t sizeClass = MIN_BLOCK_SIZE;
+            while (sizeClass < size) {
+                sizeClass <<= 1;
             }
+            size = sizeClass;
+            addr = allocateSmall(range, pool, size);
+        } else {
+            size = (size + superblockSize - 1) / superblockSize * superblockSize;
+            addr = allocateBlock(range, pool, size);
         }
-        if (range.offset + superblockSize > range.size) {
-            throw std::bad_alloc();
-        }
-        range.superblocks.emplace_back(range.startAddress + range.offset, superblockSize);
-        range.offset += superblockSize;
-        uint64_t addr = range.superblocks.back().allocate(size);
-        addrToSuperblock[addr] = &range.superblocks.back();
-        return addr;
-    } else {
-        if (!range.freeList.empty()) {
-            uint64_t addr = range.freeList.back();
-            range.freeList.pop_back();
+    } catch (const std::bad_alloc&) {
+        range.pools[pool].failedAllocations++;
+        throw;
+    }
+    range.pools[(addr - range.startAddress) / range.poolSize].allocations++;
+    allocations[addr] = {type, size, small};
+    trace.setAddress(addr);
+    return addr;
+}
+
+uint64_t Allocator::allocateBlock(MemoryRange& range, size_t pool, uint64_t size) {
+    // Best fit in the pool, moving on to the following pools (HBM ports) if it is full
+    for (size_t p = pool; p < range.pools.size(); p++) {
+        MemoryPool& memoryPool = range.pools[p];
+        auto it = memoryPool.bySize.lower_bound({size, 0});
+        if (it != memoryPool.bySize.end()) {
+            uint64_t addr = it->second;
+            takeFree(memoryPool, memoryPool.freeBlocks.find(addr), size);
             return addr;
         }
-        if (range.offset + size > range.size) {
-            throw std::bad_alloc();
-        }
-        uint64_t addr = range.startAddress;
-        while (addr + size <= range.startAddress + range.size) {
-            bool isOccupied = std::any_of(
-                range.usedMemoryBlocks.begin(), range.usedMemoryBlocks.end(),
-                [addr, size](const std::pair<uint64_t, uint64_t>& block) {
-                    return (addr >= block.first && addr < block.first + block.second) ||
-                           (addr + size > block.first && addr + size <= block.first + block.second);
-                });
-
-            if (!isOccupied) {
-                range.usedMemoryBlocks.push_back({addr, size});
-                return addr;
-            }
+    }
 
-            addr += size;
+    // Larger than any free block of a pool: look for adjacent free blocks across pools
+    uint64_t runStart = 0;
+    uint64_t runSize = 0;
+    for (size_t p = pool; p < range.pools.size() && runSize < size; p++) {
+        for (auto& [addr, blockSize] : range.pools[p].freeBlocks) {
+            if (runSize == 0 || runStart + runSize != addr) {
+                runStart = addr;
+                runSize = 0;
+            }
+            runSize += blockSize;
+            if (runSize >= size) {
+                break;
+            }
         }
-
+    }
+    if (runSize < size) {
         throw std::bad_alloc();
     }
+    uint64_t remaining = size;
+    uint64_t addr = runStart;
+    while (remaining > 0) {
+        MemoryPool& memoryPool = range.pools[(addr - range.startAddress) / range.poolSize];
+        auto it = memoryPool.freeBlocks.find(addr);
+        uint64_t taken = std::min(it->second, remaining);
+        takeFree(memoryPool, it, taken);
+        addr += taken;
+        remaining -= taken;
+    }
+    return runStart;
 }
 
-void Allocator::deallocate(uint64_t addr) {
-    auto it = addrToSuperblock.find(addr);
-    if (it != addrToSuperblock.end()) {
-        it->second->deallocate(addr);
-        addrToSuperblock.erase(it);
-    } else {
-        for (auto& [type, range] : memoryRanges) {
-            if (addr >= range.startAddress && addr < range.startAddress + range.size) {
-                range.freeList.push_back(addr);
-                return;
+uint64_t Allocator::allocateSmall(MemoryRange& range, size_t pool, uint64_t size) {
+    // A pool is only left once it has neither a partly used superblock of the class nor room for
+    // a new one, so allocations spilling to the following pools share superblocks there too
+    for (size_t p = pool; p < range.pools.size(); p++) {
+        MemoryPool& memoryPool = range.pools[p];
+        std::set<uint64_t>& partial = memoryPool.partial[size];
+        if (!partial.empty()) {
+            Superblock& superblock = memoryPool.superblocks.at(*partial.begin());
+            uint64_t addr = superblock.allocate();
+            if (superblock.full()) {
+                partial.erase(partial.begin());
             }
+            return addr;
+        }
+        if (memoryPool.bySize.lower_bound({superblockSize, 0}) != memoryPool.bySize.end()) {
+            return allocateSuperblock(range, allocateBlock(range, p, superblockSize), size);
         }
     }
+    // No pool has room for a whole superblock, it may span free blocks of adjacent pools
+    return allocateSuperblock(range, allocateBlock(range, pool, superblockSize), size);
 }
 
-uint64_t Allocator::allocate(uint64_t size, MemoryRangeType type, uint8_t port) {
-    auto it = memoryRanges.find(type);
-    if (it == memoryRanges.end()) {
-        throw std::out_of_range("Invalid memory range type");
+uint64_t Allocator::allocateSuperblock(MemoryRange& range, uint64_t superblockAddr, uint64_t size) {
+    MemoryPool& superblockPool =
+        range.pools[(superblockAddr - range.startAddress) / range.poolSize];
+    Superblock& superblock =
+        superblockPool.superblocks.emplace(superblockAddr,
+                                           Superblock(superblockAddr, superblockSize, size))
+            .first->second;
+    uint64_t addr = superblock.allocate();
+    if (!superblock.full()) {
+        superblockPool.partial[size].insert(superblockAddr);
     }
+    return addr;
+}
 
-    if (port > 31) {
-        throw std::out_of_range("Invalid port number");
+void Allocator::deallocate(uint64_t addr) {
+    TraceScope trace(TraceType::DEALLOCATE, 0, addr);
+    std::lock_guard<std::mutex> lock(mutex);
+    auto it = allocations.find(addr);
+    if (it == allocations.end()) {
+        return;
     }
+    Allocation allocation = it->second;
+    allocations.erase(it);
 
-    if (type != MemoryRangeType::HBM) {
-        return allocate(size, type);
+    MemoryRange& range = getRange(allocation.type);
+    MemoryPool& memoryPool = range.pools[(addr - range.startAddress) / range.poolSize];
+    memoryPool.deallocations++;
+    if (!allocation.small) {
+        freeBlock(range, addr, allocation.size);
+        return;
     }
 
-    MemoryRange& range = it->second;
-    uint64_t portBaseAddress = HBM_START + port * HBM_PORT_SIZE;
-    uint64_t portEndAddress =
-        portBaseAddress + 2 * HBM_PORT_SIZE * 8;  // allow moving to next port (aligned at 64bit)
-
-    if (size < superblockSize / 2) {
-        for (auto& superblock : range.superblocks) {
-            if (superblock.startAddress < portBaseAddress ||
-                superblock.startAddress >= portBaseAddress + HBM_PORT_SIZE) {
-                continue;
-            }
-            try {
-                uint64_t addr = superblock.allocate(size);
-                addrToSuperblock[addr] = &superblock;
-                return addr;
-            } catch (const std::bad_alloc&) {
-                continue;
-            }
-        }
-        if (range.offset + superblockSize > range.size) {
-            throw std::bad_alloc();
-        }
-        uint64_t sbs = superblockSize;
-        // Check if the range is already occupied in usedMemoryBlocks
-        bool isOccupied =
-            std::any_of(range.usedMemoryBlocks.begin(), range.usedMemoryBlocks.end(),
-                        [portBaseAddress, sbs](const std::pair<uint64_t, uint64_t>& block) {
-                            return (portBaseAddress >= block.first &&
-                                    portBaseAddress < block.first + block.second) ||
-                                   (portBaseAddress + sbs > block.first &&
-                                    portBaseAddress + sbs <= block.first + block.second);
-                        });
-
-        if (!isOccupied) {
-            // Allocate a new superblock from portBaseAddress
-            range.superblocks.emplace_back(portBaseAddress, superblockSize);
-            uint64_t addr = range.superblocks.back().allocate(size);
-            addrToSuperblock[addr] = &range.superblocks.back();
-            range.usedMemoryBlocks.push_back({addr, superblockSize});
-            return addr;
-        } else {
-            // Find the next free block
-            uint64_t nextFreeAddress = portBaseAddress;
-            for (const auto& block : range.usedMemoryBlocks) {
-                if (nextFreeAddress >= block.first &&
-                    nextFreeAddress < block.first + block.second) {
-                    nextFreeAddress = block.first + block.second;
-                }
-            }
+    auto superblockIt = std::prev(memoryPool.superblocks.upper_bound(addr));
+    Superblock& superblock = superblockIt->second;
+    superblock.deallocate(addr);
+    if (superblock.empty()) {
+        // Return the whole superblock to the pool
+        uint64_t superblockAddr = superblock.startAddress;
+        memoryPool.partial[allocation.size].erase(superblockAddr);
+        memoryPool.superblocks.erase(superblockIt);
+        freeBlock(range, superblockAddr, superblockSize);
+    } else {
+        memoryPool.partial[allocation.size].insert(superblock.startAddress);
+    }
+}
 
-            // Check if the next free block is within the range
-            if (nextFreeAddress + superblockSize <= range.startAddress + range.size) {
-                range.superblocks.emplace_back(nextFreeAddress, superblockSize);
-                uint64_t addr = range.superblocks.back().allocate(size);
-                addrToSuperblock[addr] = &range.superblocks.back();
-                range.usedMemoryBlocks.push_back({addr, size});
-                return addr;
-            } else {
-                throw std::bad_alloc();
-            }
-        }
+void Allocator::freeBlock(MemoryRange& range, uint64_t addr, uint64_t size) {
+    // Blocks spanning several pools are returned to each of them
+    while (size > 0) {
+        MemoryPool& memoryPool = range.pools[(addr - range.startAddress) / range.poolSize];
+        uint64_t length = std::min(size, memoryPool.startAddress + memoryPool.size - addr);
+        memoryPool.freeBytes += length;
+        size -= length;
 
-    } else {
-        if (!range.freeList.empty()) {
-            auto it =
-                std::find_if(range.freeList.begin(), range.freeList.end(),
-                             [portBaseAddress](uint64_t addr) { return addr > portBaseAddress; });
-
-            if (it != range.freeList.end()) {
-                uint64_t foundAddress = *it;
-                range.freeList.erase(it);  // Remove the allocated address from the free list
-                return foundAddress;
-            }
+        uint64_t blockAddr = addr;
+        uint64_t blockSize = length;
+        auto next = memoryPool.freeBlocks.lower_bound(addr);
+        if (next != memoryPool.freeBlocks.end() && next->first == addr + length) {
+            blockSize += next->second;
+            next = eraseFree(memoryPool, next);
         }
-        // Search in usedMemoryBlocks for the next free address within the port range
-        uint64_t nextFreeAddress = portBaseAddress;
-        for (const auto& block : range.usedMemoryBlocks) {
-            if (block.first + block.second >= portBaseAddress &&
-                block.first + block.second < portEndAddress) {
-                nextFreeAddress = block.first + block.second;
+        if (next != memoryPool.freeBlocks.begin()) {
+            auto prev = std::prev(next);
+            if (prev->first + prev->second == addr) {
+                blockAddr = prev->first;
+                blockSize += prev->second;
+                eraseFree(memoryPool, prev);
             }
         }
+        insertFree(memoryPool, blockAddr, blockSize);
+        addr += length;
+    }
+}
 
-        // Check if the next free block is within the port range
-        if (nextFreeAddress + size <= portEndAddress) {
-            range.usedMemoryBlocks.push_back(
-                {nextFreeAddress, size});  // Keep track of the used block
-            return nextFreeAddress;
-        }
+uint64_t Allocator::getSize(MemoryRangeType type) const {
+    auto it = memoryRanges.find(type);
+    if (it == memoryRanges.end()) {
+        throw std::out_of_range("Invalid memory range type");
+    }
+    return it->second.size;
+}
 
-        // Allocate from portBaseAddress
-        uint64_t addr = portBaseAddress;
-        while (addr + size <= range.startAddress + range.size) {
-            // Check if the address range is occupied
-            bool isOccupied = std::any_of(
-                range.usedMemoryBlocks.begin(), range.usedMemoryBlocks.end(),
-                [addr, size](const std::pair<uint64_t, uint64_t>& block) {
-                    return (addr >= block.first && addr < block.first + block.second) ||
-                           (addr + size > block.first && addr + size <= block.first + block.second);
-                });
-
-            if (!isOccupied) {
-                range.usedMemoryBlocks.push_back({addr, size});  // Keep track of the used block
-                return addr;
-            }
+AllocatorStats Allocator::getStats(MemoryRangeType type) const {
+    std::lock_guard<std::mutex> lock(mutex);
+    auto it = memoryRanges.find(type);
+    if (it == memoryRanges.end()) {
+        throw std::out_of_range("Invalid memory range type");
+    }
+    AllocatorStats stats;
+    for (const auto& pool : it->second.pools) {
+        addPoolStats(stats, pool);
+    }
 
-            addr += size;  // Move to the next block
+    // Free blocks are split at pool boundaries, count adjacent ones as a single block
+    uint64_t runEnd = 0;
+    uint64_t runSize = 0;
+    stats.freeBlocks = 0;
+    stats.largestFreeBlock = 0;
+    for (const auto& pool : it->second.pools) {
+        for (const auto& [addr, size] : pool.freeBlocks) {
+            if (runSize == 0 || addr != runEnd) {
+                stats.freeBlocks++;
+                runSize = 0;
+            }
+            runSize += size;
+            runEnd = addr + size;
+            stats.largestFreeBlock = std::max(stats.largestFreeBlock, runSize);
         }
-
-        throw std::bad_alloc();
     }
+    stats.fragmentation = stats.freeBytes == 0 ? 0.0
+                                               : 1.0 - static_cast<double>(stats.largestFreeBlock) /
+                                                           static_cast<double>(stats.freeBytes);
+    return stats;
 }
 
-uint64_t Allocator::getSize(MemoryRangeType type) const {
+AllocatorStats Allocator::getStats(MemoryRangeType type, uint8_t port) const {
+    std::lock_guard<std::mutex> lock(mutex);
     auto it = memoryRanges.find(type);
     if (it == memoryRanges.end()) {
         throw std::out_of_range("Invalid memory range type");
     }
-    return it->second.size;
+    if (port >= it->second.pools.size()) {
+        throw std::out_of_range("Invalid port number");
+    }
+    AllocatorStats stats;
+    addPoolStats(stats, it->second.pools[port]);
+    return stats;
 }
 
 }  // namespace vrt
@@ -0,0 +1,238 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#include "api/command_graph.hpp"
+
+#include <exception>
+
+namespace vrt {
+
+CommandGraph::CommandGraph(const BackoffPolicy& policy) : policy(policy) {}
+
+CommandGraph::Node CommandGraph::addNode(NodeData data) {
+    // Dependencies can only be earlier nodes, so the graph never has a cycle
+    for (Node dependency : data.dependencies) {
+        if (dependency >= nodes.size()) {
+            throw std::out_of_range("Command graph has no node " + std::to_string(dependency));
+        }
+    }
+    nodes.push_back(std::move(data));
+    prepared = false;
+    return nodes.size() - 1;
+}
+
+CommandGraph::Node CommandGraph::addSync(std::function<std::future<void>()> sync,
+                                         const Dependencies& dependencies) {
+    NodeData data{NodeType::SYNC};
+    data.sync = std::move(sync);
+    data.dependencies = dependencies;
+    return addNode(std::move(data));
+}
+
+CommandGraph::Node CommandGraph::addLaunch(Kernel& kernel, const LaunchDescriptor& descriptor,
+                                           const Dependencies& dependencies) {
+    if (descriptor.getLaunchPlan() != kernel.getLaunchPlan()) {
+        throw std::invalid_argument("Launch descriptor was not created for kernel " +
+                                    kernel.getName());
+    }
+    NodeData data{NodeType::LAUNCH};
+    data.kernel = &kernel;
+    data.descriptor = descriptor;
+    data.dependencies = dependencies;
+    return addNode(std::move(data));
+}
+
+CommandGraph::Node CommandGraph::addLaunch(Kernel& kernel, const std::vector<int64_t>& args,
+                                           const Dependencies& dependencies) {
+    LaunchDescriptor descriptor(kernel);
+    for (size_t i = 0; i < args.size(); i++) {
+        descriptor.setArg(i, args[i]);
+    }
+    return addLaunch(kernel, descriptor, dependencies);
+}
+
+CommandGraph::Node CommandGraph::addHost(std::function<void()> function,
+                                         const Dependencies& dependencies) {
+    NodeData data{NodeType::HOST};
+    data.host = std::move(function);
+    data.dependencies = dependencies;
+    return addNode(std::move(data));
+}
+
+void CommandGraph::setArg(Node node, size_t index, int64_t value) {
+    if (node >= nodes.size() || nodes[node].type != NodeType::LAUNCH) {
+        throw std::invalid_argument("Command graph node " + std::to_string(node) +
+                                    " is not a kernel launch");
+    }
+    nodes[node].descriptor->setArg(index, value);
+}
+
+size_t CommandGraph::size() const { return nodes.size(); }
+
+void CommandGraph::prepare() {
+    roots.clear();
+    indegrees.assign(nodes.size(), 0);
+    for (NodeData& data : nodes) {
+        data.dependents.clear();
+    }
+    for (Node node = 0; node < nodes.size(); node++) {
+        indegrees[node] = nodes[node].dependencies.size();
+        if (indegrees[node] == 0) {
+            roots.push_back(node);
+        }
+        for (Node dependency : nodes[node].dependencies) {
+            nodes[dependency].dependents.push_back(node);
+        }
+    }
+
+    // A kernel runs one launch at a time, so its launches must depend on each other. Nodes only
+    // depend on earlier nodes, so a launch can only be reached from the launches before it.
+    for (Node node = 0; node < nodes.size(); node++) {
+        if (nodes[node].type != NodeType::LAUNCH) {
+            continue;
+        }
+        std::vector<bool> reachable(nodes.size(), false);
+        std::vector<Node> stack = {node};
+        while (!stack.empty()) {
+            Node current = stack.back();
+            stack.pop_back();
+            for (Node dependent : nodes[current].dependents) {
+                if (!reachable[dependent]) {
+                    reachable[dependent] = true;
+                    stack.push_back(dependent);
+                }
+            }
+        }
+        for (Node other = node + 1; other < nodes.size(); other++) {
+            if (nodes[other].type == NodeType::LAUNCH &&
+                nodes[other].kernel == nodes[node].kernel && !reachable[other]) {
+                throw std::invalid_argument("Kernel " + nodes[node].kernel->getName() +
+                                            " is launched by nodes " + std::to_string(node) +
+                                            " and " + std::to_string(other) +
+                                            ", which do not depend on each other");
+            }
+        }
+    }
+
+    remaining.reserve(nodes.size());
+    ready.reserve(nodes.size());
+    running.reserve(nodes.size());
+    prepared = true;
+}
+
+bool CommandGraph::start(Node node) {
+    NodeData& data = nodes[node];
+    switch (data.type) {
+        case NodeType::SYNC:
+            running.push_back({node, data.sync()});
+            return false;
+        case NodeType::LAUNCH:
+            data.kernel->start(*data.descriptor);
+            running.push_back({node, {}});
+            return false;
+        case NodeType::HOST:
+            data.host();
+            return true;
+    }
+    return true;
+}
+
+bool CommandGraph::isDone(Running& entry) {
+    if (nodes[entry.node].type == NodeType::LAUNCH) {
+        return nodes[entry.node].kernel->isDone();
+    }
+    if (entry.transfer.wait_for(std::chrono::seconds(0)) != std::future_status::ready) {
+        return false;
+    }
+    // Rethrows the error of a failed transfer
+    entry.transfer.get();
+    return true;
+}
+
+void CommandGraph::complete(Node node) {
+    for (Node dependent : nodes[node].dependents) {
+        if (--remaining[dependent] == 0) {
+            ready.push_back(dependent);
+        }
+    }
+}
+
+void CommandGraph::launch() {
+    if (!prepared) {
+        prepare();
+    }
+    remaining = indegrees;
+    ready = roots;
+    running.clear();
+    std::exception_ptr error;
+    Backoff backoff(policy);
+    while (!ready.empty() || !running.empty()) {
+        // Start everything that is ready before polling, so independent branches overlap
+        while (!ready.empty() && !error) {
+            Node node = ready.back();
+            ready.pop_back();
+            try {
+                if (start(node)) {
+                    complete(node);
+                }
+            } catch (...) {
+                error = std::current_exception();
+            }
+        }
+        if (error) {
+            ready.clear();
+        }
+
+        bool progress = false;
+        for (size_t i = 0; i < running.size();) {
+            bool done;
+            try {
+                done = isDone(running[i]);
+            } catch (...) {
+                // The failed node completed, its dependents are not started
+                if (!error) {
+                    error = std::current_exception();
+                }
+                running[i] = std::move(running.back());
+                running.pop_back();
+                continue;
+            }
+            if (!done) {
+                i++;
+                continue;
+            }
+            Node node = running[i].node;
+            running[i] = std::move(running.back());
+            running.pop_back();
+            complete(node);
+            progress = true;
+        }
+        if (progress || !ready.empty()) {
+            backoff.reset();
+        } else if (!running.empty()) {
+            backoff.pause();
+        }
+    }
+    if (error) {
+        std::rethrow_exception(error);
+    }
+}
+
+}  // namespace vrt
@@ -0,0 +1,142 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#include "api/completion.hpp"
+
+#include <algorithm>
+
+namespace vrt {
+
+namespace {
+
+/**
+ * @brief Checks whether a deadline passed.
+ */
+bool expired(std::chrono::steady_clock::time_point start, std::chrono::microseconds timeout) {
+    return timeout != NO_TIMEOUT && std::chrono::steady_clock::now() - start >= timeout;
+}
+
+std::vector<Kernel*> pointers(std::vector<Kernel>& kernels) {
+    std::vector<Kernel*> result;
+    result.reserve(kernels.size());
+    for (auto& kernel : kernels) {
+        result.push_back(&kernel);
+    }
+    return result;
+}
+
+}  // namespace
+
+CompletionQueue::CompletionQueue(const BackoffPolicy& policy) : policy(policy) {}
+
+void CompletionQueue::add(Kernel& kernel, Callback callback) {
+    pending.push_back({&kernel, std::move(callback)});
+}
+
+size_t CompletionQueue::poll() {
+    size_t completed = 0;
+    for (size_t i = 0; i < pending.size();) {
+        if (!pending[i].kernel->isDone()) {
+            i++;
+            continue;
+        }
+        Entry entry = std::move(pending[i]);
+        pending[i] = std::move(pending.back());
+        pending.pop_back();
+        complete.push_back(entry.kernel);
+        completed++;
+        if (entry.callback) {
+            entry.callback(*entry.kernel);
+        }
+    }
+    return completed;
+}
+
+Kernel* CompletionQueue::waitAny(std::chrono::microseconds timeout) {
+    auto start = std::chrono::steady_clock::now();
+    Backoff backoff(policy);
+    while (complete.empty() && !pending.empty()) {
+        if (poll() > 0) {
+            break;
+        }
+        if (expired(start, timeout)) {
+            return nullptr;
+        }
+        backoff.pause();
+    }
+    if (complete.empty()) {
+        return nullptr;
+    }
+    Kernel* kernel = complete.front();
+    complete.pop_front();
+    return kernel;
+}
+
+bool CompletionQueue::waitAll(std::chrono::microseconds timeout) {
+    auto start = std::chrono::steady_clock::now();
+    Backoff backoff(policy);
+    while (!pending.empty()) {
+        if (poll() > 0) {
+            // Other kernels are likely to complete soon as well
+            backoff.reset();
+            continue;
+        }
+        if (expired(start, timeout)) {
+            return false;
+        }
+        backoff.pause();
+    }
+    complete.clear();
+    return true;
+}
+
+size_t CompletionQueue::running() const { return pending.size(); }
+
+size_t CompletionQueue::size() const { return pending.size() + complete.size(); }
+
+bool waitAll(const std::vector<Kernel*>& kernels, std::chrono::microseconds timeout) {
+    CompletionQueue queue;
+    for (Kernel* kernel : kernels) {
+        queue.add(*kernel);
+    }
+    return queue.waitAll(timeout);
+}
+
+bool waitAll(std::vector<Kernel>& kernels, std::chrono::microseconds timeout) {
+    return waitAll(pointers(kernels), timeout);
+}
+
+int waitAny(const std::vector<Kernel*>& kernels, std::chrono::microseconds timeout) {
+    CompletionQueue queue;
+    for (Kernel* kernel : kernels) {
+        queue.add(*kernel);
+    }
+    Kernel* kernel = queue.waitAny(timeout);
+    if (kernel == nullptr) {
+        return -1;
+    }
+    return std::find(kernels.begin(), kernels.end(), kernel) - kernels.begin();
+}
+
+int waitAny(std::vector<Kernel>& kernels, std::chrono::microseconds timeout) {
+    return waitAny(pointers(kernels), timeout);
+}
+
+}  // namespace vrt
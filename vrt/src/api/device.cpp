@@ -20,29 +20,63 @@
 
 #include "api/device.hpp"
 
+#include <algorithm>
+
+#include "api/command_graph.hpp"
 #include "utils/filesystem_cache.hpp"
+#include "utils/host_memory.hpp"
 
 namespace vrt {
 
+namespace {
+
+/**
+ * @brief Reads an unsigned integer from the environment.
+ * @param name The name of the environment variable.
+ * @param value The value to use if the variable is not set.
+ * @return The value of the variable, or the default.
+ */
+uint64_t getEnvOrDefault(const char* name, uint64_t value) {
+    const char* env = getenv(name);
+    if (env == nullptr || *env == '\0') {
+        return value;
+    }
+    try {
+        return std::stoull(env, nullptr, 0);
+    } catch (const std::exception&) {
+        throw std::invalid_argument(std::string("Invalid value for ") + name + ": " + env);
+    }
+}
+
+}  // namespace
+
 Device::Device(const std::string& bdf, const std::string& vrtbinPath, bool program,
-               ProgramType programType)
+               ProgramType programType, ProgramMode programMode)
     : vrtbin(vrtbinPath, bdf), clkWiz(nullptr, "", 0, 0, 0), pcieHandler(bdf) {
     lockPcieDevice(bdf);
     this->bdf = bdf;
     this->allocator = new Allocator(4096);
     this->systemMap = this->vrtbin.getSystemMapPath();
+    this->compiledMap = this->vrtbin.getSystemMap();
     this->pdiPath = this->vrtbin.getPdiPath();
     this->programType = programType;
+    this->programMode = programMode;
     this->qdmaIntf = QdmaIntf(bdf);
     this->zmqServer = std::make_shared<ZmqServer>();
+    this->dmaQueueCount = getEnvOrDefault("VRT_DMA_QUEUES", DmaEngine::DEFAULT_QUEUES);
     findPlatform();
     if (platform == Platform::HARDWARE) {
         createAmiDev();
+        this->numaNode = HostMemoryPool::getNumaNode(bdf);
         findVrtbinType();
         if (program) {
             programDevice();
         }
         parseSystemMap();
+        this->dmaEngine = std::make_shared<DmaEngine>(
+            bdf, getDmaQueueIds(qdmaConnections),
+            getEnvOrDefault("VRT_DMA_IN_FLIGHT", DmaEngine::DEFAULT_IN_FLIGHT),
+            getEnvOrDefault("VRT_DMA_CHUNK_SIZE", DmaEngine::DEFAULT_CHUNK_SIZE));
         this->clkWiz.setRateHz(200000000, false);
     } else if (platform == Platform::EMULATION) {
         parseSystemMap();
@@ -69,20 +103,28 @@ Device::~Device() {
 }
 
 void Device::parseSystemMap() {
-    XMLParser parser(systemMap);
-    parser.parseXML();
-    clockFreq = parser.getClockFrequency();
-    this->platform = parser.getPlatform();
+    clockFreq = compiledMap->getClockFrequency();
+    this->platform = compiledMap->getPlatform();
     this->clkWiz = ClkWiz(dev, "clk_wiz", CLK_WIZ_BASE, CLK_WIZ_OFFSET, clockFreq);
     this->clkWiz.setPlatform(platform);
-    kernels = parser.getKernels();
-    for (auto& kernel : kernels) {
-        kernel.second.setDevice(dev);
-    }
-    this->qdmaConnections = parser.getQdmaConnections();
+    this->qdmaConnections = compiledMap->getQdmaConnections();
+    // VRT_SHARED_MEMORY=0 falls back to sending buffer data over ZeroMQ
+    const char* sharedMemory = getenv("VRT_SHARED_MEMORY");
+    zmqServer->setSharedMemory(compiledMap->getSharedMemory() &&
+                               (sharedMemory == nullptr || std::string(sharedMemory) != "0"));
+    // VRT_ZMQ_BINARY=0 falls back to JSON commands for register accesses
+    const char* binaryProtocol = getenv("VRT_ZMQ_BINARY");
+    zmqServer->setBinaryProtocol(compiledMap->getBinaryProtocol() &&
+                                 (binaryProtocol == nullptr || std::string(binaryProtocol) != "0"));
 }
 
-Kernel Device::getKernel(const std::string& name) { return kernels[name]; }
+Kernel Device::getKernel(const std::string& name) {
+    // Kernels are created on demand and share the launch plan of the compiled system map
+    if (!compiledMap->hasKernel(name)) {
+        return Kernel();
+    }
+    return compiledMap->getKernel(name, dev);
+}
 
 void Device::cleanup() {
     if (platform == Platform::HARDWARE) {
@@ -100,27 +142,38 @@ void Device::cleanup() {
 
 std::string Device::getBdf() { return bdf; }
 
+int Device::getNumaNode() { return numaNode; }
+
+CommandGraph Device::createGraph(const BackoffPolicy& policy) { return CommandGraph(policy); }
+
+std::string Device::readLogicUUID() {
+    char current_uuid[AMI_LOGIC_UUID_SIZE] = {0};
+    if (ami_dev_read_uuid(dev, current_uuid) != AMI_STATUS_OK) {
+        return "";
+    }
+    return std::string(current_uuid).substr(0, 32);
+}
+
 void Device::programDevice() {
+    std::string logic_uuid = vrtbin.getUUID();
+    std::string current_uuid = readLogicUUID();
+    utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__, "Current UUID: {}",
+                       current_uuid.empty() ? "N/A" : current_uuid);
+    utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__, "New UUID: {}", logic_uuid);
+    if (programMode == ProgramMode::IF_CHANGED && !logic_uuid.empty() &&
+        current_uuid == logic_uuid) {
+        utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__,
+                           "Device already programmed with the same image, skipping programming");
+        if (vrtbinType == VrtbinType::SEGMENTED) {
+            utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__,
+                               "Refreshing qdma handle");
+            pcieHandler.execute(PcieDriverHandler::Command::HOTPLUG);
+        }
+        setupQdmaQueues(true);
+        return;
+    }
     if (vrtbinType == VrtbinType::FLAT) {
         if (programType == ProgramType::FLASH) {
-            char current_uuid[33];
-            std::string logic_uuid = vrtbin.getUUID();
-            int found_current_uuid = AMI_STATUS_ERROR;
-            found_current_uuid = ami_dev_read_uuid(dev, current_uuid);
-            if (found_current_uuid == AMI_STATUS_OK) {
-                std::string current_uuid_str(current_uuid);
-                current_uuid_str = current_uuid_str.substr(0, 32);
-                utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__, "Current UUID: {}",
-                                   current_uuid_str);
-                utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__, "New UUID: {}",
-                                   logic_uuid);
-                if (current_uuid_str == logic_uuid) {
-                    utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__,
-                                       "Device already programmed with the same image");
-                    bootDevice();
-                    return;
-                }
-            }
             utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__,
                                "Programming device {} in FLASH mode...This might take a while",
                                bdf);
@@ -130,24 +183,6 @@ void Device::programDevice() {
             }
             bootDevice();
         } else {
-            int found_current_uuid = AMI_STATUS_ERROR;
-            char current_uuid[33];
-            std::string logic_uuid = vrtbin.getUUID();
-            found_current_uuid = ami_dev_read_uuid(dev, current_uuid);
-            if (found_current_uuid == AMI_STATUS_OK) {
-                std::string current_uuid_str(current_uuid);
-                current_uuid_str = current_uuid_str.substr(0, 32);
-                utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__, "Current UUID: {}",
-                                   current_uuid_str);
-                utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__, "New UUID: {}",
-                                   logic_uuid);
-                if (current_uuid_str == logic_uuid) {
-                    utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__,
-                                       "Device already programmed with the same image");
-                    bootDevice();
-                    return;
-                }
-            }
             utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__,
                                "Programming device {} in JTAG mode...This might take a while", bdf);
             std::string cmd = JTAG_PROGRAM_PATH + pdiPath;
@@ -158,38 +193,6 @@ void Device::programDevice() {
         utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__,
                            "Programming device {} in SEGMENTED mode...This might take a while",
                            bdf);
-        char current_uuid[33];
-        std::string logic_uuid = vrtbin.getUUID();
-        int found_current_uuid = AMI_STATUS_ERROR;
-        found_current_uuid = ami_dev_read_uuid(dev, current_uuid);
-        if (found_current_uuid == AMI_STATUS_OK) {
-            std::string current_uuid_str(current_uuid);
-            current_uuid_str = current_uuid_str.substr(0, 32);
-            utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__, "Current UUID: {}",
-                               current_uuid_str);
-            utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__, "New UUID: {}",
-                               logic_uuid);
-            if (current_uuid_str == logic_uuid) {
-                utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__,
-                                   "Device already programmed with the same image");
-                utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__,
-                                   "Refreshing qdma handle");
-                pcieHandler.execute(PcieDriverHandler::Command::HOTPLUG);
-                XMLParser parser(systemMap);
-                parser.parseXML();
-                auto qdmaConns = parser.getQdmaConnections();
-                std::string cmd = "sudo bash " + std::string(QDMA_SETUP_QUEUES) + bdf + " --mm 0 bi";
-                for (auto& qdmaConn : qdmaConns) {
-                    uint32_t qid = qdmaConn.getQid();
-                    std::string direction =
-                        (qdmaConn.getDirection() == StreamDirection::HOST_TO_DEVICE ? "h2c"
-                                                                                    : "c2h");
-                    cmd += " --st " + std::to_string(qid) + " --dir " + direction;
-                }
-                system(cmd.c_str());
-                return;
-            }
-        }
         bootDevice();
     }
 }
@@ -216,18 +219,7 @@ void Device::bootDevice() {
                 createAmiDev();
                 utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__,
                                    "New PDI booted successfully");
-                XMLParser parser(systemMap);
-                parser.parseXML();
-                auto qdmaConns = parser.getQdmaConnections();
-                std::string cmd = "sudo bash " + std::string(QDMA_SETUP_QUEUES) + bdf + " --mm 0 bi";
-                for (auto& qdmaConn : qdmaConns) {
-                    uint32_t qid = qdmaConn.getQid();
-                    std::string direction =
-                        (qdmaConn.getDirection() == StreamDirection::HOST_TO_DEVICE ? "h2c"
-                                                                                    : "c2h");
-                    cmd += " --st " + std::to_string(qid) + " --dir " + direction;
-                }
-                system(cmd.c_str());
+                setupQdmaQueues();
                 utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__,
                                    "QDMA queues setup successfully");
             }
@@ -240,17 +232,7 @@ void Device::bootDevice() {
             createAmiDev();
             utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__,
                                "New PDI booted successfully");
-            XMLParser parser(systemMap);
-            parser.parseXML();
-            auto qdmaConns = parser.getQdmaConnections();
-            std::string cmd = "sudo bash " + std::string(QDMA_SETUP_QUEUES) + bdf + " --mm 0 bi";
-            for (auto& qdmaConn : qdmaConns) {
-                uint32_t qid = qdmaConn.getQid();
-                std::string direction =
-                    (qdmaConn.getDirection() == StreamDirection::HOST_TO_DEVICE ? "h2c" : "c2h");
-                cmd += " --st " + std::to_string(qid) + " --dir " + direction;
-            }
-            system(cmd.c_str());
+            setupQdmaQueues();
             utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__,
                                "QDMA queues setup successfully");
         }
@@ -285,23 +267,57 @@ void Device::bootDevice() {
             createAmiDev();
             utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__,
                                "PLD PDI booted successfully");
-            XMLParser parser(systemMap);
-            parser.parseXML();
-            auto qdmaConns = parser.getQdmaConnections();
-            std::string cmd = "sudo bash " + std::string(QDMA_SETUP_QUEUES) + bdf + " --mm 0 bi";
-            for (auto& qdmaConn : qdmaConns) {
-                uint32_t qid = qdmaConn.getQid();
-                std::string direction =
-                    (qdmaConn.getDirection() == StreamDirection::HOST_TO_DEVICE ? "h2c" : "c2h");
-                cmd += " --st " + std::to_string(qid) + " --dir " + direction;
-            }
-            system(cmd.c_str());
+            setupQdmaQueues();
             utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__,
                                "QDMA queues setup successfully");
         }
     }
 }
 
+std::vector<uint32_t> Device::getDmaQueueIds(const std::vector<QdmaConnection>& connections) {
+    // The lowest indexes not taken by stream queues, starting with the default queue 0
+    std::vector<uint32_t> queueIds;
+    for (uint32_t qid = 0; queueIds.size() < std::max<uint32_t>(dmaQueueCount, 1); qid++) {
+        bool isStream =
+            std::any_of(connections.begin(), connections.end(),
+                        [qid](const QdmaConnection& conn) { return conn.getQid() == qid; });
+        if (!isStream) {
+            queueIds.push_back(qid);
+        }
+    }
+    return queueIds;
+}
+
+void Device::setupQdmaQueues(bool missingOnly) {
+    auto qdmaConns = compiledMap->getQdmaConnections();
+    // The setup script takes seconds per queue, queues left by a previous run are reused
+    auto isMissing = [&](uint32_t qid, QdmaQueueType type) {
+        return !missingOnly ||
+               !std::filesystem::exists(QdmaIntf(bdf, qid, type).getQueueName());
+    };
+    std::string args;
+    for (uint32_t qid : getDmaQueueIds(qdmaConns)) {
+        if (isMissing(qid, QdmaQueueType::MEMORY_MAPPED)) {
+            args += " --mm " + std::to_string(qid) + " bi";
+        }
+    }
+    for (auto& qdmaConn : qdmaConns) {
+        uint32_t qid = qdmaConn.getQid();
+        std::string direction =
+            (qdmaConn.getDirection() == StreamDirection::HOST_TO_DEVICE ? "h2c" : "c2h");
+        if (isMissing(qid, QdmaQueueType::STREAM)) {
+            args += " --st " + std::to_string(qid) + " --dir " + direction;
+        }
+    }
+    if (args.empty()) {
+        utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__,
+                           "QDMA queues of {} already set up", bdf);
+        return;
+    }
+    std::string cmd = "sudo bash " + std::string(QDMA_SETUP_QUEUES) + bdf + args;
+    system(cmd.c_str());
+}
+
 void Device::getNewHandle() {
     ami_device* new_dev = NULL;
     int ret = AMI_STATUS_ERROR;
@@ -360,15 +376,11 @@ uint64_t Device::getMaxFrequency() {
 ami_device* Device::getAmiDev() { return dev; }
 
 void Device::findVrtbinType() {
-    XMLParser parser(systemMap);
-    parser.parseXML();
-    this->vrtbinType = parser.getVrtbinType();
+    this->vrtbinType = compiledMap->getVrtbinType();
 }
 
 void Device::findPlatform() {
-    XMLParser parser(systemMap);
-    parser.parseXML();
-    this->platform = parser.getPlatform();
+    this->platform = compiledMap->getPlatform();
 }
 
 Platform Device::getPlatform() { return platform; }
@@ -381,6 +393,8 @@ Allocator* Device::getAllocator() { return allocator; }
 
 std::vector<QdmaIntf*> Device::getQdmaInterfaces() { return qdmaIntfs; }
 
+std::shared_ptr<DmaEngine> Device::getDmaEngine() { return dmaEngine; }
+
 void Device::lockPcieDevice(const std::string& bdf) {
     std::string lockFile = FilesystemCache::getRuntimePath() / ("pcie_device_" + bdf + ".lock");
     int fd = open(lockFile.c_str(), O_CREAT | O_WRONLY, 0666);
@@ -0,0 +1,161 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#include "api/device_group.hpp"
+
+#include <libxml/parser.h>
+
+#include <algorithm>
+#include <atomic>
+#include <set>
+#include <stdexcept>
+#include <thread>
+
+#include "utils/logger.hpp"
+
+namespace vrt {
+
+namespace {
+
+/**
+ * Runs task(i) for every i below count on up to threads threads (all at once for 0), including
+ * the calling thread. Returns the exception thrown by each task, if any.
+ */
+std::vector<std::exception_ptr> runParallel(size_t count, size_t threads,
+                                            const std::function<void(size_t)>& task) {
+    std::vector<std::exception_ptr> errors(count);
+    std::atomic<size_t> next{0};
+    auto worker = [&]() {
+        for (size_t i = next++; i < count; i = next++) {
+            try {
+                task(i);
+            } catch (...) {
+                errors[i] = std::current_exception();
+            }
+        }
+    };
+    size_t workers = threads == 0 ? count : std::min(threads, count);
+    std::vector<std::thread> pool;
+    for (size_t i = 1; i < workers; i++) {
+        pool.emplace_back(worker);
+    }
+    worker();
+    for (auto& thread : pool) {
+        thread.join();
+    }
+    return errors;
+}
+
+std::string describe(const std::exception_ptr& error) {
+    try {
+        std::rethrow_exception(error);
+    } catch (const std::exception& e) {
+        return e.what();
+    } catch (...) {
+        return "unknown error";
+    }
+}
+
+}  // namespace
+
+DeviceGroup::DeviceGroup(const std::vector<std::string>& bdfs, const std::string& vrtbinPath,
+                         bool program, ProgramType programType, ProgramMode programMode,
+                         size_t threads)
+    : threads(threads) {
+    if (std::set<std::string>(bdfs.begin(), bdfs.end()).size() != bdfs.size()) {
+        throw std::invalid_argument("Duplicate device in device group");
+    }
+    // libxml2 must be initialized before it is used from several threads
+    xmlInitParser();
+    std::vector<std::unique_ptr<Device>> created(bdfs.size());
+    status.resize(bdfs.size());
+    auto errors = runParallel(bdfs.size(), threads, [&](size_t i) {
+        status[i].bdf = bdfs[i];
+        auto start = std::chrono::steady_clock::now();
+        try {
+            created[i] =
+                std::make_unique<Device>(bdfs[i], vrtbinPath, program, programType, programMode);
+        } catch (...) {
+            status[i].time = std::chrono::duration_cast<std::chrono::milliseconds>(
+                std::chrono::steady_clock::now() - start);
+            throw;
+        }
+        status[i].time = std::chrono::duration_cast<std::chrono::milliseconds>(
+            std::chrono::steady_clock::now() - start);
+        status[i].ok = true;
+    });
+    for (size_t i = 0; i < bdfs.size(); i++) {
+        if (errors[i]) {
+            status[i].error = describe(errors[i]);
+            utils::Logger::log(utils::LogLevel::ERROR, __PRETTY_FUNCTION__,
+                               "Bring-up of device {} failed after {} ms: {}", bdfs[i],
+                               status[i].time.count(), status[i].error);
+        } else {
+            utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__,
+                               "Device {} brought up in {} ms", bdfs[i], status[i].time.count());
+            devices.push_back(std::move(created[i]));
+        }
+    }
+}
+
+size_t DeviceGroup::getSize() const { return devices.size(); }
+
+Device& DeviceGroup::operator[](size_t index) { return *devices.at(index); }
+
+const std::vector<DeviceStatus>& DeviceGroup::getStatus() const { return status; }
+
+bool DeviceGroup::ok() const {
+    return std::all_of(status.begin(), status.end(),
+                       [](const DeviceStatus& device) { return device.ok; });
+}
+
+void DeviceGroup::forEach(const std::function<void(Device&, size_t)>& function) {
+    auto errors = runParallel(devices.size(), 0, [&](size_t i) { function(*devices[i], i); });
+    for (auto& error : errors) {
+        if (error) {
+            std::rethrow_exception(error);
+        }
+    }
+}
+
+void DeviceGroup::setFrequency(uint64_t freq) {
+    forEach([freq](Device& device, size_t) { device.setFrequency(freq); });
+}
+
+void DeviceGroup::cleanup() {
+    forEach([](Device& device, size_t) { device.cleanup(); });
+}
+
+KernelGroup::KernelGroup(DeviceGroup& group, const std::string& kernelName) {
+    kernels.reserve(group.getSize());
+    for (size_t i = 0; i < group.getSize(); i++) {
+        kernels.emplace_back(group[i], kernelName);
+    }
+}
+
+size_t KernelGroup::getSize() const { return kernels.size(); }
+
+Kernel& KernelGroup::operator[](size_t index) { return kernels.at(index); }
+
+std::vector<Kernel>& KernelGroup::getKernels() { return kernels; }
+
+bool KernelGroup::wait(std::chrono::microseconds timeout) { return waitAll(kernels, timeout); }
+
+}  // namespace vrt
@@ -20,17 +20,56 @@
 
 #include "api/kernel.hpp"
 
+#include <regex>
+
 #include "api/device.hpp"
+#include "api/launch_descriptor.hpp"
 
 namespace vrt {
 
+LaunchPlan::LaunchPlan(std::vector<Register> registers) {
+    std::regex re(".*_\\d+$");  // Regular expression to match strings ending with _nr
+    uint32_t lastOffset = 0;
+    for (std::size_t i = 4; i < registers.size(); i++) {
+        if (i + 1 < registers.size() && std::regex_match(registers[i].getRegisterName(), re)) {
+            args.push_back({registers[i].getOffset(), registers[i + 1].getOffset(), true});
+            lastOffset =
+                std::max({lastOffset, registers[i].getOffset(), registers[i + 1].getOffset()});
+            i++;
+        } else {
+            args.push_back({registers[i].getOffset(), 0, false});
+            lastOffset = std::max(lastOffset, registers[i].getOffset());
+        }
+    }
+    if (!args.empty()) {
+        imageSize = (lastOffset - FIRST_ARG_OFFSET) / sizeof(uint32_t) + 1;
+    }
+}
+
+LaunchPlan::LaunchPlan(std::vector<LaunchArg> args, uint32_t imageSize)
+    : args(std::move(args)), imageSize(imageSize) {}
+
+int LaunchPlan::scalarIndex(uint32_t offset) const {
+    for (std::size_t i = 0; i < args.size(); i++) {
+        if (!args[i].wide && args[i].offset == offset) {
+            return i;
+        }
+    }
+    return -1;
+}
+
 Kernel::Kernel(ami_device* device, const std::string& name, uint64_t baseAddr, uint64_t range,
-               const std::vector<Register>& registers) {
+               const std::vector<Register>& registers)
+    : Kernel(device, name, baseAddr, range, std::make_shared<const LaunchPlan>(registers)) {}
+
+Kernel::Kernel(ami_device* device, const std::string& name, uint64_t baseAddr, uint64_t range,
+               std::shared_ptr<const LaunchPlan> plan) {
     this->dev = device;
     this->name = name;
     this->baseAddr = baseAddr;
     this->range = range;
-    this->registers = registers;
+    this->plan = std::move(plan);
+    this->registerImage.assign(this->plan->imageSize, 0);
 }
 
 Kernel::Kernel(Device& device, const std::string& kernelName)
@@ -41,54 +80,37 @@ Kernel::Kernel(Device& device, const std::string& kernelName)
 }
 
 void Kernel::write(uint32_t offset, uint32_t value) {
+    TraceScope trace(TraceType::KERNEL_WRITE, sizeof(value), baseAddr + offset, getTraceName());
     if (platform == Platform::HARDWARE) {
         utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__,
                            "Writing to device {} kernel: {} at offset: {x} value: {x}", deviceBdf,
                            name, offset, value);
-        uint32_t* buf = (uint32_t*)calloc(1, sizeof(uint32_t));
-        *buf = value;
-        if (buf) {
-            int ret = ami_mem_bar_write(dev, bar, baseAddr - BASE_BAR_ADDR + offset, buf[0]);
-            if (ret != AMI_STATUS_OK) {
-                throw std::runtime_error("Failed to write to device");
-            }
+        int ret = ami_mem_bar_write(dev, bar, baseAddr - BASE_BAR_ADDR + offset, value);
+        if (ret != AMI_STATUS_OK) {
+            throw std::runtime_error("Failed to write to device");
         }
-        free(buf);
     } else if (platform == Platform::SIMULATION) {
         server->sendScalar(baseAddr + offset, value);
     }
 }
 
 uint32_t Kernel::read(uint32_t offset) {
+    TraceScope trace(TraceType::KERNEL_READ, sizeof(uint32_t), baseAddr + offset, getTraceName());
     if (platform == Platform::HARDWARE) {
         if (offset != 0)
             utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__,
                                "Reading from device {} kernel: {} at offset: {x}", deviceBdf, name,
                                offset);
-        uint32_t* buf = (uint32_t*)calloc(1, sizeof(uint32_t));
-        if (buf) {
-            int ret = ami_mem_bar_read(dev, bar, baseAddr - BASE_BAR_ADDR + offset, &buf[0]);
-            if (ret != AMI_STATUS_OK) {
-                throw std::runtime_error("Failed to read from device");
-            }
+        uint32_t value = 0;
+        int ret = ami_mem_bar_read(dev, bar, baseAddr - BASE_BAR_ADDR + offset, &value);
+        if (ret != AMI_STATUS_OK) {
+            throw std::runtime_error("Failed to read from device");
         }
-        uint32_t value = buf[0];
-        free(buf);
         return value;
     } else if (platform == Platform::EMULATION) {
-        currentRegisterIndex = 4;
-        std::size_t argIdx = 0;
-        while (currentRegisterIndex < registers.size()) {
-            std::regex re(".*_\\d+$");
-            if (std::regex_match(registers.at(currentRegisterIndex).getRegisterName(), re)) {
-                currentRegisterIndex += 2;
-            } else {
-                if (registers.at(currentRegisterIndex).getOffset() == offset) {
-                    return server->fetchScalar(name, "arg" + std::to_string(argIdx));
-                }
-                currentRegisterIndex++;
-            }
-            argIdx++;
+        int argIdx = plan ? plan->scalarIndex(offset) : -1;
+        if (argIdx >= 0) {
+            return server->fetchScalar(name, "arg" + std::to_string(argIdx));
         }
     } else if (platform == Platform::SIMULATION) {
         return server->fetchScalarSim(baseAddr + offset);
@@ -98,12 +120,29 @@ uint32_t Kernel::read(uint32_t offset) {
 
 void Kernel::setDevice(ami_device* device) { this->dev = device; }
 
-void Kernel::wait() {
-    if (platform == Platform::EMULATION) {
-        return;
+void Kernel::wait() { wait(NO_TIMEOUT); }
+
+bool Kernel::wait(std::chrono::microseconds timeout, const BackoffPolicy& policy) {
+    TraceScope trace(TraceType::KERNEL_WAIT, 0, baseAddr, getTraceName());
+    auto start = std::chrono::steady_clock::now();
+    Backoff backoff(policy);
+    while (!isDone()) {
+        if (timeout != NO_TIMEOUT && std::chrono::steady_clock::now() - start >= timeout) {
+            return false;
+        }
+        backoff.pause();
     }
-    while (read(0x00) == 1 || read(0x00) == 0x81) {
+    return true;
+}
+
+bool Kernel::isDone() {
+    if (platform == Platform::EMULATION) {
+        // Emulated calls complete before the call command returns
+        return true;
     }
+    // ap_start is still set while the kernel runs, with ap_auto_restart for 0x81
+    uint32_t control = read(0x00);
+    return control != 0x01 && control != 0x81;
 }
 
 void Kernel::startKernel(bool autorestart) {
@@ -114,24 +153,119 @@ void Kernel::startKernel(bool autorestart) {
     }
 }
 
+void Kernel::start(const std::vector<int64_t>& args) {
+    TraceScope trace(TraceType::KERNEL_START, 0, baseAddr, getTraceName());
+    currentArgIndex = 0;
+    if (platform == Platform::HARDWARE) {
+        for (int64_t arg : args) {
+            processArg(arg);
+        }
+        this->writeBatch();
+        this->startKernel();
+    } else if (platform == Platform::EMULATION) {
+        Json::Value command;
+        command["command"] = "call";
+        command["function"] = name;
+        int argIdx = 0;
+        for (int64_t arg : args) {
+            processEmuArg(arg, command, argIdx);
+        }
+        server->sendCommand(command);
+    } else if (platform == Platform::SIMULATION) {
+        for (int64_t arg : args) {
+            processSimArg(arg);
+        }
+        this->writeBatch();
+        this->startKernel();
+    }
+}
+
+void Kernel::call(const std::vector<int64_t>& args) {
+    start(args);
+    wait();
+}
+
 Kernel::~Kernel() {}
 
 void Kernel::setPlatform(Platform platform) { this->platform = platform; }
 
+void Kernel::writeSimBatch(const std::vector<uint32_t>& image, size_t argCount) {
+    std::vector<ScalarWrite> writes;
+    for (size_t i = 0; i < argCount && i < plan->args.size(); i++) {
+        const LaunchArg& arg = plan->args[i];
+        writes.push_back({baseAddr + arg.offset,
+                          image[(arg.offset - LaunchPlan::FIRST_ARG_OFFSET) / sizeof(uint32_t)]});
+        if (arg.wide) {
+            writes.push_back(
+                {baseAddr + arg.highOffset,
+                 image[(arg.highOffset - LaunchPlan::FIRST_ARG_OFFSET) / sizeof(uint32_t)]});
+        }
+    }
+    server->sendScalars(writes);
+}
+
 void Kernel::writeBatch() {
-    uint32_t noOfPhysicalRegisters =
-        (registers.at(registers.size() - 1).getOffset() + sizeof(uint32_t)) / sizeof(uint32_t);
-    uint32_t* buf = (uint32_t*)calloc(noOfPhysicalRegisters, sizeof(uint32_t));
-    for (std::size_t i = 4; i < noOfPhysicalRegisters; i++) {
-        buf[i] = registerMap[i * sizeof(uint32_t)];
-        // buf[i] = registerMap[registers.at(i).getOffset()];
+    if (registerImage.empty()) {
+        return;
+    }
+    if (platform == Platform::SIMULATION) {
+        writeSimBatch(registerImage, currentArgIndex);
+        return;
+    }
+    for (std::size_t i = 0; i < registerImage.size(); i++) {
         utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__,
-                           "Kernel {}, reg at offset {x}, value: {x}", name, i * sizeof(uint32_t),
-                           buf[i]);
+                           "Kernel {}, reg at offset {x}, value: {x}", name,
+                           LaunchPlan::FIRST_ARG_OFFSET + i * sizeof(uint32_t), registerImage[i]);
+    }
+    ami_mem_bar_write_range(dev, bar, baseAddr - BASE_BAR_ADDR + LaunchPlan::FIRST_ARG_OFFSET,
+                            registerImage.size(), registerImage.data());
+}
+
+void Kernel::writeBatch(const LaunchDescriptor& descriptor) {
+    const std::vector<uint32_t>& image = descriptor.getImage();
+    if (image.empty()) {
+        return;
+    }
+    if (platform == Platform::SIMULATION) {
+        writeSimBatch(image, descriptor.getValues().size());
+        return;
+    }
+    // The image is only read by the burst write
+    ami_mem_bar_write_range(dev, bar, baseAddr - BASE_BAR_ADDR + LaunchPlan::FIRST_ARG_OFFSET,
+                            image.size(), const_cast<uint32_t*>(image.data()));
+}
+
+std::shared_ptr<const LaunchPlan> Kernel::getLaunchPlan() const { return plan; }
+
+void Kernel::start(const LaunchDescriptor& descriptor) {
+    TraceScope trace(TraceType::KERNEL_START, 0, baseAddr, getTraceName());
+    if (descriptor.getLaunchPlan() != plan) {
+        throw std::invalid_argument("Launch descriptor was not created for kernel " + name);
+    }
+    if (platform == Platform::HARDWARE) {
+        this->writeBatch(descriptor);
+        this->startKernel();
+    } else if (platform == Platform::EMULATION) {
+        Json::Value command;
+        command["command"] = "call";
+        command["function"] = name;
+        currentArgIndex = 0;
+        int argIdx = 0;
+        for (int64_t value : descriptor.getValues()) {
+            processEmuArg(value, command, argIdx);
+        }
+        server->sendCommand(command);
+    } else if (platform == Platform::SIMULATION) {
+        this->writeBatch(descriptor);
+        this->startKernel();
     }
-    ami_mem_bar_write_range(dev, bar, baseAddr - BASE_BAR_ADDR, noOfPhysicalRegisters, buf);
-    free(buf);
 }
+
+void Kernel::call(const LaunchDescriptor& descriptor) {
+    start(descriptor);
+    wait();
+}
+
 std::string Kernel::getName() const { return name; }
 
 }  // namespace vrt
@@ -0,0 +1,50 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#include "api/launch_descriptor.hpp"
+
+namespace vrt {
+
+LaunchDescriptor::LaunchDescriptor(const Kernel& kernel) : plan(kernel.getLaunchPlan()) {
+    if (!plan) {
+        throw std::invalid_argument("Kernel has no registers");
+    }
+    image.assign(plan->imageSize, 0);
+    values.assign(plan->args.size(), 0);
+}
+
+LaunchDescriptor& LaunchDescriptor::setArg(size_t index, int64_t value) {
+    if (index >= values.size()) {
+        throw std::out_of_range("Kernel has no argument " + std::to_string(index));
+    }
+    values[index] = value;
+    plan->pack(image.data(), index, static_cast<uint64_t>(value));
+    return *this;
+}
+
+size_t LaunchDescriptor::getArgCount() const { return values.size(); }
+
+const std::vector<uint32_t>& LaunchDescriptor::getImage() const { return image; }
+
+const std::vector<int64_t>& LaunchDescriptor::getValues() const { return values; }
+
+std::shared_ptr<const LaunchPlan> LaunchDescriptor::getLaunchPlan() const { return plan; }
+
+}  // namespace vrt
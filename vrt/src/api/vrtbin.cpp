@@ -20,7 +20,33 @@
 
 #include "api/vrtbin.hpp"
 
+#include <algorithm>
+#include <iterator>
+
 namespace vrt {
+
+namespace {
+
+uint64_t getCacheSize() {
+    const char* value = std::getenv("VRT_VRTBIN_CACHE_SIZE");
+    if (value == nullptr || *value == '\0') {
+        return VrtbinCache::DEFAULT_MAX_SIZE;
+    }
+    return std::strtoull(value, nullptr, 0);
+}
+
+bool sameContents(const std::string& first, const std::string& second) {
+    std::error_code ec;
+    if (std::filesystem::file_size(first, ec) != std::filesystem::file_size(second, ec) || ec) {
+        return false;
+    }
+    std::ifstream a(first, std::ios::binary), b(second, std::ios::binary);
+    return std::equal(std::istreambuf_iterator<char>(a), std::istreambuf_iterator<char>(),
+                      std::istreambuf_iterator<char>(b));
+}
+
+}  // namespace
+
 Vrtbin::Vrtbin(std::string vrtbinPath, const std::string& bdf) {
     this->vrtbinPath = vrtbinPath;
     if (!std::filesystem::exists(vrtbinPath)) {
@@ -35,15 +61,9 @@ Vrtbin::Vrtbin(std::string vrtbinPath, const std::string& bdf) {
     if (!ami_home.empty() && ami_home.back() != '/') {
         ami_home += '/';
     }
-    std::string cmd = "mkdir -p " + ami_home + bdf;
-    utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__, "Running command: {}", cmd);
-    system(cmd.c_str());
+    std::filesystem::create_directories(ami_home + bdf);
     this->systemMapPath = ami_home + bdf + "/system_map.xml";
     extract();
-    std::string tempSystemMapPath = tempExtractPath + "/system_map.xml";
-    XMLParser parser(tempSystemMapPath);
-    parser.parseXML();
-    this->platform = parser.getPlatform();
     if (this->platform == Platform::HARDWARE) {
         this->versionPath = ami_home + bdf + "/version.json";
         this->pdiPath = tempExtractPath + "/design.pdi";
@@ -51,7 +71,13 @@ Vrtbin::Vrtbin(std::string vrtbinPath, const std::string& bdf) {
         copy(tempExtractPath + "/version.json", versionPath);
         copy(tempExtractPath + "/report_utilization.xml",
              ami_home + bdf + "/report_utilization.xml");
-        extractUUID();
+        // Older vrtbins have no binary utilization report, don't keep the one of another vrtbin
+        if (cache->contains("report_utilization.bin")) {
+            copy(tempExtractPath + "/report_utilization.bin",
+                 ami_home + bdf + "/report_utilization.bin");
+        } else {
+            std::filesystem::remove(ami_home + bdf + "/report_utilization.bin");
+        }
     } else if (this->platform == Platform::EMULATION) {
         copy(tempExtractPath + "/system_map.xml", systemMapPath);
         emulationExecPath = tempExtractPath + "/vpp_emu";
@@ -65,23 +91,38 @@ Vrtbin::Vrtbin(std::string vrtbinPath, const std::string& bdf) {
 void Vrtbin::extract() {
     utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__, "Extracting vrtbin: {}",
                        vrtbinPath);
-    std::string command = "tar -xvf " + vrtbinPath + " -C " + tempExtractPath + " 2>&1";
-    std::array<char, 128> buffer;
-    std::string result;
-
-    std::unique_ptr<FILE, decltype(&pclose)> pipe(popen(command.c_str(), "r"), pclose);
-    if (!pipe) {
-        throw std::runtime_error("popen() failed!");
+    cache = std::make_shared<VrtbinCache>(vrtbinPath, getCacheSize());
+    tempExtractPath = cache->getPath().string();
+    std::string xmlPath = cache->extract("system_map.xml").string();
+    // Hardware vrtbins have a logic UUID, designs without one are identified by their content
+    if (cache->contains("version.json")) {
+        cache->extract("version.json");
+        extractUUID();
     }
-
-    while (fgets(buffer.data(), buffer.size(), pipe.get()) != nullptr) {
-        result += buffer.data();
+    systemMap = CompiledSystemMap::load(xmlPath, uuid.empty() ? cache->getHash() : uuid);
+    this->platform = systemMap->getPlatform();
+    // Only the members used on the platform are extracted
+    if (this->platform == Platform::HARDWARE) {
+        cache->extract("design.pdi");
+        cache->extract("version.json");
+        cache->extract("report_utilization.xml");
+        if (cache->contains("report_utilization.bin")) {
+            cache->extract("report_utilization.bin");
+        }
+    } else if (this->platform == Platform::EMULATION) {
+        cache->extract("vpp_emu");
+    } else {
+        cache->extract("vpp_sim");
     }
 }
 
 void Vrtbin::copy(const std::string& source, const std::string& destination) {
     utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__, "Copying file {} to {}", source,
                        destination);
+    // Skip rewriting identical files, e.g. when the same vrtbin is loaded again
+    if (sameContents(source, destination)) {
+        return;
+    }
     std::ifstream src(source, std::ios::binary);
     if (!src) {
         utils::Logger::log(utils::LogLevel::ERROR, __PRETTY_FUNCTION__,
@@ -112,6 +153,8 @@ void Vrtbin::copy(const std::string& source, const std::string& destination) {
 }
 
 std::string Vrtbin::getSystemMapPath() { return systemMapPath; }
+
+std::shared_ptr<const CompiledSystemMap> Vrtbin::getSystemMap() { return systemMap; }
 std::string Vrtbin::getPdiPath() { return pdiPath; }
 
 std::string Vrtbin::getUUID() { return uuid; }
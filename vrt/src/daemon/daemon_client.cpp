@@ -0,0 +1,209 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#include "daemon/daemon_client.hpp"
+
+#include <sys/mman.h>
+#include <sys/socket.h>
+#include <sys/un.h>
+#include <unistd.h>
+
+#include <cerrno>
+#include <cstring>
+#include <stdexcept>
+#include <system_error>
+#include <utility>
+
+namespace vrt {
+
+RemoteBuffer::RemoteBuffer(DaemonClient* client, uint64_t address, size_t size, int fd)
+    : client(client), address(address), size(size) {
+    void* mapping = mmap(nullptr, size, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+    int error = errno;
+    close(fd);
+    if (mapping == MAP_FAILED) {
+        client->release(address);
+        throw std::system_error(error, std::generic_category(), "Failed to map buffer");
+    }
+    data = static_cast<uint8_t*>(mapping);
+}
+
+RemoteBuffer::~RemoteBuffer() {
+    if (data != nullptr) {
+        munmap(data, size);
+        try {
+            client->release(address);
+        } catch (const std::exception&) {
+            // The daemon frees the buffers of a client when it disconnects
+        }
+    }
+}
+
+RemoteBuffer::RemoteBuffer(RemoteBuffer&& other) noexcept
+    : client(other.client), address(other.address), size(other.size), data(other.data) {
+    other.data = nullptr;
+}
+
+RemoteBuffer& RemoteBuffer::operator=(RemoteBuffer&& other) noexcept {
+    // The buffer held before is freed with other
+    std::swap(client, other.client);
+    std::swap(address, other.address);
+    std::swap(size, other.size);
+    std::swap(data, other.data);
+    return *this;
+}
+
+size_t RemoteBuffer::getSize() const { return size; }
+
+uint64_t RemoteBuffer::getPhysAddr() const { return address; }
+
+void RemoteBuffer::sync(SyncType syncType, size_t offset, size_t size) {
+    client->sync(*this, syncType, offset, size);
+}
+
+DaemonClient::DaemonClient(const std::string& bdf, const std::string& socketPath) {
+    sockaddr_un address = {};
+    address.sun_family = AF_UNIX;
+    if (socketPath.empty() || socketPath.size() >= sizeof(address.sun_path)) {
+        throw std::invalid_argument("Invalid daemon socket path: " + socketPath);
+    }
+    std::memcpy(address.sun_path, socketPath.c_str(), socketPath.size() + 1);
+    socket = ::socket(AF_UNIX, SOCK_SEQPACKET | SOCK_CLOEXEC, 0);
+    if (socket < 0) {
+        throw std::system_error(errno, std::generic_category(), "Failed to create socket");
+    }
+    if (connect(socket, reinterpret_cast<sockaddr*>(&address), sizeof(address)) != 0) {
+        int error = errno;
+        close(socket);
+        throw std::system_error(error, std::generic_category(),
+                                "Failed to connect to the device manager at " + socketPath);
+    }
+    try {
+        std::lock_guard<std::mutex> lock(mutex);
+        request(DaemonOpcode::ATTACH, bdf.data(), bdf.size());
+        if (response.size() < sizeof(AttachReply)) {
+            throw std::runtime_error("Invalid reply from the device manager");
+        }
+        AttachReply reply;
+        std::memcpy(&reply, response.data(), sizeof(reply));
+        platform = static_cast<Platform>(reply.platform);
+        clockFrequency = reply.clockFrequency;
+    } catch (...) {
+        close(socket);
+        throw;
+    }
+}
+
+DaemonClient::~DaemonClient() { close(socket); }
+
+RemoteBuffer DaemonClient::allocate(size_t size, MemoryRangeType type) {
+    AllocateRequest allocation = {};
+    allocation.size = size;
+    allocation.type = static_cast<uint8_t>(type);
+    return allocate(allocation);
+}
+
+RemoteBuffer DaemonClient::allocate(size_t size, MemoryRangeType type, uint8_t port) {
+    AllocateRequest allocation = {};
+    allocation.size = size;
+    allocation.type = static_cast<uint8_t>(type);
+    allocation.port = port;
+    allocation.hasPort = 1;
+    return allocate(allocation);
+}
+
+RemoteBuffer DaemonClient::allocate(const AllocateRequest& allocation) {
+    AllocateReply reply;
+    int fd = -1;
+    {
+        std::lock_guard<std::mutex> lock(mutex);
+        request(DaemonOpcode::ALLOCATE, &allocation, sizeof(allocation), &fd);
+        if (response.size() < sizeof(reply) || fd < 0) {
+            if (fd >= 0) {
+                close(fd);
+            }
+            throw std::runtime_error("Invalid reply from the device manager");
+        }
+        std::memcpy(&reply, response.data(), sizeof(reply));
+    }
+    return RemoteBuffer(this, reply.address, reply.size, fd);
+}
+
+void DaemonClient::sync(const RemoteBuffer& buffer, SyncType syncType, size_t offset,
+                        size_t size) {
+    SyncRequest sync = {};
+    sync.address = buffer.getPhysAddr();
+    sync.offset = offset;
+    sync.size = size == 0 && offset < buffer.getSize() ? buffer.getSize() - offset : size;
+    sync.direction = static_cast<uint32_t>(syncType);
+    std::lock_guard<std::mutex> lock(mutex);
+    request(DaemonOpcode::SYNC, &sync, sizeof(sync));
+}
+
+void DaemonClient::call(const std::string& kernel, const std::vector<int64_t>& args) {
+    LaunchRequest launch = {};
+    launch.argCount = static_cast<uint32_t>(args.size());
+    launch.nameLength = static_cast<uint32_t>(kernel.size());
+    std::vector<uint8_t> payload(sizeof(launch) + args.size() * sizeof(int64_t) + kernel.size());
+    std::memcpy(payload.data(), &launch, sizeof(launch));
+    if (!args.empty()) {
+        std::memcpy(payload.data() + sizeof(launch), args.data(), args.size() * sizeof(int64_t));
+    }
+    std::memcpy(payload.data() + sizeof(launch) + args.size() * sizeof(int64_t), kernel.data(),
+                kernel.size());
+    std::lock_guard<std::mutex> lock(mutex);
+    request(DaemonOpcode::LAUNCH, payload.data(), payload.size());
+}
+
+void DaemonClient::release(uint64_t address) {
+    ReleaseRequest release = {address};
+    std::lock_guard<std::mutex> lock(mutex);
+    request(DaemonOpcode::RELEASE, &release, sizeof(release));
+}
+
+Platform DaemonClient::getPlatform() const { return platform; }
+
+uint64_t DaemonClient::getFrequency() const { return clockFrequency; }
+
+void DaemonClient::request(DaemonOpcode opcode, const void* payload, size_t size, int* fd) {
+    DaemonHeader header;
+    header.opcode = static_cast<uint16_t>(opcode);
+    header.sequence = ++sequence;
+    if (!DaemonSocket::send(socket, header, payload, size)) {
+        throw std::runtime_error("Lost the connection to the device manager");
+    }
+    DaemonHeader reply;
+    if (!DaemonSocket::receive(socket, reply, response, fd)) {
+        throw std::runtime_error("Lost the connection to the device manager");
+    }
+    if (reply.opcode != header.opcode || reply.sequence != header.sequence ||
+        reply.status != 0) {
+        if (fd != nullptr && *fd >= 0) {
+            close(*fd);
+            *fd = -1;
+        }
+        if (reply.status == 0) {
+            throw std::runtime_error("Unexpected reply from the device manager");
+        }
+        throw std::runtime_error(std::string(response.begin(), response.end()));
+    }
+}
+
+}  // namespace vrt
@@ -0,0 +1,121 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#include "daemon/daemon_protocol.hpp"
+
+#include <sys/socket.h>
+#include <unistd.h>
+
+#include <cerrno>
+#include <cstdlib>
+#include <cstring>
+#include <stdexcept>
+
+#include "utils/filesystem_cache.hpp"
+
+namespace vrt {
+
+std::string DaemonSocket::getDefaultPath() {
+    const char* path = std::getenv("VRT_DAEMON_SOCKET");
+    if (path != nullptr && *path != '\0') {
+        return path;
+    }
+    return (FilesystemCache::getRuntimePath() / "vrtd.sock").string();
+}
+
+bool DaemonSocket::send(int socket, const DaemonHeader& header, const void* payload, size_t size,
+                        int fd) {
+    if (sizeof(header) + size > MAX_MESSAGE_SIZE) {
+        throw std::invalid_argument("Daemon message of " + std::to_string(size) +
+                                    " bytes is too large");
+    }
+    iovec parts[2] = {{const_cast<DaemonHeader*>(&header), sizeof(header)},
+                      {const_cast<void*>(payload), size}};
+    msghdr message = {};
+    message.msg_iov = parts;
+    message.msg_iovlen = size > 0 ? 2 : 1;
+    alignas(cmsghdr) char control[CMSG_SPACE(sizeof(int))] = {};
+    if (fd >= 0) {
+        message.msg_control = control;
+        message.msg_controllen = sizeof(control);
+        cmsghdr* rights = CMSG_FIRSTHDR(&message);
+        rights->cmsg_level = SOL_SOCKET;
+        rights->cmsg_type = SCM_RIGHTS;
+        rights->cmsg_len = CMSG_LEN(sizeof(int));
+        std::memcpy(CMSG_DATA(rights), &fd, sizeof(int));
+    }
+    ssize_t sent;
+    do {
+        sent = sendmsg(socket, &message, MSG_NOSIGNAL);
+    } while (sent < 0 && errno == EINTR);
+    return sent == static_cast<ssize_t>(sizeof(header) + size);
+}
+
+bool DaemonSocket::receive(int socket, DaemonHeader& header, std::vector<uint8_t>& payload,
+                           int* fd) {
+    payload.resize(MAX_MESSAGE_SIZE - sizeof(header));
+    iovec parts[2] = {{&header, sizeof(header)}, {payload.data(), payload.size()}};
+    msghdr message = {};
+    message.msg_iov = parts;
+    message.msg_iovlen = 2;
+    alignas(cmsghdr) char control[CMSG_SPACE(sizeof(int))] = {};
+    message.msg_control = control;
+    message.msg_controllen = sizeof(control);
+    ssize_t received;
+    do {
+        received = recvmsg(socket, &message, MSG_CMSG_CLOEXEC);
+    } while (received < 0 && errno == EINTR);
+    if (received <= 0) {
+        return false;
+    }
+
+    if (fd != nullptr) {
+        *fd = -1;
+    }
+    int passed = -1;
+    for (cmsghdr* rights = CMSG_FIRSTHDR(&message); rights != nullptr;
+         rights = CMSG_NXTHDR(&message, rights)) {
+        if (rights->cmsg_level == SOL_SOCKET && rights->cmsg_type == SCM_RIGHTS) {
+            std::memcpy(&passed, CMSG_DATA(rights), sizeof(int));
+        }
+    }
+    bool valid = static_cast<size_t>(received) >= sizeof(header) &&
+                 !(message.msg_flags & (MSG_TRUNC | MSG_CTRUNC));
+    if (fd != nullptr && valid) {
+        *fd = passed;
+    } else if (passed >= 0) {
+        close(passed);
+    }
+
+    if (!valid) {
+        throw std::runtime_error("Invalid daemon message");
+    }
+    if (header.magic != DaemonHeader::MAGIC || header.version != DaemonHeader::VERSION) {
+        if (fd != nullptr && *fd >= 0) {
+            close(*fd);
+            *fd = -1;
+        }
+        throw std::runtime_error("Daemon message has an unsupported protocol version");
+    }
+    payload.resize(received - sizeof(header));
+    return true;
+}
+
+}  // namespace vrt
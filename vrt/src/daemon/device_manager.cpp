@@ -0,0 +1,937 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#include "daemon/device_manager.hpp"
+
+#include <fcntl.h>
+#include <poll.h>
+#include <sys/mman.h>
+#include <sys/socket.h>
+#include <sys/stat.h>
+#include <sys/un.h>
+#include <unistd.h>
+
+#include <algorithm>
+#include <cerrno>
+#include <condition_variable>
+#include <cstring>
+#include <deque>
+#include <future>
+#include <list>
+#include <mutex>
+#include <set>
+#include <stdexcept>
+#include <system_error>
+#include <thread>
+
+#include "allocator/allocator.hpp"
+#include "api/buffer.hpp"
+#include "api/kernel.hpp"
+#include "qdma/dma_engine.hpp"
+#include "utils/logger.hpp"
+#include "utils/zmq_server.hpp"
+
+namespace vrt {
+
+namespace {
+
+/// Number of connections waiting to be accepted
+constexpr int LISTEN_BACKLOG = 64;
+
+/**
+ * @brief Reads the fixed part of a payload.
+ * @param payload The payload.
+ * @return The struct at the start of the payload.
+ * @throws std::invalid_argument If the payload is too short.
+ */
+template <typename T>
+T readPayload(const std::vector<uint8_t>& payload) {
+    if (payload.size() < sizeof(T)) {
+        throw std::invalid_argument("Daemon request is too short");
+    }
+    T value;
+    std::memcpy(&value, payload.data(), sizeof(T));
+    return value;
+}
+
+/**
+ * @brief Fills a Unix socket address.
+ * @param path The path of the socket.
+ * @return The address.
+ * @throws std::invalid_argument If the path is too long.
+ */
+sockaddr_un makeAddress(const std::string& path) {
+    sockaddr_un address = {};
+    address.sun_family = AF_UNIX;
+    if (path.empty() || path.size() >= sizeof(address.sun_path)) {
+        throw std::invalid_argument("Invalid daemon socket path: " + path);
+    }
+    std::memcpy(address.sun_path, path.c_str(), path.size() + 1);
+    return address;
+}
+
+}  // namespace
+
+/**
+ * @brief Struct for a client connection, shared by the main thread and the scheduler.
+ */
+struct DeviceManager::Connection {
+    int socket;                      ///< Connected socket, closed with the connection
+    uint64_t id;                     ///< Identifier of the connection
+    pid_t pid;                       ///< Client process, which owns the buffers
+    uid_t uid;                       ///< User of the client process
+    Scheduler* scheduler = nullptr;  ///< Scheduler of the attached device
+    std::mutex writeMutex;           ///< Serializes the replies
+    bool broken = false;             ///< Whether a reply could not be sent
+
+    Connection(int socket, uint64_t id, const ucred& peer)
+        : socket(socket), id(id), pid(peer.pid), uid(peer.uid) {}
+
+    ~Connection() { close(socket); }
+
+    /**
+     * @brief Sends a reply without blocking. The socket of a client that does not read its
+     * replies is shut down, so the scheduler never waits for it and run() disconnects it.
+     * @param header The header of the reply.
+     * @param payload The payload of the reply.
+     * @param size The size of the payload.
+     * @param fd A file descriptor to pass, -1 for none.
+     */
+    void send(const DaemonHeader& header, const void* payload, size_t size, int fd = -1) {
+        std::lock_guard<std::mutex> lock(writeMutex);
+        if (broken || DaemonSocket::send(socket, header, payload, size, fd)) {
+            return;
+        }
+        if (errno == EAGAIN || errno == EWOULDBLOCK) {
+            utils::Logger::log(utils::LogLevel::WARN, __PRETTY_FUNCTION__,
+                               "Connection {} does not read its replies, closing it", id);
+        }
+        broken = true;
+        shutdown(socket, SHUT_RDWR);
+    }
+
+    /**
+     * @brief Sends the reply of a successful request.
+     * @param request The header of the request.
+     * @param payload The payload of the reply.
+     * @param size The size of the payload.
+     * @param fd A file descriptor to pass, -1 for none.
+     */
+    void reply(const DaemonHeader& request, const void* payload = nullptr, size_t size = 0,
+               int fd = -1) {
+        DaemonHeader header = request;
+        header.status = 0;
+        send(header, payload, size, fd);
+    }
+
+    /**
+     * @brief Sends the reply of a failed request.
+     * @param request The header of the request.
+     * @param message The error message.
+     */
+    void fail(const DaemonHeader& request, const std::string& message) {
+        DaemonHeader header = request;
+        header.status = -1;
+        size_t size = std::min(message.size(), DaemonSocket::MAX_MESSAGE_SIZE - sizeof(header));
+        send(header, message.data(), size);
+    }
+};
+
+/**
+ * @brief Class running the requests of the clients of one device, on its own thread.
+ */
+class DeviceManager::Scheduler {
+   public:
+    /**
+     * @brief Constructor for Scheduler. Starts the thread.
+     * @param device The device.
+     * @param policy The backoff between two polls of the running requests.
+     */
+    Scheduler(Device& device, const BackoffPolicy& policy) : device(device), policy(policy) {
+        attachReply.platform = static_cast<uint32_t>(device.getPlatform());
+        attachReply.reserved = 0;
+        attachReply.clockFrequency = device.getFrequency();
+        thread = std::thread(&Scheduler::loop, this);
+    }
+
+    /**
+     * @brief Destructor for Scheduler. Waits for the running requests and frees every buffer.
+     */
+    ~Scheduler() {
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            stopping = true;
+        }
+        wakeup.notify_one();
+        thread.join();
+        for (auto& entry : buffers) {
+            freeBuffer(entry.first, entry.second);
+        }
+    }
+
+    /**
+     * @brief Gets the device.
+     * @return The device.
+     */
+    Device& getDevice() { return device; }
+
+    /**
+     * @brief Gets the reply to ATTACH.
+     * @return The platform and clock frequency of the device.
+     */
+    const AttachReply& getAttachReply() const { return attachReply; }
+
+    /**
+     * @brief Adds the queue of a connection.
+     * @param connection The connection.
+     */
+    void attach(const std::shared_ptr<Connection>& connection) {
+        std::lock_guard<std::mutex> lock(mutex);
+        streams.emplace_back();
+        streams.back().connection = connection;
+    }
+
+    /**
+     * @brief Queues a request of a connection.
+     * @param connection The connection.
+     * @param header The header of the request.
+     * @param payload The payload of the request.
+     * @throws std::invalid_argument If the request is not valid.
+     */
+    void submit(const std::shared_ptr<Connection>& connection, const DaemonHeader& header,
+                std::vector<uint8_t> payload) {
+        Request request{header, std::move(payload)};
+        switch (static_cast<DaemonOpcode>(header.opcode)) {
+            case DaemonOpcode::ALLOCATE:
+                readPayload<AllocateRequest>(request.payload);
+                break;
+            case DaemonOpcode::RELEASE:
+                readPayload<ReleaseRequest>(request.payload);
+                break;
+            case DaemonOpcode::SYNC:
+                readPayload<SyncRequest>(request.payload);
+                break;
+            case DaemonOpcode::LAUNCH:
+                parseLaunch(request);
+                break;
+            default:
+                throw std::invalid_argument("Unknown daemon request " +
+                                            std::to_string(header.opcode));
+        }
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            findStream(connection->id).queue.push_back(std::move(request));
+            changed = true;
+        }
+        wakeup.notify_one();
+    }
+
+    /**
+     * @brief Drops the queue of a connection. Once its running request completed, the buffers
+     * of its process are freed if no other connection of the process is attached.
+     * @param connection The identifier of the connection.
+     */
+    void disconnect(uint64_t connection) {
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            Stream& stream = findStream(connection);
+            stream.queue.clear();
+            stream.closed = true;
+            changed = true;
+        }
+        wakeup.notify_one();
+    }
+
+   private:
+    /**
+     * @brief Struct for a queued request.
+     */
+    struct Request {
+        DaemonHeader header;           ///< Header of the request
+        std::vector<uint8_t> payload;  ///< Payload of the request
+        std::string kernel;            ///< Name of the kernel of a LAUNCH
+        std::vector<int64_t> args;     ///< Arguments of a LAUNCH
+    };
+
+    /**
+     * @brief Struct for the requests of a connection, which run in order, one at a time.
+     */
+    struct Stream {
+        std::shared_ptr<Connection> connection;  ///< The connection
+        std::deque<Request> queue;               ///< Requests not started yet
+        bool busy = false;                       ///< Whether a request is running
+        bool closed = false;                     ///< Whether the connection is closed
+    };
+
+    /**
+     * @brief Struct for a buffer, whose host memory is a memfd shared with its client.
+     */
+    struct SharedBuffer {
+        pid_t owner;              ///< Process that allocated it
+        uint64_t size;            ///< Size in bytes
+        int fd = -1;              ///< The memfd
+        uint8_t* data = nullptr;  ///< Mapping of the memfd
+        uint32_t users = 0;       ///< Number of running requests using it
+    };
+
+    /**
+     * @brief Struct for a request that completes asynchronously.
+     */
+    struct Running {
+        Stream* stream;              ///< Stream of the request
+        DaemonHeader header;         ///< Header of the request
+        std::future<void> transfer;  ///< DMA transfer of a SYNC
+        Kernel* kernel = nullptr;    ///< Kernel of a LAUNCH
+        std::vector<uint64_t> used;  ///< Buffers in use until the request completes
+    };
+
+    Device& device;                            ///< The device
+    BackoffPolicy policy;                      ///< Backoff between two polls
+    AttachReply attachReply;                   ///< Reply to ATTACH
+    std::thread thread;                        ///< Thread running the requests
+    std::mutex mutex;                          ///< Protects the streams and flags below
+    std::condition_variable wakeup;            ///< Signaled when a request or disconnection comes
+    std::list<Stream> streams;                 ///< Stream of each attached connection
+    std::set<std::string> busyKernels;         ///< Kernels running for a client
+    bool changed = false;                      ///< Whether the streams changed since the last pass
+    bool stopping = false;                     ///< Whether the scheduler is stopping
+    std::map<std::string, Kernel> kernels;     ///< Kernels launched so far, by name
+    std::map<uint64_t, SharedBuffer> buffers;  ///< Buffers by device address
+    std::vector<Running> running;              ///< Requests in progress
+
+    /**
+     * @brief Finds the stream of a connection. The mutex must be held.
+     * @param connection The identifier of the connection.
+     * @return The stream.
+     */
+    Stream& findStream(uint64_t connection) {
+        for (Stream& stream : streams) {
+            if (stream.connection->id == connection) {
+                return stream;
+            }
+        }
+        throw std::logic_error("Connection " + std::to_string(connection) + " is not attached");
+    }
+
+    /**
+     * @brief Reads the kernel name and arguments of a LAUNCH.
+     * @param request The request.
+     * @throws std::invalid_argument If the payload does not match its sizes.
+     */
+    static void parseLaunch(Request& request) {
+        LaunchRequest launch = readPayload<LaunchRequest>(request.payload);
+        size_t argsSize = static_cast<size_t>(launch.argCount) * sizeof(int64_t);
+        if (request.payload.size() != sizeof(launch) + argsSize + launch.nameLength) {
+            throw std::invalid_argument("Invalid kernel launch request");
+        }
+        const uint8_t* args = request.payload.data() + sizeof(launch);
+        request.args.resize(launch.argCount);
+        if (argsSize > 0) {
+            std::memcpy(request.args.data(), args, argsSize);
+        }
+        request.kernel.assign(reinterpret_cast<const char*>(args + argsSize), launch.nameLength);
+    }
+
+    /**
+     * @brief Runs the requests until the scheduler stops.
+     */
+    void loop() {
+        Backoff backoff(policy);
+        while (true) {
+            bool progress = poll();
+            progress = startRequests() || progress;
+            if (progress) {
+                backoff.reset();
+                continue;
+            }
+            if (!running.empty()) {
+                backoff.pause();
+                continue;
+            }
+            std::unique_lock<std::mutex> lock(mutex);
+            if (stopping) {
+                break;
+            }
+            wakeup.wait(lock, [this] { return changed || stopping; });
+        }
+    }
+
+    /**
+     * @brief Starts the next request of every idle stream, in round robin order.
+     * @return Whether a request was started or a closed stream removed.
+     */
+    bool startRequests() {
+        std::vector<std::pair<Stream*, Request>> ready;
+        std::vector<pid_t> closed;
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            changed = false;
+            if (stopping) {
+                return false;
+            }
+            for (auto it = streams.begin(); it != streams.end();) {
+                if (it->closed && !it->busy) {
+                    pid_t pid = it->connection->pid;
+                    it = streams.erase(it);
+                    // The buffers belong to the process, which may still use other connections
+                    if (std::none_of(streams.begin(), streams.end(), [pid](const Stream& other) {
+                            return other.connection->pid == pid;
+                        })) {
+                        closed.push_back(pid);
+                    }
+                    continue;
+                }
+                if (!it->busy && !it->queue.empty()) {
+                    Request& request = it->queue.front();
+                    // A kernel runs for one client at a time, the others wait for it
+                    auto opcode = static_cast<DaemonOpcode>(request.header.opcode);
+                    if (opcode != DaemonOpcode::LAUNCH ||
+                        busyKernels.insert(request.kernel).second) {
+                        it->busy = true;
+                        ready.emplace_back(&*it, std::move(request));
+                        it->queue.pop_front();
+                    }
+                }
+                ++it;
+            }
+            // The stream served first this pass is served last next pass
+            if (!ready.empty() && streams.size() > 1) {
+                streams.splice(streams.end(), streams, streams.begin());
+            }
+        }
+        for (pid_t pid : closed) {
+            releaseBuffers(pid);
+        }
+        for (auto& entry : ready) {
+            execute(*entry.first, entry.second);
+        }
+        return !ready.empty() || !closed.empty();
+    }
+
+    /**
+     * @brief Polls the running requests and replies to the completed ones.
+     * @return Whether a request completed.
+     */
+    bool poll() {
+        bool progress = false;
+        for (size_t i = 0; i < running.size();) {
+            Running& op = running[i];
+            bool done = true;
+            std::string error;
+            try {
+                if (op.kernel != nullptr) {
+                    done = op.kernel->isDone();
+                } else if (op.transfer.wait_for(std::chrono::seconds(0)) ==
+                           std::future_status::ready) {
+                    op.transfer.get();
+                } else {
+                    done = false;
+                }
+            } catch (const std::exception& e) {
+                error = e.what();
+            }
+            if (!done) {
+                i++;
+                continue;
+            }
+            if (error.empty()) {
+                op.stream->connection->reply(op.header);
+            } else {
+                op.stream->connection->fail(op.header, error);
+            }
+            for (uint64_t address : op.used) {
+                buffers.at(address).users--;
+            }
+            finish(*op.stream, op.kernel != nullptr ? op.kernel->getName() : std::string());
+            running[i] = std::move(running.back());
+            running.pop_back();
+            progress = true;
+        }
+        return progress;
+    }
+
+    /**
+     * @brief Marks the request of a stream as completed.
+     * @param stream The stream.
+     * @param kernel The kernel the request ran, empty for none.
+     */
+    void finish(Stream& stream, const std::string& kernel) {
+        std::lock_guard<std::mutex> lock(mutex);
+        stream.busy = false;
+        if (!kernel.empty()) {
+            busyKernels.erase(kernel);
+        }
+    }
+
+    /**
+     * @brief Starts a request. Requests that complete immediately are replied to.
+     * @param stream The stream of the request.
+     * @param request The request.
+     */
+    void execute(Stream& stream, Request& request) {
+        try {
+            switch (static_cast<DaemonOpcode>(request.header.opcode)) {
+                case DaemonOpcode::ALLOCATE:
+                    allocate(stream, request);
+                    break;
+                case DaemonOpcode::RELEASE:
+                    release(stream, request);
+                    break;
+                case DaemonOpcode::SYNC:
+                    sync(stream, request);
+                    break;
+                case DaemonOpcode::LAUNCH:
+                    launch(stream, request);
+                    break;
+                default:
+                    throw std::invalid_argument("Unknown daemon request");
+            }
+        } catch (const std::exception& e) {
+            stream.connection->fail(request.header, e.what());
+            finish(stream, request.kernel);
+        }
+    }
+
+    /**
+     * @brief Allocates a buffer on the device and its shared host memory.
+     */
+    void allocate(Stream& stream, Request& request) {
+        AllocateRequest allocation = readPayload<AllocateRequest>(request.payload);
+        if (allocation.size == 0) {
+            throw std::invalid_argument("Buffer size must not be 0");
+        }
+        if (allocation.type > static_cast<uint8_t>(MemoryRangeType::DDR)) {
+            throw std::invalid_argument("Invalid memory range type");
+        }
+        MemoryRangeType type = static_cast<MemoryRangeType>(allocation.type);
+
+        SharedBuffer buffer{stream.connection->pid, allocation.size};
+        buffer.fd = memfd_create("vrt-buffer", MFD_CLOEXEC);
+        if (buffer.fd < 0) {
+            throw std::system_error(errno, std::generic_category(), "Failed to create buffer");
+        }
+        void* data = MAP_FAILED;
+        if (ftruncate(buffer.fd, allocation.size) == 0) {
+            data = mmap(nullptr, allocation.size, PROT_READ | PROT_WRITE,
+                        MAP_SHARED | MAP_POPULATE, buffer.fd, 0);
+        }
+        if (data == MAP_FAILED) {
+            int error = errno;
+            close(buffer.fd);
+            throw std::system_error(error, std::generic_category(), "Failed to map buffer");
+        }
+        buffer.data = static_cast<uint8_t*>(data);
+
+        uint64_t address = 0;
+        try {
+            Allocator* allocator = device.getAllocator();
+            address = allocation.hasPort
+                          ? allocator->allocate(allocation.size, type, allocation.port)
+                          : allocator->allocate(allocation.size, type);
+            if (address == 0) {
+                throw std::runtime_error("Out of device memory");
+            }
+            if (device.getPlatform() == Platform::EMULATION) {
+                // Populate the buffer so it exists in the emulation environment
+                device.getZmqServer()->sendBuffer(std::to_string(address), buffer.data,
+                                                  buffer.size);
+            }
+        } catch (...) {
+            if (address != 0) {
+                device.getAllocator()->deallocate(address);
+            }
+            munmap(buffer.data, buffer.size);
+            close(buffer.fd);
+            throw;
+        }
+        buffers[address] = buffer;
+
+        AllocateReply reply{address, buffer.size};
+        stream.connection->reply(request.header, &reply, sizeof(reply), buffer.fd);
+        finish(stream, "");
+    }
+
+    /**
+     * @brief Frees a buffer of the client.
+     */
+    void release(Stream& stream, Request& request) {
+        ReleaseRequest release = readPayload<ReleaseRequest>(request.payload);
+        auto it = findBuffer(stream, release.address);
+        if (it->second.users > 0) {
+            // A transfer or kernel started through another connection of the process uses it
+            throw std::runtime_error("Buffer at address " + std::to_string(release.address) +
+                                     " is in use");
+        }
+        freeBuffer(it->first, it->second);
+        buffers.erase(it);
+        stream.connection->reply(request.header);
+        finish(stream, "");
+    }
+
+    /**
+     * @brief Synchronizes a range of a buffer of the client. On hardware the transfer is queued
+     * on the DMA engine, on emulation the whole buffer is synchronized.
+     */
+    void sync(Stream& stream, Request& request) {
+        SyncRequest sync = readPayload<SyncRequest>(request.payload);
+        auto it = findBuffer(stream, sync.address);
+        SharedBuffer& buffer = it->second;
+        if (sync.offset > buffer.size || sync.size > buffer.size - sync.offset) {
+            throw std::out_of_range("Synchronized range is outside of the buffer");
+        }
+        SyncType syncType = static_cast<SyncType>(sync.direction);
+        if (syncType != SyncType::HOST_TO_DEVICE && syncType != SyncType::DEVICE_TO_HOST) {
+            throw std::invalid_argument("Invalid sync type");
+        }
+        bool toDevice = syncType == SyncType::HOST_TO_DEVICE;
+        uint8_t* data = buffer.data + sync.offset;
+        uint64_t address = it->first + sync.offset;
+
+        Platform platform = device.getPlatform();
+        if (platform == Platform::HARDWARE) {
+            std::shared_ptr<DmaEngine> engine = device.getDmaEngine();
+            if (!engine) {
+                throw std::runtime_error("No DMA engine for device " + device.getBdf());
+            }
+            DmaDirection direction =
+                toDevice ? DmaDirection::HOST_TO_DEVICE : DmaDirection::DEVICE_TO_HOST;
+            Running op{&stream, request.header};
+            op.transfer = engine->submit(direction, reinterpret_cast<char*>(data), address,
+                                         sync.size);
+            op.used.push_back(it->first);
+            buffer.users++;
+            running.push_back(std::move(op));
+            return;
+        }
+        std::shared_ptr<ZmqServer> server = device.getZmqServer();
+        if (platform == Platform::EMULATION) {
+            // Emulated buffers are named by their address and always transferred whole
+            std::string name = std::to_string(it->first);
+            if (toDevice) {
+                server->sendBuffer(name, buffer.data, buffer.size);
+            } else {
+                server->fetchBuffer(name, buffer.data, buffer.size);
+            }
+        } else {
+            if (toDevice) {
+                server->sendBufferSim(address, data, sync.size);
+            } else {
+                server->fetchBufferSim(address, sync.size, data);
+            }
+            // The region of a range is named by its address, which freeBuffer() does not release
+            if (sync.offset != 0) {
+                server->releaseBuffer(std::to_string(address));
+            }
+        }
+        stream.connection->reply(request.header);
+        finish(stream, "");
+    }
+
+    /**
+     * @brief Starts a kernel, which is polled until it is done.
+     */
+    void launch(Stream& stream, Request& request) {
+        auto it = kernels.find(request.kernel);
+        if (it == kernels.end()) {
+            Kernel kernel(device, request.kernel);
+            if (kernel.getName().empty()) {
+                throw std::invalid_argument("No kernel " + request.kernel + " on device " +
+                                            device.getBdf());
+            }
+            it = kernels.emplace(request.kernel, std::move(kernel)).first;
+        }
+        Kernel& kernel = it->second;
+        // The kernel accesses device memory at its buffer arguments, which must point into buffers
+        // of the client, kept from being released until the kernel is done
+        std::vector<uint64_t> used;
+        std::shared_ptr<const LaunchPlan> plan = kernel.getLaunchPlan();
+        for (size_t i = 0; plan && i < request.args.size() && i < plan->args.size(); i++) {
+            if (plan->args[i].wide) {
+                uint64_t address = findContaining(stream, request.args[i])->first;
+                if (std::find(used.begin(), used.end(), address) == used.end()) {
+                    used.push_back(address);
+                }
+            }
+        }
+        kernel.start(request.args);
+        for (uint64_t address : used) {
+            buffers.at(address).users++;
+        }
+        Running op{&stream, request.header};
+        op.kernel = &kernel;
+        op.used = std::move(used);
+        running.push_back(std::move(op));
+    }
+
+    /**
+     * @brief Finds a buffer of the client process of a stream.
+     * @param stream The stream.
+     * @param address The device address of the buffer.
+     * @return The buffer.
+     * @throws std::invalid_argument If the process has no buffer at this address.
+     */
+    std::map<uint64_t, SharedBuffer>::iterator findBuffer(Stream& stream, uint64_t address) {
+        auto it = buffers.find(address);
+        if (it == buffers.end() || it->second.owner != stream.connection->pid) {
+            throw std::invalid_argument("No buffer at address " + std::to_string(address));
+        }
+        return it;
+    }
+
+    /**
+     * @brief Finds the buffer of the client process of a stream that contains an address.
+     * @param stream The stream.
+     * @param address The device address, e.g. a buffer argument of a kernel.
+     * @return The buffer.
+     * @throws std::invalid_argument If no buffer of the process contains the address.
+     */
+    std::map<uint64_t, SharedBuffer>::iterator findContaining(Stream& stream, uint64_t address) {
+        auto it = buffers.upper_bound(address);
+        if (it != buffers.begin()) {
+            --it;
+            if (address - it->first < it->second.size &&
+                it->second.owner == stream.connection->pid) {
+                return it;
+            }
+        }
+        throw std::invalid_argument("Kernel argument " + std::to_string(address) +
+                                    " is not in a buffer of the client");
+    }
+
+    /**
+     * @brief Frees a buffer on the device and unmaps its host memory.
+     * @param address The device address of the buffer.
+     * @param buffer The buffer.
+     */
+    void freeBuffer(uint64_t address, SharedBuffer& buffer) {
+        try {
+            if (device.getPlatform() != Platform::HARDWARE) {
+                device.getZmqServer()->releaseBuffer(std::to_string(address));
+            }
+            device.getAllocator()->deallocate(address);
+        } catch (const std::exception& e) {
+            utils::Logger::log(utils::LogLevel::WARN, __PRETTY_FUNCTION__,
+                               "Failed to free buffer at {x}: {}", address, e.what());
+        }
+        munmap(buffer.data, buffer.size);
+        close(buffer.fd);
+    }
+
+    /**
+     * @brief Frees the buffers of a process whose connections are all closed.
+     * @param pid The process.
+     */
+    void releaseBuffers(pid_t pid) {
+        for (auto it = buffers.begin(); it != buffers.end();) {
+            if (it->second.owner == pid) {
+                freeBuffer(it->first, it->second);
+                it = buffers.erase(it);
+            } else {
+                ++it;
+            }
+        }
+    }
+};
+
+DeviceManager::DeviceManager(const std::vector<Device*>& devices, const std::string& socketPath,
+                             const BackoffPolicy& policy)
+    : socketPath(socketPath) {
+    if (devices.empty()) {
+        throw std::invalid_argument("Device manager needs at least one device");
+    }
+    sockaddr_un address = makeAddress(socketPath);
+    try {
+        if (pipe2(wakeup, O_CLOEXEC | O_NONBLOCK) != 0) {
+            throw std::system_error(errno, std::generic_category(), "Failed to create pipe");
+        }
+        listener = socket(AF_UNIX, SOCK_SEQPACKET | SOCK_CLOEXEC, 0);
+        if (listener < 0) {
+            throw std::system_error(errno, std::generic_category(), "Failed to create socket");
+        }
+        // Replace the socket of a daemon that did not exit cleanly, but not of a running one
+        int probe = socket(AF_UNIX, SOCK_SEQPACKET | SOCK_CLOEXEC, 0);
+        bool inUse = probe >= 0 && connect(probe, reinterpret_cast<sockaddr*>(&address),
+                                           sizeof(address)) == 0;
+        if (probe >= 0) {
+            close(probe);
+        }
+        if (inUse) {
+            throw std::runtime_error("A device manager already listens on " + socketPath);
+        }
+        unlink(socketPath.c_str());
+        if (bind(listener, reinterpret_cast<sockaddr*>(&address), sizeof(address)) != 0) {
+            throw std::system_error(errno, std::generic_category(),
+                                    "Failed to bind socket " + socketPath);
+        }
+        // Clients run as the user or group of the daemon
+        chmod(socketPath.c_str(), 0660);
+        if (listen(listener, LISTEN_BACKLOG) != 0) {
+            throw std::system_error(errno, std::generic_category(), "Failed to listen");
+        }
+        for (Device* device : devices) {
+            schedulers.push_back(std::make_unique<Scheduler>(*device, policy));
+        }
+    } catch (...) {
+        schedulers.clear();
+        for (int fd : {listener, wakeup[0], wakeup[1]}) {
+            if (fd >= 0) {
+                close(fd);
+            }
+        }
+        throw;
+    }
+    utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__,
+                       "Serving {} devices on {}", devices.size(), socketPath);
+}
+
+DeviceManager::~DeviceManager() {
+    while (!connections.empty()) {
+        disconnect(connections.begin()->second);
+    }
+    schedulers.clear();
+    close(listener);
+    close(wakeup[0]);
+    close(wakeup[1]);
+    unlink(socketPath.c_str());
+}
+
+void DeviceManager::run() {
+    std::vector<pollfd> fds;
+    std::vector<std::shared_ptr<Connection>> polled;
+    while (true) {
+        fds.assign({{wakeup[0], POLLIN, 0}, {listener, POLLIN, 0}});
+        polled.clear();
+        for (auto& entry : connections) {
+            fds.push_back({entry.first, POLLIN, 0});
+            polled.push_back(entry.second);
+        }
+        if (::poll(fds.data(), fds.size(), -1) < 0) {
+            if (errno == EINTR) {
+                continue;
+            }
+            throw std::system_error(errno, std::generic_category(), "Failed to poll sockets");
+        }
+        if (fds[0].revents != 0) {
+            char byte;
+            while (read(wakeup[0], &byte, 1) > 0) {
+            }
+            return;
+        }
+        if (fds[1].revents & POLLIN) {
+            accept();
+        }
+        for (size_t i = 0; i < polled.size(); i++) {
+            if (fds[i + 2].revents != 0 && !handle(polled[i])) {
+                disconnect(polled[i]);
+            }
+        }
+    }
+}
+
+void DeviceManager::stop() {
+    char byte = 0;
+    if (write(wakeup[1], &byte, 1) < 0) {
+        // The pipe is full, so run() is already stopping
+    }
+}
+
+const std::string& DeviceManager::getSocketPath() const { return socketPath; }
+
+size_t DeviceManager::getClientCount() const { return clientCount; }
+
+void DeviceManager::accept() {
+    // Replies are sent from the scheduler threads, which must not block on a client
+    int socket = accept4(listener, nullptr, nullptr, SOCK_CLOEXEC | SOCK_NONBLOCK);
+    if (socket < 0) {
+        utils::Logger::log(utils::LogLevel::WARN, __PRETTY_FUNCTION__,
+                           "Failed to accept connection: {}", std::strerror(errno));
+        return;
+    }
+    // Buffers are owned by the process at the other end, shared by all of its connections
+    ucred peer = {};
+    socklen_t length = sizeof(peer);
+    if (getsockopt(socket, SOL_SOCKET, SO_PEERCRED, &peer, &length) != 0) {
+        utils::Logger::log(utils::LogLevel::WARN, __PRETTY_FUNCTION__,
+                           "Failed to identify the client: {}", std::strerror(errno));
+        close(socket);
+        return;
+    }
+    auto connection = std::make_shared<Connection>(socket, nextConnection++, peer);
+    connections[socket] = connection;
+    clientCount = connections.size();
+    utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__,
+                       "Connection {} from process {} of user {}", connection->id, peer.pid,
+                       peer.uid);
+}
+
+bool DeviceManager::handle(const std::shared_ptr<Connection>& connection) {
+    DaemonHeader header;
+    try {
+        if (!DaemonSocket::receive(connection->socket, header, message)) {
+            return false;
+        }
+    } catch (const std::exception& e) {
+        utils::Logger::log(utils::LogLevel::WARN, __PRETTY_FUNCTION__,
+                           "Closing connection {}: {}", connection->id, e.what());
+        return false;
+    }
+    try {
+        if (header.opcode == static_cast<uint16_t>(DaemonOpcode::ATTACH)) {
+            attach(connection, header, std::string(message.begin(), message.end()));
+        } else if (connection->scheduler == nullptr) {
+            connection->fail(header, "Connection is not attached to a device");
+        } else {
+            connection->scheduler->submit(connection, header, message);
+        }
+    } catch (const std::exception& e) {
+        connection->fail(header, e.what());
+    }
+    return true;
+}
+
+void DeviceManager::attach(const std::shared_ptr<Connection>& connection,
+                           const DaemonHeader& header, const std::string& bdf) {
+    if (connection->scheduler != nullptr) {
+        throw std::invalid_argument("Connection is already attached to a device");
+    }
+    for (auto& scheduler : schedulers) {
+        if (bdf.empty() || scheduler->getDevice().getBdf() == bdf) {
+            scheduler->attach(connection);
+            connection->scheduler = scheduler.get();
+            utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__,
+                               "Connection {} attached to device {}", connection->id,
+                               scheduler->getDevice().getBdf());
+            const AttachReply& reply = scheduler->getAttachReply();
+            connection->reply(header, &reply, sizeof(reply));
+            return;
+        }
+    }
+    throw std::invalid_argument("No device " + bdf);
+}
+
+void DeviceManager::disconnect(const std::shared_ptr<Connection>& connection) {
+    if (connection->scheduler != nullptr) {
+        connection->scheduler->disconnect(connection->id);
+    }
+    connections.erase(connection->socket);
+    clientCount = connections.size();
+}
+
+}  // namespace vrt
@@ -233,6 +233,7 @@ void ClkWiz::setRateHzInternal(uint64_t rate) {
     write(XCLK_WIZ_REG26_OFFSET, 0x0001);
 }
 void ClkWiz::setRateHz(uint64_t rate_, bool verbose) {
+    TraceScope trace(TraceType::CLOCK_SET);
     if (verbose)
         utils::Logger::log(utils::LogLevel::INFO, __PRETTY_FUNCTION__, "Setting clock at: {} MHz",
                            std::to_string((double)rate_ / 1000000.0f));
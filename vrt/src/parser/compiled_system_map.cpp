@@ -0,0 +1,478 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#include "parser/compiled_system_map.hpp"
+
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#include <algorithm>
+#include <atomic>
+#include <cctype>
+#include <cstring>
+#include <filesystem>
+#include <fstream>
+#include <map>
+#include <mutex>
+#include <stdexcept>
+
+#include "utils/filesystem_cache.hpp"
+#include "utils/logger.hpp"
+
+namespace vrt {
+
+/// Reference to a string of the string table
+struct CompiledSystemMap::StringRef {
+    uint32_t offset;
+    uint32_t size;
+};
+
+/// Start of the binary image, followed by the kernel, register, argument and QDMA records and
+/// the string table
+struct CompiledSystemMap::Header {
+    char magic[8];
+    uint32_t version;
+    uint32_t kernelCount;
+    uint64_t size;
+    uint64_t xmlHash;
+    uint64_t clockFrequency;
+    uint32_t vrtbinType;
+    uint32_t platform;
+    uint32_t sharedMemory;
+    uint32_t registerCount;
+    uint32_t argCount;
+    uint32_t qdmaCount;
+    uint32_t stringsSize;
+    uint32_t binaryProtocol;
+    StringRef key;
+};
+
+struct CompiledSystemMap::KernelRecord {
+    StringRef name;
+    uint64_t baseAddr;
+    uint64_t range;
+    uint32_t firstRegister;
+    uint32_t registerCount;
+    uint32_t firstArg;
+    uint32_t argCount;
+    uint32_t imageSize;
+    uint32_t reserved;
+};
+
+struct CompiledSystemMap::RegisterRecord {
+    StringRef name;
+    StringRef rw;
+    StringRef description;
+    uint32_t offset;
+    uint32_t width;
+};
+
+struct CompiledSystemMap::ArgRecord {
+    uint32_t offset;
+    uint32_t highOffset;
+    uint32_t wide;
+};
+
+struct CompiledSystemMap::QdmaRecord {
+    StringRef kernel;
+    StringRef interface;
+    StringRef direction;
+    uint32_t qid;
+    uint32_t reserved;
+};
+
+namespace {
+
+constexpr char MAGIC[8] = {'V', 'R', 'T', 'S', 'M', 'A', 'P', '\0'};
+
+uint64_t hashFile(const std::string& path) {
+    std::ifstream file(path, std::ios::binary);
+    if (!file) {
+        throw std::runtime_error("Failed to read " + path);
+    }
+    // FNV-1a, the system map is a few kilobytes
+    uint64_t hash = 0xcbf29ce484222325ULL;
+    char buffer[16384];
+    while (file.read(buffer, sizeof(buffer)) || file.gcount() > 0) {
+        for (std::streamsize i = 0; i < file.gcount(); i++) {
+            hash = (hash ^ static_cast<uint8_t>(buffer[i])) * 0x100000001b3ULL;
+        }
+    }
+    return hash;
+}
+
+std::string getFileName(const std::string& key) {
+    std::string name = key;
+    for (char& c : name) {
+        if (!std::isalnum(static_cast<unsigned char>(c)) && c != '-' && c != '_') {
+            c = '_';
+        }
+    }
+    return name + ".bin";
+}
+
+void writeAtomically(const std::filesystem::path& path, const std::string& contents) {
+    static std::atomic<uint64_t> counter{0};
+    std::filesystem::path temp = path;
+    temp += ".tmp." + std::to_string(getpid()) + "." + std::to_string(counter++);
+    {
+        std::ofstream file(temp, std::ios::binary | std::ios::trunc);
+        file.write(contents.data(), contents.size());
+        if (!file) {
+            std::filesystem::remove(temp);
+            throw std::runtime_error("Error writing " + temp.string());
+        }
+    }
+    std::filesystem::rename(temp, path);
+}
+
+/**
+ * @brief Class collecting the strings of the image, each distinct string is stored once.
+ */
+class StringTable {
+    std::string contents;
+    std::map<std::string, uint32_t> offsets;
+
+   public:
+    template <typename Ref>
+    Ref add(const std::string& value) {
+        auto it = offsets.find(value);
+        if (it == offsets.end()) {
+            it = offsets.emplace(value, static_cast<uint32_t>(contents.size())).first;
+            contents += value;
+        }
+        return {it->second, static_cast<uint32_t>(value.size())};
+    }
+
+    const std::string& getContents() const { return contents; }
+};
+
+template <typename T>
+void append(std::string& image, const std::vector<T>& records) {
+    image.append(reinterpret_cast<const char*>(records.data()), records.size() * sizeof(T));
+}
+
+}  // namespace
+
+CompiledSystemMap::CompiledSystemMap(const std::string& xmlPath, const std::string& key)
+    : key(key) {
+    uint64_t xmlHash = hashFile(xmlPath);
+    std::filesystem::path dir = FilesystemCache::getCachePath() / "system_map";
+    std::filesystem::path path = dir / getFileName(key);
+    if (map(path.string(), xmlHash)) {
+        utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__,
+                           "Mapped compiled system map {}", path.string());
+    } else {
+        data = compile(xmlPath, key, xmlHash);
+        try {
+            std::filesystem::create_directories(dir);
+            writeAtomically(path, data);
+            utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__,
+                               "Compiled system map {} to {}", xmlPath, path.string());
+        } catch (const std::exception& e) {
+            // The image in memory is still used, only later loads have to compile it again
+            utils::Logger::log(utils::LogLevel::WARN, __PRETTY_FUNCTION__,
+                               "Failed to store compiled system map: {}", e.what());
+        }
+        if (!attach(data.data(), data.size(), xmlHash)) {
+            throw std::runtime_error("Invalid compiled system map of " + xmlPath);
+        }
+    }
+    plans.reserve(header->kernelCount);
+    for (uint32_t i = 0; i < header->kernelCount; i++) {
+        const KernelRecord& kernel = kernelRecords[i];
+        std::vector<LaunchArg> args;
+        args.reserve(kernel.argCount);
+        for (uint32_t j = kernel.firstArg; j < kernel.firstArg + kernel.argCount; j++) {
+            const ArgRecord& arg = argRecords[j];
+            args.push_back({arg.offset, arg.highOffset, arg.wide != 0});
+        }
+        plans.push_back(std::make_shared<const LaunchPlan>(std::move(args), kernel.imageSize));
+    }
+}
+
+std::shared_ptr<const CompiledSystemMap> CompiledSystemMap::load(const std::string& xmlPath,
+                                                                 const std::string& key) {
+    static std::mutex mutex;
+    static std::map<std::string, std::weak_ptr<const CompiledSystemMap>> loaded;
+    std::lock_guard<std::mutex> lock(mutex);
+    auto it = loaded.find(key);
+    if (it != loaded.end()) {
+        auto systemMap = it->second.lock();
+        if (systemMap && systemMap->header->xmlHash == hashFile(xmlPath)) {
+            return systemMap;
+        }
+    }
+    std::shared_ptr<const CompiledSystemMap> systemMap(new CompiledSystemMap(xmlPath, key));
+    loaded[key] = systemMap;
+    return systemMap;
+}
+
+std::string CompiledSystemMap::compile(const std::string& xmlPath, const std::string& key,
+                                       uint64_t xmlHash) {
+    // The records are written as they are in memory, none of them has padding
+    static_assert(sizeof(Header) == 80 && sizeof(KernelRecord) == 48 &&
+                      sizeof(RegisterRecord) == 32 && sizeof(ArgRecord) == 12 &&
+                      sizeof(QdmaRecord) == 32,
+                  "Unexpected layout of the compiled system map");
+    XMLParser parser(xmlPath);
+    parser.parseXML();
+    auto kernels = parser.getKernelDescriptions();
+    std::sort(kernels.begin(), kernels.end(),
+              [](const KernelDescription& a, const KernelDescription& b) {
+                  return a.name < b.name;
+              });
+
+    StringTable strings;
+    std::vector<KernelRecord> kernelList;
+    std::vector<RegisterRecord> registerList;
+    std::vector<ArgRecord> argList;
+    std::vector<QdmaRecord> qdmaList;
+    for (auto& kernel : kernels) {
+        LaunchPlan plan(kernel.registers);
+        KernelRecord record = {};
+        record.name = strings.add<StringRef>(kernel.name);
+        record.baseAddr = kernel.baseAddr;
+        record.range = kernel.range;
+        record.firstRegister = registerList.size();
+        record.registerCount = kernel.registers.size();
+        record.firstArg = argList.size();
+        record.argCount = plan.args.size();
+        record.imageSize = plan.imageSize;
+        kernelList.push_back(record);
+        for (auto& reg : kernel.registers) {
+            registerList.push_back({strings.add<StringRef>(reg.getRegisterName()),
+                                    strings.add<StringRef>(reg.getRW()),
+                                    strings.add<StringRef>(reg.getDescription()), reg.getOffset(),
+                                    reg.getWidth()});
+        }
+        for (auto& arg : plan.args) {
+            argList.push_back({arg.offset, arg.highOffset, arg.wide ? 1u : 0u});
+        }
+    }
+    for (auto& qdma : parser.getQdmaConnections()) {
+        std::string direction = qdma.getDirection() == StreamDirection::HOST_TO_DEVICE
+                                     ? "HostToDevice"
+                                     : "DeviceToHost";
+        qdmaList.push_back({strings.add<StringRef>(qdma.getKernel()),
+                            strings.add<StringRef>(qdma.getInterface()),
+                            strings.add<StringRef>(direction), qdma.getQid(), 0});
+    }
+
+    Header header = {};
+    std::memcpy(header.magic, MAGIC, sizeof(MAGIC));
+    header.version = VERSION;
+    header.kernelCount = kernelList.size();
+    header.xmlHash = xmlHash;
+    header.clockFrequency = parser.getClockFrequency();
+    header.vrtbinType = static_cast<uint32_t>(parser.getVrtbinType());
+    header.platform = static_cast<uint32_t>(parser.getPlatform());
+    header.sharedMemory = parser.getSharedMemory();
+    header.binaryProtocol = parser.getBinaryProtocol();
+    header.registerCount = registerList.size();
+    header.argCount = argList.size();
+    header.qdmaCount = qdmaList.size();
+    header.key = strings.add<StringRef>(key);
+    header.stringsSize = strings.getContents().size();
+
+    std::string image(reinterpret_cast<const char*>(&header), sizeof(header));
+    append(image, kernelList);
+    append(image, registerList);
+    append(image, argList);
+    append(image, qdmaList);
+    image += strings.getContents();
+    reinterpret_cast<Header*>(&image[0])->size = image.size();
+    return image;
+}
+
+bool CompiledSystemMap::map(const std::string& path, uint64_t xmlHash) {
+    int fd = open(path.c_str(), O_RDONLY | O_CLOEXEC);
+    if (fd < 0) {
+        return false;
+    }
+    struct stat st;
+    if (fstat(fd, &st) != 0 || st.st_size < static_cast<off_t>(sizeof(Header))) {
+        close(fd);
+        return false;
+    }
+    void* address = mmap(nullptr, st.st_size, PROT_READ, MAP_SHARED, fd, 0);
+    close(fd);
+    if (address == MAP_FAILED) {
+        return false;
+    }
+    if (!attach(static_cast<const char*>(address), st.st_size, xmlHash)) {
+        munmap(address, st.st_size);
+        utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__,
+                           "Compiled system map {} is outdated", path);
+        return false;
+    }
+    mapping = address;
+    mappingSize = st.st_size;
+    return true;
+}
+
+bool CompiledSystemMap::attach(const char* base, size_t size, uint64_t xmlHash) {
+    if (size < sizeof(Header)) {
+        return false;
+    }
+    auto head = reinterpret_cast<const Header*>(base);
+    if (std::memcmp(head->magic, MAGIC, sizeof(MAGIC)) != 0 || head->version != VERSION ||
+        head->size != size || head->xmlHash != xmlHash) {
+        return false;
+    }
+    uint64_t expected = sizeof(Header) + uint64_t(head->kernelCount) * sizeof(KernelRecord) +
+                        uint64_t(head->registerCount) * sizeof(RegisterRecord) +
+                        uint64_t(head->argCount) * sizeof(ArgRecord) +
+                        uint64_t(head->qdmaCount) * sizeof(QdmaRecord) + head->stringsSize;
+    if (expected != size) {
+        return false;
+    }
+    const char* cursor = base + sizeof(Header);
+    auto kernels = reinterpret_cast<const KernelRecord*>(cursor);
+    cursor += head->kernelCount * sizeof(KernelRecord);
+    auto registers = reinterpret_cast<const RegisterRecord*>(cursor);
+    cursor += head->registerCount * sizeof(RegisterRecord);
+    auto args = reinterpret_cast<const ArgRecord*>(cursor);
+    cursor += head->argCount * sizeof(ArgRecord);
+    auto qdmas = reinterpret_cast<const QdmaRecord*>(cursor);
+    cursor += head->qdmaCount * sizeof(QdmaRecord);
+
+    auto valid = [&](const StringRef& ref) {
+        return uint64_t(ref.offset) + ref.size <= head->stringsSize;
+    };
+    if (!valid(head->key) || std::string_view(cursor + head->key.offset, head->key.size) != key) {
+        return false;
+    }
+    for (uint32_t i = 0; i < head->kernelCount; i++) {
+        const KernelRecord& kernel = kernels[i];
+        if (!valid(kernel.name) ||
+            uint64_t(kernel.firstRegister) + kernel.registerCount > head->registerCount ||
+            uint64_t(kernel.firstArg) + kernel.argCount > head->argCount) {
+            return false;
+        }
+    }
+    for (uint32_t i = 0; i < head->registerCount; i++) {
+        if (!valid(registers[i].name) || !valid(registers[i].rw) ||
+            !valid(registers[i].description)) {
+            return false;
+        }
+    }
+    for (uint32_t i = 0; i < head->qdmaCount; i++) {
+        if (!valid(qdmas[i].kernel) || !valid(qdmas[i].interface) || !valid(qdmas[i].direction)) {
+            return false;
+        }
+    }
+    header = head;
+    kernelRecords = kernels;
+    registerRecords = registers;
+    argRecords = args;
+    qdmaRecords = qdmas;
+    strings = cursor;
+    return true;
+}
+
+CompiledSystemMap::~CompiledSystemMap() {
+    if (mapping != nullptr) {
+        munmap(mapping, mappingSize);
+    }
+}
+
+std::string_view CompiledSystemMap::getString(const StringRef& ref) const {
+    return std::string_view(strings + ref.offset, ref.size);
+}
+
+int CompiledSystemMap::findKernel(std::string_view name) const {
+    auto end = kernelRecords + header->kernelCount;
+    auto it = std::lower_bound(kernelRecords, end, name,
+                               [this](const KernelRecord& kernel, std::string_view value) {
+                                   return getString(kernel.name) < value;
+                               });
+    if (it == end || getString(it->name) != name) {
+        return -1;
+    }
+    return it - kernelRecords;
+}
+
+const std::string& CompiledSystemMap::getKey() const { return key; }
+
+uint64_t CompiledSystemMap::getClockFrequency() const { return header->clockFrequency; }
+
+VrtbinType CompiledSystemMap::getVrtbinType() const {
+    return static_cast<VrtbinType>(header->vrtbinType);
+}
+
+Platform CompiledSystemMap::getPlatform() const { return static_cast<Platform>(header->platform); }
+
+bool CompiledSystemMap::getSharedMemory() const { return header->sharedMemory != 0; }
+
+bool CompiledSystemMap::getBinaryProtocol() const { return header->binaryProtocol != 0; }
+
+std::vector<QdmaConnection> CompiledSystemMap::getQdmaConnections() const {
+    std::vector<QdmaConnection> connections;
+    connections.reserve(header->qdmaCount);
+    for (uint32_t i = 0; i < header->qdmaCount; i++) {
+        const QdmaRecord& qdma = qdmaRecords[i];
+        connections.emplace_back(std::string(getString(qdma.kernel)), qdma.qid,
+                                 std::string(getString(qdma.interface)),
+                                 std::string(getString(qdma.direction)));
+    }
+    return connections;
+}
+
+std::vector<std::string> CompiledSystemMap::getKernelNames() const {
+    std::vector<std::string> names;
+    names.reserve(header->kernelCount);
+    for (uint32_t i = 0; i < header->kernelCount; i++) {
+        names.emplace_back(getString(kernelRecords[i].name));
+    }
+    return names;
+}
+
+bool CompiledSystemMap::hasKernel(const std::string& name) const { return findKernel(name) >= 0; }
+
+Kernel CompiledSystemMap::getKernel(const std::string& name, ami_device* device) const {
+    int index = findKernel(name);
+    if (index < 0) {
+        throw std::out_of_range("No kernel " + name + " in the system map");
+    }
+    const KernelRecord& kernel = kernelRecords[index];
+    return Kernel(device, name, kernel.baseAddr, kernel.range, plans[index]);
+}
+
+std::vector<Register> CompiledSystemMap::getRegisters(const std::string& name) const {
+    int index = findKernel(name);
+    if (index < 0) {
+        throw std::out_of_range("No kernel " + name + " in the system map");
+    }
+    const KernelRecord& kernel = kernelRecords[index];
+    std::vector<Register> registers;
+    registers.reserve(kernel.registerCount);
+    for (uint32_t i = kernel.firstRegister; i < kernel.firstRegister + kernel.registerCount; i++) {
+        const RegisterRecord& reg = registerRecords[i];
+        registers.emplace_back(std::string(getString(reg.name)), reg.offset, reg.width,
+                               std::string(getString(reg.rw)),
+                               std::string(getString(reg.description)));
+    }
+    return registers;
+}
+
+}  // namespace vrt
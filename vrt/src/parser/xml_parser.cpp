@@ -24,7 +24,14 @@ namespace vrt {
 XMLParser::XMLParser(const std::string& file_path) {
     this->filename = file_path;
     this->document = xmlReadFile(this->filename.c_str(), NULL, 0);
+    if (this->document == nullptr) {
+        throw std::runtime_error("Failed to parse " + file_path);
+    }
     this->rootNode = xmlDocGetRootElement(this->document);
+    if (this->rootNode == nullptr) {
+        xmlFreeDoc(this->document);
+        throw std::runtime_error("Empty system map " + file_path);
+    }
     this->workingNode = rootNode->children;
 }
 
@@ -66,6 +73,7 @@ void XMLParser::parseXML() {
             auto r = std::stoull(range, nullptr, 16);
             Kernel kernel((ami_device*)nullptr, name, ba, r, registers);
             kernels[name] = kernel;
+            kernelDescriptions.push_back({name, ba, r, registers});
         } else if (kernelNode->type == XML_ELEMENT_NODE &&
                    xmlStrcmp(kernelNode->name, BAD_CAST "ClockFrequency") == 0) {
             std::string clkFreq = (const char*)xmlNodeGetContent(kernelNode);
@@ -84,6 +92,14 @@ void XMLParser::parseXML() {
             if (this->platform == Platform::UNKNOWN) {
                 throw std::runtime_error("Unknown platform type");
             }
+        } else if (kernelNode->type == XML_ELEMENT_NODE &&
+                   xmlStrcmp(kernelNode->name, BAD_CAST "SharedMemory") == 0) {
+            std::string sharedMemory_ = (const char*)xmlNodeGetContent(kernelNode);
+            this->sharedMemory = (sharedMemory_ == "true");
+        } else if (kernelNode->type == XML_ELEMENT_NODE &&
+                   xmlStrcmp(kernelNode->name, BAD_CAST "BinaryProtocol") == 0) {
+            std::string binaryProtocol_ = (const char*)xmlNodeGetContent(kernelNode);
+            this->binaryProtocol = (binaryProtocol_ == "true");
         } else if (kernelNode->type == XML_ELEMENT_NODE &&
                    xmlStrcmp(kernelNode->name, BAD_CAST "Qdma") == 0) {
             std::string kernelName, qdmaStream, syncTypeStr;
@@ -109,6 +125,8 @@ void XMLParser::parseXML() {
 
 std::map<std::string, Kernel> XMLParser::getKernels() { return kernels; }
 
+std::vector<KernelDescription> XMLParser::getKernelDescriptions() { return kernelDescriptions; }
+
 uint64_t XMLParser::getClockFrequency() { return this->clockFrequency; }
 
 VrtbinType XMLParser::getVrtbinType() { return this->vrtbinType; }
@@ -117,11 +135,16 @@ Platform XMLParser::getPlatform() { return this->platform; }
 
 std::vector<QdmaConnection> XMLParser::getQdmaConnections() { return this->qdmaConnections; }
 
+bool XMLParser::getSharedMemory() { return this->sharedMemory; }
+
+bool XMLParser::getBinaryProtocol() { return this->binaryProtocol; }
+
 XMLParser::~XMLParser() {
     if (this->document != nullptr) {
         xmlFreeDoc(this->document);
     }
-    xmlCleanupParser();
+    // No xmlCleanupParser(): it frees the global state of libxml2 while other threads, e.g. of a
+    // DeviceGroup, may still be parsing.
 }
 
 }  // namespace vrt
\ No newline at end of file
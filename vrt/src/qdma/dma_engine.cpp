@@ -0,0 +1,156 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#include "qdma/dma_engine.hpp"
+
+#include <unistd.h>
+
+#include <algorithm>
+#include <stdexcept>
+
+#include "utils/logger.hpp"
+
+namespace vrt {
+
+DmaEngine::DmaEngine(const std::string& bdf, const std::vector<uint32_t>& queueIds,
+                     uint32_t inFlight, size_t chunkSize) {
+    for (uint32_t queueId : queueIds) {
+        auto queue = std::make_unique<QdmaIntf>(bdf, queueId, QdmaQueueType::MEMORY_MAPPED);
+        // Extra queues are only used if setup_queues.sh created them
+        if (!queues.empty() && access(queue->getQueueName().c_str(), R_OK | W_OK) != 0) {
+            utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__,
+                               "Skipping missing queue {}", queue->getQueueName());
+            continue;
+        }
+        queues.push_back(std::move(queue));
+    }
+    if (queues.empty()) {
+        throw std::invalid_argument("DmaEngine needs at least one queue");
+    }
+    this->inFlight = std::max<uint32_t>(inFlight, 1);
+    this->chunkSize = std::max((chunkSize / CHUNK_ALIGNMENT) * CHUNK_ALIGNMENT, CHUNK_ALIGNMENT);
+    utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__,
+                       "DMA engine with {} queues, {} transfers in flight, chunks of {x} bytes",
+                       queues.size(), this->inFlight, this->chunkSize);
+    startWorkers();
+}
+
+DmaEngine::~DmaEngine() { stopWorkers(); }
+
+void DmaEngine::startWorkers() {
+    stopping = false;
+    for (uint32_t i = 0; i < inFlight; i++) {
+        workers.emplace_back(&DmaEngine::worker, this, queues[i % queues.size()].get());
+    }
+}
+
+void DmaEngine::stopWorkers() {
+    {
+        std::lock_guard<std::mutex> lock(mutex);
+        stopping = true;
+    }
+    available.notify_all();
+    for (auto& worker : workers) {
+        worker.join();
+    }
+    workers.clear();
+}
+
+void DmaEngine::configure(uint32_t inFlight, size_t chunkSize) {
+    stopWorkers();
+    this->inFlight = std::max<uint32_t>(inFlight, 1);
+    this->chunkSize = std::max((chunkSize / CHUNK_ALIGNMENT) * CHUNK_ALIGNMENT, CHUNK_ALIGNMENT);
+    startWorkers();
+}
+
+std::future<void> DmaEngine::submit(DmaDirection direction, char* buffer, uint64_t address,
+                                    size_t size) {
+    auto batch = std::make_shared<Batch>();
+    std::future<void> future = batch->promise.get_future();
+    if (size == 0) {
+        batch->promise.set_value();
+        return future;
+    }
+
+    // Split transfers smaller than inFlight full chunks evenly, so they still use every queue
+    size_t split = (size + inFlight - 1) / inFlight;
+    split = ((split + CHUNK_ALIGNMENT - 1) / CHUNK_ALIGNMENT) * CHUNK_ALIGNMENT;
+    size_t currentChunkSize = std::min(chunkSize, std::max(split, MIN_CHUNK_SIZE));
+    batch->remaining = (size + currentChunkSize - 1) / currentChunkSize;
+    {
+        std::lock_guard<std::mutex> lock(mutex);
+        for (size_t offset = 0; offset < size; offset += currentChunkSize) {
+            pending.push_back({direction, buffer + offset, address + offset,
+                               std::min(currentChunkSize, size - offset), batch});
+        }
+    }
+    available.notify_all();
+    return future;
+}
+
+void DmaEngine::transfer(DmaDirection direction, char* buffer, uint64_t address, size_t size) {
+    submit(direction, buffer, address, size).get();
+}
+
+void DmaEngine::worker(QdmaIntf* queue) {
+    while (true) {
+        Chunk chunk;
+        {
+            std::unique_lock<std::mutex> lock(mutex);
+            available.wait(lock, [this] { return stopping || !pending.empty(); });
+            if (pending.empty()) {
+                return;
+            }
+            chunk = std::move(pending.front());
+            pending.pop_front();
+        }
+        execute(queue, chunk);
+    }
+}
+
+void DmaEngine::execute(QdmaIntf* queue, const Chunk& chunk) {
+    Batch& batch = *chunk.batch;
+    // Once a chunk failed, the remaining chunks of the transfer are dropped
+    if (!batch.failed) {
+        ssize_t ret = chunk.direction == DmaDirection::HOST_TO_DEVICE
+                          ? queue->write_buff(chunk.buffer, chunk.address, chunk.size)
+                          : queue->read_buff(chunk.buffer, chunk.address, chunk.size);
+        if (ret < 0 && !batch.failed.exchange(true)) {
+            batch.error = std::make_exception_ptr(std::runtime_error(
+                "DMA transfer of " + std::to_string(chunk.size) + " bytes at address " +
+                std::to_string(chunk.address) + " on " + queue->getQueueName() + " failed"));
+        }
+    }
+    if (batch.remaining.fetch_sub(1) == 1) {
+        if (batch.failed) {
+            batch.promise.set_exception(batch.error);
+        } else {
+            batch.promise.set_value();
+        }
+    }
+}
+
+uint32_t DmaEngine::getQueueCount() const { return queues.size(); }
+
+uint32_t DmaEngine::getInFlight() const { return inFlight; }
+
+size_t DmaEngine::getChunkSize() const { return chunkSize; }
+
+}  // namespace vrt
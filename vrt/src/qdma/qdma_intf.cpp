@@ -33,12 +33,17 @@ QdmaIntf::QdmaIntf(const std::string& bdf) {
     free(bus);
 }
 
-QdmaIntf::QdmaIntf(const std::string& bdf, const uint32_t queueIdx) {
+QdmaIntf::QdmaIntf(const std::string& bdf, const uint32_t queueIdx)
+    : QdmaIntf(bdf, queueIdx, QdmaQueueType::STREAM) {}
+
+QdmaIntf::QdmaIntf(const std::string& bdf, const uint32_t queueIdx, QdmaQueueType type) {
     this->bdf = bdf;
     char* bus = strip(bdf.c_str());
 
     char formattedQueueName[256];
-    sprintf(formattedQueueName, QDMA_DEFAULT_ST_QUEUE, bus, queueIdx);
+    sprintf(formattedQueueName,
+            type == QdmaQueueType::STREAM ? QDMA_DEFAULT_ST_QUEUE : QDMA_DEFAULT_MM_QUEUE, bus,
+            queueIdx);
     queueName = std::string(formattedQueueName);
     free(bus);
 
@@ -93,6 +98,11 @@ int QdmaIntf::delete_qdma_queue(const char* bdf) {
 
 ssize_t QdmaIntf::write_from_buffer(const char* fname, char* buffer, uint64_t size, uint64_t base) {
     int fd = open(queueName.c_str(), O_WRONLY);
+    if (fd < 0) {
+        utils::Logger::log(utils::LogLevel::ERROR, __PRETTY_FUNCTION__, "Could not open {}",
+                           fname);
+        return -EIO;
+    }
     ssize_t rc;
     uint64_t count = 0;
     char* buf = buffer;
@@ -108,11 +118,13 @@ ssize_t QdmaIntf::write_from_buffer(const char* fname, char* buffer, uint64_t si
             if (rc < 0) {
                 utils::Logger::log(utils::LogLevel::ERROR, __PRETTY_FUNCTION__,
                                    "Could not write to {}", fname);
+                close(fd);
                 return -EIO;
             }
             if (rc != offset) {
                 utils::Logger::log(utils::LogLevel::ERROR, __PRETTY_FUNCTION__,
                                    "Could not write to {}", fname);
+                close(fd);
                 return -EIO;
             }
         }
@@ -122,11 +134,13 @@ ssize_t QdmaIntf::write_from_buffer(const char* fname, char* buffer, uint64_t si
         if (rc < 0) {
             utils::Logger::log(utils::LogLevel::ERROR, __PRETTY_FUNCTION__, "Could not write to {}",
                                fname);
+            close(fd);
             return -EIO;
         }
         if (rc != bytes) {
             utils::Logger::log(utils::LogLevel::ERROR, __PRETTY_FUNCTION__, "Could not write to {}",
                                fname);
+            close(fd);
             return -EIO;
         }
 
@@ -138,6 +152,7 @@ ssize_t QdmaIntf::write_from_buffer(const char* fname, char* buffer, uint64_t si
     if (count != size) {
         utils::Logger::log(utils::LogLevel::ERROR, __PRETTY_FUNCTION__, "Could not write to {}",
                            fname);
+        close(fd);
         return -EIO;
     }
     close(fd);
@@ -146,6 +161,11 @@ ssize_t QdmaIntf::write_from_buffer(const char* fname, char* buffer, uint64_t si
 
 ssize_t QdmaIntf::read_to_buffer(const char* fname, char* buffer, uint64_t size, uint64_t base) {
     int fd = open(queueName.c_str(), O_RDONLY);
+    if (fd < 0) {
+        utils::Logger::log(utils::LogLevel::ERROR, __PRETTY_FUNCTION__, "Could not open {}",
+                           fname);
+        return -EIO;
+    }
     ssize_t rc;
     uint64_t count = 0;
     char* buf = buffer;
@@ -161,11 +181,13 @@ ssize_t QdmaIntf::read_to_buffer(const char* fname, char* buffer, uint64_t size,
             if (rc < 0) {
                 utils::Logger::log(utils::LogLevel::ERROR, __PRETTY_FUNCTION__,
                                    "Could not read from {}", fname);
+                close(fd);
                 return -EIO;
             }
             if (rc != offset) {
                 utils::Logger::log(utils::LogLevel::ERROR, __PRETTY_FUNCTION__,
                                    "Could not read from {}", fname);
+                close(fd);
                 return -EIO;
             }
         }
@@ -175,11 +197,13 @@ ssize_t QdmaIntf::read_to_buffer(const char* fname, char* buffer, uint64_t size,
         if (rc < 0) {
             utils::Logger::log(utils::LogLevel::ERROR, __PRETTY_FUNCTION__,
                                "Could not read from {}", fname);
+            close(fd);
             return -EIO;
         }
         if (rc != bytes) {
             utils::Logger::log(utils::LogLevel::ERROR, __PRETTY_FUNCTION__,
                                "Could not read from {}", fname);
+            close(fd);
             return -EIO;
         }
 
@@ -191,26 +215,31 @@ ssize_t QdmaIntf::read_to_buffer(const char* fname, char* buffer, uint64_t size,
     if (count != size) {
         utils::Logger::log(utils::LogLevel::ERROR, __PRETTY_FUNCTION__, "Could not read from {}",
                            fname);
+        close(fd);
         return -EIO;
     }
     close(fd);
     return count;
 }
 
-void QdmaIntf::write_buff(char* buffer, uint64_t start_addr, uint64_t size) {
+ssize_t QdmaIntf::write_buff(char* buffer, uint64_t start_addr, uint64_t size) {
+    TraceScope trace(TraceType::QDMA_WRITE, size, start_addr);
     utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__,
                        "Writing buffer with size: {x} to {} at address {x}", size, queueName,
                        start_addr);
-    write_from_buffer(queueName.c_str(), buffer, size, start_addr);
+    return write_from_buffer(queueName.c_str(), buffer, size, start_addr);
 }
 
-void QdmaIntf::read_buff(char* buffer, uint64_t start_addr, uint64_t size) {
+ssize_t QdmaIntf::read_buff(char* buffer, uint64_t start_addr, uint64_t size) {
+    TraceScope trace(TraceType::QDMA_READ, size, start_addr);
     utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__,
                        "Reading buffer with size: {x} to {} at address {x}", size, queueName,
                        start_addr);
-    read_to_buffer(queueName.c_str(), buffer, size, start_addr);
+    return read_to_buffer(queueName.c_str(), buffer, size, start_addr);
 }
 
 uint32_t QdmaIntf::getQueueIdx() { return queueIdx; }
 
+std::string QdmaIntf::getQueueName() { return queueName; }
+
 }  // namespace vrt
\ No newline at end of file
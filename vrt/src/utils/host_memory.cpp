@@ -0,0 +1,256 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#include "utils/host_memory.hpp"
+
+#include <sys/mman.h>
+#include <sys/syscall.h>
+#include <unistd.h>
+
+#include <algorithm>
+#include <cerrno>
+#include <cstdlib>
+#include <cstring>
+#include <fstream>
+#include <new>
+#include <stdexcept>
+#include <vector>
+
+#include "utils/logger.hpp"
+
+// Not every libc defines the huge page size flags of mmap
+#ifndef MAP_HUGE_SHIFT
+#define MAP_HUGE_SHIFT 26
+#endif
+#ifndef MAP_HUGE_2MB
+#define MAP_HUGE_2MB (21 << MAP_HUGE_SHIFT)
+#endif
+#ifndef MAP_HUGE_1GB
+#define MAP_HUGE_1GB (30 << MAP_HUGE_SHIFT)
+#endif
+
+namespace vrt {
+
+namespace {
+
+/// Memory policy of mbind that prefers a node but falls back to others, see <numaif.h>
+constexpr int MPOL_PREFERRED_MODE = 1;
+
+size_t roundUp(size_t size, size_t alignment) {
+    return (size + alignment - 1) / alignment * alignment;
+}
+
+/**
+ * @brief Maps anonymous memory aligned to a huge page, so it can be backed by transparent
+ * huge pages.
+ * @param size The size of the mapping, a multiple of the huge page size.
+ * @return The mapping, or MAP_FAILED.
+ */
+void* mapAligned(size_t size) {
+    size_t alignment = HostMemoryPool::HUGE_PAGE_SIZE;
+    void* mapped = mmap(nullptr, size + alignment, PROT_READ | PROT_WRITE,
+                        MAP_PRIVATE | MAP_ANONYMOUS, -1, 0);
+    if (mapped == MAP_FAILED) {
+        return MAP_FAILED;
+    }
+    uintptr_t start = reinterpret_cast<uintptr_t>(mapped);
+    uintptr_t aligned = roundUp(start, alignment);
+    if (aligned > start) {
+        munmap(mapped, aligned - start);
+    }
+    // aligned - start is always less than the extra huge page, so part of the tail is left
+    munmap(reinterpret_cast<void*>(aligned + size), start + alignment - aligned);
+    madvise(reinterpret_cast<void*>(aligned), size, MADV_HUGEPAGE);
+    return reinterpret_cast<void*>(aligned);
+}
+
+/**
+ * @brief Sets the preferred NUMA node of a mapping whose pages are not faulted in yet.
+ * @param address The start of the mapping.
+ * @param size The size of the mapping.
+ * @param numaNode The node to place the pages on.
+ * @return True if the policy was set.
+ */
+bool bindToNode(void* address, size_t size, int numaNode) {
+#ifdef SYS_mbind
+    constexpr size_t bits = 8 * sizeof(unsigned long);
+    std::vector<unsigned long> mask(numaNode / bits + 1, 0);
+    mask[numaNode / bits] |= 1UL << (numaNode % bits);
+    // The kernel reads maxnode - 1 bits of the mask
+    return syscall(SYS_mbind, address, size, MPOL_PREFERRED_MODE, mask.data(),
+                   mask.size() * bits + 1, 0) == 0;
+#else
+    return false;
+#endif
+}
+
+}  // namespace
+
+HostMemoryPool::HostMemoryPool(size_t maxCachedBytes) : maxCachedBytes(maxCachedBytes) {}
+
+HostMemoryPool& HostMemoryPool::getInstance() {
+    // Never destroyed, so buffers outliving main can still return their memory
+    static HostMemoryPool* pool = [] {
+        const char* value = std::getenv("VRT_HOST_POOL_SIZE");
+        size_t maxCachedBytes = DEFAULT_MAX_CACHED_BYTES;
+        if (value != nullptr && *value != '\0') {
+            maxCachedBytes = std::strtoull(value, nullptr, 0);
+        }
+        return new HostMemoryPool(maxCachedBytes);
+    }();
+    return *pool;
+}
+
+int HostMemoryPool::getNumaNode(const std::string& bdf) {
+    std::string address = bdf;
+    if (address.find(':') == std::string::npos) {
+        address += ":00.0";
+    }
+    if (std::count(address.begin(), address.end(), ':') == 1) {
+        address = "0000:" + address;
+    }
+    std::ifstream file("/sys/bus/pci/devices/" + address + "/numa_node");
+    int numaNode = -1;
+    if (!(file >> numaNode) || numaNode < 0) {
+        return -1;
+    }
+    return numaNode;
+}
+
+HostMemoryPool::Block HostMemoryPool::map(size_t size, int numaNode) {
+    Block block;
+    void* mapped = MAP_FAILED;
+    int flags = MAP_PRIVATE | MAP_ANONYMOUS | MAP_HUGETLB;
+    // Huge pages only come from the pools reserved in /sys/kernel/mm/hugepages
+    if (size >= GIGANTIC_PAGE_SIZE) {
+        block.capacity = roundUp(size, GIGANTIC_PAGE_SIZE);
+        mapped = mmap(nullptr, block.capacity, PROT_READ | PROT_WRITE, flags | MAP_HUGE_1GB, -1, 0);
+    }
+    if (mapped == MAP_FAILED && size >= HUGE_PAGE_SIZE) {
+        block.capacity = roundUp(size, HUGE_PAGE_SIZE);
+        mapped = mmap(nullptr, block.capacity, PROT_READ | PROT_WRITE, flags | MAP_HUGE_2MB, -1, 0);
+    }
+    if (mapped == MAP_FAILED && size >= HUGE_PAGE_SIZE) {
+        mapped = mapAligned(block.capacity);
+    }
+    if (mapped == MAP_FAILED && size < HUGE_PAGE_SIZE) {
+        block.capacity = roundUp(size, sysconf(_SC_PAGESIZE));
+        mapped = mmap(nullptr, block.capacity, PROT_READ | PROT_WRITE,
+                      MAP_PRIVATE | MAP_ANONYMOUS, -1, 0);
+    }
+    if (mapped == MAP_FAILED) {
+        throw std::bad_alloc();
+    }
+    block.address = mapped;
+    block.numaNode = numaNode;
+
+    // The policy only applies to pages faulted in afterwards
+    if (numaNode >= 0) {
+        if (!bindToNode(block.address, block.capacity, numaNode)) {
+            utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__,
+                               "Could not place host memory on NUMA node {}: {}", numaNode,
+                               std::strerror(errno));
+        }
+    }
+    block.locked = mlock(block.address, block.capacity) == 0;
+    if (!block.locked) {
+        // Without CAP_IPC_LOCK or a large enough RLIMIT_MEMLOCK, fault the pages in instead
+        utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__,
+                           "Could not lock {} bytes of host memory: {}", block.capacity,
+                           std::strerror(errno));
+        size_t pageSize = sysconf(_SC_PAGESIZE);
+        volatile uint8_t* bytes = static_cast<uint8_t*>(block.address);
+        for (size_t offset = 0; offset < block.capacity; offset += pageSize) {
+            bytes[offset] = 0;
+        }
+    }
+    return block;
+}
+
+void HostMemoryPool::unmap(const Block& block) {
+    if (block.locked) {
+        munlock(block.address, block.capacity);
+    }
+    munmap(block.address, block.capacity);
+}
+
+void* HostMemoryPool::allocate(size_t size, int numaNode) {
+    if (size == 0) {
+        return nullptr;
+    }
+    {
+        std::lock_guard<std::mutex> lock(mutex);
+        // Reuse the smallest freed block on the node that wastes at most half of it
+        size_t limit = std::max<size_t>(2 * size, sysconf(_SC_PAGESIZE));
+        for (auto it = available.lower_bound(size); it != available.end() && it->first <= limit;
+             ++it) {
+            if (it->second.numaNode == numaNode) {
+                Block block = it->second;
+                available.erase(it);
+                cachedBytes -= block.capacity;
+                used.emplace(block.address, block);
+                return block.address;
+            }
+        }
+    }
+    Block block = map(size, numaNode);
+    std::lock_guard<std::mutex> lock(mutex);
+    used.emplace(block.address, block);
+    return block.address;
+}
+
+void HostMemoryPool::deallocate(void* address) {
+    if (address == nullptr) {
+        return;
+    }
+    std::unique_lock<std::mutex> lock(mutex);
+    auto it = used.find(address);
+    if (it == used.end()) {
+        throw std::invalid_argument("Host memory was not allocated by the pool");
+    }
+    Block block = it->second;
+    used.erase(it);
+    if (cachedBytes + block.capacity <= maxCachedBytes) {
+        available.emplace(block.capacity, block);
+        cachedBytes += block.capacity;
+        return;
+    }
+    lock.unlock();
+    unmap(block);
+}
+
+void HostMemoryPool::trim() {
+    std::multimap<size_t, Block> blocks;
+    {
+        std::lock_guard<std::mutex> lock(mutex);
+        blocks.swap(available);
+        cachedBytes = 0;
+    }
+    for (const auto& entry : blocks) {
+        unmap(entry.second);
+    }
+}
+
+size_t HostMemoryPool::getCachedBytes() {
+    std::lock_guard<std::mutex> lock(mutex);
+    return cachedBytes;
+}
+
+}  // namespace vrt
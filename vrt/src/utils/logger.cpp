@@ -28,8 +28,10 @@ namespace utils {
 std::unique_ptr<std::ofstream> Logger::fileStream_ = nullptr;
 std::ostream* Logger::output_ = &std::cout;
 LogLevel Logger::currentLogLevel_ = LogLevel::INFO;
+std::mutex Logger::mutex_;
 
 void Logger::setOutput(const std::string& filename) {
+    std::lock_guard<std::mutex> lock(mutex_);
     fileStream_ = std::make_unique<std::ofstream>(filename);
     if (fileStream_->is_open()) {
         output_ = fileStream_.get();
@@ -74,8 +76,10 @@ std::string Logger::getCurrentTime() {
     auto now_ms =
         std::chrono::duration_cast<std::chrono::milliseconds>(now.time_since_epoch()) % 1000;
 
+    std::tm localTime;
+    localtime_r(&now_time_t, &localTime);
     std::ostringstream oss;
-    oss << std::put_time(std::localtime(&now_time_t), "%Y-%m-%d %H:%M:%S") << '.'
+    oss << std::put_time(&localTime, "%Y-%m-%d %H:%M:%S") << '.'
         << std::setfill('0') << std::setw(3) << now_ms.count();
     return oss.str();
 }
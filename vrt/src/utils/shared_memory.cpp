@@ -0,0 +1,72 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#include "utils/shared_memory.hpp"
+
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <unistd.h>
+
+#include <algorithm>
+#include <cerrno>
+#include <cstring>
+#include <stdexcept>
+
+namespace vrt {
+
+std::atomic<uint64_t> SharedMemory::counter{0};
+
+SharedMemory::SharedMemory(size_t size) : size(size) {
+    name = "/vrt-" + std::to_string(getpid()) + "-" + std::to_string(counter++);
+    int fd = shm_open(name.c_str(), O_CREAT | O_EXCL | O_RDWR, 0600);
+    if (fd < 0) {
+        throw std::runtime_error("Failed to create shared memory " + name + ": " +
+                                 std::strerror(errno));
+    }
+    // mmap does not accept empty mappings
+    size_t mapSize = std::max<size_t>(size, 1);
+    if (ftruncate(fd, mapSize) != 0) {
+        close(fd);
+        shm_unlink(name.c_str());
+        throw std::runtime_error("Failed to resize shared memory " + name);
+    }
+    void* mapped = mmap(nullptr, mapSize, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+    close(fd);
+    if (mapped == MAP_FAILED) {
+        shm_unlink(name.c_str());
+        throw std::runtime_error("Failed to map shared memory " + name);
+    }
+    address = static_cast<uint8_t*>(mapped);
+}
+
+SharedMemory::~SharedMemory() {
+    if (address != nullptr) {
+        munmap(address, std::max<size_t>(size, 1));
+    }
+    shm_unlink(name.c_str());
+}
+
+uint8_t* SharedMemory::data() const { return address; }
+
+size_t SharedMemory::getSize() const { return size; }
+
+const std::string& SharedMemory::getName() const { return name; }
+
+}  // namespace vrt
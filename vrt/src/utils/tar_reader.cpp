@@ -0,0 +1,213 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#include "utils/tar_reader.hpp"
+
+#include <algorithm>
+#include <array>
+#include <fstream>
+#include <stdexcept>
+#include <vector>
+
+namespace vrt {
+
+namespace {
+
+constexpr size_t BLOCK_SIZE = 512;
+constexpr size_t COPY_CHUNK_SIZE = 1 << 20;
+
+using Block = std::array<char, BLOCK_SIZE>;
+
+std::string field(const Block& block, size_t offset, size_t length) {
+    const char* start = block.data() + offset;
+    return std::string(start, std::find(start, start + length, '\0'));
+}
+
+uint64_t numericField(const Block& block, size_t offset, size_t length) {
+    const unsigned char* start = reinterpret_cast<const unsigned char*>(block.data()) + offset;
+    uint64_t value = 0;
+    // GNU base-256 encoding, used for sizes of 8 GiB and more
+    if (start[0] & 0x80) {
+        value = start[0] & 0x7f;
+        for (size_t i = 1; i < length; i++) {
+            value = (value << 8) | start[i];
+        }
+        return value;
+    }
+    for (size_t i = 0; i < length && start[i] != '\0'; i++) {
+        if (start[i] >= '0' && start[i] <= '7') {
+            value = (value << 3) | (start[i] - '0');
+        } else if (start[i] != ' ') {
+            break;
+        }
+    }
+    return value;
+}
+
+bool checksumValid(const Block& block) {
+    uint64_t sum = 0;
+    for (size_t i = 0; i < BLOCK_SIZE; i++) {
+        // The checksum field itself counts as spaces
+        sum += (i >= 148 && i < 156) ? ' ' : static_cast<unsigned char>(block[i]);
+    }
+    return sum == numericField(block, 148, 8);
+}
+
+std::string normalize(std::string name) {
+    while (name.compare(0, 2, "./") == 0) {
+        name.erase(0, 2);
+    }
+    return name;
+}
+
+uint64_t padded(uint64_t size) { return (size + BLOCK_SIZE - 1) / BLOCK_SIZE * BLOCK_SIZE; }
+
+}  // namespace
+
+TarReader::TarReader(const std::string& path) : path(path) { scan(); }
+
+void TarReader::scan() {
+    std::ifstream archive(path, std::ios::binary);
+    if (!archive) {
+        throw std::runtime_error("Error opening archive " + path);
+    }
+    archive.seekg(0, std::ios::end);
+    uint64_t archiveSize = archive.tellg();
+    archive.seekg(0);
+
+    uint64_t offset = 0;
+    std::string longName;
+    Block block;
+    while (offset + BLOCK_SIZE <= archiveSize) {
+        if (!archive.read(block.data(), BLOCK_SIZE)) {
+            throw std::runtime_error("Error reading archive " + path);
+        }
+        offset += BLOCK_SIZE;
+        if (std::all_of(block.begin(), block.end(), [](char c) { return c == '\0'; })) {
+            break;
+        }
+        if (!checksumValid(block)) {
+            throw std::runtime_error(path + " is not a tar archive");
+        }
+        uint64_t size = numericField(block, 124, 12);
+        if (offset + size > archiveSize) {
+            throw std::runtime_error("Truncated archive " + path);
+        }
+        char type = block[156];
+        if (type == 'L' || type == 'x') {
+            std::string data(size, '\0');
+            if (!archive.read(&data[0], size)) {
+                throw std::runtime_error("Error reading archive " + path);
+            }
+            if (type == 'L') {
+                longName = data.c_str();
+            } else {
+                // pax records: "<length> <key>=<value>\n"
+                size_t pos = 0;
+                while (pos < data.size()) {
+                    size_t space = data.find(' ', pos);
+                    size_t length = 0;
+                    for (size_t i = pos; space != std::string::npos && i < space; i++) {
+                        if (data[i] < '0' || data[i] > '9' || length > data.size()) {
+                            length = 0;
+                            break;
+                        }
+                        length = length * 10 + (data[i] - '0');
+                    }
+                    // The length counts the whole record, its own digits and the newline included
+                    if (space == std::string::npos || length <= space - pos + 1 ||
+                        length > data.size() - pos || data[pos + length - 1] != '\n') {
+                        throw std::runtime_error("Malformed pax header in " + path);
+                    }
+                    std::string record = data.substr(space + 1, pos + length - space - 2);
+                    if (record.compare(0, 5, "path=") == 0) {
+                        longName = record.substr(5);
+                    }
+                    pos += length;
+                }
+            }
+        } else if (type == '0' || type == '\0' || type == '7') {
+            std::string name = longName;
+            if (name.empty()) {
+                name = field(block, 0, 100);
+                std::string prefix = field(block, 345, 155);
+                if (field(block, 257, 5) == "ustar" && !prefix.empty()) {
+                    name = prefix + "/" + name;
+                }
+            }
+            TarMember member;
+            member.name = normalize(name);
+            member.offset = offset;
+            member.size = size;
+            member.mode = numericField(block, 100, 8) & 07777;
+            members[member.name] = member;
+            longName.clear();
+        } else {
+            longName.clear();
+        }
+        offset += padded(size);
+        archive.seekg(offset);
+    }
+}
+
+bool TarReader::contains(const std::string& name) const { return members.count(name) != 0; }
+
+const TarMember& TarReader::getMember(const std::string& name) const {
+    auto it = members.find(name);
+    if (it == members.end()) {
+        throw std::out_of_range(name + " not found in " + path);
+    }
+    return it->second;
+}
+
+const std::map<std::string, TarMember>& TarReader::getMembers() const { return members; }
+
+void TarReader::extract(const std::string& name, const std::filesystem::path& destination) const {
+    const TarMember& member = getMember(name);
+    std::ifstream archive(path, std::ios::binary);
+    if (!archive) {
+        throw std::runtime_error("Error opening archive " + path);
+    }
+    std::ofstream dest(destination, std::ios::binary | std::ios::trunc);
+    if (!dest) {
+        throw std::runtime_error("Error opening destination file " + destination.string());
+    }
+    archive.seekg(member.offset);
+    std::vector<char> chunk(std::min<uint64_t>(member.size, COPY_CHUNK_SIZE));
+    uint64_t remaining = member.size;
+    while (remaining > 0) {
+        size_t count = std::min<uint64_t>(remaining, chunk.size());
+        if (!archive.read(chunk.data(), count)) {
+            throw std::runtime_error("Error reading " + name + " from " + path);
+        }
+        if (!dest.write(chunk.data(), count)) {
+            throw std::runtime_error("Error writing destination file " + destination.string());
+        }
+        remaining -= count;
+    }
+    dest.close();
+    if (!dest) {
+        throw std::runtime_error("Error writing destination file " + destination.string());
+    }
+    std::filesystem::permissions(destination,
+                                 static_cast<std::filesystem::perms>((member.mode & 0777) | 0400));
+}
+
+}  // namespace vrt
@@ -0,0 +1,294 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#include "utils/tracer.hpp"
+
+#include <algorithm>
+#include <cerrno>
+#include <chrono>
+#include <condition_variable>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <memory>
+#include <mutex>
+#include <stdexcept>
+#include <thread>
+#include <unordered_map>
+#include <vector>
+
+namespace vrt {
+
+namespace {
+
+constexpr char MAGIC[8] = {'V', 'R', 'T', 'T', 'R', 'A', 'C', 'E'};
+constexpr std::chrono::milliseconds FLUSH_INTERVAL(10);
+
+/// Names of the event types, in the order of TraceType
+constexpr const char* TYPE_NAMES[] = {"kernel_write",          "kernel_read",
+                                      "kernel_start",          "kernel_wait",
+                                      "buffer_sync_to_device", "buffer_sync_to_host",
+                                      "allocate",              "deallocate",
+                                      "clock_set",             "qdma_write",
+                                      "qdma_read"};
+static_assert(sizeof(TYPE_NAMES) / sizeof(TYPE_NAMES[0]) ==
+                  static_cast<size_t>(TraceType::COUNT),
+              "Every trace type needs a name");
+
+uint32_t makeTag(const char* tag) {
+    uint32_t value;
+    std::memcpy(&value, tag, sizeof(value));
+    return value;
+}
+
+/**
+ * @brief Single producer, single consumer ring of the events of one thread.
+ */
+struct TraceRing {
+    std::unique_ptr<TraceEvent[]> events{new TraceEvent[Tracer::RING_CAPACITY]};
+    std::atomic<uint64_t> head{0};     ///< Next event written by the thread
+    std::atomic<uint64_t> tail{0};     ///< Next event drained by the flusher
+    std::atomic<uint64_t> dropped{0};  ///< Events dropped because the ring was full
+    uint32_t thread = 0;               ///< Index of the thread
+};
+
+/**
+ * @brief State of the tracer: the trace file, the rings of all threads and the flusher.
+ */
+class TraceState {
+    std::mutex mutex;                                   ///< Protects the members below
+    std::mutex fileMutex;                               ///< Serializes writes to the file
+    std::FILE* file = nullptr;                          ///< The trace file
+    std::vector<std::shared_ptr<TraceRing>> rings;      ///< Rings of all threads
+    std::vector<std::string> names;                     ///< Interned names, id - 1
+    std::unordered_map<std::string, uint16_t> nameIds;  ///< Ids of the interned names
+    size_t namesWritten = 0;                            ///< Names already in the file
+    uint32_t threadCount = 0;                           ///< Threads that recorded events
+    std::thread flusher;                                ///< Drains the rings periodically
+    std::condition_variable wakeup;                     ///< Wakes the flusher when stopping
+    bool stopping = false;                              ///< Whether the flusher stops
+
+    void writeChunk(const char* tag, const void* data, uint32_t size) {
+        uint32_t header[2] = {makeTag(tag), size};
+        std::fwrite(header, sizeof(header), 1, file);
+        std::fwrite(data, 1, size, file);
+    }
+
+    void writeNames(const char* tag, const std::vector<std::string>& list, size_t first,
+                    uint16_t firstId) {
+        std::vector<char> payload;
+        for (size_t i = first; i < list.size(); i++) {
+            uint16_t id = firstId + (i - first);
+            const char* bytes = reinterpret_cast<const char*>(&id);
+            payload.insert(payload.end(), bytes, bytes + sizeof(id));
+            payload.insert(payload.end(), list[i].begin(), list[i].end());
+            payload.push_back('\0');
+        }
+        if (!payload.empty()) {
+            writeChunk(tag, payload.data(), payload.size());
+        }
+    }
+
+    void run() {
+        std::unique_lock<std::mutex> lock(mutex);
+        while (!stopping) {
+            wakeup.wait_for(lock, FLUSH_INTERVAL);
+            lock.unlock();
+            drain();
+            lock.lock();
+        }
+    }
+
+   public:
+    ~TraceState() { close(); }
+
+    void open(const std::string& path) {
+        close();
+        std::FILE* created = std::fopen(path.c_str(), "wb");
+        if (created == nullptr) {
+            throw std::runtime_error("Failed to create trace file " + path + ": " +
+                                     std::strerror(errno));
+        }
+        std::lock_guard<std::mutex> fileLock(fileMutex);
+        std::lock_guard<std::mutex> lock(mutex);
+        file = created;
+        uint32_t header[2] = {Tracer::VERSION, sizeof(TraceEvent)};
+        std::fwrite(MAGIC, sizeof(MAGIC), 1, file);
+        std::fwrite(header, sizeof(header), 1, file);
+        writeNames("TYPE", std::vector<std::string>(std::begin(TYPE_NAMES), std::end(TYPE_NAMES)),
+                   0, 0);
+        namesWritten = 0;
+        stopping = false;
+        flusher = std::thread(&TraceState::run, this);
+    }
+
+    void close() {
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            if (file == nullptr) {
+                return;
+            }
+            stopping = true;
+        }
+        wakeup.notify_all();
+        flusher.join();
+        drain();
+        std::lock_guard<std::mutex> fileLock(fileMutex);
+        std::fclose(file);
+        file = nullptr;
+    }
+
+    /**
+     * @brief Wakes the flusher early, e.g. when a ring is filling up.
+     */
+    void wake() { wakeup.notify_one(); }
+
+    std::shared_ptr<TraceRing> createRing() {
+        auto ring = std::make_shared<TraceRing>();
+        std::lock_guard<std::mutex> lock(mutex);
+        ring->thread = ++threadCount;
+        rings.push_back(ring);
+        return ring;
+    }
+
+    uint16_t intern(const std::string& name) {
+        std::lock_guard<std::mutex> lock(mutex);
+        auto it = nameIds.find(name);
+        if (it != nameIds.end()) {
+            return it->second;
+        }
+        // Id 0 means no name
+        uint16_t id = names.size() < UINT16_MAX ? names.size() + 1 : 0;
+        if (id != 0) {
+            names.push_back(name);
+            nameIds.emplace(name, id);
+        }
+        return id;
+    }
+
+    /**
+     * @brief Writes new names and the events of all rings to the file.
+     */
+    void drain() {
+        std::lock_guard<std::mutex> fileLock(fileMutex);
+        if (file == nullptr) {
+            return;
+        }
+        std::vector<std::shared_ptr<TraceRing>> current;
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            // Names are written before the events that refer to them
+            writeNames("NAME", names, namesWritten, namesWritten + 1);
+            namesWritten = names.size();
+            current = rings;
+            // Rings of exited threads are only kept until they are drained
+            rings.erase(std::remove_if(rings.begin(), rings.end(),
+                                       [](const std::shared_ptr<TraceRing>& ring) {
+                                           return ring.use_count() == 2 &&
+                                                  ring->head.load() == ring->tail.load();
+                                       }),
+                        rings.end());
+        }
+        uint64_t dropped = 0;
+        std::vector<TraceEvent> events;
+        for (const auto& ring : current) {
+            uint64_t tail = ring->tail.load(std::memory_order_relaxed);
+            uint64_t head = ring->head.load(std::memory_order_acquire);
+            for (uint64_t i = tail; i < head; i++) {
+                events.push_back(ring->events[i % Tracer::RING_CAPACITY]);
+            }
+            ring->tail.store(head, std::memory_order_release);
+            dropped += ring->dropped.exchange(0);
+        }
+        if (!events.empty()) {
+            writeChunk("EVTS", events.data(), events.size() * sizeof(TraceEvent));
+        }
+        if (dropped != 0) {
+            writeChunk("DROP", &dropped, sizeof(dropped));
+        }
+        std::fflush(file);
+    }
+};
+
+TraceState& getState() {
+    static TraceState state;
+    return state;
+}
+
+/**
+ * @brief Enables tracing at startup when VRT_TRACE is set, and closes the file at exit.
+ */
+struct EnvironmentTracer {
+    EnvironmentTracer() {
+        // Constructs the state first, so it is destroyed after the destructor below
+        getState();
+        const char* path = std::getenv("VRT_TRACE");
+        if (path != nullptr && *path != '\0') {
+            Tracer::enable(path);
+        }
+    }
+
+    ~EnvironmentTracer() { Tracer::disable(); }
+} environmentTracer;
+
+}  // namespace
+
+std::atomic<bool> Tracer::enabled{false};
+
+void Tracer::enable(const std::string& path) {
+    enabled.store(false);
+    getState().open(path);
+    enabled.store(true);
+}
+
+void Tracer::disable() {
+    enabled.store(false);
+    getState().close();
+}
+
+void Tracer::flush() { getState().drain(); }
+
+uint16_t Tracer::intern(const std::string& name) { return getState().intern(name); }
+
+uint64_t Tracer::now() {
+    return std::chrono::duration_cast<std::chrono::nanoseconds>(
+               std::chrono::steady_clock::now().time_since_epoch())
+        .count();
+}
+
+void Tracer::record(TraceType type, uint64_t start, uint64_t bytes, uint64_t address,
+                    uint16_t name) {
+    thread_local std::shared_ptr<TraceRing> ring = getState().createRing();
+    uint64_t end = now();
+    uint64_t head = ring->head.load(std::memory_order_relaxed);
+    uint64_t used = head - ring->tail.load(std::memory_order_acquire);
+    if (used >= RING_CAPACITY) {
+        ring->dropped.fetch_add(1, std::memory_order_relaxed);
+        return;
+    }
+    if (used == RING_CAPACITY / 2) {
+        getState().wake();
+    }
+    ring->events[head % RING_CAPACITY] = {start,   end - start, bytes, address,
+                                          ring->thread, static_cast<uint16_t>(type), name};
+    ring->head.store(head + 1, std::memory_order_release);
+}
+
+}  // namespace vrt
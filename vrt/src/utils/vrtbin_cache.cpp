@@ -0,0 +1,319 @@
+/**
+ * The MIT License (MIT)
+ * Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+ * and associated documentation files (the "Software"), to deal in the Software without restriction,
+ * including without limitation the rights to use, copy, modify, merge, publish, distribute,
+ * sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all copies or
+ * substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+ * NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+ * DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+#include "utils/vrtbin_cache.hpp"
+
+#include <fcntl.h>
+#include <sys/file.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#include <algorithm>
+#include <atomic>
+#include <cerrno>
+#include <cstring>
+#include <fstream>
+#include <sstream>
+#include <stdexcept>
+#include <tuple>
+#include <vector>
+
+#include "utils/filesystem_cache.hpp"
+#include "utils/logger.hpp"
+
+namespace vrt {
+
+namespace {
+
+constexpr uint64_t FNV_OFFSET = 0xcbf29ce484222325ULL;
+constexpr uint64_t FNV_PRIME = 0x100000001b3ULL;
+constexpr size_t HASH_CHUNK_SIZE = 1 << 20;
+constexpr const char* MEMBERS_FILE = ".members";
+constexpr const char* EXTRACT_LOCK_FILE = ".lock";
+
+std::string toHex(uint64_t value) {
+    char text[17];
+    snprintf(text, sizeof(text), "%016llx", static_cast<unsigned long long>(value));
+    return text;
+}
+
+uint64_t hashString(const std::string& text) {
+    uint64_t hash = FNV_OFFSET;
+    for (unsigned char c : text) {
+        hash = (hash ^ c) * FNV_PRIME;
+    }
+    return hash;
+}
+
+/**
+ * FNV-1a over 64-bit words, which hashes at memory bandwidth rather than one byte per multiply.
+ */
+uint64_t hashFile(const std::string& path) {
+    std::ifstream file(path, std::ios::binary);
+    if (!file) {
+        throw std::runtime_error("Error opening " + path);
+    }
+    std::vector<char> chunk(HASH_CHUNK_SIZE);
+    uint64_t hash = FNV_OFFSET;
+    uint64_t total = 0;
+    while (file) {
+        file.read(chunk.data(), chunk.size());
+        size_t count = file.gcount();
+        size_t words = count / sizeof(uint64_t);
+        for (size_t i = 0; i < words; i++) {
+            uint64_t word;
+            std::memcpy(&word, chunk.data() + i * sizeof(uint64_t), sizeof(uint64_t));
+            hash = (hash ^ word) * FNV_PRIME;
+        }
+        for (size_t i = words * sizeof(uint64_t); i < count; i++) {
+            hash = (hash ^ static_cast<unsigned char>(chunk[i])) * FNV_PRIME;
+        }
+        total += count;
+    }
+    if (file.bad()) {
+        throw std::runtime_error("Error reading " + path);
+    }
+    return (hash ^ total) * FNV_PRIME;
+}
+
+/**
+ * Opens and flocks a lock file. Lock files of evicted entries are unlinked by the evicting
+ * process while it holds the lock, so a lock acquired on a file that is no longer linked at
+ * its path is retried. Returns -1 if the lock is busy and nonBlocking is set.
+ */
+int lockFile(const std::filesystem::path& path, int operation, bool nonBlocking = false) {
+    while (true) {
+        int fd = open(path.c_str(), O_RDWR | O_CREAT | O_CLOEXEC, 0600);
+        if (fd < 0) {
+            throw std::runtime_error("Error opening lock file " + path.string() + ": " +
+                                     std::strerror(errno));
+        }
+        if (flock(fd, operation | (nonBlocking ? LOCK_NB : 0)) != 0) {
+            int error = errno;
+            close(fd);
+            if (nonBlocking && error == EWOULDBLOCK) {
+                return -1;
+            }
+            throw std::runtime_error("Error locking " + path.string() + ": " +
+                                     std::strerror(error));
+        }
+        struct stat locked, linked;
+        if (fstat(fd, &locked) == 0 && stat(path.c_str(), &linked) == 0 &&
+            locked.st_dev == linked.st_dev && locked.st_ino == linked.st_ino) {
+            return fd;
+        }
+        close(fd);
+    }
+}
+
+uint64_t directorySize(const std::filesystem::path& path) {
+    uint64_t size = 0;
+    std::error_code ec;
+    for (auto it = std::filesystem::recursive_directory_iterator(path, ec);
+         it != std::filesystem::recursive_directory_iterator(); it.increment(ec)) {
+        if (ec) {
+            break;
+        }
+        if (it->is_regular_file(ec)) {
+            size += it->file_size(ec);
+        }
+    }
+    return size;
+}
+
+/**
+ * Writes a file under a temporary name and renames it, so other processes see either nothing
+ * or the complete file.
+ */
+void writeAtomically(const std::filesystem::path& path, const std::string& contents) {
+    static std::atomic<uint64_t> counter{0};
+    std::filesystem::path temp = path;
+    temp += ".tmp." + std::to_string(getpid()) + "." + std::to_string(counter++);
+    {
+        std::ofstream file(temp, std::ios::trunc);
+        file << contents;
+        if (!file) {
+            throw std::runtime_error("Error writing " + temp.string());
+        }
+    }
+    std::filesystem::rename(temp, path);
+}
+
+}  // namespace
+
+VrtbinCache::VrtbinCache(const std::string& vrtbinPath, uint64_t maxSize)
+    : vrtbinPath(vrtbinPath), maxSize(maxSize) {
+    root = FilesystemCache::getCachePath() / "vrtbin";
+    std::filesystem::create_directories(root / "index");
+    hash = computeHash();
+    entryPath = root / hash;
+    useLock = lockFile(root / (hash + ".lock"), LOCK_SH);
+    try {
+        std::filesystem::create_directories(entryPath);
+        // The modification time of the entry orders the entries for eviction
+        std::filesystem::last_write_time(entryPath, std::filesystem::file_time_type::clock::now());
+        loadMembers();
+        evict();
+    } catch (...) {
+        close(useLock);
+        throw;
+    }
+    utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__, "Cache entry of {}: {}",
+                       vrtbinPath, entryPath.string());
+}
+
+VrtbinCache::~VrtbinCache() {
+    if (useLock >= 0) {
+        close(useLock);
+    }
+}
+
+std::string VrtbinCache::computeHash() {
+    struct stat info;
+    if (stat(vrtbinPath.c_str(), &info) != 0) {
+        throw std::runtime_error("Error reading " + vrtbinPath + ": " + std::strerror(errno));
+    }
+    std::string canonical = std::filesystem::canonical(vrtbinPath).string();
+    std::filesystem::path indexPath = root / "index" / toHex(hashString(canonical));
+    std::ostringstream key;
+    key << info.st_dev << " " << info.st_ino << " " << info.st_size << " "
+        << info.st_mtim.tv_sec << "." << info.st_mtim.tv_nsec << " " << canonical;
+
+    std::ifstream index(indexPath);
+    std::string indexKey, indexHash;
+    if (std::getline(index, indexKey) && std::getline(index, indexHash) && indexKey == key.str()) {
+        return indexHash;
+    }
+    utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__, "Hashing {}", vrtbinPath);
+    std::string contentHash = toHex(hashFile(vrtbinPath));
+    writeAtomically(indexPath, key.str() + "\n" + contentHash + "\n");
+    return contentHash;
+}
+
+void VrtbinCache::loadMembers() {
+    std::filesystem::path membersPath = entryPath / MEMBERS_FILE;
+    if (!std::filesystem::exists(membersPath)) {
+        int extractLock = lockFile(entryPath / EXTRACT_LOCK_FILE, LOCK_EX);
+        try {
+            if (!std::filesystem::exists(membersPath)) {
+                std::string list;
+                for (const auto& member : getReader().getMembers()) {
+                    list += member.first + "\n";
+                }
+                writeAtomically(membersPath, list);
+            }
+        } catch (...) {
+            close(extractLock);
+            throw;
+        }
+        close(extractLock);
+    }
+    std::ifstream file(membersPath);
+    std::string name;
+    while (std::getline(file, name)) {
+        members.insert(name);
+    }
+}
+
+const TarReader& VrtbinCache::getReader() {
+    if (!reader) {
+        reader = std::make_unique<TarReader>(vrtbinPath);
+    }
+    return *reader;
+}
+
+const std::filesystem::path& VrtbinCache::getPath() const { return entryPath; }
+
+const std::string& VrtbinCache::getHash() const { return hash; }
+
+bool VrtbinCache::contains(const std::string& name) const { return members.count(name) != 0; }
+
+std::filesystem::path VrtbinCache::extract(const std::string& name) {
+    if (!contains(name)) {
+        throw std::runtime_error(vrtbinPath + " does not contain " + name);
+    }
+    std::filesystem::path path = entryPath / name;
+    if (std::filesystem::exists(path)) {
+        return path;
+    }
+    int extractLock = lockFile(entryPath / EXTRACT_LOCK_FILE, LOCK_EX);
+    try {
+        if (!std::filesystem::exists(path)) {
+            utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__, "Extracting {} from {}",
+                               name, vrtbinPath);
+            std::filesystem::create_directories(path.parent_path());
+            std::filesystem::path temp = path;
+            temp += ".tmp." + std::to_string(getpid());
+            getReader().extract(name, temp);
+            std::filesystem::rename(temp, path);
+        }
+    } catch (...) {
+        close(extractLock);
+        throw;
+    }
+    close(extractLock);
+    return path;
+}
+
+void VrtbinCache::evict() {
+    int evictLock = lockFile(root / ".evict.lock", LOCK_EX);
+    try {
+        // (last use, size, hash) of every entry, oldest first
+        std::vector<std::tuple<std::filesystem::file_time_type, uint64_t, std::string>> entries;
+        uint64_t total = 0;
+        for (const auto& dir : std::filesystem::directory_iterator(root)) {
+            std::string name = dir.path().filename().string();
+            if (!dir.is_directory() || name == "index") {
+                continue;
+            }
+            uint64_t size = directorySize(dir.path());
+            entries.emplace_back(dir.last_write_time(), size, name);
+            total += size;
+        }
+        std::sort(entries.begin(), entries.end());
+        for (const auto& entry : entries) {
+            if (total <= maxSize) {
+                break;
+            }
+            const std::string& name = std::get<2>(entry);
+            if (name == hash) {
+                continue;
+            }
+            std::filesystem::path lockPath = root / (name + ".lock");
+            int lock = lockFile(lockPath, LOCK_EX, true);
+            if (lock < 0) {
+                continue;  // In use
+            }
+            utils::Logger::log(utils::LogLevel::DEBUG, __PRETTY_FUNCTION__,
+                               "Evicting cache entry {}", name);
+            std::error_code ec;
+            std::filesystem::remove_all(root / name, ec);
+            std::filesystem::remove(lockPath, ec);
+            close(lock);
+            total -= std::get<1>(entry);
+        }
+    } catch (...) {
+        close(evictLock);
+        throw;
+    }
+    close(evictLock);
+}
+
+}  // namespace vrt
@@ -20,39 +20,114 @@
 
 #include "utils/zmq_server.hpp"
 
+#include <cstring>
+#include <stdexcept>
+
 namespace vrt {
 
-ZmqServer::ZmqServer() : context(1), socket(context, ZMQ_REQ) { socket.connect(address); }
+ZmqServer::ZmqServer() : context(1), socket(context, ZMQ_DEALER) {
+    writer["indentation"] = "";
+    socket.connect(address);
+}
+
+std::string ZmqServer::serialize(const Json::Value& command) const {
+    return Json::writeString(writer, command);
+}
+
+void ZmqServer::post(zmq::message_t& request, zmq::message_t* data) {
+    // The empty delimiter frame stands in for the envelope a REQ socket would add
+    zmq::message_t delimiter;
+    socket.send(delimiter, zmq::send_flags::sndmore);
+    socket.send(request, data != nullptr ? zmq::send_flags::sndmore : zmq::send_flags::none);
+    if (data != nullptr) {
+        socket.send(*data, zmq::send_flags::none);
+    }
+    if (++inFlight > MAX_IN_FLIGHT) {
+        receive();
+    }
+}
+
+zmq::message_t ZmqServer::receive() {
+    zmq::message_t delimiter;
+    zmq::message_t reply;
+    socket.recv(delimiter);
+    socket.recv(reply);
+    inFlight--;
+    return reply;
+}
+
+zmq::message_t ZmqServer::roundTrip(zmq::message_t& request, zmq::message_t* data) {
+    post(request, data);
+    // The executable answers in request order, the last reply belongs to this request
+    while (inFlight > 1) {
+        receive();
+    }
+    return receive();
+}
+
+void ZmqServer::flush() {
+    while (inFlight > 0) {
+        receive();
+    }
+}
 
 void ZmqServer::sendBuffer(const std::string& name, const std::vector<uint8_t>& buffer) {
+    sendBuffer(name, buffer.data(), buffer.size());
+}
+
+void ZmqServer::sendBuffer(const std::string& name, const uint8_t* data, size_t size) {
     Json::Value command;
     command["command"] = "populate";
     command["name"] = name;
-    command["size"] = static_cast<Json::UInt64>(buffer.size());
+    command["size"] = static_cast<Json::UInt64>(size);
 
-    zmq::message_t request(command.toStyledString().size());
-    memcpy(request.data(), command.toStyledString().c_str(), command.toStyledString().size());
-    socket.send(request, zmq::send_flags::sndmore);
+    if (sharedMemory) {
+        SharedMemory& region = getRegion(name, size);
+        std::memcpy(region.data(), data, size);
+        command["shm"] = region.getName();
+        sendCommand(command);
+        return;
+    }
 
-    zmq::message_t data(buffer.size());
-    memcpy(data.data(), buffer.data(), buffer.size());
-    socket.send(data, zmq::send_flags::none);
+    std::string commandStr = serialize(command);
+    zmq::message_t request(commandStr.data(), commandStr.size());
+    zmq::message_t message(data, size);
+    roundTrip(request, &message);
+}
 
-    zmq::message_t reply;
-    socket.recv(reply);
-    std::string replyStr(static_cast<char*>(reply.data()), reply.size());
+void ZmqServer::setSharedMemory(bool enabled) { sharedMemory = enabled; }
+
+bool ZmqServer::useSharedMemory() const { return sharedMemory; }
+
+void ZmqServer::setBinaryProtocol(bool enabled) { binaryProtocol = enabled; }
+
+bool ZmqServer::useBinaryProtocol() const { return binaryProtocol; }
+
+SharedMemory& ZmqServer::getRegion(const std::string& name, size_t size) {
+    std::unique_ptr<SharedMemory>& region = regions[name];
+    if (!region || region->getSize() != size) {
+        region = std::make_unique<SharedMemory>(size);
+    }
+    return *region;
 }
 
-void ZmqServer::sendCommand(const Json::Value& command) {
-    Json::StreamWriterBuilder writer;
-    std::string commandStr = Json::writeString(writer, command);
+void ZmqServer::releaseBuffer(const std::string& name) {
+    if (regions.erase(name) == 0) {
+        return;
+    }
+    // The executable unmaps its side of the region, the reply is not waited for
+    Json::Value command;
+    command["command"] = "release";
+    command["name"] = name;
+    std::string commandStr = serialize(command);
+    zmq::message_t request(commandStr.data(), commandStr.size());
+    post(request);
+}
 
-    zmq::message_t request(commandStr.size());
-    memcpy(request.data(), commandStr.data(), commandStr.size());
-    socket.send(request, zmq::send_flags::none);
-    zmq::message_t reply;
-    socket.recv(reply);
-    std::string replyStr(static_cast<char*>(reply.data()), reply.size());
+void ZmqServer::sendCommand(const Json::Value& command) {
+    std::string commandStr = serialize(command);
+    zmq::message_t request(commandStr.data(), commandStr.size());
+    roundTrip(request);
 }
 
 uint32_t ZmqServer::fetchScalar(const std::string& function, const std::string& argIdx) {
@@ -62,15 +137,9 @@ uint32_t ZmqServer::fetchScalar(const std::string& function, const std::string&
     command["function"] = function;
     command["arg"] = argIdx;
 
-    Json::StreamWriterBuilder writer;
-    std::string commandStr = Json::writeString(writer, command);
-
-    zmq::message_t request(commandStr.size());
-    memcpy(request.data(), commandStr.c_str(), commandStr.size());
-    socket.send(request, zmq::send_flags::none);
-
-    zmq::message_t reply;
-    socket.recv(reply);
+    std::string commandStr = serialize(command);
+    zmq::message_t request(commandStr.data(), commandStr.size());
+    zmq::message_t reply = roundTrip(request);
     std::string replyStr(static_cast<char*>(reply.data()), reply.size());
 
     Json::Value response;
@@ -86,15 +155,9 @@ std::vector<uint8_t> ZmqServer::fetchBuffer(const std::string& name) {
     command["type"] = "buffer";
     command["name"] = name;
 
-    Json::StreamWriterBuilder writer;
-    std::string commandStr = Json::writeString(writer, command);
-
-    zmq::message_t request(commandStr.size());
-    memcpy(request.data(), commandStr.c_str(), commandStr.size());
-    socket.send(request, zmq::send_flags::none);
-
-    zmq::message_t reply;
-    socket.recv(reply);
+    std::string commandStr = serialize(command);
+    zmq::message_t request(commandStr.data(), commandStr.size());
+    zmq::message_t reply = roundTrip(request);
     std::string replyStr(static_cast<char*>(reply.data()), reply.size());
 
     Json::Value response;
@@ -109,22 +172,31 @@ std::vector<uint8_t> ZmqServer::fetchBuffer(const std::string& name) {
     return byteArray;
 }
 
+void ZmqServer::fetchBuffer(const std::string& name, uint8_t* data, size_t size) {
+    if (!sharedMemory) {
+        std::vector<uint8_t> buffer = fetchBuffer(name);
+        std::memcpy(data, buffer.data(), std::min<size_t>(size, buffer.size()));
+        return;
+    }
+    SharedMemory& region = getRegion(name, size);
+    Json::Value command;
+    command["command"] = "fetch";
+    command["type"] = "buffer";
+    command["name"] = name;
+    command["shm"] = region.getName();
+    sendCommand(command);
+    std::memcpy(data, region.data(), size);
+}
+
 void ZmqServer::sendStream(const std::string& name, const std::vector<uint8_t>& buffer) {
     Json::Value command;
     command["command"] = "stream_in";
     command["name"] = name;
 
-    zmq::message_t request(command.toStyledString().size());
-    memcpy(request.data(), command.toStyledString().c_str(), command.toStyledString().size());
-    socket.send(request, zmq::send_flags::sndmore);
-
-    zmq::message_t data(buffer.size());
-    memcpy(data.data(), buffer.data(), buffer.size());
-    socket.send(data, zmq::send_flags::none);
-
-    zmq::message_t reply;
-    socket.recv(reply);
-    std::string replyStr(static_cast<char*>(reply.data()), reply.size());
+    std::string commandStr = serialize(command);
+    zmq::message_t request(commandStr.data(), commandStr.size());
+    zmq::message_t data(buffer.data(), buffer.size());
+    roundTrip(request, &data);
 }
 
 std::vector<uint8_t> ZmqServer::fetchStream(const std::string& name, size_t size) {
@@ -133,15 +205,9 @@ std::vector<uint8_t> ZmqServer::fetchStream(const std::string& name, size_t size
     command["name"] = name;
     command["size"] = static_cast<Json::UInt64>(size);
 
-    Json::StreamWriterBuilder writer;
-    std::string commandStr = Json::writeString(writer, command);
-
-    zmq::message_t request(commandStr.size());
-    memcpy(request.data(), commandStr.c_str(), commandStr.size());
-    socket.send(request, zmq::send_flags::none);
-
-    zmq::message_t reply;
-    socket.recv(reply);
+    std::string commandStr = serialize(command);
+    zmq::message_t request(commandStr.data(), commandStr.size());
+    zmq::message_t reply = roundTrip(request);
     std::vector<uint8_t> buffer(reply.size());
     memcpy(buffer.data(), reply.data(), reply.size());
     return buffer;
@@ -156,15 +222,9 @@ void ZmqServer::fetchBufferSim(uint64_t addr, uint64_t size, std::vector<uint8_t
     command["addr"] = Json::UInt64(addr);
     command["size"] = Json::UInt64(size);
 
-    Json::StreamWriterBuilder writer;
-    std::string commandStr = Json::writeString(writer, command);
-
-    zmq::message_t request(commandStr.size());
-    memcpy(request.data(), commandStr.c_str(), commandStr.size());
-    socket.send(request, zmq::send_flags::none);
-
-    zmq::message_t reply;
-    socket.recv(reply);
+    std::string commandStr = serialize(command);
+    zmq::message_t request(commandStr.data(), commandStr.size());
+    zmq::message_t reply = roundTrip(request);
     std::string replyStr(static_cast<char*>(reply.data()), reply.size());
 
     Json::Value response;
@@ -176,21 +236,36 @@ void ZmqServer::fetchBufferSim(uint64_t addr, uint64_t size, std::vector<uint8_t
     }
 }
 
+void ZmqServer::fetchBufferSim(uint64_t addr, uint64_t size, uint8_t* data) {
+    if (!sharedMemory) {
+        std::vector<uint8_t> buffer;
+        fetchBufferSim(addr, size, buffer);
+        std::memcpy(data, buffer.data(), std::min<size_t>(size, buffer.size()));
+        return;
+    }
+    SharedMemory& region = getRegion(std::to_string(addr), size);
+    Json::Value command;
+    command["command"] = "fetch";
+    command["type"] = "buffer";
+    command["addr"] = Json::UInt64(addr);
+    command["size"] = Json::UInt64(size);
+    command["shm"] = region.getName();
+    sendCommand(command);
+    std::memcpy(data, region.data(), size);
+}
+
 uint32_t ZmqServer::fetchScalarSim(uint64_t addr) {
+    if (binaryProtocol) {
+        return fetchScalarsSim({addr})[0];
+    }
     Json::Value command;
     command["command"] = "fetch";
     command["type"] = "scalar";
     command["addr"] = Json::UInt64(addr);
 
-    Json::StreamWriterBuilder writer;
-    std::string commandStr = Json::writeString(writer, command);
-
-    zmq::message_t request(commandStr.size());
-    memcpy(request.data(), commandStr.c_str(), commandStr.size());
-    socket.send(request, zmq::send_flags::none);
-
-    zmq::message_t reply;
-    socket.recv(reply);
+    std::string commandStr = serialize(command);
+    zmq::message_t request(commandStr.data(), commandStr.size());
+    zmq::message_t reply = roundTrip(request);
     std::string replyStr(static_cast<char*>(reply.data()), reply.size());
 
     Json::Value response;
@@ -201,28 +276,95 @@ uint32_t ZmqServer::fetchScalarSim(uint64_t addr) {
 }
 
 void ZmqServer::sendBufferSim(uint64_t addr, const std::vector<uint8_t>& buffer) {
+    sendBufferSim(addr, buffer.data(), buffer.size());
+}
+
+void ZmqServer::sendBufferSim(uint64_t addr, const uint8_t* data, size_t size) {
     Json::Value command;
     command["command"] = "populate";
     command["addr"] = Json::UInt64(addr);
-    command["size"] = Json::UInt64(buffer.size());
-    zmq::message_t dataMsg(buffer.data(), buffer.size());
-    std::string commandStr = Json::writeString(Json::StreamWriterBuilder(), command);
-    zmq::message_t request(commandStr.c_str(), commandStr.size());
-    socket.send(request, zmq::send_flags::sndmore);
-    socket.send(dataMsg, zmq::send_flags::none);
+    command["size"] = Json::UInt64(size);
 
-    zmq::message_t reply;
-    socket.recv(reply);
-    std::string replyStr(static_cast<char*>(reply.data()), reply.size());
+    if (sharedMemory) {
+        SharedMemory& region = getRegion(std::to_string(addr), size);
+        std::memcpy(region.data(), data, size);
+        command["shm"] = region.getName();
+        sendCommand(command);
+        return;
+    }
+
+    zmq::message_t dataMsg(data, size);
+    std::string commandStr = serialize(command);
+    zmq::message_t request(commandStr.data(), commandStr.size());
+    roundTrip(request, &dataMsg);
 }
 
-void ZmqServer::sendScalar(uint64_t addr, uint32_t value) {
-    Json::Value command;
-    command["command"] = "reg";
-    command["addr"] = Json::UInt64(addr);
-    command["val"] = Json::UInt64(value);
+std::vector<uint32_t> ZmqServer::fetchScalarsSim(const std::vector<uint64_t>& addrs) {
+    std::vector<uint32_t> values;
+    values.reserve(addrs.size());
+    if (!binaryProtocol) {
+        for (uint64_t addr : addrs) {
+            values.push_back(fetchScalarSim(addr));
+        }
+        return values;
+    }
+    std::vector<BinaryScalar> scalars;
+    scalars.reserve(addrs.size());
+    for (uint64_t addr : addrs) {
+        scalars.push_back({addr, 0, 1});
+    }
+    zmq::message_t request = makeScalarRequest(scalars);
+    zmq::message_t reply = roundTrip(request);
+    BinaryHeader header;
+    if (reply.size() < sizeof(header)) {
+        throw std::runtime_error("Invalid reply to a scalar request");
+    }
+    std::memcpy(&header, reply.data(), sizeof(header));
+    if (header.magic != BinaryHeader::MAGIC || header.count != addrs.size() ||
+        reply.size() != sizeof(header) + addrs.size() * sizeof(uint32_t)) {
+        throw std::runtime_error("Invalid reply to a scalar request");
+    }
+    values.resize(addrs.size());
+    std::memcpy(values.data(), static_cast<const char*>(reply.data()) + sizeof(header),
+                values.size() * sizeof(uint32_t));
+    return values;
+}
 
-    sendCommand(command);
+zmq::message_t ZmqServer::makeScalarRequest(const std::vector<BinaryScalar>& scalars) {
+    BinaryHeader header;
+    header.count = scalars.size();
+    zmq::message_t request(sizeof(header) + scalars.size() * sizeof(BinaryScalar));
+    char* data = static_cast<char*>(request.data());
+    std::memcpy(data, &header, sizeof(header));
+    std::memcpy(data + sizeof(header), scalars.data(), scalars.size() * sizeof(BinaryScalar));
+    return request;
+}
+
+void ZmqServer::sendScalar(uint64_t addr, uint32_t value) { sendScalars({{addr, value}}); }
+
+void ZmqServer::sendScalars(const std::vector<ScalarWrite>& writes) {
+    if (writes.empty()) {
+        return;
+    }
+    if (binaryProtocol) {
+        std::vector<BinaryScalar> scalars;
+        scalars.reserve(writes.size());
+        for (const ScalarWrite& write : writes) {
+            scalars.push_back({write.addr, write.value, 0});
+        }
+        zmq::message_t request = makeScalarRequest(scalars);
+        post(request);
+        return;
+    }
+    for (const ScalarWrite& write : writes) {
+        Json::Value command;
+        command["command"] = "reg";
+        command["addr"] = Json::UInt64(write.addr);
+        command["val"] = Json::UInt64(write.value);
+        std::string commandStr = serialize(command);
+        zmq::message_t request(commandStr.data(), commandStr.size());
+        post(request);
+    }
 }
 
 }  // namespace vrt
\ No newline at end of file
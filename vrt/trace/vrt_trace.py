@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# ##################################################################################################
+#  The MIT License (MIT)
+#  Copyright (c) 2025 Advanced Micro Devices, Inc. All rights reserved.
+# 
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+#  and associated documentation files (the "Software"), to deal in the Software without restriction,
+#  including without limitation the rights to use, copy, modify, merge, publish, distribute,
+#  sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+# 
+#  The above copyright notice and this permission notice shall be included in all copies or
+#  substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+# NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ##################################################################################################
+
+
+"""
+Analyzer of the binary trace files written by vrt::Tracer (VRT_TRACE=<file>).
+
+    summary    count, latency percentiles and throughput of every operation and kernel
+    histogram  log2 latency histograms of every operation
+    timeline   bytes and events per time interval of every operation
+    chrome     Chrome trace event JSON, to open in chrome://tracing or https://ui.perfetto.dev
+
+The file format is described in utils/tracer.hpp: a header, then TYPE, NAME, EVTS and DROP
+chunks. Unknown chunks are skipped, so newer writers stay readable.
+"""
+
+import argparse
+import collections
+import json
+import math
+import struct
+import sys
+
+MAGIC = b"VRTTRACE"
+VERSION = 1
+HEADER = struct.Struct("<8sII")       # magic, version, event size
+CHUNK = struct.Struct("<4sI")         # tag, payload size
+EVENT = struct.Struct("<QQQQIHH")     # start, duration, bytes, address, thread, type, name
+
+# Operations whose bytes are a size rather than data transferred
+NO_THROUGHPUT = {"allocate", "deallocate"}
+
+Event = collections.namedtuple("Event", "start duration bytes address thread type name")
+
+class Trace:
+    def __init__(self, types, names, events, dropped):
+        self.types = types        # type id -> operation name
+        self.names = names        # name id -> interned name, e.g. of a kernel
+        self.events = events      # list of Event, sorted by start
+        self.dropped = dropped    # events lost because a ring buffer was full
+
+    def operation(self, event):
+        return self.types.get(event.type, f"type_{event.type}")
+
+    def label(self, event):
+        """The operation of an event, with its name if it has one."""
+        if event.name:
+            return f"{self.operation(event)}:{self.names.get(event.name, event.name)}"
+        return self.operation(event)
+
+def parse_names(payload):
+    names = {}
+    offset = 0
+    while offset < len(payload):
+        (ident,) = struct.unpack_from("<H", payload, offset)
+        end = payload.index(b"\0", offset + 2)
+        names[ident] = payload[offset + 2:end].decode()
+        offset = end + 1
+    return names
+
+def load(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path} is not a VRT trace")
+    magic, version, event_size = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a VRT trace")
+    if version != VERSION or event_size != EVENT.size:
+        raise ValueError(f"Unsupported trace version {version} with {event_size} byte events")
+    types, names, events, dropped = {}, {}, [], 0
+    offset = HEADER.size
+    # A trace of a process that was killed may end in a partial chunk
+    while offset + CHUNK.size <= len(data):
+        tag, size = CHUNK.unpack_from(data, offset)
+        payload = data[offset + CHUNK.size:offset + CHUNK.size + size]
+        offset += CHUNK.size + size
+        if len(payload) < size:
+            break
+        if tag == b"TYPE":
+            types.update(parse_names(payload))
+        elif tag == b"NAME":
+            names.update(parse_names(payload))
+        elif tag == b"EVTS":
+            events.extend(Event._make(fields) for fields in EVENT.iter_unpack(payload))
+        elif tag == b"DROP":
+            dropped += struct.unpack("<Q", payload)[0]
+    events.sort(key=lambda event: event.start)
+    return Trace(types, names, events, dropped)
+
+def percentile(values, fraction):
+    """Nearest rank percentile of sorted values."""
+    return values[min(len(values) - 1, max(0, math.ceil(fraction * len(values)) - 1))]
+
+def format_time(ns):
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.2f} {unit}"
+    return f"{ns:.0f} ns"
+
+def format_rate(bytes_per_second):
+    for unit, scale in (("GB/s", 1e9), ("MB/s", 1e6), ("kB/s", 1e3)):
+        if bytes_per_second >= scale:
+            return f"{bytes_per_second / scale:.2f} {unit}"
+    return f"{bytes_per_second:.0f} B/s"
+
+def group(trace, by_name):
+    groups = collections.defaultdict(list)
+    for event in trace.events:
+        groups[trace.label(event) if by_name else trace.operation(event)].append(event)
+    return groups
+
+def summary(trace, args):
+    rows = []
+    for label, events in sorted(group(trace, not args.by_operation).items()):
+        durations = sorted(event.duration for event in events)
+        total_bytes = sum(event.bytes for event in events
+                          if trace.operation(event) not in NO_THROUGHPUT)
+        busy = sum(durations)
+        rows.append({
+            "operation": label,
+            "count": len(events),
+            "total_ns": busy,
+            "mean_ns": busy / len(events),
+            "p50_ns": percentile(durations, 0.50),
+            "p99_ns": percentile(durations, 0.99),
+            "max_ns": durations[-1],
+            "bytes": total_bytes,
+            # Bytes over the time spent in the operation, not over the wall clock
+            "throughput": total_bytes / (busy / 1e9) if busy and total_bytes else 0,
+        })
+    if args.json:
+        json.dump({"dropped": trace.dropped, "operations": rows}, sys.stdout, indent=2)
+        print()
+        return
+    print(f"{'operation':<40} {'count':>8} {'total':>10} {'mean':>10} {'p50':>10} "
+          f"{'p99':>10} {'max':>10} {'throughput':>12}")
+    for row in rows:
+        print(f"{row['operation']:<40} {row['count']:>8} {format_time(row['total_ns']):>10} "
+              f"{format_time(row['mean_ns']):>10} {format_time(row['p50_ns']):>10} "
+              f"{format_time(row['p99_ns']):>10} {format_time(row['max_ns']):>10} "
+              f"{format_rate(row['throughput']) if row['bytes'] else '-':>12}")
+    if trace.dropped:
+        print(f"\n{trace.dropped} events were dropped, the trace is incomplete")
+
+def histogram(trace, args):
+    for label, events in sorted(group(trace, args.by_name).items()):
+        buckets = collections.Counter(max(0, event.duration.bit_length() - 1) for event in events)
+        largest = max(buckets.values())
+        print(f"{label} ({len(events)} events)")
+        for bucket in range(min(buckets), max(buckets) + 1):
+            count = buckets.get(bucket, 0)
+            bar = "#" * math.ceil(args.width * count / largest) if count else ""
+            span = f"{format_time(1 << bucket)} - {format_time(1 << (bucket + 1))}"
+            print(f"  {span:>22} {count:>8} {bar}")
+        print()
+
+def timeline(trace, args):
+    if not trace.events:
+        return
+    interval = int(args.interval * 1e6)
+    origin = trace.events[0].start
+    labels = sorted(group(trace, args.by_name))
+    rows = collections.defaultdict(lambda: collections.defaultdict(lambda: [0, 0]))
+    for event in trace.events:
+        label = trace.label(event) if args.by_name else trace.operation(event)
+        # Bytes are attributed to the intervals the operation overlaps, in proportion
+        start = event.start - origin
+        end = start + max(event.duration, 1)
+        first = start // interval
+        for index in range(first, (end - 1) // interval + 1):
+            overlap = min(end, (index + 1) * interval) - max(start, index * interval)
+            rows[index][label][0] += event.bytes * overlap / (end - start)
+        rows[first][label][1] += 1
+    columns = [f"{label} {unit}" for label in labels for unit in ("MB/s", "events")]
+    print(",".join(["time_ms"] + columns))
+    for index in range(max(rows) + 1):
+        cells = [f"{index * args.interval:.3f}"]
+        for label in labels:
+            transferred, count = rows[index][label] if label in rows[index] else (0, 0)
+            cells.append(f"{transferred / (interval / 1e9) / 1e6:.3f}")
+            cells.append(str(count))
+        print(",".join(cells))
+
+def chrome(trace, args):
+    origin = trace.events[0].start if trace.events else 0
+    events = [{"name": "thread_name", "ph": "M", "pid": 1, "tid": thread,
+               "args": {"name": f"thread {thread}"}}
+              for thread in sorted({event.thread for event in trace.events})]
+    for event in trace.events:
+        fields = {"bytes": event.bytes} if event.bytes else {}
+        if event.address:
+            fields["address"] = hex(event.address)
+        events.append({
+            "name": trace.label(event),
+            "cat": trace.operation(event),
+            "ph": "X",
+            "pid": 1,
+            "tid": event.thread,
+            "ts": (event.start - origin) / 1e3,
+            "dur": event.duration / 1e3,
+            "args": fields,
+        })
+    with open(args.output, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ns",
+                   "otherData": {"dropped": trace.dropped}}, f)
+    print(f"Wrote {len(trace.events)} events to {args.output}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze VRT trace files.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    summary_parser = subparsers.add_parser("summary", help="Latency and throughput per operation.")
+    summary_parser.add_argument("--by-operation", action="store_true",
+                                help="Do not split operations by kernel name.")
+    summary_parser.add_argument("--json", action="store_true", help="Print JSON.")
+    summary_parser.set_defaults(handler=summary)
+
+    histogram_parser = subparsers.add_parser("histogram", help="Latency histograms.")
+    histogram_parser.add_argument("--by-name", action="store_true",
+                                  help="Split operations by kernel name.")
+    histogram_parser.add_argument("--width", type=int, default=50,
+                                  help="Width of the longest bar (default: %(default)s).")
+    histogram_parser.set_defaults(handler=histogram)
+
+    timeline_parser = subparsers.add_parser("timeline", help="Throughput over time, as CSV.")
+    timeline_parser.add_argument("--interval", type=float, default=10.0,
+                                 help="Interval in milliseconds (default: %(default)s).")
+    timeline_parser.add_argument("--by-name", action="store_true",
+                                 help="Split operations by kernel name.")
+    timeline_parser.set_defaults(handler=timeline)
+
+    chrome_parser = subparsers.add_parser("chrome", help="Convert to Chrome trace JSON.")
+    chrome_parser.add_argument("-o", "--output", type=str, default="trace.json",
+                               help="Output file (default: %(default)s).")
+    chrome_parser.set_defaults(handler=chrome)
+
+    for subparser in subparsers.choices.values():
+        subparser.add_argument("trace", type=str, help="Trace file written with VRT_TRACE.")
+    args = parser.parse_args()
+    args.handler(load(args.trace), args)
+
+if __name__ == "__main__":
+    main()